@@ -0,0 +1,66 @@
+"""Notification rendering throughput.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_notify.py [--seconds 2]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.chores4kids.notify import NotificationRenderer  # noqa: E402
+from custom_components.chores4kids.storage import Child, Purchase, Task  # noqa: E402
+
+
+class _Store:
+    def __init__(self, children):
+        self._by_id = {c.id: c for c in children}
+
+    def get_child_name(self, child_id):
+        c = self._by_id.get(child_id) if child_id else None
+        return c.name if c is not None else None
+
+
+def _throughput(fn, seconds: float) -> float:
+    count = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            fn()
+        count += 100
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    children = [Child(id=f"c{i}", name=f"Kid {i}") for i in range(20)]
+    hass = SimpleNamespace(
+        config=SimpleNamespace(language="da", external_url="https://ha.example", internal_url="", api=None),
+        bus=SimpleNamespace(async_listen=lambda *_a, **_k: (lambda: None)),
+    )
+    renderer = NotificationRenderer(hass, _Store(children))
+    task = Task(id="t1", title="Vacuum", points=5, assigned_to="c19", bonus_enabled=True, bonus_title="Windows")
+    purchase = Purchase(id="p1", child_id="c3", item_id="i1", title="Ice cream", price=20, image="/local/chores4kids/x.jpg", ts="2024-01-01T12:00:00+00:00")
+
+    results = {
+        "task_completed_per_s": _throughput(lambda: renderer.task_completed(task), args.seconds),
+        "shop_purchase_per_s": _throughput(
+            lambda: (renderer.shop_purchase(purchase), renderer.resolve_image_url(purchase.image)), args.seconds
+        ),
+    }
+    print(json.dumps({k: round(v, 1) for k, v in results.items()}))
+
+
+if __name__ == "__main__":
+    main()
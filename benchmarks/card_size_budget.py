@@ -0,0 +1,50 @@
+"""Size budget for the Lovelace card bundle.
+
+Kid and overview dashboards only load the core module; the admin view, icon
+picker and config editor are separate chunks. Fails (exit 1) when any file
+grows past its budget so regressions show up before a release:
+
+    python benchmarks/card_size_budget.py [--dir .]
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import sys
+from pathlib import Path
+
+# (raw bytes, gzip -9 bytes)
+BUDGETS = {
+    "chores4kids-card.js": (185_000, 44_000),
+    "chores4kids-card-admin.js": (90_000, 18_000),
+    "chores4kids-card-icons.js": (24_000, 7_500),
+    "chores4kids-card-editor.js": (45_000, 8_000),
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dir", default=str(Path(__file__).resolve().parents[1]))
+    args = parser.parse_args()
+    base = Path(args.dir)
+
+    report = {}
+    ok = True
+    for name, (raw_max, gz_max) in BUDGETS.items():
+        path = base / name
+        if not path.exists():
+            path = base / "www" / name
+        data = path.read_bytes()
+        raw = len(data)
+        gz = len(gzip.compress(data, compresslevel=9, mtime=0))
+        within = raw <= raw_max and gz <= gz_max
+        ok = ok and within
+        report[name] = {"raw": raw, "raw_budget": raw_max, "gzip": gz, "gzip_budget": gz_max, "ok": within}
+
+    print(json.dumps(report, indent=2))
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
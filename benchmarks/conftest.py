@@ -0,0 +1,234 @@
+"""Benchmark harness for the store and sensor hot paths.
+
+Runs against the real integration code with Home Assistant installed; only
+the `HomeAssistant` instance and the `Store` helper are replaced, by a minimal
+object and an in-memory store that still JSON-encodes on save, decodes on
+load and migrates older documents like `ChoresStorage`. From the repository root:
+
+    python -m pytest benchmarks [--bench-profile small,medium,large]
+        [--bench-rounds 5] [--bench-json bench-results.json]
+
+Each benchmark runs `--bench-rounds` times on a freshly loaded household (the
+setup is not timed). Results are written as JSON for tracking over time.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from household import PROFILES, Profile, make_household  # noqa: E402
+
+_RESULTS: List[Dict[str, Any]] = []
+# (profile name, "v1" | "primed") -> storage payload (bytes), shared by all benchmarks of a run
+_PAYLOADS: Dict[tuple, bytes] = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("chores4kids benchmarks")
+    group.addoption("--bench-profile", default="small,medium,large", help="comma separated: " + ", ".join(PROFILES))
+    group.addoption("--bench-rounds", type=int, default=5, help="timed runs per benchmark")
+    group.addoption("--bench-json", default="bench-results.json", help="where to write the JSON results")
+
+
+def pytest_generate_tests(metafunc):
+    if "profile" in metafunc.fixturenames:
+        names = [p.strip() for p in metafunc.config.getoption("--bench-profile").split(",") if p.strip()]
+        unknown = [n for n in names if n not in PROFILES]
+        if unknown:
+            raise pytest.UsageError(f"unknown benchmark profile(s): {', '.join(unknown)}")
+        metafunc.parametrize("profile", [PROFILES[n] for n in names], ids=names)
+
+
+class FakeHass:
+    """Just enough of HomeAssistant for KidsChoresStore; `disk` backs MemoryStore."""
+
+    def __init__(self, disk: Optional[Dict[str, bytes]] = None) -> None:
+        self.data: Dict[str, Any] = {}
+        self.disk: Dict[str, bytes] = dict(disk or {})
+        self.config = type("Config", (), {"path": staticmethod(lambda *parts: str(Path("/tmp", *parts)))})()
+
+    def async_create_task(self, coro):
+        return asyncio.get_running_loop().create_task(coro)
+
+    async def async_add_executor_job(self, func, *args):
+        return func(*args)
+
+
+class MemoryStore:
+    """storage.ChoresStorage with the file replaced by hass.disk."""
+
+    def __init__(self, hass: FakeHass, version: int, key: str, *args, **kwargs) -> None:
+        self.hass = hass
+        self.version = version
+        self.key = key
+
+    async def async_load(self):
+        from homeassistant.util.json import json_loads
+
+        from custom_components.chores4kids.storage import _migrate_document
+
+        raw = self.hass.disk.get(self.key)
+        if raw is None:
+            return None
+        stored = json_loads(raw)
+        if stored["version"] == self.version:
+            return stored["data"]
+        # Like Store: migrate and write the result back before returning it
+        data = _migrate_document(stored["version"], stored["data"])
+        await self.async_save(data)
+        return data
+
+    async def async_save(self, data) -> None:
+        from homeassistant.helpers.json import json_bytes
+
+        self.hass.disk[self.key] = json_bytes({"version": self.version, "key": self.key, "data": data})
+
+
+@pytest.fixture(autouse=True)
+def _stub_hass_helpers(monkeypatch):
+    from custom_components.chores4kids import storage
+
+    monkeypatch.setattr(storage, "ChoresStorage", MemoryStore)
+    # Dispatch cost belongs to the listeners, not the store
+    monkeypatch.setattr(storage, "async_dispatcher_send", lambda *_a, **_k: None)
+
+
+def _payload(profile: Profile, state: str = "primed") -> bytes:
+    """Household as a version 1 document ("v1") or after one load/save ("primed"),
+    i.e. migrated with ledger and statistics already seeded."""
+    payload = _PAYLOADS.get((profile.name, state))
+    if payload is not None:
+        return payload
+    from homeassistant.helpers.json import json_bytes
+
+    from custom_components.chores4kids.const import STORAGE_KEY
+    from custom_components.chores4kids.storage import KidsChoresStore
+
+    if state == "v1":
+        payload = json_bytes({"version": 1, "key": STORAGE_KEY, "data": make_household(profile)})
+    else:
+        async def _prime() -> bytes:
+            hass = FakeHass({STORAGE_KEY: _payload(profile, "v1")})
+            await KidsChoresStore(hass).async_load()
+            return hass.disk[STORAGE_KEY]
+
+        payload = asyncio.run(_prime())
+    _PAYLOADS[(profile.name, state)] = payload
+    return payload
+
+
+@pytest.fixture
+def new_store(profile):
+    """Async factory: a store on a private copy of the household, optionally loaded."""
+    from custom_components.chores4kids.const import STORAGE_KEY
+    from custom_components.chores4kids.storage import KidsChoresStore
+
+    payloads = {state: _payload(profile, state) for state in ("v1", "primed")}
+
+    async def factory(load: bool = True, state: str = "primed"):
+        store = KidsChoresStore(FakeHass({STORAGE_KEY: payloads[state]}))
+        if load:
+            await store.async_load()
+        return store
+
+    return factory
+
+
+@pytest.fixture
+def bench(request, profile):
+    rounds = max(1, int(request.config.getoption("--bench-rounds")))
+
+    def run(name: str, action: Callable[[Any], Any], setup: Optional[Callable[[], Awaitable[Any]]] = None) -> Dict[str, Any]:
+        loop = asyncio.new_event_loop()
+        samples: List[float] = []
+        try:
+            for _ in range(rounds):
+                ctx = loop.run_until_complete(setup()) if setup is not None else None
+                start = time.perf_counter()
+                result = action(ctx)
+                if asyncio.iscoroutine(result):
+                    loop.run_until_complete(result)
+                samples.append(time.perf_counter() - start)
+                # Background work the action scheduled (e.g. size accounting after a save) runs untimed
+                pending = asyncio.all_tasks(loop)
+                if pending:
+                    loop.run_until_complete(asyncio.gather(*pending))
+        finally:
+            loop.close()
+        ms = [s * 1000 for s in samples]
+        row = {
+            "benchmark": name,
+            "profile": profile.name,
+            "children": profile.children,
+            "tasks": profile.tasks,
+            "purchases": profile.purchases,
+            "rounds": rounds,
+            "min_ms": round(min(ms), 3),
+            "median_ms": round(statistics.median(ms), 3),
+            "mean_ms": round(statistics.fmean(ms), 3),
+            "max_ms": round(max(ms), 3),
+            "stdev_ms": round(statistics.stdev(ms), 3) if len(ms) > 1 else 0.0,
+        }
+        _RESULTS.append(row)
+        return row
+
+    return run
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _ha_version() -> Optional[str]:
+    try:
+        from homeassistant.const import __version__
+    except ImportError:
+        return None
+    return __version__
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _RESULTS:
+        return
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "homeassistant": _ha_version(),
+            "rounds": session.config.getoption("--bench-rounds"),
+        },
+        "results": _RESULTS,
+    }
+    Path(session.config.getoption("--bench-json")).write_text(json.dumps(report, indent=2, default=str) + "\n", encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _RESULTS:
+        return
+    terminalreporter.section("chores4kids benchmarks (ms)")
+    terminalreporter.write_line(f"{'benchmark':<38}{'profile':<9}{'median':>11}{'min':>11}{'max':>11}")
+    for row in _RESULTS:
+        terminalreporter.write_line(
+            f"{row['benchmark']:<38}{row['profile']:<9}{row['median_ms']:>11.3f}{row['min_ms']:>11.3f}{row['max_ms']:>11.3f}"
+        )
+    terminalreporter.write_line(f"results written to {terminalreporter.config.getoption('--bench-json')}")
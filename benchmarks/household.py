@@ -0,0 +1,140 @@
+"""Synthetic households for the benchmark suite, in the store's on-disk format.
+
+Deterministic for a given profile and seed. Besides the bulk data every
+household contains a few fixed records the benchmarks act on:
+
+- ``bench-awaiting``: a task of child-0 waiting for approval
+- ``bench-fw``: a fastest-wins template with one unclaimed copy per child
+  (``bench-fw-<n>``)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+import random
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    children: int
+    tasks: int
+    purchases: int
+
+
+PROFILES = {
+    "small": Profile("small", children=1, tasks=100, purchases=100),
+    "medium": Profile("medium", children=5, tasks=5_000, purchases=1_000),
+    "large": Profile("large", children=20, tasks=50_000, purchases=10_000),
+}
+
+# Share of the task count that are templates and open (not yet approved) chores;
+# the rest is approved history spread over the last year.
+TEMPLATE_SHARE = 0.05
+OPEN_SHARE = 0.15
+HISTORY_DAYS = 365
+
+
+def _iso(day: date, hour: int = 12) -> str:
+    return datetime.combine(day, time(hour), tzinfo=timezone.utc).isoformat()
+
+
+def _ms(day: date, hour: int = 12) -> int:
+    return int(datetime.combine(day, time(hour), tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def make_household(profile: Profile, seed: int = 0, today: Optional[date] = None) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    today = today or datetime.now(timezone.utc).date()
+    children = [
+        {"id": f"child-{n}", "name": f"Kid {n}", "slug": f"kid_{n}", "points": rng.randint(0, 500)}
+        for n in range(profile.children)
+    ]
+    child_ids = [c["id"] for c in children]
+    categories = [{"id": f"cat-{n}", "name": f"Category {n}", "color": ""} for n in range(8)]
+    items = [
+        {"id": f"item-{n}", "title": f"Reward {n}", "price": rng.randint(5, 200), "icon": "mdi:gift"}
+        for n in range(30)
+    ]
+
+    tasks: List[Dict[str, Any]] = []
+
+    def _task(**fields) -> Dict[str, Any]:
+        row = {
+            "id": f"task-{len(tasks)}",
+            "title": f"Chore {len(tasks)}",
+            "points": rng.randint(1, 20),
+            "created": _iso(today),
+            "categories": [rng.choice(categories)["id"]],
+        }
+        row.update(fields)
+        tasks.append(row)
+        return row
+
+    fixed = 2 + profile.children
+    templates = max(1, int(profile.tasks * TEMPLATE_SHARE))
+    open_count = max(1, int(profile.tasks * OPEN_SHARE))
+    history = max(0, profile.tasks - templates - open_count - fixed)
+
+    for _ in range(templates):
+        mode = rng.choice(["", "", "weekly", "monthly"])
+        _task(
+            schedule_mode=mode,
+            repeat_days=sorted(rng.sample(range(7), rng.randint(1, 4))) if not mode else [],
+            repeat_child_ids=rng.sample(child_ids, min(len(child_ids), rng.randint(1, 3))),
+        )
+    for _ in range(open_count):
+        due = today + timedelta(days=rng.randint(-3, 3))
+        status = rng.choice(["assigned", "assigned", "in_progress", "awaiting_approval"])
+        _task(
+            assigned_to=rng.choice(child_ids),
+            status=status,
+            created=_iso(min(due, today)),
+            due=due.isoformat(),
+            completed_ts=_ms(due) if status == "awaiting_approval" else None,
+            persist_until_completed=rng.random() < 0.3,
+        )
+    for _ in range(history):
+        day = today - timedelta(days=rng.randint(1, HISTORY_DAYS))
+        _task(
+            assigned_to=rng.choice(child_ids),
+            status="approved",
+            created=_iso(day, 7),
+            due=day.isoformat(),
+            completed_ts=_ms(day, 17),
+            approved_at=_iso(day, 19),
+        )
+
+    _task(id="bench-awaiting", assigned_to=child_ids[0], status="awaiting_approval",
+          due=today.isoformat(), completed_ts=_ms(today, 8))
+    _task(id="bench-fw", fastest_wins=True)
+    for n, cid in enumerate(child_ids):
+        _task(id=f"bench-fw-{n}", assigned_to=cid, status="assigned", due=today.isoformat(),
+              fastest_wins=True, fastest_wins_template_id="bench-fw")
+
+    purchases = []
+    for n in range(profile.purchases):
+        item = rng.choice(items)
+        child = rng.choice(children)
+        day = today - timedelta(days=rng.randint(0, HISTORY_DAYS))
+        purchases.append({
+            "id": f"purchase-{n}",
+            "child_id": child["id"],
+            "item_id": item["id"],
+            "title": item["title"],
+            "price": item["price"],
+            "icon": item["icon"],
+            "ts": _iso(day, rng.randint(8, 20)),
+            "child_name": child["name"],
+        })
+
+    return {
+        "children": children,
+        "tasks": tasks,
+        "categories": categories,
+        "items": items,
+        "purchases": purchases,
+        "earned_backfill_done": True,
+        "last_rollover_date": (today - timedelta(days=1)).isoformat(),
+    }
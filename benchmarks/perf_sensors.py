@@ -0,0 +1,55 @@
+"""Sensor attribute builds; these run on every state write."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+
+def _attributes(sensor):
+    return sensor.extra_state_attributes
+
+
+def test_child_sensor_attributes(bench, new_store):
+    from custom_components.chores4kids.sensor import KidsChoresPointsSensor
+
+    async def setup():
+        return KidsChoresPointsSensor(await new_store(), "child-0")
+
+    bench("sensor.child.attributes", _attributes, setup)
+
+
+def test_tasks_sensor_attributes(bench, new_store):
+    from custom_components.chores4kids.sensor import Chores4KidsAllTasksSensor
+
+    async def setup():
+        return Chores4KidsAllTasksSensor(await new_store())
+
+    bench("sensor.tasks.attributes", _attributes, setup)
+
+
+def test_shop_sensor_attributes(bench, new_store):
+    from custom_components.chores4kids.sensor import Chores4KidsShopSensor
+
+    async def setup():
+        return Chores4KidsShopSensor(await new_store())
+
+    bench("sensor.shop.attributes", _attributes, setup)
+
+
+def test_ui_sensor_attributes(bench, new_store):
+    from custom_components.chores4kids.sensor import Chores4KidsUiSensor
+
+    async def setup():
+        return Chores4KidsUiSensor(await new_store())
+
+    bench("sensor.ui.attributes", _attributes, setup)
+
+
+def test_leaderboard_sensor_attributes(bench, new_store):
+    from custom_components.chores4kids.sensor import Chores4KidsLeaderboardSensor
+
+    async def setup():
+        return Chores4KidsLeaderboardSensor(await new_store(), "month")
+
+    bench("sensor.leaderboard.attributes", _attributes, setup)
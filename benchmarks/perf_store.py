@@ -0,0 +1,47 @@
+"""Store operations: load, save and the mutators the UI hits most."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+
+def test_async_load(bench, new_store):
+    async def setup():
+        return await new_store(load=False)
+
+    bench("store.async_load", lambda store: store.async_load(), setup)
+
+
+def test_async_load_migrate(bench, new_store):
+    # First start after an upgrade: migration, ledger and statistics seeding and one save
+    async def setup():
+        return await new_store(load=False, state="v1")
+
+    bench("store.async_load[migrate v1]", lambda store: store.async_load(), setup)
+
+
+def test_async_save(bench, new_store):
+    bench("store.async_save", lambda store: store.async_save(), new_store)
+
+
+def test_add_task(bench, new_store):
+    bench(
+        "store.add_task",
+        lambda store: store.add_task(title="Benchmark chore", points=5, assigned_to="child-0"),
+        new_store,
+    )
+
+
+def test_set_task_status_fastest_wins(bench, new_store):
+    # Claims the fastest-wins copy of child-0 and marks every sibling copy as taken
+    bench("store.set_task_status[fastest_wins]", lambda store: store.set_task_status("bench-fw-0", "in_progress"), new_store)
+
+
+def test_approve_task(bench, new_store):
+    bench("store.approve_task", lambda store: store.approve_task("bench-awaiting"), new_store)
+
+
+def test_daily_rollover(bench, new_store):
+    # The primed household last rolled over yesterday, so this is one regular night
+    bench("store.daily_rollover", lambda store: store.daily_rollover(), new_store)
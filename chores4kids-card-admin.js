@@ -0,0 +1,1124 @@
+// Chores4Kids card: admin view (task, category and shop editors, admin modals).
+// Imported on demand by chores4kids-card.js the first time an admin card renders,
+// so kid and overview dashboards never download or parse it.
+import { html } from "https://unpkg.com/lit?module";
+import { repeat } from "https://unpkg.com/lit/directives/repeat.js?module";
+
+// Rows rendered per admin table before "show more"; each click adds another page.
+const C4K_ROW_PAGE = 25;
+
+let c4kUploadFile;
+
+class C4kAdminView {
+	_normalizeScheduleFlags(){
+		try{
+			// Carry unfinished cannot be combined with weekly/monthly
+			if (this._persistUntilDone){
+				this._weeklyEnabled = false;
+				this._monthlyEnabled = false;
+			}
+			// Weekly/monthly are mutually exclusive with repeat and with each other
+			if (this._weeklyEnabled){
+				this._monthlyEnabled = false;
+				this._repeatEnabled = false;
+				this._repeatDays = new Set();
+				this._openRepeatMenu = false;
+				this._persistUntilDone = false;
+				this._markOverdue = true;
+			}
+			if (this._monthlyEnabled){
+				this._weeklyEnabled = false;
+				this._repeatEnabled = false;
+				this._repeatDays = new Set();
+				this._openRepeatMenu = false;
+				this._persistUntilDone = false;
+				this._markOverdue = true;
+			}
+			if (this._repeatEnabled){
+				this._weeklyEnabled = false;
+				this._monthlyEnabled = false;
+			}
+		}catch{ /* ignore */ }
+	}
+	_toggleRepeat(e){
+		const enabled = !!(e?.target?.checked);
+		this._repeatEnabled = enabled;
+		if (enabled){
+			this._weeklyEnabled = false;
+			this._monthlyEnabled = false;
+		}
+		if (!enabled){
+			this._repeatDays = new Set();
+			this._repeatAssign = new Set();
+			this._openRepeatMenu = false;
+		}
+		this._normalizeScheduleFlags();
+		this.requestUpdate();
+	}
+	_toggleWeekly(e){
+		const enabled = !!(e?.target?.checked);
+		this._weeklyEnabled = enabled;
+		if (enabled){
+			this._monthlyEnabled = false;
+			this._repeatEnabled = false;
+			this._repeatDays = new Set();
+			this._openRepeatMenu = false;
+			// Weekly/monthly must not be used with carry unfinished
+			this._persistUntilDone = false;
+			this._markOverdue = true;
+		}
+		this._normalizeScheduleFlags();
+		this.requestUpdate();
+	}
+	_toggleMonthly(e){
+		const enabled = !!(e?.target?.checked);
+		this._monthlyEnabled = enabled;
+		if (enabled){
+			this._weeklyEnabled = false;
+			this._repeatEnabled = false;
+			this._repeatDays = new Set();
+			this._openRepeatMenu = false;
+			// Weekly/monthly must not be used with carry unfinished
+			this._persistUntilDone = false;
+			this._markOverdue = true;
+		}
+		this._normalizeScheduleFlags();
+		this.requestUpdate();
+	}
+	_renderAdmin(){
+		const { children } = this._store; const totalKids = children.length;
+		const pointsEnabled = this._pointsEnabled();
+		const showScoreboard = pointsEnabled && (this.config?.show_scoreboard !== false);
+		return html`
+			<ha-card header="${this._t('card.admin_title')}">
+				<div class="card-content">
+					<div class="row">
+						<input placeholder="${this._t('input.new_child_name')}" .value=${this._name||''} @input=${(e)=>this._name=e.target.value} />
+						<button class="btn-primary" @click=${this._addChild}>${this._t('btn.add_child')}</button>
+						${pointsEnabled ? html`<button class="btn-ghost" style="margin-left:auto; min-height:40px;" @click=${()=>this._shopModalOpen=true}>${this._t('shop.open')}</button>` : ''}
+					</div>
+
+					<div class="list section">
+						<h3 class="h3-row">
+							<span class="collapsible" @click=${()=>this._toggleSection('children')}><ha-icon class="chev ${this._isCollapsed('children')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('section.children')} (${totalKids})</span>
+						</h3>
+						${this._isCollapsed('children')? '' : html`<div class="table-wrap"><table class="table-center">
+							<thead><tr><th>${this._t('th.name')}</th>${pointsEnabled ? html`<th>${this._t('th.points')}</th>`:''}<th>${this._t('th.pending')}</th><th>${this._t('th.actions')}</th></tr></thead>
+							<tbody>
+								${children.map((c)=> html`
+									<tr>
+										<td data-label="${this._t('th.name')}">${c.name}</td>
+										${pointsEnabled ? html`<td data-label="${this._t('th.points')}"><b>${c.points}</b></td>`:''}
+										<td data-label="${this._t('th.pending')}"><span class="badge status-awaiting_approval">${(c.tasks||[]).filter(t=>t.status==="awaiting_approval").length}</span></td>
+										<td data-label="${this._t('th.actions')}">
+											<button class="btn-ghost" @click=${()=>this._promptRename(c)}>${this._t('btn.rename')}</button>
+											${pointsEnabled ? html`<button class="btn-ghost" @click=${()=>this._openPoints(c)}>${this._t('btn.add_points')}</button>`:''}
+											${pointsEnabled ? html`<button class="btn-ghost" @click=${()=>this._resetPoints(c)}>${this._t('btn.reset_points')}</button>`:''}
+											<button class="btn-danger" @click=${()=>this._removeChild(c)}>${this._t('btn.delete')}</button>
+										</td>
+									</tr>
+								`)}
+							</tbody>
+						</table></div>`}
+					</div>
+
+					<hr />
+
+					<!-- Categories management -->
+					<div class="list section">
+						<h3 class="h3-row">
+							<span class="collapsible" @click=${()=>this._toggleSection('categories')}><ha-icon class="chev ${this._isCollapsed('categories')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('section.categories')} (${(this._store.categories||[]).length})</span>
+						</h3>
+						${this._isCollapsed('categories')? '' : html`<div class="row">
+							<input placeholder="${this._t('input.new_category_name')}" .value=${this._newCategoryName||''} @input=${(e)=> this._newCategoryName = e.target.value} />
+							<div class="color-cell" style="flex:0 0 auto; align-items:center;">
+								<input type="color" .value=${this._colorInputValue(this._newCategoryColor)} @change=${(e)=>{ this._newCategoryColor = e?.target?.value || ''; }} />
+							</div>
+							<button class="btn-ghost" @click=${this._addCategory}>${this._t('btn.add_category')}</button>
+						</div>
+						<div class="table-wrap"><table class="table-center">
+							<thead><tr><th>${this._t('th.name')}</th><th>${this._t('th.color')}</th><th>${this._t('th.actions')}</th></tr></thead>
+							<tbody>
+								${(this._store.categories||[]).map(cat=> html`
+									<tr>
+										<td data-label="${this._t('th.name')}">${cat.name}</td>
+										<td data-label="${this._t('th.color')}">
+											<div class="color-cell">
+												<input type="color" .value=${this._colorInputValue(cat?.color)} @change=${(e)=>this._setCategoryColor(cat, e)} />
+											</div>
+										</td>
+										<td data-label="${this._t('th.actions')}">
+											<button class="btn-ghost" @click=${()=> this._promptRenameCategory(cat)}>${this._t('btn.rename')}</button>
+											<button class="btn-danger" @click=${()=> this._deleteCategory(cat)}>${this._t('btn.delete')}</button>
+										</td>
+									</tr>
+								`)}
+							</tbody>
+						</table></div>`}
+					</div>
+
+					<hr />
+					<h3 class="h3-row"><span class="collapsible" @click=${()=>this._toggleSection('newtask')}><ha-icon class="chev ${this._isCollapsed('newtask')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('section.new_task')}</span></h3>
+					${this._isCollapsed('newtask')? '' : html`<div class="row fields">
+						<div class="form-field title">
+							<input class="${this._showTitleError? 'invalid':''}" placeholder="${this._t('ph.title')}" .value=${this._taskTitle||''} @input=${e=>{this._taskTitle=e.target.value; this.requestUpdate();}} />
+							<div class="error-space">${this._showTitleError? html`<span class="error-text">${this._t('err.title_required')}</span>`:''}</div>
+						</div>
+						${pointsEnabled ? html`
+							<div class="form-field points">
+								<input class="${this._showPointsError? 'invalid':''}" type="number" placeholder="${this._t('ph.points')}" .value=${this._taskPoints||''} @input=${e=>{this._taskPoints=e.target.value; this.requestUpdate();}} />
+								<div class="error-space">${this._pointsErrorKey? html`<span class="error-text">${this._t(this._pointsErrorKey)}</span>`:''}</div>
+							</div>
+						` : ''}
+					</div>
+					<div class="row"><textarea rows="2" placeholder="${this._t('ph.description')}" .value=${this._taskDesc||''} @input=${e=>this._taskDesc=e.target.value}></textarea></div>
+					<div class="row">
+						<div style="flex:1 1 260px;">
+							<div style="font-size:.9rem; color: var(--secondary-text-color); margin-bottom:4px;">${this._t('ph.categories')}</div>
+							<div class="multi-dd" @click=${(e)=>{ e.stopPropagation(); this._openCategoriesMenu = !this._openCategoriesMenu; }}>
+								<div class="box">
+									<span class="multi-dd-value ${this._taskCategories && this._taskCategories.size ? '' : 'placeholder'}">
+										${(()=>{ const ids=this._taskCategories||new Set(); const names=(this._store.categories||[]).filter(c=> ids.has(c.id)).map(c=>c.name); return names.length? (names.slice(0,2).join(', ')+(names.length>2?` +${names.length-2}`:'')) : this._t('select.categories'); })()}
+									</span>
+									<ha-icon icon="mdi:chevron-down"></ha-icon>
+								</div>
+								${this._openCategoriesMenu ? html`
+									<div class="multi-dd-menu" @click=${e=> e.stopPropagation()}>
+										${(this._store.categories||[]).map(c=> html`<label><input type="checkbox" .checked=${this._taskCategories?.has?.(c.id)} @change=${(e)=>{ const s=this._taskCategories instanceof Set? this._taskCategories : new Set(this._taskCategories||[]); if(e.target.checked){ s.add(c.id);}else{ s.delete(c.id);} this._taskCategories=s; this.requestUpdate(); }} /><span>${c.name}</span></label>`) }
+									</div>
+								` : ''}
+							</div>
+						</div>
+					</div>
+					<div class="row" style="justify-content:flex-start; align-items:flex-start;">
+						<div style="flex:1 1 520px; min-width:260px;">
+							<div style="display:flex; flex-direction:column; gap:6px; align-items:flex-start;">
+								${pointsEnabled ? html`
+									<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
+										<input style="margin:0;" type="checkbox" .checked=${!!this._taskEarlyBonusEnabled} @change=${e=>{ this._taskEarlyBonusEnabled = !!e.target.checked; this.requestUpdate(); }} />
+										<span style="white-space:nowrap;">${this._t('ui.early_bonus_enabled')}</span>
+									</label>
+									<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
+										<input style="margin:0;" type="checkbox" .checked=${!!this._taskBonusEnabled} @change=${e=>{ this._taskBonusEnabled = !!e.target.checked; this.requestUpdate(); }} />
+										<span style="white-space:nowrap;">${this._t('ui.bonus_task')}</span>
+									</label>
+									${this._taskBonusEnabled ? html`
+										<div style="width:100%;">
+											<div class="row fields" style="margin-top:4px;">
+												<div class="form-field">
+													<input placeholder="${this._t('ph.bonus_title')}" .value=${this._taskBonusTitle||''} @input=${e=>{ this._taskBonusTitle=e.target.value; this.requestUpdate(); }} />
+												</div>
+												<div class="form-field">
+													<input type="number" min="0" step="1" placeholder="${this._t('ph.bonus_points')}" .value=${this._taskBonusPoints||''} @input=${e=>{ this._taskBonusPoints=e.target.value; this.requestUpdate(); }} />
+												</div>
+											</div>
+										</div>
+									` : ''}
+									${(!!this._taskEarlyBonusEnabled || String(this._taskDue||'').trim()) ? html`
+										<div style="width:100%;">
+											<div class="row fields" style="margin-top:4px;">
+												<div class="form-field">
+													<input type="date" placeholder="${this._t('ph.due')}" ?disabled=${(!!this._taskEarlyBonusEnabled) && (!!this._repeatEnabled || !!this._weeklyEnabled || !!this._monthlyEnabled)} .value=${this._taskDue||''} @input=${e=>{ this._taskDue=e.target.value; this.requestUpdate(); }} />
+													<div class="error-space">${((!!this._taskEarlyBonusEnabled) && (!!this._repeatEnabled || !!this._weeklyEnabled || !!this._monthlyEnabled)) ? html`<span class="error-text">${this._t('warn.schedule_overrides_due')}</span>` : ''}</div>
+												</div>
+												${this._taskEarlyBonusEnabled ? html`
+													<div class="form-field">
+														<input type="number" min="0" step="1" placeholder="${this._t('ph.early_bonus_days')}" .value=${this._taskEarlyBonusDays||''} @input=${e=>{ this._taskEarlyBonusDays=e.target.value; this.requestUpdate(); }} />
+													</div>
+												` : html`<div class="form-field"></div>`}
+											</div>
+											${this._taskEarlyBonusEnabled ? html`
+												<div class="row fields">
+													<div class="form-field">
+														<input type="number" min="0" step="1" placeholder="${this._t('ph.early_bonus_points')}" .value=${this._taskEarlyBonusPoints||''} @input=${e=>{ this._taskEarlyBonusPoints=e.target.value; this.requestUpdate(); }} />
+													</div>
+													<div class="form-field"></div>
+												</div>
+											` : ''}
+										</div>
+									` : ''}
+								` : ''}
+									<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
+																	<input style="margin:0;" type="checkbox" .checked=${!!this._persistUntilDone} ?disabled=${!!this._weeklyEnabled || !!this._monthlyEnabled} @change=${e=>{ this._persistUntilDone = !!e.target.checked; this._normalizeScheduleFlags(); this.requestUpdate(); }} />
+																	<span style="white-space:nowrap;">${this._t('ui.persist_until_done')}</span>
+																</label>
+																${this._persistUntilDone ? html`
+																	<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin-left:24px; font-size:.9rem; width:fit-content; text-align:left;">
+																		<input style="margin:0;" type="checkbox" .checked=${this._markOverdue!==false} @change=${e=>{ this._markOverdue = !!e.target.checked; this.requestUpdate(); }} />
+																		<span style="white-space:nowrap;">${this._t('ui.mark_overdue')}</span>
+																	</label>
+																` : ''}
+								<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
+									<input style="margin:0;" type="checkbox" .checked=${!!this._quickComplete} @change=${e=>{ this._quickComplete = !!e.target.checked; }} />
+									<span style="white-space:nowrap;">${this._t('ui.quick_complete')}</span>
+								</label>
+								<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
+									<input style="margin:0;" type="checkbox" .checked=${!!this._skipApproval} @change=${e=>{ this._skipApproval = !!e.target.checked; }} />
+									<span style="white-space:nowrap;">${this._t('ui.skip_approval')}</span>
+								</label>
+								<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
+									<input style="margin:0;" type="checkbox" .checked=${!!this._fastestWins} @change=${e=>{ this._fastestWins = !!e.target.checked; }} />
+									<span style="white-space:nowrap;">${this._t('ui.fastest_wins')}</span>
+								</label>
+								<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
+																	<input style="margin:0;" type="checkbox" .checked=${!!this._repeatEnabled} ?disabled=${(!!this._weeklyEnabled || !!this._monthlyEnabled) && !this._repeatEnabled} @change=${this._toggleRepeat} />
+									<span style="white-space:nowrap;">${this._t('repeat.enable')}</span>
+								</label>
+																<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
+																	<input style="margin:0;" type="checkbox" .checked=${!!this._weeklyEnabled} ?disabled=${!!this._persistUntilDone || ((!!this._repeatEnabled || !!this._monthlyEnabled) && !this._weeklyEnabled)} @change=${this._toggleWeekly} />
+																	<span style="white-space:nowrap;">${this._t('schedule.weekly')}</span>
+																</label>
+																<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
+																	<input style="margin:0;" type="checkbox" .checked=${!!this._monthlyEnabled} ?disabled=${!!this._persistUntilDone || ((!!this._repeatEnabled || !!this._weeklyEnabled) && !this._monthlyEnabled)} @change=${this._toggleMonthly} />
+																	<span style="white-space:nowrap;">${this._t('schedule.monthly')}</span>
+																</label>
+							</div>
+															${this._repeatEnabled ? html`
+								<div class="repeat-line">
+									<div class="repeat-days">
+										<div style="font-size:.9rem; color: var(--secondary-text-color); margin-bottom:4px;">${this._t('repeat.label')}</div>
+										<div class="days">
+											${['mon','tue','wed','thu','fri','sat','sun'].map(k=> html`
+												<span class="day ${this._repeatDays.has(k)?'on':''}" @click=${()=>{ const s=this._repeatDays; s.has(k)?s.delete(k):s.add(k); this.requestUpdate(); }}>${this._t('repeat.days.'+k)}</span>
+											`)}
+										</div>
+									</div>
+									<div class="repeat-assign">
+										<div style="font-size:.9rem; color: var(--secondary-text-color); margin-bottom:4px;">${this._t('repeat.auto_assign')}</div>
+										<div class="multi-dd" @click=${(e)=>{ e.stopPropagation(); this._openRepeatMenu = !this._openRepeatMenu; }}>
+											<div class="box">
+												<span class="multi-dd-value ${this._repeatAssign && this._repeatAssign.size ? '' : 'placeholder'}">
+													${(()=>{ const ids=this._repeatAssign||new Set(); const names=children.filter(c=>ids.has(c.id)).map(c=>c.name); return names.length? (names.slice(0,2).join(', ')+(names.length>2?` +${names.length-2}`:'')) : '—'; })()}
+												</span>
+												<ha-icon icon="mdi:chevron-down"></ha-icon>
+											</div>
+											${this._openRepeatMenu ? html`
+												<div class="multi-dd-menu" @click=${e=> e.stopPropagation()}>
+													${children.map(c=> html`<label><input type="checkbox" .checked=${this._repeatAssign?.has?.(c.id)} @change=${(e)=>{ const s=this._repeatAssign instanceof Set? this._repeatAssign : new Set(this._repeatAssign||[]); if(e.target.checked){ s.add(c.id);}else{ s.delete(c.id);} this._repeatAssign=s; this.requestUpdate(); }} /><span>${c.name}</span></label>`)}
+												</div>
+											` : ''}
+										</div>
+									</div>
+								</div>
+							` : ''}
+						</div>
+					</div>
+					<div class="row">
+						<button type="button" class="btn-ghost" @click=${()=> this._openIconPicker()}>${this._t('icon.choose')}</button>
+						${this._editingTask ? html`
+							<button class="btn-primary" ?disabled=${this._hasFormErrors} @click=${this._saveEditedTask}>${this._t('btn.update_task')}</button>
+							<span style="font-size:.9rem; color: var(--secondary-text-color);">${this._t('editor.loaded_task')}</span>
+						` : html`
+							<button class="btn-primary" ?disabled=${this._hasFormErrors} @click=${this._createTask}>${this._t('btn.create_task')}</button>
+						`}
+					</div>
+				`}
+
+
+					<hr />
+					<h3 class="h3-row">
+						<span class="collapsible" @click=${()=>this._toggleSection('tasks')}><ha-icon class="chev ${this._isCollapsed('tasks')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('section.tasks')}</span>
+						<button class="btn-ghost icon-btn" title="${this._t('sort.configure')}" @click=${()=> this._sortModalOpen = true}><ha-icon icon="mdi:sort-variant"></ha-icon></button>
+					</h3>
+					${this._isCollapsed('tasks')? '' : (()=>{
+						const unassigned = this._memo('unassignedSorted', [this._store.allTasks, this._catOrderMemo()], ()=> this._sortTasks(this._store.allTasks.filter(t=>!t.assigned_to), false));
+						const { rows, more } = this._windowRows('unassigned', unassigned);
+						return html`<div class="table-wrap"><table class="table-center">
+						<thead><tr><th>${this._t('ph.title')}</th>${pointsEnabled ? html`<th>${this._t('ph.points')}</th>`:''}<th>${this._t('th.categories')}</th><th class="assign-col">${this._t('th.assign')}</th><th>${this._t('th.actions')}</th></tr></thead>
+						<tbody @click=${()=>{ this._openAssignMenuFor = null; this._assignMenuStyle=''; }}>
+										${repeat(rows, (t)=> t.id, (t)=> html`
+								<tr data-task="${t.id}">
+									<td data-label="${this._t('ph.title')}">${t.title}${String(t?.bonus_title||'').trim() ? ` • ${this._t('lbl.bonus')}: ${String(t?.bonus_title||'').trim()}` : ''}${t.icon? html` <ha-icon class="inline-ico" icon="${t.icon}"></ha-icon>`:''}</td>
+								${pointsEnabled ? html`<td data-label="${this._t('ph.points')}"><b>${t.points}</b></td>`:''}
+									<td data-label="${this._t('th.categories')}">
+										${(()=>{ const ids=Array.isArray(t.categories)? t.categories:[]; const cats=this._orderedCategories(ids); return cats.length? cats.map(c=> this._renderCategoryChip(c)) : html`—`; })()}
+									</td>
+												<td class="assign-cell" data-label="${this._t('th.assign')}">
+													${this._autoAssignActive(t) ? (()=>{
+														const ids = (Array.isArray(t.repeat_child_ids)&&t.repeat_child_ids.length)? t.repeat_child_ids : (t.repeat_child_id? [t.repeat_child_id]:[]);
+														const names = this._store.children.filter(c=> ids.includes(c.id)).map(c=> c.name);
+														return html`<span>${this._t('assign.auto_to',{names: (names.length? names.join(', ') : '—')})}</span>`;
+													})() : html`
+													<div class="multi-dd task-assign-dd" @click=${(e)=>{ e.stopPropagation(); const open = this._openAssignMenuFor===t.id? null : t.id; this._openAssignMenuFor = open; if (open){ try{ const box=e.currentTarget.querySelector('.box'); const r=box.getBoundingClientRect(); this._assignMenuStyle=`position:fixed;left:${Math.round(r.left)}px;top:${Math.round(r.bottom+4)}px;width:${Math.round(r.width)}px;z-index:200000`; }catch{ this._assignMenuStyle=''; } } else { this._assignMenuStyle=''; } }}>
+														<div class="box"><span class="multi-dd-value placeholder">${this._t('select.assign_child')}</span><ha-icon icon="mdi:chevron-down"></ha-icon></div>
+														${this._openAssignMenuFor===t.id ? html`
+															<div class="multi-dd-menu" style="${this._assignMenuStyle||''}" @click=${e=> e.stopPropagation()}>
+																${this._store.children.map(c=> html`<label><input class="c4k-assign" type="checkbox" value=${c.id} @change=${(e)=> this._updateAssignSummary(t.id, t)} /><span>${c.name}</span></label>`)}
+															</div>
+														`: ''}
+													</div>`}
+												</td>
+									<td data-label="${this._t('th.actions')}">
+														${(this._weeklyEnabled || this._monthlyEnabled) ? html`
+															<div class="repeat-line">
+																<div class="repeat-assign">
+																	<div style="font-size:.9rem; color: var(--secondary-text-color); margin-bottom:4px;">${this._t('repeat.auto_assign')}</div>
+																	<div class="multi-dd" @click=${(e)=>{ e.stopPropagation(); this._openRepeatMenu = !this._openRepeatMenu; }}>
+																		<div class="box">
+																			<span class="multi-dd-value ${this._repeatAssign && this._repeatAssign.size ? '' : 'placeholder'}">
+																				${(()=>{ const ids=this._repeatAssign||new Set(); const names=children.filter(c=>ids.has(c.id)).map(c=>c.name); return names.length? (names.slice(0,2).join(', ')+(names.length>2?` +${names.length-2}`:'')) : '—'; })()}
+																			</span>
+																			<ha-icon icon="mdi:chevron-down"></ha-icon>
+																		</div>
+																		${this._openRepeatMenu ? html`
+																			<div class="multi-dd-menu" @click=${e=> e.stopPropagation()}>
+																				${children.map(c=> html`<label><input type="checkbox" .checked=${this._repeatAssign?.has?.(c.id)} @change=${(e)=>{ const s=this._repeatAssign instanceof Set? this._repeatAssign : new Set(this._repeatAssign||[]); if(e.target.checked){ s.add(c.id);}else{ s.delete(c.id);} this._repeatAssign=s; this.requestUpdate(); }} /><span>${c.name}</span></label>`)}
+																			</div>
+																		` : ''}
+																	</div>
+																</div>
+															</div>
+														` : ''}
+										<button class="btn-ghost" @click=${()=> this._editTask(t)}>${this._t('btn.edit')}</button>
+										<button class="btn-primary" ?disabled=${this._autoAssignActive(t)} title="${this._autoAssignActive(t)? this._t('assign.disabled_auto') : ''}" @click=${()=> {
+											const row = this.shadowRoot.querySelector(`tr[data-task="${t.id}"]`);
+											const checkedNow = Array.from(row?.querySelectorAll('.c4k-assign:checked')||[]).map(i=> i.value);
+											const ids = (Array.isArray(t._assignToMulti) && t._assignToMulti.length) ? t._assignToMulti : checkedNow;
+											this._assignTaskMulti(t, ids);
+										}}>${this._t('btn.assign')}</button>
+										<button class="btn-danger" @click=${()=> this._deleteTask(t.id)}>${this._t('btn.delete')}</button>
+									</td>
+								</tr>
+							`)}
+						</tbody>
+						</table></div>${this._renderMoreRows('unassigned', more)}`;
+					})()}
+
+					<hr />
+					<h3 class="h3-row">
+						<span class="collapsible" @click=${()=>this._toggleSection('overview')}><ha-icon class="chev ${this._isCollapsed('overview')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('overview.title')}</span>
+						<button class="btn-ghost icon-btn" title="${this._t('sort.configure')}" @click=${()=> this._sortModalOpen = true}><ha-icon icon="mdi:sort-variant"></ha-icon></button>
+					</h3>
+					${this._isCollapsed('overview')? '' : (()=>{
+						const allAssigned=(this._store.allTasks||[]).filter(t=>!!t.assigned_to);
+						const active=allAssigned.filter(t=>!['approved','awaiting_approval','taken'].includes(this._effectiveStatus(t)));
+						if(!active.length) return html`<i>${this._t('overview.none_active')}</i>`;
+						const sorted=this._sortTasks(active, true);
+						const top=sorted.slice(0,3); const pending=allAssigned.filter(t=>t.status==='awaiting_approval').length;
+						const row=(t)=> html`<tr>
+							<td data-label="${this._t('ph.title')}">${t.title}${String(t?.bonus_title||'').trim() ? ` • ${this._t('lbl.bonus')}: ${String(t?.bonus_title||'').trim()}` : ''}${t.icon? html` <ha-icon class="inline-ico" icon="${t.icon}"></ha-icon>`:''}</td>
+							${pointsEnabled ? html`<td data-label="${this._t('ph.points')}"><b>${t.points}</b></td>`:''}
+							<td data-label="${this._t('th.categories')}">${(()=>{ const ids=Array.isArray(t.categories)? t.categories:[]; const names=this._orderedCategoryNames(ids); return names.length? names.map(n=> html`<span class='chip'>${n}</span>`): html`—`; })()}</td>
+							<td data-label="${this._t('th.status')}">${this._renderStatusBadge(t)}</td>
+							<td data-label="${this._t('th.completed')}">${(()=>{ const ts=this._displayedTsFor(t); if(!ts) return html`—`; const dt=this._fmtDateTime(ts); return html`${dt.formatted}`; })()}</td>
+							<td data-label="${this._t('th.assign')}">${t.assigned_to_name || this._t('status.unassigned')}</td>
+							<td data-label="${this._t('th.actions')}">
+								${t.status==="assigned" ? html`
+									${this._canManualReassign(t) ? html`<button class="btn-ghost" @click=${()=>this._manualReassign(t)}>${this._t('btn.back')}</button>`:''}
+									<button class="btn-danger" @click=${()=>this._deleteTask(t.id)}>${this._t('btn.delete')}</button>
+								`: t.status==="in_progress" ? html`
+									<button class="btn-ghost" @click=${()=>this._setStatus(t.id,'awaiting_approval')}>${this._t('btn.awaiting')}</button>
+									<button class="btn-ghost" @click=${()=>this._setStatus(t.id,'assigned')}>${this._t('btn.back')}</button>
+									<button class="btn-danger" @click=${()=>this._deleteTask(t.id)}>${this._t('btn.delete')}</button>
+								`: t.status==="awaiting_approval" ? html`
+									${this._renderAwaitingActions(t)}
+								`: html`${this._renderBonusApproveBtn(t)}${this._canManualReassign(t) ? html`<button class="btn-ghost" @click=${()=>this._manualReassign(t)}>${this._t('btn.back')}</button>`:''}<button class="btn-danger" @click=${()=>this._deleteTask(t.id)}>${this._t('btn.delete')}</button>`}
+							</td>
+						</tr>`;
+						return html`
+							<div class="table-wrap"><table class="table-center table-fixed">${this._renderAssignedFinishedColgroup()}
+								<thead><tr><th>${this._t('ph.title')}</th>${pointsEnabled ? html`<th>${this._t('ph.points')}</th>`:''}<th>${this._t('th.categories')}</th><th>${this._t('th.status')}</th><th>${this._t('th.completed')}</th><th>${this._t('th.assign')}</th><th>${this._t('th.actions')}</th></tr></thead>
+								<tbody>${top.map(row)}</tbody>
+							</table></div>
+							<div class="row" style="justify-content:flex-end;">${active.length>3? html`<button class="btn-primary" @click=${()=>this._tasksModalOpen=true}>${this._t('overview.show_all',{pending})}</button>`:''}</div>
+						`;
+					})()}
+
+					<h3 class="h3-row">
+						<span class="collapsible" @click=${()=>this._toggleSection('awaiting')}><ha-icon class="chev ${this._isCollapsed('awaiting')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('lbl.awaiting')}</span>
+					</h3>
+					${this._isCollapsed('awaiting')? '' : (()=>{
+						const allAssigned=(this._store.allTasks||[]).filter(t=>!!t.assigned_to);
+						const awaiting=allAssigned.filter(t=>this._effectiveStatus(t)==='awaiting_approval');
+						if(!awaiting.length) return html`<i>${this._t('overview.none_active')}</i>`;
+						const { rows, more } = this._windowRows('awaiting', this._sortTasks(awaiting, true));
+						const row=(t)=> html`<tr>
+							<td data-label="${this._t('ph.title')}">${t.title}${String(t?.bonus_title||'').trim() ? ` • ${this._t('lbl.bonus')}: ${String(t?.bonus_title||'').trim()}` : ''}${t.icon? html` <ha-icon class="inline-ico" icon="${t.icon}"></ha-icon>`:''}</td>
+							${pointsEnabled ? html`<td data-label="${this._t('ph.points')}"><b>${t.points}</b></td>`:''}
+							<td data-label="${this._t('th.categories')}">${(()=>{ const ids=Array.isArray(t.categories)? t.categories:[]; const names=this._orderedCategoryNames(ids); return names.length? names.map(n=> html`<span class='chip'>${n}</span>`): html`—`; })()}</td>
+							<td data-label="${this._t('th.status')}">${this._renderStatusBadge(t)}</td>
+							<td data-label="${this._t('th.completed')}">${(()=>{ const ts=this._displayedTsFor(t); if(!ts) return html`—`; const dt=this._fmtDateTime(ts); return html`${dt.formatted}`; })()}</td>
+							<td data-label="${this._t('th.assign')}">${t.assigned_to_name || this._t('status.unassigned')}</td>
+							<td data-label="${this._t('th.actions')}">
+								${this._renderAwaitingActions(t)}
+							</td>
+						</tr>`;
+						return html`
+							<div class="table-wrap"><table class="table-center table-fixed">${this._renderAssignedFinishedColgroup()}
+								<thead><tr><th>${this._t('ph.title')}</th>${pointsEnabled ? html`<th>${this._t('ph.points')}</th>`:''}<th>${this._t('th.categories')}</th><th>${this._t('th.status')}</th><th>${this._t('th.completed')}</th><th>${this._t('th.assign')}</th><th>${this._t('th.actions')}</th></tr></thead>
+								<tbody>${repeat(rows, (t)=> t.id, row)}</tbody>
+							</table></div>
+							${this._renderMoreRows('awaiting', more)}
+						`;
+					})()}
+
+					<h3 class="h3-row">
+						<span class="collapsible" @click=${()=>this._toggleSection('finished')}><ha-icon class="chev ${this._isCollapsed('finished')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('overview.finished_title')}</span>
+					</h3>
+					${this._isCollapsed('finished')? '' : (()=>{
+						const allAssigned=(this._store.allTasks||[]).filter(t=>!!t.assigned_to);
+						const finished=allAssigned.filter(t=>['approved','taken'].includes(this._effectiveStatus(t)));
+						if(!finished.length) return html`<i>${this._t('overview.finished_none')}</i>`;
+						const { rows, more } = this._windowRows('finished', this._sortTasks(finished, true));
+						const row=(t)=> html`<tr>
+							<td data-label="${this._t('ph.title')}">${t.title}${String(t?.bonus_title||'').trim() ? ` • ${this._t('lbl.bonus')}: ${String(t?.bonus_title||'').trim()}` : ''}${t.icon? html` <ha-icon class="inline-ico" icon="${t.icon}"></ha-icon>`:''}</td>
+							${pointsEnabled ? html`<td data-label="${this._t('ph.points')}"><b>${t.points}</b></td>`:''}
+							<td data-label="${this._t('th.categories')}">${(()=>{ const ids=Array.isArray(t.categories)? t.categories:[]; const names=this._orderedCategoryNames(ids); return names.length? names.map(n=> html`<span class='chip'>${n}</span>`): html`—`; })()}</td>
+								<td data-label="${this._t('th.status')}">${this._renderStatusBadge(t)}</td>
+							<td data-label="${this._t('th.completed')}">${(()=>{ const ts=this._displayedTsFor(t); if(!ts) return html`—`; const dt=this._fmtDateTime(ts); return html`${dt.formatted}`; })()}</td>
+							<td data-label="${this._t('th.assign')}">${t.assigned_to_name || this._t('status.unassigned')}</td>
+							<td data-label="${this._t('th.actions')}">
+								${t.status==="awaiting_approval" ? html`
+									${this._renderAwaitingActions(t)}
+								` : html`
+									${this._renderBonusApproveBtn(t)}
+									${this._canManualReassign(t) ? html`<button class="btn-ghost" @click=${()=>this._manualReassign(t)}>${this._t('btn.back')}</button>`:''}
+									<button class="btn-danger" @click=${()=>this._deleteTask(t.id)}>${this._t('btn.delete')}</button>
+								`}
+							</td>
+						</tr>`;
+						return html`
+							<div class="table-wrap"><table class="table-center table-fixed">${this._renderAssignedFinishedColgroup()}
+								<thead><tr><th>${this._t('ph.title')}</th>${pointsEnabled ? html`<th>${this._t('ph.points')}</th>`:''}<th>${this._t('th.categories')}</th><th>${this._t('th.status')}</th><th>${this._t('th.completed')}</th><th>${this._t('th.assign')}</th><th>${this._t('th.actions')}</th></tr></thead>
+								<tbody>${repeat(rows, (t)=> t.id, row)}</tbody>
+							</table></div>
+							${this._renderMoreRows('finished', more)}
+						`;
+					})()}
+
+				${showScoreboard ? html`
+					<hr />
+					<h3 class="h3-row"><span class="collapsible" @click=${()=>this._toggleSection('scoreboard')}><ha-icon class="chev ${this._isCollapsed('scoreboard')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('section.scoreboard')}</span></h3>
+					${this._isCollapsed('scoreboard')? '' : html`
+						<ol style="display:grid; gap:8px; padding-left:18px;">
+							${[...children].sort((a,b)=>b.points-a.points).map((c,i)=> html`
+								<li style="display:flex; align-items:center; gap:10px;"><span class="badge status-in_progress">#${i+1}</span><span style="flex:1;">${c.name}</span><b>${c.points}</b></li>
+							`)}
+						</ol>
+					`}
+				` : ''}
+				</div>
+
+				${pointsEnabled ? this._renderPointsModal() : ''}
+				${this._renderAllTasksModal()}
+				${pointsEnabled ? this._renderShopModal() : ''}
+			${this._renderAdvancedModal()}
+			${this._renderSortModal()}
+				${this._renderReassignModal()}
+		</ha-card>
+		${this._chunkReady('icons') ? html`${this._renderIconModal()}${this._renderCustomIconModal()}` : ''}
+	`;
+	}
+	_renderPointsModal(){
+		return html`<div class="overlay ${this._pointsChild?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._closePoints(); }}>
+			<div class="modal" @click=${e=>e.stopPropagation()}>
+				<h3>${this._pointsChild ? this._t('points.title', { name: this._pointsChild.name }) : ''}</h3>
+				<div style="font-size:.85rem; color: var(--secondary-text-color);">${this._t('points.quick')}</div>
+				<div class="row" style="gap:8px;">${[5,10,15,20].map(n=> html`<button class="btn-primary" @click=${()=>this._addPointsQuick(n)}>+${n}</button>`)}</div>
+				<div style="font-size:.85rem; color: var(--secondary-text-color);">${this._t('points.remove')}</div>
+				<div class="row" style="gap:8px;">${[5,10,15,20].map(n=> html`<button class="btn-danger" @click=${()=>this._addPointsQuick(-n)}>−${n}</button>`)}</div>
+				<div style="font-size:.85rem; color: var(--secondary-text-color);">${this._t('points.custom')}</div>
+				<div class="row" style="gap:6px; align-items:center;">
+					<input type="number" .value=${String(this._pointsValue||0)} @input=${e=> this._pointsValue = Number(e.target.value||0)} style="max-width:120px;" />
+					<button class="btn-primary" @click=${()=>this._addPointsQuick(this._pointsValue||0)}>${this._t('form.add')}</button>
+					<button class="btn-ghost" @click=${this._closePoints}>${this._t('form.cancel')}</button>
+				</div>
+			</div>
+		</div>`;
+	}
+	_renderShopModal(){
+		if (!this._pointsEnabled()) return '';
+		const history = this._shopModalOpen ? this._purchaseHistory() : { rows: [], more: 0 };
+		return html`<div class="overlay shop-admin-overlay ${this._shopModalOpen?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._shopModalOpen=false; }}>
+			<div class="modal shop-modal shop-admin-modal" @click=${e=>e.stopPropagation()}>
+                <h3>${this._t('shop.title')}</h3>
+				<div class="row fields">
+					<div class="form-field title"><input placeholder="${this._t('shop.item')}" .value=${this._shopTitle||''} @input=${e=>this._shopTitle=e.target.value} /></div>
+					<div class="form-field points"><input type="number" placeholder="${this._t('shop.price')}" .value=${this._shopPrice||''} @input=${e=>this._shopPrice=e.target.value} /></div>
+				</div>
+				<div class="shop-add-row">
+					<div class="shop-add-left">
+						${this._shopImage ? html`<img class="img-preview" src="${this._resolveUrl(this._shopImage)}" alt="preview" loading="lazy" decoding="async"/>` : html`<div class="img-preview" style="display:grid;place-items:center;color:var(--secondary-text-color);">${this._t('shop.image')}</div>`}
+						<input id="c4k-shop-file" class="file-hidden" type="file" accept="image/*" @change=${this._onPickImage} />
+						<button class="btn-ghost" @click=${()=> this.shadowRoot.getElementById('c4k-shop-file')?.click()}>${this._t('shop.upload')}</button>
+					</div>
+					<button class="btn-primary" style="flex:0 0 auto;" @click=${this._addShopItem}>${this._t('shop.add_item')}</button>
+				</div>
+								<div class="table-wrap desktop-only"><table class="table-center">
+					<thead><tr><th>${this._t('shop.item')}</th><th>${this._t('shop.price')}</th><th>${this._t('shop.active')}</th><th>${this._t('th.actions')}</th></tr></thead>
+					<tbody>
+						${this._store.items.map(i=> html`
+							${this._editItem && this._editItem.id===i.id ? html`
+								<tr>
+									<td data-label="${this._t('shop.item')}"><div style="display:flex; align-items:center; gap:8px;">${this._editItem.image? html`<img class="img-preview" style="width:36px;height:36px;" src="${this._resolveUrl(this._editItem.image)}" loading="lazy" decoding="async">`:''}<input style="max-width:220px;" .value=${this._editItem.title||''} @input=${e=> this._editItem={...this._editItem, title:e.target.value}} /><input type="file" accept="image/*" @change=${this._onPickEditImage} /></div></td>
+									<td data-label="${this._t('shop.price')}"><input type="number" style="max-width:120px;" .value=${this._editItem.price||0} @input=${e=> this._editItem={...this._editItem, price:Number(e.target.value||0)}} /></td>
+									<td data-label="${this._t('shop.active')}"><input type="checkbox" .checked=${this._editItem.active!==false} @change=${e=> this._editItem={...this._editItem, active: e.target.checked}} /></td>
+									<td data-label="${this._t('th.actions')}"><button class="btn-primary" @click=${this._saveEditItem}>${this._t('form.save')}</button><button class="btn-ghost" @click=${()=>{this._editItem=null; this.requestUpdate();}}>${this._t('form.cancel')}</button></td>
+								</tr>
+							`: html`
+								<tr>
+									<td data-label="${this._t('shop.item')}">${i.image? html`<img class="img-preview" style="width:36px;height:36px;margin-right:6px;vertical-align:middle;" src="${this._imageUrl(i, 'thumb')}" loading="lazy" decoding="async">`:''}${i.title}</td>
+									<td data-label="${this._t('shop.price')}"><b>${i.price}</b></td>
+									<td data-label="${this._t('shop.active')}"><input type="checkbox" .checked=${i.active!==false} @change=${e=> this._toggleItemActive(i,e)} /></td>
+									<td data-label="${this._t('th.actions')}"><button class="btn-ghost" @click=${()=> this._startEditItem(i)}>${this._t('btn.edit')}</button><button class="btn-ghost" @click=${()=> this._openAdvanced(i)}>${this._t('shop.advanced')}</button><button class="btn-danger" @click=${()=>this._deleteShopItem(i.id)}>${this._t('btn.delete')}</button></td>
+								</tr>
+							`}
+						`)}
+					</tbody>
+				</table></div>
+								<!-- Mobile cards for items -->
+								<div class="mobile-only mobile-only-grid">
+									${this._store.items.map(i=> html`
+										<div class="shop-admin-card">
+											<div class="shop-admin-head">
+												${i.image? html`<img src="${this._imageUrl(i, 'thumb')}" alt="${i.title}" loading="lazy" decoding="async">` : html`<div class="img-preview" style="width:44px;height:44px;display:grid;place-items:center;">?</div>`}
+												<div class="shop-admin-meta">
+													<div class="shop-admin-title">${i.title}</div>
+													<div class="shop-admin-price">${i.price}</div>
+												</div>
+																								<label class="shop-admin-toggle">
+																									<span>${this._t('shop.active')}</span>
+																									<ha-switch .checked=${i.active!==false} @change=${e=> this._toggleItemActive(i,e)}></ha-switch>
+																								</label>
+											</div>
+											<div class="shop-admin-actions">
+												<button class="btn-ghost" @click=${()=> this._startEditItem(i)}>${this._t('btn.edit')}</button>
+												<button class="btn-ghost" @click=${()=> this._openAdvanced(i)}>${this._t('shop.advanced')}</button>
+												<button class="btn-danger" @click=${()=> this._deleteShopItem(i.id)}>${this._t('btn.delete')}</button>
+											</div>
+										</div>
+									`)}
+								</div>
+				<div class="row" style="align-items:center; justify-content:space-between; margin-top:12px;">
+					<h3 style="margin:0;">${this._t('shop.history')}</h3>
+					${(this._store.purchases||[]).length ? html`<button class="btn-danger" @click=${this._clearShopHistory}>${this._t('shop.clear_history')}</button>`:''}
+				</div>
+								<div class="table-wrap desktop-only"><table class="table-center">
+					<thead><tr><th>${this._t('shop.date')}</th><th>${this._t('shop.time')}</th><th>${this._t('shop.child')}</th><th>${this._t('shop.item')}</th><th>${this._t('shop.price')}</th></tr></thead>
+					<tbody>
+						${repeat(history.rows, (p)=> p.id, (p)=> { const dt=this._fmtDateTime(p.ts); return html`<tr>
+							<td data-label="${this._t('shop.date')}">${dt.date}</td>
+							<td data-label="${this._t('shop.time')}">${dt.time}</td>
+							<td data-label="${this._t('shop.child')}">${p.child_name||p.child_id}</td>
+							<td data-label="${this._t('shop.item')}">${p.title}</td>
+							<td data-label="${this._t('shop.price')}"><b>${p.price}</b></td>
+						</tr>`; })}
+					</tbody>
+				</table></div>
+								<!-- Mobile cards for purchases -->
+								<div class="mobile-only mobile-only-grid">
+									${repeat(history.rows, (p)=> p.id, (p)=> { const dt=this._fmtDateTime(p.ts); return html`
+										<div class="purchase-card">
+											<div class="kv"><b>${this._t('shop.date')}</b><span>${dt.date}</span></div>
+											<div class="kv"><b>${this._t('shop.time')}</b><span>${dt.time}</span></div>
+											<div class="kv"><b>${this._t('shop.child')}</b><span>${p.child_name||p.child_id}</span></div>
+											<div class="kv"><b>${this._t('shop.item')}</b><span>${p.title}</span></div>
+											<div class="kv"><b>${this._t('shop.price')}</b><b>${p.price}</b></div>
+										</div>`; })}
+								</div>
+								${this._renderMoreRows('purchases', history.more, ()=> this._showMorePurchases())}
+				<div class="row" style="justify-content:flex-end; margin-top:8px;"><button class="btn-ghost" @click=${()=>this._shopModalOpen=false}>${this._t('form.close')}</button></div>
+			</div>
+		</div>`;
+	}
+	// ----- Windowed rows -----
+	_windowRows(key, list){
+		const size = Math.max(C4K_ROW_PAGE, Number(this._rowWindow?.[key]) || 0);
+		return { rows: list.length > size ? list.slice(0, size) : list, more: Math.max(0, list.length - size) };
+	}
+	_showMoreRows(key){
+		this._rowWindow = { ...(this._rowWindow||{}), [key]: Math.max(C4K_ROW_PAGE, Number(this._rowWindow?.[key]) || 0) + C4K_ROW_PAGE };
+		this.requestUpdate();
+	}
+	_renderMoreRows(key, more, onMore){
+		if (!more) return '';
+		const busy = key === 'purchases' && this._purchasesLoading;
+		return html`<div class="row" style="justify-content:center; margin-top:8px;">
+			<button class="btn-ghost" ?disabled=${busy} @click=${()=> onMore ? onMore() : this._showMoreRows(key)}>${this._t('list.show_more', { n: more })}</button>
+		</div>`;
+	}
+	// Newest purchases come with the shop sensor; older pages are fetched with list_purchases.
+	_purchaseHistory(){
+		const store = this._store;
+		const recent = this._memo('recentPurchases', [store.purchases], ()=> [...(store.purchases||[])].reverse());
+		const seen = new Set(recent.map(p=> p.id));
+		const all = [...recent, ...(this._olderPurchases||[]).filter(p=> !seen.has(p.id))];
+		const total = Math.max(all.length, Number(store.purchasesTotal) || 0);
+		const { rows } = this._windowRows('purchases', all);
+		return { rows, more: total - rows.length, loaded: all.length };
+	}
+	async _showMorePurchases(){
+		const { rows, loaded } = this._purchaseHistory();
+		if (rows.length < loaded) return this._showMoreRows('purchases');
+		if (this._purchasesLoading) return;
+		this._purchasesLoading = true; this.requestUpdate();
+		try{
+			const res = await this.hass.callWS({ type: 'call_service', domain: 'chores4kids', service: 'list_purchases', service_data: { offset: loaded, limit: C4K_ROW_PAGE * 2 }, return_response: true });
+			const page = res?.response?.purchases || [];
+			this._olderPurchases = [...(this._olderPurchases||[]), ...page];
+			this._showMoreRows('purchases');
+		}catch(err){
+			console.error('Chores4Kids: loading purchases failed', err);
+		}finally{
+			this._purchasesLoading = false; this.requestUpdate();
+		}
+	}
+	_renderAdvancedModal(){
+		return html`<div class="overlay ${this._advItem?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._advItem=null; }}>
+			${this._advItem ? html`<div class="modal" style="max-width: 900px; width: min(95vw, 900px);" @click=${e=>e.stopPropagation()}>
+				<h3>${this._t('shop.advanced')} — ${this._advItem.title}</h3>
+				<div style="font-size:.9rem; color: var(--secondary-text-color); margin-bottom:6px;">${this._t('shop.steps')}</div>
+				<div style="display:grid; gap:8px;">${(this._advSteps||[]).map((st,idx)=> html`
+					<div style="display:grid; grid-template-columns: 1fr auto; gap:8px; align-items:center; border:1px solid var(--divider-color); padding:8px; border-radius:8px;">
+						${st.type==='delay' ? html`<div style="display:flex; gap:8px; align-items:center;"><b>${this._t('shop.delay')}</b><input type="number" style="width:110px;" .value=${st.seconds||0} @input=${e=>{ st.seconds=Number(e.target.value||0); this.requestUpdate(); }} /><span>${this._t('shop.seconds')}</span></div>` : html`
+							<div style="display:flex; gap:8px; align-items:center; flex-wrap:wrap;">
+								<b>${this._t('shop.entity')}</b>
+								<select style="min-width:260px;" .value=${st.entity_id||''} @change=${e=>{ st.entity_id=e.target.value; if(!st.op) st.op = this._defaultOpFor(st.entity_id); this.requestUpdate(); }}>
+									<option value="">—</option>
+									${(()=>{ const ents=Object.values(this.hass.states); const cur=st.entity_id||''; const exists=cur && ents.some(x=>x.entity_id===cur); return html`${!exists&&cur? html`<option value=${cur} selected>${cur}</option>`:''}${ents.map(s=> html`<option value=${s.entity_id} ?selected=${s.entity_id===cur}>${s.attributes.friendly_name||s.entity_id}</option>`)}`; })()}
+								</select>
+								<b>${this._t('shop.operation')}</b>
+								<select .value=${st.op||(st.entity_id?this._defaultOpFor(st.entity_id):'')} @change=${e=>{ st.op=e.target.value; this.requestUpdate(); }}>
+									${this._opsForDomain((st.entity_id||'').split('.')[0]).map(op=> html`<option value=${op} ?selected=${op===st.op}>${op}</option>`)}</select>
+							</div>`}
+						<button class="btn-danger" @click=${()=>{ this._advSteps.splice(idx,1); this.requestUpdate(); }}>${this._t('btn.delete')}</button>
+					</div>`)}
+				</div>
+				<div class="row" style="gap:8px; margin-top:10px;">
+					<button class="btn-ghost" @click=${()=>{ this._advSteps.push({ type:'entity_service', entity_id:'', op:'turn_on' }); this.requestUpdate(); }}>${this._t('shop.add_action')}</button>
+					<button class="btn-ghost" @click=${()=>{ this._advSteps.push({ type:'delay', seconds:60 }); this.requestUpdate(); }}>${this._t('shop.add_delay')}</button>
+				</div>
+				<div class="row" style="justify-content:flex-end; gap:8px; margin-top:10px;">
+					<button class="btn-ghost" @click=${()=>{ this._advItem=null; }}>${this._t('form.cancel')}</button>
+					<button class="btn-primary" @click=${this._saveAdvanced}>${this._t('form.save')}</button>
+				</div>
+			</div>`: ''}
+		</div>`;
+	}
+	_renderSortModal(){
+		const cats = (this._store.categories||[]);
+		// Working order = saved order filtered to existing + new appended; include optional NONE marker at end if present in saved
+		const NONE = '__none__';
+		let order = Array.isArray(this._catOrder)? [...this._catOrder]:[];
+		// ensure only existing ids + NONE
+		order = order.filter(id => id===NONE || cats.some(c=> c.id===id));
+		// append any missing categories
+		for (const c of cats){ if (!order.includes(c.id)) order.push(c.id); }
+		// also ensure NONE is present at end if previously chosen
+		if (!order.includes(NONE)) order.push(NONE);
+		const labelFor = (id)=> id===NONE ? this._t('sort.none') : (cats.find(c=>c.id===id)?.name || id);
+		const onDragStart = (e, idx)=>{ e.dataTransfer.effectAllowed='move'; e.dataTransfer.setData('text/plain', String(idx)); };
+		const onDragOver = (e)=>{ e.preventDefault(); e.currentTarget.classList.add('dragover'); };
+		const onDragLeave = (e)=>{ e.currentTarget.classList.remove('dragover'); };
+		const onDrop = (e, toIdx)=>{
+			e.preventDefault(); e.currentTarget.classList.remove('dragover');
+			const fromIdx = Number(e.dataTransfer.getData('text/plain'));
+			if (!Number.isFinite(fromIdx)) return;
+			const arr = [...order];
+			const [it] = arr.splice(fromIdx,1);
+			arr.splice(toIdx,0,it);
+			this._catOrder = arr; this.requestUpdate();
+		};
+		const save = ()=>{ try{ localStorage.setItem('c4k_cat_order', JSON.stringify(order)); }catch{} this._catOrder = order; this._sortModalOpen=false; this.requestUpdate(); };
+		const reset = ()=>{ order = cats.map(c=> c.id); order.push(NONE); this._catOrder = order; this.requestUpdate(); };
+		return html`<div class="overlay ${this._sortModalOpen?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._sortModalOpen=false; }}>
+			${this._sortModalOpen ? html`<div class="modal" style="max-width: 560px; width: min(95vw, 560px);" @click=${e=>e.stopPropagation()}>
+				<h3>${this._t('sort.title')}</h3>
+				<div style="font-size:.9rem; color: var(--secondary-text-color);">${this._t('sort.categories_order')}</div>
+				<ul class="sort-list">
+					${order.map((id, idx)=> html`
+						<li class="sort-item" draggable="true" @dragstart=${e=> onDragStart(e, idx)} @dragover=${onDragOver} @dragleave=${onDragLeave} @drop=${e=> onDrop(e, idx)}>
+							<span class="sort-handle">⋮⋮</span>
+							<span style="flex:1;">${labelFor(id)}</span>
+						</li>
+					`)}
+				</ul>
+				<div class="row" style="justify-content:flex-end; gap:8px;">
+					<button class="btn-ghost" @click=${reset}>${this._t('sort.reset')}</button>
+					<button class="btn-primary" @click=${save}>${this._t('sort.save')}</button>
+				</div>
+			</div>`: ''}
+		</div>`;
+	}
+	_renderReassignModal(){
+		const task = this._reassignTask;
+		if (!task) return '';
+		
+		const approveOnly = async () => {
+			await this.hass.callService('chores4kids','approve_task',{ task_id: task.id });
+			this._reassignTask = null;
+			this.requestUpdate();
+		};
+		
+		const approveAndReassign = async () => {
+			// First approve
+			await this.hass.callService('chores4kids','approve_task',{ task_id: task.id });
+			
+			// Then assign today's version to same child(ren)
+			const targetIds = Array.isArray(task.repeat_child_ids) && task.repeat_child_ids.length 
+				? task.repeat_child_ids 
+				: (task.repeat_child_id ? [task.repeat_child_id] : [task.assigned_to]);
+			
+			for (const childId of targetIds) {
+				try {
+					// Find the unassigned template task
+					const templates = this._store.allTasks.filter(t => 
+						!t.assigned_to && 
+						t.title === task.title && 
+						Number(t.points) === Number(task.points)
+					);
+					
+					if (templates.length > 0) {
+						await this.hass.callService('chores4kids','assign_task',{ 
+							task_id: templates[0].id, 
+							child_id: childId 
+						});
+						this._setBonusVisualState(templates[0].id, 'assigned');
+					}
+				} catch(e) {
+					console.error('Failed to reassign task:', e);
+				}
+			}
+			
+			this._reassignTask = null;
+			this.requestUpdate();
+		};
+		
+		return html`<div class="overlay ${task?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) { this._reassignTask=null; this.requestUpdate(); } }}>
+			<div class="modal" style="max-width: 560px; width: min(95vw, 560px);" @click=${e=>e.stopPropagation()}>
+				<h3>${this._t('overdue.reassign_prompt')}</h3>
+				<div style="padding: 16px 0; color: var(--secondary-text-color);">
+					<div><strong>${task.title}</strong></div>
+					<div style="margin-top:8px; font-size:0.9rem;">${task.assigned_to_name || task.assigned_to}</div>
+				</div>
+				<div class="row" style="justify-content:flex-end; gap:8px;">
+					<button class="btn-ghost" @click=${approveOnly}>${this._t('overdue.no')}</button>
+					<button class="btn-primary" @click=${approveAndReassign}>${this._t('overdue.yes')}</button>
+				</div>
+			</div>
+		</div>`;
+	}
+	async _addChild(){ if(!this._name) return; await this.hass.callService('chores4kids','add_child',{ name: this._name }); this._name=''; }
+	async _removeChild(c){ if(!confirm(this._t('confirm.delete_child',{name:c.name}))) return; await this.hass.callService('chores4kids','remove_child',{ child_id: c.id }); }
+	_openIconPicker(){ this._iconModalOpen = true; this._ensureChunk('icons'); }
+	_openPoints(c){ if(!this._pointsEnabled()) return; this._pointsChild=c; this._pointsValue=5; this.requestUpdate(); }
+	_closePoints(){ this._pointsChild=null; this.requestUpdate(); }
+	async _addPointsQuick(n){ if(!this._pointsEnabled()) return; if(!this._pointsChild) return; const pts=Number(n||0); if(!Number.isFinite(pts)||pts===0) return; await this.hass.callService('chores4kids','add_points',{ child_id: this._pointsChild.id, points: pts }); this._closePoints(); }
+	async _resetPoints(c){ if(!this._pointsEnabled()) return; if(!confirm(this._t('btn.reset_points')+'?')) return; await this.hass.callService('chores4kids','reset_points',{ child_id: c.id }); }
+	async _promptRename(c){ const nn=prompt(this._t('btn.rename'), c.name); if(!nn || nn===c.name) return; await this.hass.callService('chores4kids','rename_child',{ child_id:c.id, new_name: nn }); }
+	get _showTitleError(){ return (this._touchedTitle && !(String(this._taskTitle||'').trim().length>0)); }
+	get _pointsErrorKey(){ if(!this._pointsEnabled()) return null; if(!this._touchedPoints) return null; const raw=String(this._taskPoints??'').trim(); if(raw==='') return 'err.points_required'; const n=Number(raw); if(!Number.isFinite(n)) return 'err.points_number'; if(n<0) return 'err.points_positive'; return null; }
+	get _showPointsError(){ return !!this._pointsErrorKey; }
+	get _hasFormErrors(){ return this._showTitleError || (this._pointsEnabled() && this._showPointsError); }
+	async _waitForNewTemplateTask(beforeUnassignedIds, sig, timeoutMs=6000){
+		const start = Date.now();
+		const sleep = (ms)=> new Promise(r=> setTimeout(r, ms));
+		const wantTitle = String(sig?.title||'').trim();
+		const wantPoints = Number(sig?.points||0);
+		while ((Date.now() - start) < (Number(timeoutMs)||6000)){
+			try{
+				const candidates = (this._store.allTasks||[])
+					.filter(t=> !t.assigned_to && !(beforeUnassignedIds?.has?.(t.id)))
+					.filter(t=> String(t.title||'').trim()===wantTitle && Number(t.points||0)===wantPoints);
+				if (candidates.length){
+					// Prefer the most recently created
+					candidates.sort((a,b)=>{ try{ return new Date(b.created).getTime() - new Date(a.created).getTime(); }catch{ return 0; } });
+					return candidates[0];
+				}
+			}catch{ /* ignore */ }
+			await sleep(150);
+		}
+		return null;
+	}
+	async _createTask(){
+		const pointsEnabled = this._pointsEnabled();
+		this._touchedTitle=true;
+		this._touchedPoints = pointsEnabled;
+		if(this._hasFormErrors) return;
+		const beforeUnassignedIds = new Set((this._store.allTasks||[]).filter(t=>!t.assigned_to).map(t=>t.id));
+		const scheduleMode = this._weeklyEnabled ? 'weekly' : (this._monthlyEnabled ? 'monthly' : (this._repeatEnabled ? 'repeat' : ''));
+		const repeatOn = (scheduleMode === 'repeat');
+		const bonusOn = pointsEnabled ? !!this._taskEarlyBonusEnabled : false;
+		const dueVal = (bonusOn && (scheduleMode==='repeat' || scheduleMode==='weekly' || scheduleMode==='monthly')) ? undefined : (String(this._taskDue||'').trim() || undefined);
+		const _days = repeatOn ? Array.from(this._repeatDays||[]) : [];
+		const _ids = repeatOn ? Array.from(this._repeatAssign||[]) : [];
+		const _cats = Array.from(this._taskCategories||[]);
+		const _persist = (scheduleMode==='weekly' || scheduleMode==='monthly') ? false : !!this._persistUntilDone;
+		const _quick = !!this._quickComplete;
+		const _skip = !!this._skipApproval;
+		const _fastest = !!this._fastestWins;
+		const _bonusEnabled = pointsEnabled ? !!this._taskBonusEnabled : false;
+		const _bonusTitle = _bonusEnabled ? String(this._taskBonusTitle||'').trim() : '';
+		const _bonusPoints = _bonusEnabled ? Number(this._taskBonusPoints||0) : 0;
+		const _autoAssignIds = (scheduleMode ? Array.from(this._repeatAssign||[]) : []);
+		
+		// Check if today matches schedule - if so, auto-assign immediately
+		const now = new Date();
+		const jsDay = now.getDay(); // 0=Sun
+		const weekdayMap = [6, 0, 1, 2, 3, 4, 5]; // Convert JS day (0=Sun) to backend format (0=Mon)
+		const todayBackend = weekdayMap[jsDay];
+		const assignToday = (
+			scheduleMode==='weekly' ? (todayBackend===0) :
+			scheduleMode==='monthly' ? (now.getDate()===1) :
+			repeatOn ? (_days.includes(todayBackend) || _days.includes(['mon','tue','wed','thu','fri','sat','sun'][todayBackend])) :
+			false
+		);
+		
+		// Always create a reusable unassigned template task.
+		// If today is included in repeat_days, we then assign today's copies from the template
+		// so the task stays editable under "Tasks" and assigned tasks remain linked.
+		const taskData = {
+			title:this._taskTitle,
+			points: pointsEnabled ? Number(this._taskPoints) : 0,
+			description:this._taskDesc||'',
+			due: dueVal,
+			schedule_mode: scheduleMode || undefined,
+			early_bonus_enabled: bonusOn,
+			early_bonus_days: (bonusOn && this._taskEarlyBonusDays!=='' && this._taskEarlyBonusDays!=null) ? Number(this._taskEarlyBonusDays) : undefined,
+			early_bonus_points: (bonusOn && this._taskEarlyBonusPoints!=='' && this._taskEarlyBonusPoints!=null) ? Number(this._taskEarlyBonusPoints) : undefined,
+			bonus_enabled: _bonusEnabled,
+			icon:this._taskIcon||undefined,
+			quick_complete: _quick,
+			skip_approval: _skip,
+			fastest_wins: _fastest,
+			bonus_title: _bonusTitle,
+			bonus_points: Number.isFinite(_bonusPoints) ? _bonusPoints : 0,
+			repeat_days:_days,
+			repeat_child_id: scheduleMode ? (((_autoAssignIds[0]||'') || undefined)) : undefined,
+			repeat_child_ids: scheduleMode ? (_autoAssignIds.length ? _autoAssignIds : undefined) : undefined,
+			persist_until_completed: _persist,
+			mark_overdue: _persist ? !!this._markOverdue : true,
+			categories: _cats
+		};
+		await this.hass.callService('chores4kids','add_task', taskData);
+
+		if (assignToday && _autoAssignIds.length){
+			const tpl = await this._waitForNewTemplateTask(beforeUnassignedIds, { title: this._taskTitle, points: pointsEnabled ? Number(this._taskPoints) : 0 });
+			if (tpl?.id){
+				for (const cid of _autoAssignIds){
+					if(!cid) continue;
+					await this.hass.callService('chores4kids','assign_task', { task_id: tpl.id, child_id: cid });
+				}
+			}
+		}
+
+		// Ensure Tasks section is visible after creating a task
+		try{
+			if (this._collapsed?.tasks){
+				const next = { ...(this._collapsed||{}) };
+				next.tasks = false;
+				this._collapsed = next;
+				localStorage.setItem('c4k_admin_collapsed', JSON.stringify(next));
+			}
+		}catch{}
+		// Clear form and reset validation state so inputs don't show errors
+		this._taskTitle=this._taskPoints=this._taskDesc=this._taskIcon='';
+		this._taskDue='';
+		this._taskEarlyBonusDays='';
+		this._taskEarlyBonusPoints='';
+		this._taskEarlyBonusEnabled=false;
+		this._taskBonusEnabled=false;
+		this._taskBonusTitle='';
+		this._taskBonusPoints='';
+		this._repeatDays=new Set();
+		this._repeatAssign=new Set();
+		this._repeatEnabled=false;
+		this._weeklyEnabled=false;
+		this._monthlyEnabled=false;
+		this._taskCategories=new Set();
+		this._markOverdue=true;
+		this._persistUntilDone=false;
+		this._quickComplete=false;
+		this._skipApproval=false;
+		this._fastestWins=false;
+		this._touchedTitle=false; this._touchedPoints=false;
+	}
+	async _assignTask(task, childId){ if(!childId){ alert(this._t('alert.choose_child_first')); return; } await this.hass.callService('chores4kids','assign_task',{ task_id: task.id, child_id: childId }); this._setBonusVisualState(task.id, 'assigned'); task._assignTo=''; this.requestUpdate(); }
+	async _assignTaskMulti(task, childIds){
+		const ids = Array.isArray(childIds) ? childIds.filter(Boolean) : [];
+		if (!ids.length){ alert(this._t('alert.choose_child_first')); return; }
+		for (const id of ids){
+			try{ await this.hass.callService('chores4kids','assign_task',{ task_id: task.id, child_id: id }); this._setBonusVisualState(task.id, 'assigned'); }
+			catch(e){ /* continue to next */ }
+		}
+		// Best-effort: ensure new assigned copies inherit categories from template
+		try{ this._ensureAssignedHasCategories(task, ids); }catch{}
+		// clear selections
+		try{
+			const row = this.shadowRoot.querySelector(`tr[data-task="${task.id}"]`);
+			row?.querySelectorAll('.c4k-assign')?.forEach(i=> i.checked = false);
+			const val = row?.querySelector('.multi-dd-value'); if (val) val.textContent = this._t('select.assign_child'); val?.classList.add('placeholder');
+		}catch{}
+		this._openAssignMenuFor = null;
+		this.requestUpdate();
+	}
+	// Category management
+	async _addCategory(){
+		const n=String(this._newCategoryName||'').trim();
+		if(!n) return;
+		const color=this._normalizeHexColor(this._newCategoryColor);
+		const payload = color ? { name:n, color } : { name:n };
+		await this.hass.callService('chores4kids','add_category', payload);
+		this._newCategoryName='';
+		this._newCategoryColor='';
+	}
+	async _setCategoryColor(cat, e){
+		try{
+			if (!cat?.id) return;
+			const color = String(e?.target?.value || '').trim();
+			await this.hass.callService('chores4kids','set_category_color',{ category_id: cat.id, color });
+		}catch(err){
+			console.error('Failed to set category color:', err);
+		}
+	}
+	async _promptRenameCategory(cat){ const nn=prompt(this._t('btn.rename'), cat.name); if(!nn || nn===cat.name) return; await this.hass.callService('chores4kids','rename_category',{ category_id: cat.id, new_name: nn }); }
+	async _deleteCategory(cat){ if(!confirm(this._t('btn.delete')+'?')) return; await this.hass.callService('chores4kids','delete_category',{ category_id: cat.id }); }
+	_updateAssignSummary(taskId, taskRef){
+		try{
+			const row = this.shadowRoot.querySelector(`tr[data-task="${taskId}"]`);
+			const boxes = Array.from(row?.querySelectorAll('.c4k-assign:checked')||[]);
+			const ids = boxes.map(i=> i.value);
+			const names = boxes.map(i=> i.parentElement?.querySelector('span')?.textContent?.trim()).filter(Boolean);
+			if (taskRef) taskRef._assignToMulti = ids;
+			const val = row?.querySelector('.multi-dd-value');
+			if (val){
+				if (names.length===0){ val.textContent = this._t('select.assign_child'); val.classList.add('placeholder'); }
+				else {
+					val.textContent = names.slice(0,2).join(', ') + (names.length>2? ` +${names.length-2}` : '');
+					val.classList.remove('placeholder');
+				}
+			}
+		}catch{}
+	}
+	_editTask(t){ this._editingTask=t; this._taskTitle=t.title; this._taskPoints=t.points; this._taskDesc=t.description||''; this._taskIcon=t.icon||''; this._taskDue = (()=>{ const d=this._parseDueToDate(t?.due); return d? this._formatDateISO(d) : ''; })(); this._taskEarlyBonusDays = (t?.early_bonus_days!=null && Number(t.early_bonus_days)>0)? String(t.early_bonus_days) : ''; this._taskEarlyBonusPoints = (t?.early_bonus_points!=null && Number(t.early_bonus_points)>0)? String(t.early_bonus_points) : ''; this._taskEarlyBonusEnabled = (()=>{ const v=t?.early_bonus_enabled; if (v===true) return true; if (v===false) return false; return (Number(t?.early_bonus_days||0)>0 && Number(t?.early_bonus_points||0)>0); })(); this._taskBonusTitle = String(t?.bonus_title||''); this._taskBonusPoints = (t?.bonus_points!=null && Number(t.bonus_points)>0)? String(t.bonus_points) : ''; this._taskBonusEnabled = !!(String(t?.bonus_title||'').trim() || Number(t?.bonus_points||0)>0); const mode = String(t?.schedule_mode||'').toLowerCase(); this._weeklyEnabled = (mode==='weekly'); this._monthlyEnabled = (mode==='monthly'); const map=["mon","tue","wed","thu","fri","sat","sun"]; const fromAttr=Array.isArray(t.repeat_days)? t.repeat_days.map(d=> typeof d==='number'? map[d] : String(d).slice(0,3)) : []; this._repeatDays=new Set(fromAttr); const kids = Array.isArray(t.repeat_child_ids)? t.repeat_child_ids : (t.repeat_child_id? [t.repeat_child_id]:[]); this._repeatAssign=new Set(kids); this._repeatEnabled = (!this._weeklyEnabled && !this._monthlyEnabled) && !!(fromAttr.length || kids.length || mode==='repeat'); this._persistUntilDone = !!t.persist_until_completed; this._markOverdue = t.mark_overdue !== false; this._quickComplete = !!t.quick_complete; this._skipApproval = !!t.skip_approval; this._fastestWins = !!t.fastest_wins; const cats = Array.isArray(t.categories)? t.categories : []; this._taskCategories = new Set(cats); if (this._weeklyEnabled || this._monthlyEnabled){ this._persistUntilDone = false; this._markOverdue = true; } }
+	async _saveEditedTask(){
+		if(!this._editingTask) return;
+		// validate like create
+		const pointsEnabled = this._pointsEnabled();
+		this._touchedTitle = true; this._touchedPoints = pointsEnabled; this.requestUpdate();
+		if (this._hasFormErrors) return;
+		try{
+			const bonusOn = pointsEnabled ? !!this._taskEarlyBonusEnabled : false;
+			const scheduleMode = this._weeklyEnabled ? 'weekly' : (this._monthlyEnabled ? 'monthly' : (this._repeatEnabled ? 'repeat' : ''));
+			const repeatOn = (scheduleMode === 'repeat');
+			const dueVal = (bonusOn && (scheduleMode==='repeat' || scheduleMode==='weekly' || scheduleMode==='monthly')) ? undefined : (String(this._taskDue||'').trim() || undefined);
+			await this.hass.callService('chores4kids','update_task',{
+				task_id: this._editingTask.id,
+				title: this._taskTitle,
+				points: pointsEnabled ? Number(this._taskPoints) : 0,
+				description: this._taskDesc||'',
+				due: dueVal,
+				early_bonus_enabled: bonusOn,
+				early_bonus_days: (bonusOn && this._taskEarlyBonusDays!=='' && this._taskEarlyBonusDays!=null) ? Number(this._taskEarlyBonusDays) : undefined,
+				early_bonus_points: (bonusOn && this._taskEarlyBonusPoints!=='' && this._taskEarlyBonusPoints!=null) ? Number(this._taskEarlyBonusPoints) : undefined,
+				bonus_enabled: (pointsEnabled && this._taskBonusEnabled),
+				bonus_title: (pointsEnabled && this._taskBonusEnabled) ? String(this._taskBonusTitle||'').trim() : '',
+				bonus_points: (pointsEnabled && this._taskBonusEnabled) ? Number(this._taskBonusPoints||0) : 0,
+				icon: this._taskIcon||'',
+				persist_until_completed: (scheduleMode==='weekly' || scheduleMode==='monthly') ? false : !!this._persistUntilDone,
+				mark_overdue: ((scheduleMode==='weekly' || scheduleMode==='monthly') ? false : !!this._persistUntilDone) ? !!this._markOverdue : true,
+				quick_complete: !!this._quickComplete,
+				skip_approval: !!this._skipApproval,
+				fastest_wins: !!this._fastestWins,
+				categories: Array.from(this._taskCategories||[])
+			});
+			// Try to set multi-children (backend may ignore list if unsupported). Fallback: set first only.
+			const _ids = scheduleMode ? Array.from(this._repeatAssign||[]) : [];
+			const _days = repeatOn ? Array.from(this._repeatDays||[]) : [];
+			await this.hass.callService('chores4kids','set_task_repeat',{
+				task_id: this._editingTask.id,
+				repeat_days: _days,
+				repeat_child_id: _ids[0]||undefined,
+				repeat_child_ids: _ids,
+				schedule_mode: scheduleMode || undefined,
+			});
+			
+			// Check if today is in repeat days and task is unassigned template - if so, auto-assign now
+			if (!this._editingTask.assigned_to && scheduleMode && _ids.length > 0) {
+				const now = new Date();
+				const jsDay = now.getDay();
+				const weekdayMap = [6, 0, 1, 2, 3, 4, 5];
+				const todayBackend = weekdayMap[jsDay];
+				const assignToday = (
+					scheduleMode==='weekly' ? (todayBackend===0) :
+					scheduleMode==='monthly' ? (now.getDate()===1) :
+					repeatOn ? (_days.includes(todayBackend) || _days.includes(['mon','tue','wed','thu','fri','sat','sun'][todayBackend])) :
+					false
+				);
+				
+				if (assignToday) {
+					// Assign only for children missing a today's active instance (avoid duplicates)
+					for (const cid of _ids) {
+						try {
+							if(!cid) continue;
+							const alreadyHasTodays = (this._store.allTasks||[]).some(t =>
+								!!t.assigned_to &&
+								t.assigned_to === cid &&
+								String(t.repeat_template_id||'') === String(this._editingTask.id||'') &&
+								['assigned','in_progress','awaiting_approval'].includes(String(t.status||'')) &&
+								!this._isFromBeforeToday(t)
+							);
+							if (alreadyHasTodays) continue;
+							await this.hass.callService('chores4kids','assign_task',{ 
+								task_id: this._editingTask.id, 
+								child_id: cid 
+							});
+							this._setBonusVisualState(this._editingTask.id, 'assigned');
+						} catch(e) {
+							// Best-effort: ignore assign errors (e.g. backend rejects invalid child)
+						}
+					}
+				}
+			}
+		} finally {
+			this._editingTask=null;
+			this._taskTitle=this._taskPoints=this._taskDesc=this._taskIcon='';
+			this._taskDue='';
+			this._taskEarlyBonusDays='';
+			this._taskEarlyBonusPoints='';
+			this._taskEarlyBonusEnabled=false;
+			this._taskBonusEnabled=false;
+			this._taskBonusTitle='';
+			this._taskBonusPoints='';
+			this._repeatDays=new Set(); this._repeatAssign=new Set();
+			this._repeatEnabled=false;
+			this._weeklyEnabled=false;
+			this._monthlyEnabled=false;
+			this._taskCategories=new Set();
+			this._markOverdue=true;
+			this._quickComplete=false;
+			this._skipApproval=false;
+			this._touchedTitle=false; this._touchedPoints=false;
+		}
+	}
+	async _addShopItem(){ if(!this._pointsEnabled()) return; const title=String(this._shopTitle||'').trim(); const price=Number(this._shopPrice||0); if(!title || !Number.isFinite(price)) return; await this.hass.callService('chores4kids','add_shop_item',{ title, price, image: this._shopImage||undefined }); this._shopTitle=this._shopPrice=this._shopImage=''; try{ const el=this.shadowRoot.getElementById('c4k-shop-file'); if(el) el.value=''; }catch{} }
+	async _deleteShopItem(id){ if(!this._pointsEnabled()) return; if(!id) return; await this.hass.callService('chores4kids','delete_shop_item',{ item_id: id }); }
+	async _clearShopHistory(){
+		if(!this._pointsEnabled()) return;
+		if(!confirm(this._t('confirm.clear_history'))) return;
+		try{
+			await this.hass.callService('chores4kids','clear_shop_history',{});
+		}catch(err){
+			try{
+				await this.hass.callService('chores4kids','reset_shop_history',{});
+			}catch(err2){
+				alert('Service chores4kids.clear_shop_history not available');
+			}
+		}
+		this._olderPurchases = []; this._rowWindow = { ...(this._rowWindow||{}), purchases: 0 };
+	}
+	async _onPickImage(e){ if(!this._pointsEnabled()) return; const f=e.target?.files?.[0]; if(!f) return; try{ const ext=(f.name.split('.').pop()||'jpg').toLowerCase(); const name=`c4k_${Date.now()}_${Math.random().toString(36).slice(2)}.${ext}`; this._shopImage=await c4kUploadFile(this.hass, f, name); } finally { this.requestUpdate(); } }
+	_startEditItem(i){ this._editItem={ id:i.id, title:i.title, price:i.price, image:i.image||'', active:i.active!==false }; this.requestUpdate(); }
+	async _onPickEditImage(e){ if(!this._pointsEnabled()) return; const f=e.target?.files?.[0]; if(!f) return; const ext=(f.name.split('.').pop()||'jpg').toLowerCase(); const name=`c4k_${Date.now()}_${Math.random().toString(36).slice(2)}.${ext}`; const url=await c4kUploadFile(this.hass, f, name); this._editItem={ ...this._editItem, image:url }; this.requestUpdate(); }
+	async _saveEditItem(){ if(!this._pointsEnabled()) return; const it=this._editItem; if(!it) return; await this.hass.callService('chores4kids','update_shop_item',{ item_id: it.id, title:String(it.title||'').trim(), price:Number(it.price||0), image: it.image||'', active: !!it.active }); this._editItem=null; this.requestUpdate(); }
+	async _toggleItemActive(i,e){ if(!this._pointsEnabled()) return; const active=!!e.target.checked; await this.hass.callService('chores4kids','update_shop_item',{ item_id: i.id, active }); }
+	_openAdvanced(i){ if(!this._pointsEnabled()) return; try{ const shop=Object.values(this.hass.states).find(s=> s?.entity_id?.includes('chores4kids_shop')); const latest=shop?.attributes?.items?.find?.((x)=> x.id===i.id); this._advItem=latest||i; }catch{ this._advItem=i; } const steps=Array.isArray(this._advItem.actions)? JSON.parse(JSON.stringify(this._advItem.actions)) : []; this._advSteps=steps.map(st=>{ const t=String(st?.type||'').toLowerCase(); if(t==='service'){ const ent=st.entity_id || st.data?.entity_id || ''; const op=st.service || st.op; return { type:'entity_service', entity_id: ent, op }; } if(t==='entity_service'){ return { type:'entity_service', entity_id: st.entity_id||'', op: st.op||st.service }; } if(t==='delay'){ return { type:'delay', seconds: Number(st.seconds||st.secs||0) }; } return st; }); this.requestUpdate(); }
+	_defaultOpFor(entity_id){ const dom=(entity_id||'').split('.')[0]; const ops=this._opsForDomain(dom); return ops[0]||'turn_on'; }
+	_opsForDomain(dom){ switch(dom){ case 'switch': case 'light': case 'fan': case 'input_boolean': return ['turn_on','turn_off','toggle']; case 'media_player': return ['turn_on','turn_off','media_play','media_pause','toggle']; case 'lock': return ['lock','unlock']; default: return ['turn_on','turn_off']; } }
+	async _saveAdvanced(){ if(!this._pointsEnabled()) return; if(!this._advItem) return; const actions=(this._advSteps||[]).map(st=> st.type==='delay'? { type:'delay', seconds: Number(st.seconds||0) } : { type:'entity_service', entity_id: st.entity_id, op: st.op||'turn_on' }); await this.hass.callService('chores4kids','update_shop_item',{ item_id: this._advItem.id, actions }); this._advItem=null; this._advSteps=[]; this.requestUpdate(); }
+}
+
+export function install(Card, deps){
+	({ c4kUploadFile } = deps);
+	deps.installMethods(Card, C4kAdminView);
+}
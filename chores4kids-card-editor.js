@@ -0,0 +1,604 @@
+// Chores4Kids card: visual config editor, imported by getConfigElement().
+import { LitElement, html, css } from "https://unpkg.com/lit?module";
+
+let c4kLocalize, c4kUploadFile;
+
+class Chores4KidsDevCardEditor extends LitElement{
+	static get properties(){ return { hass: {}, _config: {} }; }
+	setConfig(config){
+		this._config = { mode:'admin', ...config };
+		this.requestUpdate();
+	}
+	updated(changedProps){
+		try{
+			if (changedProps.has('hass') || changedProps.has('_config')){
+				this._ensureDetectedCompletionSound();
+			}
+		}catch{ /* ignore */ }
+	}
+	_getGlobalConfettiEnabled(){
+		try{
+			const a = this._getUiSensorAttrs?.() || {};
+			if (typeof a.confetti_enabled === 'boolean') return a.confetti_enabled;
+		}catch{ /* ignore */ }
+		// Default ON
+		return true;
+	}
+	async _saveGlobalConfettiEnabled(enabled){
+		try{
+			await this._saveGlobalUiSettings({ confetti_enabled: !!enabled });
+		}catch(e){
+			console.warn('Failed to save confetti_enabled', e);
+		}
+	}
+	_getGlobalEnablePoints(){
+		try{
+			const states = this.hass?.states || {};
+			let s = states['sensor.chores4kids_ui'];
+			if (!s){
+				s = Object.values(states).find(st=>{
+					try{
+						if (!st?.entity_id?.startsWith('sensor.')) return false;
+						const a = st.attributes || {};
+						return ('enable_points' in a) || ('start_task_bg' in a) || ('complete_task_bg' in a) || ('kid_points_bg' in a)
+							|| ('task_done_bg' in a) || ('task_done_text' in a)
+							|| ('start_task_text' in a) || ('complete_task_text' in a) || ('kid_points_text' in a)
+							|| ('task_points_bg' in a) || ('task_points_text' in a);
+					}catch{ return false; }
+				});
+			}
+			const a = s?.attributes || {};
+			if (typeof a.enable_points === 'boolean') return a.enable_points;
+		}catch{ /* ignore */ }
+		return true;
+	}
+	async _saveGlobalEnablePoints(enabled){
+		try{
+			if (!this.hass) return;
+			await this.hass.callService('chores4kids','set_ui_colors',{ enable_points: !!enabled });
+		}catch(e){
+			console.warn('Failed to save enable_points', e);
+		}
+	}
+	_saveGlobalColors(cfg){
+		// Persist globally in HA backend so it syncs across users/devices.
+		try{
+			if (!this.hass) return;
+			const payload = {
+				start_task_bg: cfg?.start_task_bg || '',
+				complete_task_bg: cfg?.complete_task_bg || '',
+				kid_points_bg: cfg?.kid_points_bg || '',
+				task_done_bg: cfg?.task_done_bg || '',
+				start_task_text: cfg?.start_task_text || '',
+				complete_task_text: cfg?.complete_task_text || '',
+				kid_points_text: cfg?.kid_points_text || '',
+				task_done_text: cfg?.task_done_text || '',
+				task_points_bg: cfg?.task_points_bg || '',
+				task_points_text: cfg?.task_points_text || '',
+			};
+			// debounce service calls while typing
+			this._pendingUiColors = payload;
+			if (this._uiColorSaveTimer) clearTimeout(this._uiColorSaveTimer);
+			this._uiColorSaveTimer = setTimeout(async ()=>{
+				try{
+					await this.hass.callService('chores4kids','set_ui_colors', this._pendingUiColors || payload);
+				}catch(e){
+					console.warn('Failed to save UI colors', e);
+				}
+			}, 250);
+		}catch{ /* ignore */ }
+	}
+	_t(key, vars){ return c4kLocalize(key, this.hass || navigator.language || 'en', vars); }
+	_emit(){ this.dispatchEvent(new CustomEvent('config-changed',{ detail:{ config: this._config }, bubbles:true, composed:true })); }
+	async _onSoundUpload(e) {
+		const file = e.target?.files?.[0];
+		if(!file) return;
+		try {
+			const ext = (file.name.split('.').pop() || 'mp3').toLowerCase();
+			// Use a stable filename so all dashboards share the same sound
+			const name = `completion.${ext}`;
+			const url = await c4kUploadFile(this.hass, file, name);
+			// Update config with the path
+			this._config = {...this._config, completion_sound: url};
+			// allow selecting the same file again later
+			try{ if (e?.target) e.target.value = ''; }catch{}
+			this._emit();
+		} catch(err) {
+			console.error('Sound upload failed:', err);
+			alert('Failed to upload sound file');
+		}
+	}
+	_getCompletionSoundFilename(){
+		try{
+			const raw = String(this._config?.completion_sound || '').trim();
+			if (!raw) return '';
+			const m = raw.match(/\/local\/chores4kids\/([^/?#]+)$/);
+			if (m && m[1]) return m[1];
+			const last = raw.split('/').pop();
+			return String(last || '').trim();
+		}catch{ return ''; }
+	}
+	async _urlExists(url){
+		try{
+			const bust = (url.includes('?') ? '&' : '?') + `_=${Date.now()}`;
+			let r = await fetch(url + bust, { method:'HEAD', cache:'no-store' });
+			if (r.ok) return true;
+			// Some servers block HEAD; try a tiny GET.
+			if (r.status === 405 || r.status === 403){
+				r = await fetch(url + bust, { method:'GET', cache:'no-store', headers: { 'Range': 'bytes=0-0' } });
+				if (r.ok) return true;
+			}
+		}catch{ /* ignore */ }
+		return false;
+	}
+	async _ensureDetectedCompletionSound(force=false){
+		try{
+			const cfg = this._config || {};
+			if (cfg.mode === 'kid') return;
+			// If explicitly configured, no need to detect.
+			if (cfg.completion_sound){
+				this._detectedCompletionSound = null;
+				return;
+			}
+			if (!force && this._detectedCompletionSound) return;
+			if (this._soundDetectInFlight) return;
+			this._soundDetectInFlight = true;
+			const exts = ['mp3','wav','ogg','m4a','aac'];
+			let found = null;
+			for (const ext of exts){
+				const url = `/local/chores4kids/completion.${ext}`;
+				// eslint-disable-next-line no-await-in-loop
+				if (await this._urlExists(url)) { found = { url, filename: `completion.${ext}` }; break; }
+			}
+			this._detectedCompletionSound = found;
+			this.requestUpdate();
+		}catch{ /* ignore */ }
+		finally{ this._soundDetectInFlight = false; }
+	}
+	async _deleteCompletionSound(){
+		try{
+			if (!this.hass) return;
+			const fromCfg = this._getCompletionSoundFilename();
+			const filename = fromCfg || this._detectedCompletionSound?.filename || '';
+			if (!confirm(this._t('editor.delete_sound_confirm'))) return;
+			// Try deleting the explicitly referenced filename (if any)
+			if (filename){
+				try{ await this.hass.callService('chores4kids','delete_uploaded_file',{ filename }); }catch(e){ /* fall through */ }
+			}
+			// Always also delete legacy completion files
+			await this.hass.callService('chores4kids','delete_completion_sound',{});
+			this._config = {...(this._config||{}), completion_sound: ''};
+			this._detectedCompletionSound = null;
+			this._emit();
+			this._ensureDetectedCompletionSound(true);
+		}catch(e){
+			console.error('Sound delete failed:', e);
+			alert(this._t('editor.delete_sound_failed'));
+		}
+	}
+	_getChildren(){
+		try{
+			const states = this.hass?.states || {};
+			const names = Object.values(states)
+				.filter((s)=> s && s.entity_id?.startsWith('sensor.') && s.attributes?.child_id && s.attributes?.name)
+				.map((s)=> s.attributes.name)
+				.filter(Boolean);
+			return Array.from(new Set(names)).sort((a,b)=> String(a).localeCompare(String(b)));
+		}catch{ return []; }
+	}
+	_getNotifyServiceOptions(){
+		try{
+			const services = this.hass?.services?.notify || {};
+			return Object.keys(services).sort((a,b)=> String(a).localeCompare(String(b)));
+		}catch{ return []; }
+	}
+	_getGlobalNotifyServices(){
+		try{
+			const a = this._getUiSensorAttrs?.() || {};
+			const fromCfg = Array.isArray(this._config?.notify_services) ? this._config.notify_services : [];
+			const list = Array.isArray(a.notify_services) ? a.notify_services : [];
+			const cleaned = [...list, ...fromCfg].map(s=> String(s||'').trim()).filter(Boolean)
+				.filter((v,i,a)=> a.indexOf(v)===i);
+			const single = String(a.notify_service || '').trim();
+			if (single && !cleaned.includes(single)) cleaned.push(single);
+			return cleaned;
+		}catch{ return []; }
+	}
+	_getNotifyServiceSettings(){
+		try{
+			const a = this._getUiSensorAttrs?.() || {};
+			const fromCfg = (this._config?.notify_service_settings && typeof this._config.notify_service_settings === 'object') ? this._config.notify_service_settings : {};
+			const fromStore = (a.notify_service_settings && typeof a.notify_service_settings === 'object') ? a.notify_service_settings : {};
+			const merged = { ...fromStore };
+			for (const [svc, opts] of Object.entries(fromCfg || {})){
+				if (!opts || typeof opts !== 'object') continue;
+				merged[svc] = { ...(merged[svc] || {}), ...opts };
+			}
+			return merged;
+		}catch{ return {}; }
+	}
+	_setNotifyServiceSetting(service, key, value){
+		try{
+			const map = this._getNotifyServiceSettings();
+			const next = { ...map, [service]: { ...(map?.[service] || {}), [key]: !!value } };
+			this._config = { ...(this._config||{}), notify_service_settings: next };
+			this._saveGlobalUiSettings({ notify_service_settings: next });
+			this._emit();
+		}catch{ /* ignore */ }
+	}
+	_getUiSensorAttrs(){
+		try{
+			const states = this.hass?.states;
+			if (!states) return {};
+			let s = states['sensor.chores4kids_ui'];
+			if (!s){
+				s = Object.values(states).find(st=>{
+					try{
+						if (!st?.entity_id?.startsWith('sensor.')) return false;
+						const a = st.attributes || {};
+						return (
+							('enable_points' in a) || ('start_task_bg' in a) || ('complete_task_bg' in a) || ('kid_points_bg' in a)
+							|| ('task_done_bg' in a) || ('task_done_text' in a)
+							|| ('start_task_text' in a) || ('complete_task_text' in a) || ('kid_points_text' in a)
+							|| ('task_points_bg' in a) || ('task_points_text' in a)
+							|| ('kid_task_title_size' in a) || ('kid_task_points_size' in a) || ('kid_task_button_size' in a)
+							|| ('confetti_enabled' in a)
+							|| ('notify_service' in a) || ('notify_services' in a) || ('notify_service_settings' in a)
+						);
+					}catch{ return false; }
+				});
+			}
+			return (s?.attributes && typeof s.attributes === 'object') ? s.attributes : {};
+		}catch{ return {}; }
+	}
+	_getGlobalKidFontSizes(){
+		const a = this._getUiSensorAttrs();
+		return {
+			title: a?.kid_task_title_size || '',
+			points: a?.kid_task_points_size || '',
+			button: a?.kid_task_button_size || '',
+		};
+	}
+	_saveGlobalUiSettings(payload){
+		// Persist globally in HA backend so it syncs across users/devices.
+		try{
+			if (!this.hass) return;
+			const next = { ...(this._pendingUiColors || {}), ...(payload || {}) };
+			this._pendingUiColors = next;
+			const hasNotifySettings = payload && Object.prototype.hasOwnProperty.call(payload, 'notify_service_settings');
+			if (hasNotifySettings){
+				try{ this.hass.callService('chores4kids','set_ui_colors', this._pendingUiColors || next); }catch(e){
+					console.warn('Failed to save UI settings (notify)', e);
+				}
+				return;
+			}
+			if (this._uiColorSaveTimer) clearTimeout(this._uiColorSaveTimer);
+			this._uiColorSaveTimer = setTimeout(async ()=>{
+				try{
+					await this.hass.callService('chores4kids','set_ui_colors', this._pendingUiColors || next);
+				}catch(e){
+					console.warn('Failed to save UI settings', e);
+				}
+			}, 250);
+		}catch{ /* ignore */ }
+	}
+		render(){
+		const cfg=this._config||{};
+		const kids=this._getChildren();
+		const notifyOptions = this._getNotifyServiceOptions();
+		const globalNotify = this._getGlobalNotifyServices();
+		const notifyAvailable = (notifyOptions||[]).filter(s=> !globalNotify.includes(s));
+		const notifySettings = this._getNotifyServiceSettings();
+		const globalFs = this._getGlobalKidFontSizes();
+		const fsTitle = (this._fsTaskTitle != null) ? this._fsTaskTitle : globalFs.title;
+		const fsPoints = (this._fsTaskPoints != null) ? this._fsTaskPoints : globalFs.points;
+		const fsButton = (this._fsTaskButton != null) ? this._fsTaskButton : globalFs.button;
+		return html`
+		<div class="card-config">
+			<div class="section-box">
+				<div class="form-field">
+					<label>${this._t('editor.developer_mode')}</label>
+					<label style="display:flex;align-items:center;gap:8px;">
+						<span>${this._t('ui.toggle_off_on')}</span>
+						<ha-switch .checked=${cfg.debug_mode === true} @change=${e=>{ this._config={...cfg, debug_mode: !!e.target.checked}; this._emit(); }}></ha-switch>
+					</label>
+					<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.developer_mode_help')}</small>
+				</div>
+				<div class="form-field"><label>${this._t('editor.mode')}</label>
+					<select .value=${cfg.mode||'admin'} @change=${e=>{ this._config={...cfg, mode:e.target.value}; this._emit(); }}>
+						<option value="admin">${this._t('editor.mode_admin')}</option>
+						<option value="kid">${this._t('editor.mode_kid')}</option>
+						<option value="overview">${this._t('editor.mode_overview')}</option>
+					</select>
+				</div>
+				${(cfg.mode||'admin')==='admin' ? html`
+					<div class="form-field">
+						<label>${this._t('editor.confetti')}</label>
+						<label style="display:flex;align-items:center;gap:8px;">
+							<span>${this._t('ui.toggle_off_on')}</span>
+							<ha-switch .checked=${this._getGlobalConfettiEnabled()} @change=${async e=>{ const enabled=!!e.target.checked; await this._saveGlobalConfettiEnabled(enabled); this._config={...cfg, confetti: enabled}; this._emit(); }}></ha-switch>
+						</label>
+						<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.confetti_help')}</small>
+					</div>
+				` : ''}
+				${cfg.mode !== 'kid' ? html`
+					<div class="form-field">
+						<label>${this._t('editor.completion_sound')}</label>
+						<input type="file" accept="audio/*" @change=${e=> this._onSoundUpload(e)} style="width:100%; max-width:100%; box-sizing:border-box; margin-bottom:4px;" />
+						${(cfg.completion_sound || this._detectedCompletionSound) ? html`
+							<div style="display:flex;align-items:center;gap:8px;margin-top:4px; flex-wrap:wrap;">
+								<small style="opacity:.8;flex:1;word-break:break-all;">${cfg.completion_sound || this._detectedCompletionSound?.url}</small>
+								${cfg.completion_sound ? html`
+									<button @click=${()=>{ this._config={...cfg, completion_sound: ''}; this._emit(); }} style="padding:4px 8px;font-size:0.8rem;">${this._t('form.clear')}</button>
+								` : ''}
+								<button @click=${()=> this._deleteCompletionSound()} ?disabled=${!(cfg.completion_sound || this._detectedCompletionSound?.filename)} style="padding:4px 8px;font-size:0.8rem;">${this._t('editor.delete_sound')}</button>
+							</div>
+						` : ''}
+
+						${(!(cfg.completion_sound || this._detectedCompletionSound)) ? html`
+							<div style="display:flex;align-items:center;gap:8px;margin-top:4px;">
+								<button @click=${()=> this._deleteCompletionSound()} style="padding:4px 8px;font-size:0.8rem;">${this._t('editor.delete_sound')}</button>
+							</div>
+						` : ''}
+						<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.completion_sound_help')}</small>
+					</div>
+				` : ''}
+			</div>
+
+			${(cfg.mode||'admin')==='admin' ? html`
+				<div class="section-box">
+					<div class="form-field">
+						<label>${this._t('section.notifications')}</label>
+						<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.notify_target_help')}</small>
+						<div class="notify-chips">
+							${(globalNotify||[]).length ? (globalNotify||[]).map(s=> html`
+								<span class="notify-chip">
+									${s}
+									<button class="chip-x" title="${this._t('form.clear')}" @click=${()=>{
+										const next = (globalNotify||[]).filter(x=> x!==s);
+										this._saveGlobalUiSettings({ notify_services: next, notify_service: next[0] || '' });
+										this._config={...cfg, notify_service: next[0] || '', notify_services: next};
+										this._emit();
+									}}>&times;</button>
+								</span>
+							`) : html`<span class="notify-empty">${this._t('editor.notify_target_none')}</span>`}
+						</div>
+						<select .value=${''} @change=${e=>{ const v=String(e.target.value||''); if(!v){ this._saveGlobalUiSettings({ notify_services: [], notify_service: '' }); this._config={...cfg, notify_service: '', notify_services: []}; this._emit(); return; } const next=[...(globalNotify||[]), v].filter((x,i,a)=>a.indexOf(x)===i); this._saveGlobalUiSettings({ notify_services: next, notify_service: next[0] || '' }); this._config={...cfg, notify_service: next[0] || '', notify_services: next}; this._emit(); try{ e.target.value=''; }catch{} }}>
+							<option value="">${this._t('editor.notify_target_none')}</option>
+							${(notifyAvailable||[]).map(s=> html`<option value="${s}">${s}</option>`)}
+						</select>
+						${(globalNotify||[]).length ? html`
+							<div style="margin-top:10px; display:grid; gap:10px;">
+								${(globalNotify||[]).map(service=>{
+									const s = notifySettings?.[service] || {};
+									const taskCompleteEnabled = (s.task_complete !== undefined) ? !!s.task_complete : true;
+									const shopPurchaseEnabled = (s.shop_purchase !== undefined) ? !!s.shop_purchase : true;
+									const shopImageEnabled = (s.shop_image !== undefined) ? !!s.shop_image : true;
+									return html`
+										<ha-expansion-panel .header=${service} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
+											<div style="padding:10px; display:grid; gap:10px;">
+												<label style="display:flex;align-items:center;gap:8px;">
+													<ha-switch .checked=${taskCompleteEnabled} @change=${e=> this._setNotifyServiceSetting(service, 'task_complete', e.target.checked)}></ha-switch>
+													<span>${this._t('editor.notify_toggle_complete')}</span>
+												</label>
+												<label style="display:flex;align-items:center;gap:8px;">
+													<ha-switch .checked=${shopPurchaseEnabled} @change=${e=> this._setNotifyServiceSetting(service, 'shop_purchase', e.target.checked)}></ha-switch>
+													<span>${this._t('editor.notify_toggle_shop')}</span>
+												</label>
+												<label style="display:flex;align-items:center;gap:8px; margin-left:26px; opacity:${shopPurchaseEnabled ? '1' : '.5'};">
+													<ha-switch .checked=${shopImageEnabled} ?disabled=${!shopPurchaseEnabled} @change=${e=> this._setNotifyServiceSetting(service, 'shop_image', e.target.checked)}></ha-switch>
+													<span>${this._t('editor.notify_toggle_shop_image')}</span>
+												</label>
+											</div>
+										</ha-expansion-panel>
+									`;
+								})}
+							</div>
+						` : ''}
+					</div>
+				</div>
+			` : ''}
+
+			${cfg.mode==='admin' ? html`
+				<div class="section-box">
+					<div class="form-field">
+						<label>${this._t('editor.enable_points')}</label>
+						<label style="display:flex;align-items:center;gap:8px;">
+							<span>${this._t('ui.toggle_off_on')}</span>
+							<ha-switch .checked=${this._getGlobalEnablePoints()} @change=${async e=>{ const enabled=!!e.target.checked; await this._saveGlobalEnablePoints(enabled); this._config={...cfg, enable_points: enabled}; this._emit(); }}></ha-switch>
+						</label>
+						<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.enable_points_help')}</small>
+					</div>
+					<div class="form-field">
+						<label>${this._t('section.scoreboard')}</label>
+						<label style="display:flex;align-items:center;gap:8px;">
+							<span>${this._t('ui.toggle_off_on')}</span>
+							<ha-switch .checked=${(cfg.enable_points !== false) && (cfg.show_scoreboard !== false)} ?disabled=${cfg.enable_points === false} @change=${e=>{ this._config={...cfg, show_scoreboard: !!e.target.checked}; this._emit(); }}></ha-switch>
+						</label>
+					</div>
+				</div>
+
+				<div class="section-box">
+					<div class="form-field">
+						<label>${this._t('editor.colors')}</label>
+						<div style="display:grid; gap:12px; margin-top:8px;">
+						<ha-expansion-panel .header=${this._t('editor.color_group_start')} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
+							<div style="padding:10px;">
+								<div class="form-field" style="margin-top:6px;">
+									<label style="font-weight:600;">${this._t('editor.color_field_bg')}</label>
+									<div style="display:flex; gap:8px; align-items:center;">
+										<input .value=${cfg.start_task_bg||''} @input=${e=>{ this._config={...cfg, start_task_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
+										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.start_task_bg||'') ? cfg.start_task_bg : '#000000')} @change=${e=>{ this._config={...cfg, start_task_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
+											<button @click=${()=>{ this._config={...cfg, start_task_bg: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+									</div>
+								</div>
+								<div class="form-field" style="margin-top:6px;">
+									<label style="font-weight:600;">${this._t('editor.color_field_text')}</label>
+									<div style="display:flex; gap:8px; align-items:center;">
+										<input .value=${cfg.start_task_text||''} @input=${e=>{ this._config={...cfg, start_task_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
+										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.start_task_text||'') ? cfg.start_task_text : '#000000')} @change=${e=>{ this._config={...cfg, start_task_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
+											<button @click=${()=>{ this._config={...cfg, start_task_text: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+									</div>
+								</div>
+								<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.color_empty_default')}</small>
+							</div>
+						</ha-expansion-panel>
+
+						<ha-expansion-panel .header=${this._t('editor.color_group_complete')} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
+							<div style="padding:10px;">
+								<div class="form-field" style="margin-top:6px;">
+									<label style="font-weight:600;">${this._t('editor.color_field_bg')}</label>
+									<div style="display:flex; gap:8px; align-items:center;">
+										<input .value=${cfg.complete_task_bg||''} @input=${e=>{ this._config={...cfg, complete_task_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
+										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.complete_task_bg||'') ? cfg.complete_task_bg : '#000000')} @change=${e=>{ this._config={...cfg, complete_task_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
+											<button @click=${()=>{ this._config={...cfg, complete_task_bg: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+									</div>
+								</div>
+								<div class="form-field" style="margin-top:6px;">
+									<label style="font-weight:600;">${this._t('editor.color_field_text')}</label>
+									<div style="display:flex; gap:8px; align-items:center;">
+										<input .value=${cfg.complete_task_text||''} @input=${e=>{ this._config={...cfg, complete_task_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
+										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.complete_task_text||'') ? cfg.complete_task_text : '#000000')} @change=${e=>{ this._config={...cfg, complete_task_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
+											<button @click=${()=>{ this._config={...cfg, complete_task_text: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+									</div>
+								</div>
+								<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.color_empty_default')}</small>
+							</div>
+						</ha-expansion-panel>
+
+						<ha-expansion-panel .header=${this._t('btn.task_done')} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
+							<div style="padding:10px;">
+								<div class="form-field" style="margin-top:6px;">
+									<label style="font-weight:600;">${this._t('editor.color_field_bg')}</label>
+									<div style="display:flex; gap:8px; align-items:center;">
+										<input .value=${cfg.task_done_bg||''} @input=${e=>{ this._config={...cfg, task_done_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
+										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.task_done_bg||'') ? cfg.task_done_bg : '#000000')} @change=${e=>{ this._config={...cfg, task_done_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
+											<button @click=${()=>{ this._config={...cfg, task_done_bg: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+									</div>
+								</div>
+								<div class="form-field" style="margin-top:6px;">
+									<label style="font-weight:600;">${this._t('editor.color_field_text')}</label>
+									<div style="display:flex; gap:8px; align-items:center;">
+										<input .value=${cfg.task_done_text||''} @input=${e=>{ this._config={...cfg, task_done_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
+										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.task_done_text||'') ? cfg.task_done_text : '#000000')} @change=${e=>{ this._config={...cfg, task_done_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
+											<button @click=${()=>{ this._config={...cfg, task_done_text: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+									</div>
+								</div>
+								<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.color_empty_default')}</small>
+							</div>
+						</ha-expansion-panel>
+
+						${cfg.enable_points === false ? '' : html`<ha-expansion-panel .header=${this._t('editor.color_group_kid_points')} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
+							<div style="padding:10px;">
+								<div class="form-field" style="margin-top:6px;">
+									<label style="font-weight:600;">${this._t('editor.color_field_bg')}</label>
+									<div style="display:flex; gap:8px; align-items:center;">
+										<input .value=${cfg.kid_points_bg||''} @input=${e=>{ this._config={...cfg, kid_points_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
+										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.kid_points_bg||'') ? cfg.kid_points_bg : '#000000')} @change=${e=>{ this._config={...cfg, kid_points_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
+											<button @click=${()=>{ this._config={...cfg, kid_points_bg: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+									</div>
+								</div>
+								<div class="form-field" style="margin-top:6px;">
+									<label style="font-weight:600;">${this._t('editor.color_field_text')}</label>
+									<div style="display:flex; gap:8px; align-items:center;">
+										<input .value=${cfg.kid_points_text||''} @input=${e=>{ this._config={...cfg, kid_points_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
+										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.kid_points_text||'') ? cfg.kid_points_text : '#000000')} @change=${e=>{ this._config={...cfg, kid_points_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
+											<button @click=${()=>{ this._config={...cfg, kid_points_text: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+									</div>
+								</div>
+								<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.color_empty_default')}</small>
+							</div>
+						</ha-expansion-panel>`}
+
+						${cfg.enable_points === false ? '' : html`<ha-expansion-panel .header=${this._t('editor.color_group_task_points')} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
+							<div style="padding:10px;">
+								<div class="form-field" style="margin-top:6px;">
+									<label style="font-weight:600;">${this._t('editor.color_field_bg')}</label>
+									<div style="display:flex; gap:8px; align-items:center;">
+										<input .value=${cfg.task_points_bg||''} @input=${e=>{ this._config={...cfg, task_points_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
+										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.task_points_bg||'') ? cfg.task_points_bg : '#000000')} @change=${e=>{ this._config={...cfg, task_points_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
+											<button @click=${()=>{ this._config={...cfg, task_points_bg: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+									</div>
+								</div>
+								<div class="form-field" style="margin-top:6px;">
+									<label style="font-weight:600;">${this._t('editor.color_field_text')}</label>
+									<div style="display:flex; gap:8px; align-items:center;">
+										<input .value=${cfg.task_points_text||''} @input=${e=>{ this._config={...cfg, task_points_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
+										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.task_points_text||'') ? cfg.task_points_text : '#000000')} @change=${e=>{ this._config={...cfg, task_points_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
+											<button @click=${()=>{ this._config={...cfg, task_points_text: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+									</div>
+								</div>
+								<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.color_empty_default')}</small>
+							</div>
+						</ha-expansion-panel>`}
+					</div>
+					</div>
+				</div>
+
+				<div class="section-box">
+					<div class="form-field">
+						<label>Font Sizes</label>
+						<div style="display:grid; gap:12px; margin-top:8px;">
+							<div class="form-field">
+								<label style="font-weight:600;">Task title</label>
+								<div style="display:flex; gap:8px; align-items:center;">
+									<input type="number" min="10" max="40" step="1" .value=${(fsTitle||'').replace('px','')} @input=${e=>{ const raw=String(e.target.value||'').trim(); this._fsTaskTitle = raw; const v = raw==='' ? '' : `${Number(raw)}px`; this._saveGlobalUiSettings({ kid_task_title_size: v }); }} placeholder="16" style="flex:1;" />
+									<span style="opacity:.8; white-space:nowrap;">px</span>
+									<button @click=${()=>{ this._fsTaskTitle=''; this._saveGlobalUiSettings({ kid_task_title_size: '' }); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+								</div>
+							</div>
+							<div class="form-field">
+								<label style="font-weight:600;">Task points</label>
+								<div style="display:flex; gap:8px; align-items:center;">
+									<input type="number" min="10" max="30" step="1" .value=${(fsPoints||'').replace('px','')} @input=${e=>{ const raw=String(e.target.value||'').trim(); this._fsTaskPoints = raw; const v = raw==='' ? '' : `${Number(raw)}px`; this._saveGlobalUiSettings({ kid_task_points_size: v }); }} placeholder="12" style="flex:1;" />
+									<span style="opacity:.8; white-space:nowrap;">px</span>
+									<button @click=${()=>{ this._fsTaskPoints=''; this._saveGlobalUiSettings({ kid_task_points_size: '' }); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+								</div>
+							</div>
+							<div class="form-field">
+								<label style="font-weight:600;">Task button text</label>
+								<div style="display:flex; gap:8px; align-items:center;">
+									<input type="number" min="10" max="30" step="1" .value=${(fsButton||'').replace('px','')} @input=${e=>{ const raw=String(e.target.value||'').trim(); this._fsTaskButton = raw; const v = raw==='' ? '' : `${Number(raw)}px`; this._saveGlobalUiSettings({ kid_task_button_size: v }); }} placeholder="14" style="flex:1;" />
+									<span style="opacity:.8; white-space:nowrap;">px</span>
+									<button @click=${()=>{ this._fsTaskButton=''; this._saveGlobalUiSettings({ kid_task_button_size: '' }); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
+								</div>
+							</div>
+						</div>
+					</div>
+				</div>
+			` : ''}
+
+			${cfg.mode==='kid' ? html`
+				<div class="section-box">
+					<div class="form-field">
+						<label>${this._t('editor.child_label')}</label>
+						${kids.length ? html`
+							<select @change=${e=>{ this._config={...cfg, child: e.target.value}; this._emit(); }}>
+								<option value="" ?selected=${!cfg.child}>${this._t('editor.child_select_prompt')}</option>
+								${cfg.child && !kids.includes(cfg.child) ? html`<option value=${cfg.child} ?selected=${true}>(custom) ${cfg.child}</option>`: ''}
+								${kids.map(n=> html`<option value=${n} ?selected=${n===cfg.child}>${n}</option>`) }
+							</select>
+						`: html`
+							<input .value=${cfg.child||''} @input=${e=>{ this._config={...cfg, child: e.target.value}; this._emit(); }} placeholder="${this._t('editor.child_placeholder')}" />
+							<small style="opacity:.8;">${this._t('editor.child_hint')}</small>
+						`}
+					</div>
+				</div>
+			`:''}
+		</div>`;
+	}
+	static get styles(){
+		return css`
+			.card-config{ display:grid; gap:12px; }
+			.section-box{ border:1px solid var(--divider-color); border-radius: var(--ha-card-border-radius, 12px); padding: 12px; display:grid; gap:10px; }
+			label{ display:block; font-weight:600; margin-bottom:4px; }
+			input,select{ width:100%; padding:8px 10px; border-radius:8px; border:1px solid var(--divider-color); background: var(--card-background-color); color: var(--primary-text-color); }
+			ha-expansion-panel{ background: var(--ha-card-background, var(--card-background-color)); }
+		`;
+	}
+}
+
+export function install(Card, deps){
+	({ c4kLocalize, c4kUploadFile } = deps);
+	try{ customElements.define('chores4kids-card-editor', Chores4KidsDevCardEditor); }catch(e){ /* ignore */ }
+}
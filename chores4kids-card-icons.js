@@ -0,0 +1,249 @@
+// Chores4Kids card: icon picker (curated set, MDI search, custom icons).
+// Imported on demand by the admin view when the picker is first opened.
+import { html } from "https://unpkg.com/lit?module";
+
+// Curated icon set (full list from original admin card)
+const C4K_ICON_SET = [
+	{ id:'mdi:broom', label:'Sweep' },
+	{ id:'mdi:bucket', label:'Mop' },
+	{ id:'mdi:vacuum', label:'Vacuum' },
+	{ id:'mdi:robot-vacuum', label:'Robot vacuum' },
+	{ id:'mdi:spray-bottle', label:'Wipe surfaces' },
+	{ id:'mdi:window-closed-variant', label:'Windows' },
+	{ id:'mdi:bucket-outline', label:'Bucket' },
+	{ id:'mdi:washing-machine', label:'Laundry wash' },
+	{ id:'mdi:tumble-dryer', label:'Laundry dry' },
+	{ id:'mdi:iron', label:'Iron clothes' },
+	{ id:'mdi:hanger', label:'Put away clothes' },
+	{ id:'mdi:wardrobe-outline', label:'Closet' },
+	{ id:'mdi:bed', label:'Make bed' },
+	{ id:'mdi:bed-single', label:'Tidy room' },
+	{ id:'mdi:trash-can-outline', label:'Take out trash' },
+	{ id:'mdi:recycle', label:'Recycling' },
+	{ id:'mdi:watering-can', label:'Water plants' },
+	{ id:'mdi:flower', label:'Garden' },
+	{ id:'mdi:leaf', label:'Leaves' },
+	{ id:'mdi:car-wash', label:'Wash car' },
+	{ id:'mdi:silverware-clean', label:'Dishes' },
+	{ id:'mdi:dishwasher', label:'Load dishwasher' },
+	{ id:'mdi:dishwasher-off', label:'Unload dishwasher' },
+	{ id:'mdi:table-furniture', label:'Set table' },
+	{ id:'mdi:table-chair', label:'Clear table' },
+	{ id:'mdi:pot-steam', label:'Cook' },
+	{ id:'mdi:stove', label:'Kitchen' },
+	{ id:'mdi:toothbrush-paste', label:'Brush teeth' },
+	{ id:'mdi:shower', label:'Shower' },
+	{ id:'mdi:toilet', label:'Bathroom' },
+	{ id:'mdi:book', label:'Homework' },
+	{ id:'mdi:school', label:'Study' },
+	{ id:'mdi:dog-side', label:'Walk dog' },
+	{ id:'mdi:cat', label:'Feed cat' },
+	{ id:'mdi:paw', label:'Pet care' },
+	{ id:'mdi:fish', label:'Feed fish' },
+	{ id:'mdi:sofa', label:'Living room' },
+	{ id:'mdi:bookshelf', label:'Books' },
+];
+
+class C4kIconPicker {
+	_renderIconModal(){
+		return html`<div class="overlay ${this._iconModalOpen?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._iconModalOpen=false; }}>
+			<div class="modal" style="max-width: 560px; width: min(95vw, 560px);" @click=${e=>e.stopPropagation()}>
+				<h3>${this._t('icon.choose')}</h3>
+				<div class="row" style="gap:8px; align-items:center;">
+					<input style="flex:1" placeholder="${this._t('icon.search')}" .value=${this._iconSearch||''} @input=${e=>{ this._iconSearch=e.target.value; this.requestUpdate(); }} />
+					${this._taskIcon ? html`<button class="btn-ghost" @click=${()=>{ this._taskIcon=''; this.requestUpdate(); }}>${this._t('icon.clear')}</button>`: ''}
+				</div>
+				${(()=>{ 
+					const q=String(this._iconSearch||'').toLowerCase(); 
+					const filter=(arr)=> arr.filter(i=> i.id.toLowerCase().includes(q) || (i.label||'').toLowerCase().includes(q)); 
+					const customIcons = (this._customIcons||[]).map(c=> ({id:c.id, label:c.label}));
+					const allIcons = [...customIcons, ...C4K_ICON_SET];
+					const recent=filter((this._iconRecents||[]).map(id=> {const found = allIcons.find(x=>x.id===id); return {id, label: found?.label || id};})).slice(0,12); 
+					const base=filter(C4K_ICON_SET);
+					const custom=filter(customIcons);
+					const tile=(i)=> html`<button class="btn-ghost" style="display:flex;align-items:center;gap:8px;border:1px solid var(--divider-color);border-radius:8px;padding:8px;" @click=${()=> this._pickIcon(i.id)}><ha-icon icon="${i.id}"></ha-icon><small>${i.label||i.id}</small></button>`; 
+					const customTile = html`<button class="btn-primary" style="display:flex;align-items:center;gap:8px;border:1px solid var(--divider-color);border-radius:8px;padding:8px;" @click=${()=> this._openCustomIconModal()}><ha-icon icon="mdi:plus-circle"></ha-icon><small>Custom</small></button>`;
+					return html`
+						${recent.length? html`<div style="font-size:.9rem;color:var(--secondary-text-color);margin:6px 0;">Recent</div>`:''}${recent.length? html`<div style="display:grid;grid-template-columns:repeat(auto-fill,minmax(120px,1fr));gap:8px;">${recent.map(tile)}</div>`:''}
+						${custom.length? html`<div style="font-size:.9rem;color:var(--secondary-text-color);margin:6px 0;">Custom</div>`:''}
+						${custom.length? html`<div style="display:grid;grid-template-columns:repeat(auto-fill,minmax(120px,1fr));gap:8px;">${custom.map(tile)}</div>`:''}
+						<div style="font-size:.9rem;color:var(--secondary-text-color);margin:6px 0;">All</div>
+						<div style="display:grid;grid-template-columns:repeat(auto-fill,minmax(120px,1fr));gap:8px;">${customTile}${base.map(tile)}</div>
+					`; 
+				})()}
+				<div class="row" style="justify-content:flex-end; margin-top:10px;"><button class="btn-ghost" @click=${()=> this._iconModalOpen=false}>${this._t('form.cancel')}</button></div>
+			</div>
+		</div>`;
+	}
+	_renderCustomIconModal(){
+		return html`<div class="overlay ${this._customIconModalOpen?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._closeCustomIconModal(); }}>
+			<div class="modal" style="max-width: 800px; width: min(95vw, 800px); max-height: 85vh; display:flex; flex-direction:column;" @click=${e=>e.stopPropagation()}>
+				<h3>Vælg Custom Icon</h3>
+				<div class="row" style="gap:8px; align-items:center; margin-bottom:8px;">
+					<input style="flex:1" placeholder="Søg efter ikon (f.eks. home, car, star, heart...)" .value=${this._customIconSearch||''} @input=${e=>{ this._customIconSearch=e.target.value; this._iconDisplayLimit = 200; this.requestUpdate(); }} />
+					${this._customIconSearch ? html`<button class="btn-ghost" @click=${()=>{ this._customIconSearch=''; this._iconDisplayLimit = 200; this.requestUpdate(); }}>Ryd</button>` : ''}
+				</div>
+				<div 
+					style="flex:1; overflow-y:auto; border:1px solid var(--divider-color); border-radius:8px; padding:12px; margin:8px 0; background:var(--card-background-color);"
+					@scroll=${(e) => {
+						const el = e.target;
+						const scrolledToBottom = el.scrollHeight - el.scrollTop <= el.clientHeight + 100;
+						if (scrolledToBottom && this._iconDisplayLimit < (this._availableIcons?.length || 0)) {
+							this._iconDisplayLimit += 200;
+							this.requestUpdate();
+						}
+					}}
+				>
+					${(()=>{
+						const q = String(this._customIconSearch||'').toLowerCase().trim();
+						// Hvis der ikke er ikoner endnu, vis loading
+						if(!this._availableIcons || !this._availableIcons.length) {
+							return html`<div style="text-align:center; padding:40px; color:var(--secondary-text-color);">
+								<ha-icon icon="mdi:loading" style="--mdc-icon-size:48px; animation: spin 1s linear infinite;"></ha-icon>
+								<div style="margin-top:12px;">Henter ikoner...</div>
+							</div>`;
+						}
+						// Filter baseret på søgning - både med og uden "mdi:" prefix
+						const filtered = q 
+							? this._availableIcons.filter(i=> {
+								const iconName = i.toLowerCase();
+								const searchTerm = q.startsWith('mdi:') ? q : q;
+								return iconName.includes(searchTerm) || iconName.replace('mdi:','').includes(searchTerm);
+							  })
+							: this._availableIcons;
+						
+						if(!filtered.length) {
+							return html`<div style="text-align:center; padding:40px; color:var(--secondary-text-color);">
+								<ha-icon icon="mdi:magnify-close" style="--mdc-icon-size:48px;"></ha-icon>
+								<div style="margin-top:12px;">Ingen ikoner fundet for "${this._customIconSearch}"</div>
+								<div style="margin-top:8px; font-size:0.85rem;">Prøv f.eks: home, car, star, heart, light, door</div>
+							</div>`;
+						}
+						
+						// Begræns til displayLimit for performance
+						const displayLimit = this._iconDisplayLimit || 200;
+						const toShow = filtered.slice(0, displayLimit);
+						const hasMore = filtered.length > displayLimit;
+						
+						return html`
+							<div style="display:grid; grid-template-columns:repeat(auto-fill,minmax(85px,1fr)); gap:8px;">
+								${toShow.map(icon=> html`
+									<button 
+										class="btn-ghost ${this._customIconPreview===icon?'btn-primary':''}" 
+										style="display:flex;flex-direction:column;align-items:center;justify-content:center;gap:6px;border:1px solid var(--divider-color);border-radius:10px;padding:12px 6px;min-height:90px;transition:all 0.2s ease;${this._customIconPreview===icon?'transform:scale(1.05);box-shadow:0 4px 12px rgba(var(--rgb-primary-color),0.3);border-color:var(--primary-color);':''}" 
+										@click=${()=>{ this._customIconPreview=icon; this._customIconLabel = icon.replace('mdi:','').split('-').map(w=> w.charAt(0).toUpperCase()+w.slice(1)).join(' '); this.requestUpdate(); }}
+										title="${icon}"
+									>
+										<ha-icon icon="${icon}" style="--mdc-icon-size:36px;"></ha-icon>
+										<small style="font-size:9px;text-align:center;word-break:break-word;line-height:1.3;max-width:100%;opacity:0.8;">${icon.replace('mdi:','').replace(/-/g,' ')}</small>
+									</button>
+								`)}
+							</div>
+							${hasMore ? html`
+								<div style="text-align:center; margin-top:16px; padding:12px; color:var(--secondary-text-color); font-size:0.9rem; background:color-mix(in srgb, var(--primary-color) 6%, transparent); border-radius:8px;">
+									<ha-icon icon="mdi:arrow-down" style="--mdc-icon-size:24px;"></ha-icon>
+									<div style="margin-top:6px;">Scroll ned for at se flere...</div>
+								</div>
+							` : ''}
+							<div style="text-align:center; margin-top:12px; padding:8px; color:var(--secondary-text-color); font-size:0.85rem;">
+								${q ? html`Viser <b>${toShow.length}</b> af <b>${filtered.length}</b> matchende ikoner` : html`Viser <b>${toShow.length}</b> af <b>${filtered.length}</b> ikoner`}
+							</div>
+						`;
+					})()}
+				</div>
+				${this._customIconPreview ? html`
+					<div style="border:1px solid var(--primary-color); border-radius:12px; padding:16px; margin-bottom:8px; background:color-mix(in srgb, var(--primary-color) 4%, transparent);">
+						<div style="font-size:.9rem; font-weight:600; color:var(--primary-text-color); margin-bottom:10px;">Valgt ikon:</div>
+						<div style="display:flex; align-items:center; gap:16px;">
+							<div style="width:80px; height:80px; display:grid; place-items:center; border:2px solid var(--primary-color); border-radius:12px; background:var(--card-background-color); box-shadow:0 2px 8px rgba(0,0,0,0.1);">
+								<ha-icon icon="${this._customIconPreview}" style="--mdc-icon-size:56px; color:var(--primary-color);"></ha-icon>
+							</div>
+							<div style="flex:1;">
+								<div style="font-size:.85rem; color:var(--secondary-text-color); margin-bottom:8px;">
+									<b>Ikon ID:</b> ${this._customIconPreview}
+								</div>
+								<div style="font-size:.85rem; color:var(--secondary-text-color); margin-bottom:6px;">Navngiv dit custom ikon:</div>
+								<input 
+									placeholder="F.eks. Mit Hjem, Min Favorit Stjerne, etc." 
+									.value=${this._customIconLabel||''} 
+									@input=${e=>{ this._customIconLabel=e.target.value; this.requestUpdate(); }}
+									style="width:100%; padding:10px; border-radius:8px; border:1px solid var(--divider-color);" 
+								/>
+							</div>
+						</div>
+					</div>
+				` : ''}
+				${(this._customIcons||[]).length ? html`
+					<div style="border:1px solid var(--divider-color); border-radius:12px; padding:12px; margin-bottom:8px; background:color-mix(in srgb, var(--success-color,#43a047) 4%, transparent);">
+						<div style="font-size:.9rem; font-weight:600; color:var(--primary-text-color); margin-bottom:8px; display:flex; align-items:center; gap:6px;">
+							<ha-icon icon="mdi:star-circle" style="--mdc-icon-size:20px; color:var(--success-color,#43a047);"></ha-icon>
+							Gemte Custom Ikoner (${(this._customIcons||[]).length})
+						</div>
+						<div style="display:grid; gap:6px;">
+							${(this._customIcons||[]).map(c=> html`
+								<div style="display:flex; align-items:center; gap:10px; padding:8px 10px; border-radius:8px; background:var(--card-background-color); border:1px solid var(--divider-color);">
+									<ha-icon icon="${c.id}" style="--mdc-icon-size:28px;"></ha-icon>
+									<span style="flex:1; font-weight:500;">${c.label}</span>
+									<small style="color:var(--secondary-text-color); font-size:10px;">${c.id}</small>
+									<button class="btn-danger icon-btn" @click=${()=> this._deleteCustomIcon(c.id)} title="Slet">
+										<ha-icon icon="mdi:delete"></ha-icon>
+									</button>
+								</div>
+							`)}
+						</div>
+					</div>
+				` : ''}
+				<div class="row" style="justify-content:flex-end; gap:8px; margin-top:8px;">
+					<button class="btn-ghost" @click=${()=> this._closeCustomIconModal()}>${this._t('form.cancel')}</button>
+					<button class="btn-primary" ?disabled=${!this._customIconPreview || !this._customIconLabel} @click=${()=> this._saveCustomIcon()}>${this._t('form.save')}</button>
+				</div>
+			</div>
+		</div>`;
+	}
+	_pickIcon(id){ this._taskIcon=id; try{ const arr=Array.isArray(this._iconRecents)? [...this._iconRecents]:[]; const next=[id,...arr.filter(x=>x!==id)].slice(0,12); this._iconRecents=next; localStorage.setItem('c4k_icn_recent', JSON.stringify(next)); }catch{} this._iconModalOpen=false; this.requestUpdate(); }
+	_openCustomIconModal(){ this._customIconModalOpen = true; this._customIconSearch = ''; this._customIconPreview = ''; this._customIconLabel = ''; this._iconDisplayLimit = 200; this._iconModalOpen = false; if(!this._availableIcons || !this._availableIcons.length) this._fetchAvailableIcons(); this.requestUpdate(); }
+	_closeCustomIconModal(){ this._customIconModalOpen = false; this._customIconSearch = ''; this._customIconPreview = ''; this._customIconLabel = ''; this._iconDisplayLimit = 200; this.requestUpdate(); }
+	async _fetchAvailableIcons(){ 
+		try{ 
+			// Hent ALLE MDI ikoner direkte fra CDN metadata
+			console.log('Fetching all MDI icons from CDN...');
+			const response = await fetch('https://cdn.jsdelivr.net/npm/@mdi/svg@latest/meta.json');
+			const data = await response.json();
+			
+			if (data && Array.isArray(data)) {
+				this._availableIcons = data.map(icon => `mdi:${icon.name}`).sort();
+				console.log('Successfully loaded ALL MDI icons:', this._availableIcons.length);
+				this.requestUpdate();
+				return;
+			}
+		} catch(e) {
+			console.warn('Could not fetch from MDI CDN:', e);
+		}
+		
+		// Fallback: Prøv Home Assistant's API
+		try{ 
+			const result = await this.hass.callWS({ type: 'frontend/get_icons', category: 'mdi' }); 
+			const icons = result?.resources?.mdi || {}; 
+			this._availableIcons = Object.keys(icons).map(k=> `mdi:${k}`).sort(); 
+			console.log('Loaded icons via HA WebSocket:', this._availableIcons.length);
+			this.requestUpdate(); 
+		}catch(e){ 
+			console.error('Could not fetch icons, using fallback list:', e); 
+			// Sidste fallback: Generate common icons
+			this._availableIcons = this._generateFallbackIcons();
+			console.log('Using fallback icons:', this._availableIcons.length);
+			this.requestUpdate();
+		} 
+	}
+	_generateFallbackIcons(){
+		// Fallback list med de mest almindelige ikoner
+		const common = ['home','car','star','heart','phone','email','calendar','clock','bell','light','fan','door','window','lock','key','trash','recycle','book','pen','pencil','brush','palette','music','headphones','speaker','microphone','camera','video','television','monitor','laptop','keyboard','mouse','gamepad','gift','shopping','cart','bag','wallet','credit-card','money','piggy-bank','food','pizza','coffee','beer','wine','leaf','flower','tree','sun','moon','cloud','umbrella','snowflake','fire','water','lightning','weather','thermometer','gauge','speedometer','wrench','hammer','screwdriver','tools','cog','settings','account','face','people','run','walk','bike','bus','train','airplane','rocket','boat','castle','office','store','hospital','school','bank','factory','warehouse','package','truck','van','ambulance','police','shield','alert','information','help','check','close','plus','minus','arrow','chevron','menu','dots','grid','list','chart','graph','table','download','upload','share','link','tag','label','bookmark','flag','pin','map','navigation','compass','target','crosshairs','eye','hide','lock-open','volume','brightness','wifi','bluetooth','battery','power','plug','usb','sd-card','memory','cpu','chip','server','cloud-outline','cloud-download','cloud-upload','folder','file','document','image','picture','note','text','format','undo','redo','save','print','scan','fax','timer','stopwatch','alarm','weather-cloudy','weather-rainy','weather-snowy','weather-windy','dog','cat','paw','fish','bug','bee','butterfly','baseball','basketball','football','soccer','tennis','golf','cards','dice','puzzle','robot','alien','ghost','skull','pizza-outline','hamburger','ice-cream','cake','cupcake','candy','apple','orange','banana','grapes','carrot','corn','bread','cheese','egg','cookie','donut','hot-dog','popcorn','soda','cup','glass','bottle','plate','silverware','pot','kettle','microwave','oven','fridge','dishwasher','washing-machine','tumble-dryer','iron','vacuum','broom','bucket','spray-bottle','mop','brush-variant','sponge','soap','towel','toilet','shower','bathtub','sink','mirror','toothbrush','razor','hair-dryer','perfume','ring','diamond','crown','medal','trophy','ticket','balloon','confetti','firework','party-popper','candle','lamp','lightbulb','desk-lamp','ceiling-light','chandelier','spotlight','led-strip','necklace','bracelet','watch','glasses','sunglasses','hat','shirt','tie','shoe','boot','sock','glove','jacket','umbrella-outline','backpack','briefcase','purse','luggage'];
+		return common.map(name=> `mdi:${name}`).sort();
+	}
+	_saveCustomIcon(){ const icon = String(this._customIconPreview||'').trim(); const label = String(this._customIconLabel||'').trim(); if(!icon || !label) return; const customs = Array.isArray(this._customIcons)? [...this._customIcons]:[]; const exists = customs.find(c=> c.id === icon); if(!exists){ customs.push({ id: icon, label }); try{ localStorage.setItem('c4k_custom_icons', JSON.stringify(customs)); }catch{} this._customIcons = customs; } this._pickIcon(icon); this._closeCustomIconModal(); }
+	_deleteCustomIcon(iconId){ const customs = Array.isArray(this._customIcons)? [...this._customIcons]:[]; const filtered = customs.filter(c=> c.id !== iconId); try{ localStorage.setItem('c4k_custom_icons', JSON.stringify(filtered)); }catch{} this._customIcons = filtered; this.requestUpdate(); }
+}
+
+export function install(Card, deps){
+	deps.installMethods(Card, C4kIconPicker);
+}
@@ -65,7 +65,7 @@ const C4K_I18N = {
 		'status.assigned':'Assigned','status.in_progress':'In progress','status.awaiting_approval':'Awaiting approval','status.approved':'Approved','status.rejected':'Rejected','status.unassigned':'Unassigned','status.taken':'Taken',
 		'status.overdue':'Overdue','overdue.reassign_prompt':'This task is also scheduled for today. Assign it again?','overdue.yes':'Yes, assign again','overdue.no':'No thanks',
 		// Shop
-		'shop.title':'Point shop','shop.open':'Open shop','shop.item':'Item','shop.price':'Price','shop.icon':'Icon','shop.image':'Image','shop.upload':'Upload image','shop.add_item':'Add item','shop.history':'Purchase history','shop.child':'Child','shop.when':'When','shop.date':'Date','shop.time':'Time','shop.advanced':'Advanced actions','shop.entity':'Entity','shop.operation':'Operation','shop.add_action':'Add action','shop.add_delay':'Add delay','shop.steps':'Steps','shop.seconds':'Seconds','shop.minutes':'Minutes','shop.hours':'Hours','shop.delay':'Delay','shop.active':'Active','shop.buy':'Buy','shop.bought':'Bought','shop.clear_history':'Clear history','confirm.clear_history':'Clear all purchase history?',
+		'list.show_more':'Show more ({n} left)', 'shop.title':'Point shop','shop.open':'Open shop','shop.item':'Item','shop.price':'Price','shop.icon':'Icon','shop.image':'Image','shop.upload':'Upload image','shop.add_item':'Add item','shop.history':'Purchase history','shop.child':'Child','shop.when':'When','shop.date':'Date','shop.time':'Time','shop.advanced':'Advanced actions','shop.entity':'Entity','shop.operation':'Operation','shop.add_action':'Add action','shop.add_delay':'Add delay','shop.steps':'Steps','shop.seconds':'Seconds','shop.minutes':'Minutes','shop.hours':'Hours','shop.delay':'Delay','shop.active':'Active','shop.buy':'Buy','shop.bought':'Bought','shop.clear_history':'Clear history','confirm.clear_history':'Clear all purchase history?',
 		// Child specific
 		'card.child_title_fallback': 'Chores4Kids – {name}',
 		'msg.child_not_found': 'Child not found. Check the name in card configuration.',
@@ -178,7 +178,7 @@ const C4K_I18N = {
 		'status.assigned':'Tildelt','status.in_progress':'I gang','status.awaiting_approval':'Afventer godkendelse','status.approved':'Godkendt','status.rejected':'Afvist','status.unassigned':'Ikke tildelt','status.taken':'Taget',
 		'status.overdue':'Forfalden','overdue.reassign_prompt':'Denne opgave er også planlagt i dag. Tildel den igen?','overdue.yes':'Ja, tildel igen','overdue.no':'Nej tak',
 		'debug.mark_overdue':'[TEST] Markér forfalden',
-		'shop.title':'Pointshop','shop.open':'Åbn shop','shop.item':'Vare','shop.price':'Pris','shop.icon':'Ikon','shop.image':'Billede','shop.upload':'Upload billede','shop.add_item':'Tilføj vare','shop.history':'Købshistorik','shop.child':'Barn','shop.when':'Tidspunkt','shop.date':'Dato','shop.time':'Tidspunkt','shop.advanced':'Avancerede handlinger','shop.entity':'Enhed','shop.operation':'Handling','shop.add_action':'Tilføj handling','shop.add_delay':'Tilføj delay','shop.steps':'Trin','shop.seconds':'Sekunder','shop.minutes':'Minutter','shop.hours':'Timer','shop.delay':'Forsinkelse','shop.active':'Aktiv','shop.buy':'Køb','shop.bought':'Købt','shop.clear_history':'Ryd historik','confirm.clear_history':'Ryd hele købshistorikken?',
+		'list.show_more':'Vis flere ({n} tilbage)', 'shop.title':'Pointshop','shop.open':'Åbn shop','shop.item':'Vare','shop.price':'Pris','shop.icon':'Ikon','shop.image':'Billede','shop.upload':'Upload billede','shop.add_item':'Tilføj vare','shop.history':'Købshistorik','shop.child':'Barn','shop.when':'Tidspunkt','shop.date':'Dato','shop.time':'Tidspunkt','shop.advanced':'Avancerede handlinger','shop.entity':'Enhed','shop.operation':'Handling','shop.add_action':'Tilføj handling','shop.add_delay':'Tilføj delay','shop.steps':'Trin','shop.seconds':'Sekunder','shop.minutes':'Minutter','shop.hours':'Timer','shop.delay':'Forsinkelse','shop.active':'Aktiv','shop.buy':'Køb','shop.bought':'Købt','shop.clear_history':'Ryd historik','confirm.clear_history':'Ryd hele købshistorikken?',
 			'card.child_title_fallback': 'Chores4Kids – {name}', 'msg.child_not_found': 'Barn ikke fundet. Tjek navn i kort-konfigurationen.', 'msg.no_tasks':'Ingen opgaver lige nu.', 'btn.done':'Fuldført', 'btn.start_task':'Start opgave', 'btn.complete_task':'Opgave klaret', 'btn.task_done':'Opgave færdig', 'btn.complete_bonus':'Færdiggør bonus', 'lbl.awaiting':'Afventer godkendelse', 'lbl.bonus':'Bonusopgave', 'lbl.bonus_locked':'Afslut hovedopgaven først', 'lbl.taken_by':'Opgave taget af {name}', 'lbl.points': 'point',
 			'section.daily_tasks': 'Dagens opgaver',
 			'section.weekly_tasks': 'Ugens opgaver',
@@ -248,7 +248,7 @@ const C4K_I18N = {
 			'btn.add_points':'Lägg till poäng','btn.reset_points':'Återställ poäng', 'points.title':'Lägg till poäng till {name}','points.quick':'Snabbtillägg','points.remove':'Snabb borttagning','points.custom':'Anpassat antal',
 			'err.title_required':'Titel krävs','err.points_required':'Poäng krävs','err.points_number':'Poäng måste vara ett tal','err.points_positive':'Poängen måste vara 0 eller mer',
 			'status.assigned':'Tilldelad','status.in_progress':'Pågår','status.awaiting_approval':'Väntar på godkännande','status.approved':'Godkänd','status.rejected':'Avvisad','status.unassigned':'Ej tilldelad','status.taken':'Tagen',
-			'shop.title':'Shop','shop.open':'Öppna shop','shop.item':'Vara','shop.price':'Pris','shop.icon':'Ikon','shop.image':'Bild','shop.upload':'Ladda upp bild','shop.add_item':'Lägg till vara','shop.history':'Köphistorik','shop.child':'Barn','shop.when':'Tidpunkt','shop.date':'Datum','shop.time':'Tid','shop.active':'Aktiv','shop.buy':'Köp','shop.bought':'Köpt','shop.clear_history':'Rensa historik','confirm.clear_history':'Rensa all köphistorik?',
+			'list.show_more':'Visa fler ({n} kvar)', 'shop.title':'Shop','shop.open':'Öppna shop','shop.item':'Vara','shop.price':'Pris','shop.icon':'Ikon','shop.image':'Bild','shop.upload':'Ladda upp bild','shop.add_item':'Lägg till vara','shop.history':'Köphistorik','shop.child':'Barn','shop.when':'Tidpunkt','shop.date':'Datum','shop.time':'Tid','shop.active':'Aktiv','shop.buy':'Köp','shop.bought':'Köpt','shop.clear_history':'Rensa historik','confirm.clear_history':'Rensa all köphistorik?',
 			'shop.advanced':'Avancerade åtgärder','shop.entity':'Enhet','shop.operation':'Åtgärd','shop.add_action':'Lägg till åtgärd','shop.add_delay':'Lägg till fördröjning','shop.steps':'Steg','shop.seconds':'Sekunder','shop.minutes':'Minuter','shop.hours':'Timmar','shop.delay':'Fördröjning',
 			'sort.configure':'Sortering','sort.title':'Välj ordning','sort.categories_order':'Ordning för kategorier','sort.none':'Ingen kategori','sort.save':'Spara','sort.reset':'Återställ',
 			'card.child_title_fallback':'Chores4Kids – {name}','msg.child_not_found':'Barn hittades inte. Kontrollera namnet i kortets konfiguration.','msg.no_tasks':'Inga uppgifter just nu.', 'btn.done':'Klar','btn.start_task':'Starta uppgift','btn.complete_task':'Uppgift klar','btn.task_done':'Uppgift klar','btn.complete_bonus':'Slutför bonus','lbl.awaiting':'Väntar på godkännande','lbl.bonus':'Bonusuppgift','lbl.bonus_locked':'Slutför huvuduppgiften först','lbl.taken_by':'Uppgiften är tagen av {name}','lbl.points':'poäng',
@@ -312,7 +312,7 @@ const C4K_I18N = {
 			'btn.add_points':'Legg til poeng','btn.reset_points':'Nullstill poeng', 'points.title':'Legg til poeng til {name}','points.quick':'Hurtig legg til','points.remove':'Hurtig trekk fra','points.custom':'Valgfritt antall',
 			'err.title_required':'Tittel er påkrevd','err.points_required':'Poeng må fylles ut','err.points_number':'Poeng må være et tall','err.points_positive':'Poeng må være 0 eller mer',
 			'status.assigned':'Tildelt','status.in_progress':'Pågår','status.awaiting_approval':'Avventer godkjenning','status.approved':'Godkjent','status.rejected':'Avvist','status.unassigned':'Ikke tildelt','status.taken':'Tatt',
-			'shop.title':'Butikk','shop.open':'Åpne butikk','shop.item':'Vare','shop.price':'Pris','shop.icon':'Ikon','shop.image':'Bilde','shop.upload':'Last opp bilde','shop.add_item':'Legg til vare','shop.history':'Kjøpshistorikk','shop.child':'Barn','shop.when':'Tidspunkt','shop.date':'Dato','shop.time':'Tidspunkt','shop.active':'Aktiv','shop.buy':'Kjøp','shop.bought':'Kjøpt','shop.clear_history':'Rydd historikk','confirm.clear_history':'Rydd hele kjøpshistorikken?',
+			'list.show_more':'Vis flere ({n} igjen)', 'shop.title':'Butikk','shop.open':'Åpne butikk','shop.item':'Vare','shop.price':'Pris','shop.icon':'Ikon','shop.image':'Bilde','shop.upload':'Last opp bilde','shop.add_item':'Legg til vare','shop.history':'Kjøpshistorikk','shop.child':'Barn','shop.when':'Tidspunkt','shop.date':'Dato','shop.time':'Tidspunkt','shop.active':'Aktiv','shop.buy':'Kjøp','shop.bought':'Kjøpt','shop.clear_history':'Rydd historikk','confirm.clear_history':'Rydd hele kjøpshistorikken?',
 			'shop.advanced':'Avanserte handlinger','shop.entity':'Enhet','shop.operation':'Handling','shop.add_action':'Legg til handling','shop.add_delay':'Legg til forsinkelse','shop.steps':'Steg','shop.seconds':'Sekunder','shop.minutes':'Minutter','shop.hours':'Timer','shop.delay':'Forsinkelse',
 			'sort.configure':'Sortering','sort.title':'Velg rekkefølge','sort.categories_order':'Rekkefølge for kategorier','sort.none':'Ingen kategori','sort.save':'Lagre','sort.reset':'Nullstill',
 			'card.child_title_fallback':'Chores4Kids – {name}','msg.child_not_found':'Barn ikke funnet. Sjekk navnet i kortkonfigurasjonen.','msg.no_tasks':'Ingen oppgaver nå.', 'btn.done':'Ferdig','btn.start_task':'Start oppgave','btn.complete_task':'Oppgave klar','btn.task_done':'Oppgave ferdig','btn.complete_bonus':'Fullfør bonus','lbl.awaiting':'Venter på godkjenning','lbl.bonus':'Bonusoppgave','lbl.bonus_locked':'Fullfør hovedoppgaven først','lbl.taken_by':'Oppgave tatt av {name}','lbl.points':'poeng',
@@ -376,7 +376,7 @@ const C4K_I18N = {
 			'btn.add_points':'Punkte hinzufügen','btn.reset_points':'Punkte zurücksetzen','points.title':'Punkte hinzufügen für {name}','points.quick':'Schnell hinzufügen','points.remove':'Schnell abziehen','points.custom':'Eigene Anzahl',
 			'err.title_required':'Titel ist erforderlich','err.points_required':'Punkte sind erforderlich','err.points_number':'Punkte müssen eine Zahl sein','err.points_positive':'Punkte müssen 0 oder mehr sein',
 			'status.assigned':'Zugewiesen','status.in_progress':'In Arbeit','status.awaiting_approval':'Wartet auf Genehmigung','status.approved':'Genehmigt','status.rejected':'Abgelehnt','status.unassigned':'Nicht zugewiesen','status.taken':'Vergeben',
-			'shop.title':'Shop','shop.open':'Shop öffnen','shop.item':'Artikel','shop.price':'Preis','shop.icon':'Symbol','shop.image':'Bild','shop.upload':'Bild hochladen','shop.add_item':'Artikel hinzufügen','shop.history':'Kaufhistorie','shop.child':'Kind','shop.when':'Zeitpunkt','shop.date':'Datum','shop.time':'Uhrzeit','shop.active':'Aktiv','shop.buy':'Kaufen','shop.bought':'Gekauft','shop.clear_history':'Historie löschen','confirm.clear_history':'Gesamte Kaufhistorie löschen?',
+			'list.show_more':'Mehr anzeigen ({n} übrig)', 'shop.title':'Shop','shop.open':'Shop öffnen','shop.item':'Artikel','shop.price':'Preis','shop.icon':'Symbol','shop.image':'Bild','shop.upload':'Bild hochladen','shop.add_item':'Artikel hinzufügen','shop.history':'Kaufhistorie','shop.child':'Kind','shop.when':'Zeitpunkt','shop.date':'Datum','shop.time':'Uhrzeit','shop.active':'Aktiv','shop.buy':'Kaufen','shop.bought':'Gekauft','shop.clear_history':'Historie löschen','confirm.clear_history':'Gesamte Kaufhistorie löschen?',
 			'shop.advanced':'Erweiterte Aktionen','shop.entity':'Entität','shop.operation':'Aktion','shop.add_action':'Aktion hinzufügen','shop.add_delay':'Verzögerung hinzufügen','shop.steps':'Schritte','shop.seconds':'Sekunden','shop.minutes':'Minuten','shop.hours':'Stunden','shop.delay':'Verzögerung',
 			'sort.configure':'Sortierung','sort.title':'Reihenfolge wählen','sort.categories_order':'Reihenfolge der Kategorien','sort.none':'Keine Kategorie','sort.save':'Speichern','sort.reset':'Zurücksetzen',
 			'card.child_title_fallback':'Chores4Kids – {name}','msg.child_not_found':'Kind nicht gefunden. Prüfe den Namen in der Kartenkonfiguration.','msg.no_tasks':'Keine Aufgaben gerade.', 'btn.done':'Fertig','btn.start_task':'Aufgabe starten','btn.complete_task':'Aufgabe erledigt','btn.task_done':'Aufgabe erledigt','btn.complete_bonus':'Bonus abschließen','lbl.awaiting':'Wartet auf Genehmigung','lbl.bonus':'Bonusaufgabe','lbl.bonus_locked':'Zuerst Hauptaufgabe abschließen','lbl.taken_by':'Aufgabe übernommen von {name}','lbl.points':'Punkte',
@@ -440,7 +440,7 @@ const C4K_I18N = {
 			'btn.add_points':'Añadir puntos','btn.reset_points':'Reiniciar puntos','points.title':'Añadir puntos a {name}','points.quick':'Añadir rápido','points.remove':'Quitar rápido','points.custom':'Cantidad personalizada',
 			'err.title_required':'El título es obligatorio','err.points_required':'Los puntos son obligatorios','err.points_number':'Los puntos deben ser un número','err.points_positive':'Los puntos deben ser 0 o más',
 			'status.assigned':'Asignada','status.in_progress':'En curso','status.awaiting_approval':'En espera de aprobación','status.approved':'Aprobada','status.rejected':'Rechazada','status.unassigned':'Sin asignar','status.taken':'Tomada',
-			'shop.title':'Tienda','shop.open':'Abrir tienda','shop.item':'Artículo','shop.price':'Precio','shop.icon':'Icono','shop.image':'Imagen','shop.upload':'Subir imagen','shop.add_item':'Añadir artículo','shop.history':'Historial de compras','shop.child':'Niño','shop.when':'Fecha y hora','shop.date':'Fecha','shop.time':'Hora','shop.active':'Activo','shop.buy':'Comprar','shop.bought':'Comprado','shop.clear_history':'Limpiar historial','confirm.clear_history':'¿Limpiar todo el historial de compras?',
+			'list.show_more':'Mostrar más (quedan {n})', 'shop.title':'Tienda','shop.open':'Abrir tienda','shop.item':'Artículo','shop.price':'Precio','shop.icon':'Icono','shop.image':'Imagen','shop.upload':'Subir imagen','shop.add_item':'Añadir artículo','shop.history':'Historial de compras','shop.child':'Niño','shop.when':'Fecha y hora','shop.date':'Fecha','shop.time':'Hora','shop.active':'Activo','shop.buy':'Comprar','shop.bought':'Comprado','shop.clear_history':'Limpiar historial','confirm.clear_history':'¿Limpiar todo el historial de compras?',
 			'shop.advanced':'Acciones avanzadas','shop.entity':'Entidad','shop.operation':'Operación','shop.add_action':'Añadir acción','shop.add_delay':'Añadir retraso','shop.steps':'Pasos','shop.seconds':'Segundos','shop.minutes':'Minutos','shop.hours':'Horas','shop.delay':'Retraso',
 			'sort.configure':'Ordenación','sort.title':'Elegir orden','sort.categories_order':'Orden de categorías','sort.none':'Sin categoría','sort.save':'Guardar','sort.reset':'Restablecer',
 			'card.child_title_fallback':'Chores4Kids – {name}','msg.child_not_found':'Niño no encontrado. Revisa el nombre en la configuración de la tarjeta.','msg.no_tasks':'No hay tareas por ahora.', 'btn.done':'Hecho','btn.start_task':'Iniciar tarea','btn.complete_task':'Tarea hecha','btn.task_done':'Tarea hecha','btn.complete_bonus':'Completar bono','lbl.awaiting':'En espera de aprobación','lbl.bonus':'Tarea de bono','lbl.bonus_locked':'Completa la tarea principal primero','lbl.taken_by':'Tarea tomada por {name}','lbl.points':'puntos',
@@ -504,7 +504,7 @@ const C4K_I18N = {
 			'btn.add_points':'Ajouter des points','btn.reset_points':'Réinitialiser les points','points.title':'Ajouter des points à {name}','points.quick':'Ajout rapide','points.remove':'Retrait rapide','points.custom':'Montant personnalisé',
 			'err.title_required':'Le titre est requis','err.points_required':'Les points sont requis','err.points_number':'Les points doivent être un nombre','err.points_positive':'Les points doivent être 0 ou plus',
 			'status.assigned':'Attribuée','status.in_progress':'En cours','status.awaiting_approval':'En attente d’approbation','status.approved':'Approuvée','status.rejected':'Rejetée','status.unassigned':'Non attribuée','status.taken':'Prise',
-			'shop.title':'Boutique','shop.open':'Ouvrir la boutique','shop.item':'Article','shop.price':'Prix','shop.icon':'Icône','shop.image':'Image','shop.upload':'Téléverser une image','shop.add_item':'Ajouter un article','shop.history':'Historique des achats','shop.child':'Enfant','shop.when':'Date et heure','shop.date':'Date','shop.time':'Heure','shop.active':'Actif','shop.buy':'Acheter','shop.bought':'Acheté','shop.clear_history':'Effacer l`historique','confirm.clear_history':'Effacer tout l`historique des achats?',
+			'list.show_more':'Afficher plus ({n} restants)', 'shop.title':'Boutique','shop.open':'Ouvrir la boutique','shop.item':'Article','shop.price':'Prix','shop.icon':'Icône','shop.image':'Image','shop.upload':'Téléverser une image','shop.add_item':'Ajouter un article','shop.history':'Historique des achats','shop.child':'Enfant','shop.when':'Date et heure','shop.date':'Date','shop.time':'Heure','shop.active':'Actif','shop.buy':'Acheter','shop.bought':'Acheté','shop.clear_history':'Effacer l`historique','confirm.clear_history':'Effacer tout l`historique des achats?',
 			'shop.advanced':'Actions avancées','shop.entity':'Entité','shop.operation':'Opération','shop.add_action':'Ajouter une action','shop.add_delay':'Ajouter un délai','shop.steps':'Étapes','shop.seconds':'Secondes','shop.minutes':'Minutes','shop.hours':'Heures','shop.delay':'Délai',
 			'sort.configure':'Tri','sort.title':'Choisir l’ordre','sort.categories_order':'Ordre des catégories','sort.none':'Aucune catégorie','sort.save':'Enregistrer','sort.reset':'Réinitialiser',
 			'card.child_title_fallback':'Chores4Kids – {name}','msg.child_not_found':'Enfant introuvable. Vérifiez le nom dans la configuration de la carte.','msg.no_tasks':'Aucune tâche pour le moment.', 'btn.done':'Terminé','btn.start_task':'Démarrer la tâche','btn.complete_task':'Tâche terminée','btn.task_done':'Tâche terminée','btn.complete_bonus':'Terminer le bonus','lbl.awaiting':'En attente d’approbation','lbl.bonus':'Tâche bonus','lbl.bonus_locked':'Terminer la tâche principale d\'abord','lbl.taken_by':'Tâche prise par {name}','lbl.points':'points',
@@ -568,7 +568,7 @@ const C4K_I18N = {
 			'btn.add_points':'Lisää pisteitä','btn.reset_points':'Nollaa pisteet','points.title':'Lisää pisteitä: {name}','points.quick':'Pikalisäys','points.remove':'Pikavähennys','points.custom':'Mukautettu määrä',
 			'err.title_required':'Otsikko on pakollinen','err.points_required':'Pisteet ovat pakolliset','err.points_number':'Pisteiden on oltava numero','err.points_positive':'Pisteiden on oltava 0 tai enemmän',
 			'status.assigned':'Määritetty','status.in_progress':'Käynnissä','status.awaiting_approval':'Odottaa hyväksyntää','status.approved':'Hyväksytty','status.rejected':'Hylätty','status.unassigned':'Ei määritetty','status.taken':'Varattu',
-			'shop.title':'Kauppa','shop.open':'Avaa kauppa','shop.item':'Tuote','shop.price':'Hinta','shop.icon':'Kuvake','shop.image':'Kuva','shop.upload':'Lataa kuva','shop.add_item':'Lisää tuote','shop.history':'Ostohistoria','shop.child':'Lapsi','shop.when':'Aika','shop.date':'Päiväys','shop.time':'Aika','shop.active':'Aktiivinen','shop.buy':'Osta','shop.bought':'Ostettu','shop.clear_history':'Tyhjennä historia','confirm.clear_history':'Tyhjennä koko ostohistoria?',
+			'list.show_more':'Näytä lisää ({n} jäljellä)', 'shop.title':'Kauppa','shop.open':'Avaa kauppa','shop.item':'Tuote','shop.price':'Hinta','shop.icon':'Kuvake','shop.image':'Kuva','shop.upload':'Lataa kuva','shop.add_item':'Lisää tuote','shop.history':'Ostohistoria','shop.child':'Lapsi','shop.when':'Aika','shop.date':'Päiväys','shop.time':'Aika','shop.active':'Aktiivinen','shop.buy':'Osta','shop.bought':'Ostettu','shop.clear_history':'Tyhjennä historia','confirm.clear_history':'Tyhjennä koko ostohistoria?',
 			'shop.advanced':'Edistyneet toiminnot','shop.entity':'Entiteetti','shop.operation':'Toiminto','shop.add_action':'Lisää toiminto','shop.add_delay':'Lisää viive','shop.steps':'Vaiheet','shop.seconds':'Sekuntia','shop.minutes':'Minuuttia','shop.hours':'Tuntia','shop.delay':'Viive',
 			'sort.configure':'Lajittelu','sort.title':'Valitse järjestys','sort.categories_order':'Kategorioiden järjestys','sort.none':'Ei kategoriaa','sort.save':'Tallenna','sort.reset':'Palauta',
 			'card.child_title_fallback':'Chores4Kids – {name}','msg.child_not_found':'Lasta ei löytynyt. Tarkista nimi kortin asetuksista.','msg.no_tasks':'Ei tehtäviä juuri nyt.', 'btn.done':'Valmis','btn.start_task':'Aloita tehtävä','btn.complete_task':'Tehtävä valmis','btn.task_done':'Tehtävä valmis','btn.complete_bonus':'Suorita bonus','lbl.awaiting':'Odottaa hyväksyntää','lbl.bonus':'Bonustehtävä','lbl.bonus_locked':'Suorita päätehtävä ensin','lbl.taken_by':'Tehtävän otti {name}','lbl.points':'pistettä',
@@ -632,7 +632,7 @@ const C4K_I18N = {
 			'btn.add_points':'Aggiungi punti','btn.reset_points':'Azzera punti','points.title':'Aggiungi punti a {name}','points.quick':'Aggiunta rapida','points.remove':'Rimozione rapida','points.custom':'Quantità personalizzata',
 			'err.title_required':'Titolo obbligatorio','err.points_required':'Punti obbligatori','err.points_number':'I punti devono essere un numero','err.points_positive':'I punti devono essere 0 o più',
 			'status.assigned':'Assegnata','status.in_progress':'In corso','status.awaiting_approval':'In attesa di approvazione','status.approved':'Approvata','status.rejected':'Rifiutata','status.unassigned':'Non assegnata','status.taken':'Presa',
-			'shop.title':'Negozio','shop.open':'Apri negozio','shop.item':'Articolo','shop.price':'Prezzo','shop.icon':'Icona','shop.image':'Immagine','shop.upload':'Carica immagine','shop.add_item':'Aggiungi articolo','shop.history':'Storico acquisti','shop.child':'Bambino','shop.when':'Data e ora','shop.date':'Data','shop.time':'Ora','shop.active':'Attivo','shop.buy':'Compra','shop.bought':'Comprato','shop.clear_history':'Cancella storico','confirm.clear_history':'Cancellare tutto lo storico acquisti?',
+			'list.show_more':'Mostra altri ({n} rimanenti)', 'shop.title':'Negozio','shop.open':'Apri negozio','shop.item':'Articolo','shop.price':'Prezzo','shop.icon':'Icona','shop.image':'Immagine','shop.upload':'Carica immagine','shop.add_item':'Aggiungi articolo','shop.history':'Storico acquisti','shop.child':'Bambino','shop.when':'Data e ora','shop.date':'Data','shop.time':'Ora','shop.active':'Attivo','shop.buy':'Compra','shop.bought':'Comprato','shop.clear_history':'Cancella storico','confirm.clear_history':'Cancellare tutto lo storico acquisti?',
 			'shop.advanced':'Azioni avanzate','shop.entity':'Entità','shop.operation':'Operazione','shop.add_action':'Aggiungi azione','shop.add_delay':'Aggiungi ritardo','shop.steps':'Passi','shop.seconds':'Secondi','shop.minutes':'Minuti','shop.hours':'Ore','shop.delay':'Ritardo',
 			'sort.configure':'Ordinamento','sort.title':'Scegli ordine','sort.categories_order':'Ordine categorie','sort.none':'Nessuna categoria','sort.save':'Salva','sort.reset':'Reimposta',
 			'card.child_title_fallback':'Chores4Kids – {name}','msg.child_not_found':'Bambino non trovato. Controlla il nome nella configurazione della scheda.','msg.no_tasks':'Nessuna attività al momento.', 'btn.done':'Fatto','btn.start_task':'Avvia attività','btn.complete_task':'Attività completata','btn.task_done':'Attività completata','btn.complete_bonus':'Completa bonus','lbl.awaiting':'In attesa di approvazione','lbl.bonus':'Attività bonus','lbl.bonus_locked':'Completa prima l\'attività principale','lbl.taken_by':'Attività presa da {name}','lbl.points':'punti',
@@ -692,47 +692,96 @@ function c4kLocalize(key, langOrHass, vars){
 	return txt;
 }
 
-// Curated icon set (full list from original admin card)
-const C4K_ICON_SET = [
-	{ id:'mdi:broom', label:'Sweep' },
-	{ id:'mdi:bucket', label:'Mop' },
-	{ id:'mdi:vacuum', label:'Vacuum' },
-	{ id:'mdi:robot-vacuum', label:'Robot vacuum' },
-	{ id:'mdi:spray-bottle', label:'Wipe surfaces' },
-	{ id:'mdi:window-closed-variant', label:'Windows' },
-	{ id:'mdi:bucket-outline', label:'Bucket' },
-	{ id:'mdi:washing-machine', label:'Laundry wash' },
-	{ id:'mdi:tumble-dryer', label:'Laundry dry' },
-	{ id:'mdi:iron', label:'Iron clothes' },
-	{ id:'mdi:hanger', label:'Put away clothes' },
-	{ id:'mdi:wardrobe-outline', label:'Closet' },
-	{ id:'mdi:bed', label:'Make bed' },
-	{ id:'mdi:bed-single', label:'Tidy room' },
-	{ id:'mdi:trash-can-outline', label:'Take out trash' },
-	{ id:'mdi:recycle', label:'Recycling' },
-	{ id:'mdi:watering-can', label:'Water plants' },
-	{ id:'mdi:flower', label:'Garden' },
-	{ id:'mdi:leaf', label:'Leaves' },
-	{ id:'mdi:car-wash', label:'Wash car' },
-	{ id:'mdi:silverware-clean', label:'Dishes' },
-	{ id:'mdi:dishwasher', label:'Load dishwasher' },
-	{ id:'mdi:dishwasher-off', label:'Unload dishwasher' },
-	{ id:'mdi:table-furniture', label:'Set table' },
-	{ id:'mdi:table-chair', label:'Clear table' },
-	{ id:'mdi:pot-steam', label:'Cook' },
-	{ id:'mdi:stove', label:'Kitchen' },
-	{ id:'mdi:toothbrush-paste', label:'Brush teeth' },
-	{ id:'mdi:shower', label:'Shower' },
-	{ id:'mdi:toilet', label:'Bathroom' },
-	{ id:'mdi:book', label:'Homework' },
-	{ id:'mdi:school', label:'Study' },
-	{ id:'mdi:dog-side', label:'Walk dog' },
-	{ id:'mdi:cat', label:'Feed cat' },
-	{ id:'mdi:paw', label:'Pet care' },
-	{ id:'mdi:fish', label:'Feed fish' },
-	{ id:'mdi:sofa', label:'Living room' },
-	{ id:'mdi:bookshelf', label:'Books' },
-];
+// Upload a File/Blob into /config/www/chores4kids. Streams through the integration's
+// HTTP view; falls back to the base64 service for older backends. Returns the /local URL.
+function c4kReadDataUrl(file){ return new Promise((resolve, reject)=>{ const r=new FileReader(); r.onload=()=>resolve(String(r.result)); r.onerror=()=>reject(r.error); r.readAsDataURL(file); }); }
+async function c4kUploadFile(hass, file, filename){
+	if (typeof hass?.fetchWithAuth === 'function'){
+		const form = new FormData();
+		form.append('file', file, filename);
+		let resp = null;
+		try{ resp = await hass.fetchWithAuth(`/api/chores4kids/upload?filename=${encodeURIComponent(filename)}`, { method:'POST', body: form }); }catch{ resp = null; }
+		if (resp?.ok){ const body = await resp.json(); return body.url || `/local/chores4kids/${filename}`; }
+		if (resp?.status === 413) throw new Error('file_too_large');
+		// 404/405: backend without the upload view -> use the service below
+		if (resp && resp.status !== 404 && resp.status !== 405) throw new Error(`upload_failed_${resp.status}`);
+	}
+	const dataUrl = await c4kReadDataUrl(file);
+	await hass.callService('chores4kids','upload_shop_image',{ filename, data: dataUrl });
+	return `/local/chores4kids/${filename}`;
+}
+
+// Card-local UI state kept in localStorage (completed timestamps, bonus progress).
+// Parsed values are cached per key and shared by all card instances; a write reaches
+// the other cards in this document directly and other tabs via BroadcastChannel (or
+// the storage event where that is unavailable). Nothing runs while nothing changes.
+const c4kSync = {
+	_raw: {}, _val: {}, _subs: new Set(), _channel: null,
+	_parse(raw){ try{ const v = raw ? JSON.parse(raw) : {}; return (v && typeof v === 'object') ? v : {}; }catch{ return {}; } },
+	get(key){
+		if (!(key in this._val)){
+			let raw = null; try{ raw = localStorage.getItem(key); }catch{}
+			this._raw[key] = raw; this._val[key] = this._parse(raw);
+		}
+		return this._val[key];
+	},
+	set(key, value, origin){
+		const raw = JSON.stringify(value || {});
+		this._raw[key] = raw; this._val[key] = value || {};
+		try{ localStorage.setItem(key, raw); }catch{}
+		try{ this._channel?.postMessage({ key, raw }); }catch{}
+		this._notify(key, origin);
+	},
+	_apply(key, raw){
+		if (!key || !String(key).startsWith('c4k_') || raw === this._raw[key]) return;
+		this._raw[key] = raw; this._val[key] = this._parse(raw);
+		this._notify(key);
+	},
+	_notify(key, origin){ for (const fn of this._subs){ if (fn !== origin){ try{ fn(key, this._val[key]); }catch{} } } },
+	_onStorage(e){ if (e.storageArea === localStorage) c4kSync._apply(e.key, e.newValue); },
+	subscribe(fn){
+		if (!this._subs.size){
+			if (typeof BroadcastChannel === 'function'){
+				try{ this._channel = new BroadcastChannel('chores4kids'); this._channel.onmessage = (e)=> this._apply(e.data?.key, e.data?.raw); }catch{ this._channel = null; }
+			}
+			if (!this._channel) window.addEventListener('storage', this._onStorage);
+		}
+		this._subs.add(fn);
+		return ()=>{
+			this._subs.delete(fn);
+			if (this._subs.size) return;
+			if (this._channel){ try{ this._channel.close(); }catch{} this._channel = null; }
+			window.removeEventListener('storage', this._onStorage);
+			// Another tab may write while nobody listens; re-read on next get().
+			this._raw = {}; this._val = {};
+		};
+	},
+};
+
+// How long a confirmed optimistic patch may wait for the sensors to catch up
+const C4K_PENDING_TTL_MS = 10000;
+
+// Lazily imported parts of the card (admin view, icon picker, config editor). Chunk URLs
+// reuse this module's ?v= token, which frontend.py derives from every bundle file, and
+// each chunk installs its methods on the card class once it has loaded.
+const C4K_CHUNK_QUERY = (()=>{ try{ return new URL(import.meta.url).search; }catch{ return ''; } })();
+const c4kChunkLoads = {};
+const c4kChunksInstalled = new Set();
+function c4kInstallMethods(Card, source){
+	for (const [key, desc] of Object.entries(Object.getOwnPropertyDescriptors(source.prototype))){
+		if (key !== 'constructor') Object.defineProperty(Card.prototype, key, desc);
+	}
+}
+function c4kChunkInstalled(name){ return c4kChunksInstalled.has(name); }
+function c4kLoadChunk(name){
+	return c4kChunkLoads[name] ||= import(new URL(`./chores4kids-card-${name}.js${C4K_CHUNK_QUERY}`, import.meta.url).href)
+		.then((mod)=>{
+			mod.install(Chores4KidsDevCard, { c4kLocalize, c4kUploadFile, installMethods: c4kInstallMethods });
+			c4kChunksInstalled.add(name);
+			return mod;
+		})
+		.catch((err)=>{ delete c4kChunkLoads[name]; throw err; });
+}
 
 class Chores4KidsDevCard extends LitElement {
 	static get properties(){
@@ -1086,6 +1135,10 @@ class Chores4KidsDevCard extends LitElement {
 		this._quickComplete = false;
 		this._skipApproval = false;
 		this._fastestWins = false;
+		// Long admin tables render a window of rows; older purchases are paged in on demand
+		this._rowWindow = {};
+		this._olderPurchases = [];
+		this._purchasesLoading = false;
 		// Child
 		this._shopOpen = false;
 		this._viewingTaskDesc = null;
@@ -1100,87 +1153,31 @@ class Chores4KidsDevCard extends LitElement {
 		// collapsed sections
 		try{ this._collapsed = JSON.parse(localStorage.getItem('c4k_admin_collapsed')||'{}') || {}; }catch{ this._collapsed = {}; }
 		// completed timestamps
-		try{ this._completed = JSON.parse(localStorage.getItem('c4k_completed_ts')||'{}') || {}; }catch{ this._completed = {}; }
+		this._completed = c4kSync.get('c4k_completed_ts');
 		// child-only visual bonus progress (no backend persistence)
-		try{ this._bonusVisual = JSON.parse(localStorage.getItem('c4k_bonus_visual')||'{}') || {}; }catch{ this._bonusVisual = {}; }
-		
-		// Bind storage listener
-		this._storageListener = this._handleStorageChange.bind(this);
-	}
-	_normalizeScheduleFlags(){
-		try{
-			// Carry unfinished cannot be combined with weekly/monthly
-			if (this._persistUntilDone){
-				this._weeklyEnabled = false;
-				this._monthlyEnabled = false;
-			}
-			// Weekly/monthly are mutually exclusive with repeat and with each other
-			if (this._weeklyEnabled){
-				this._monthlyEnabled = false;
-				this._repeatEnabled = false;
-				this._repeatDays = new Set();
-				this._openRepeatMenu = false;
-				this._persistUntilDone = false;
-				this._markOverdue = true;
-			}
-			if (this._monthlyEnabled){
-				this._weeklyEnabled = false;
-				this._repeatEnabled = false;
-				this._repeatDays = new Set();
-				this._openRepeatMenu = false;
-				this._persistUntilDone = false;
-				this._markOverdue = true;
-			}
-			if (this._repeatEnabled){
-				this._weeklyEnabled = false;
-				this._monthlyEnabled = false;
-			}
-		}catch{ /* ignore */ }
+		this._bonusVisual = c4kSync.get('c4k_bonus_visual');
+
+		this._onSyncChange = (key, value)=>{
+			if (key === 'c4k_completed_ts') this._completed = value;
+			else if (key === 'c4k_bonus_visual') this._bonusVisual = value;
+			else return;
+			this.requestUpdate();
+		};
 	}
 
 	connectedCallback() {
 		super.connectedCallback();
-		// Listen for localStorage changes from other tabs/cards
-		window.addEventListener('storage', this._storageListener);
-		// Also poll localStorage for changes (for same-page updates)
-		this._storageInterval = setInterval(() => {
-			try {
-				const stored = JSON.parse(localStorage.getItem('c4k_completed_ts') || '{}');
-				if (JSON.stringify(stored) !== JSON.stringify(this._completed)) {
-					console.log('Detected completed timestamp changes, updating...');
-					this._completed = stored;
-					this.requestUpdate();
-				}
-				const bonusStored = JSON.parse(localStorage.getItem('c4k_bonus_visual') || '{}');
-				if (JSON.stringify(bonusStored) !== JSON.stringify(this._bonusVisual)) {
-					this._bonusVisual = bonusStored;
-					this.requestUpdate();
-				}
-			} catch {}
-		}, 1000);
+		// Follow changes from other cards/tabs; pick up anything written while detached
+		this._unsubscribeSync = c4kSync.subscribe(this._onSyncChange);
+		this._completed = c4kSync.get('c4k_completed_ts');
+		this._bonusVisual = c4kSync.get('c4k_bonus_visual');
 	}
 
 	disconnectedCallback() {
 		super.disconnectedCallback();
-		window.removeEventListener('storage', this._storageListener);
-		if (this._storageInterval) {
-			clearInterval(this._storageInterval);
-		}
-	}
-
-	_handleStorageChange(e) {
-		if (e.key === 'c4k_completed_ts' && e.newValue) {
-			try {
-				console.log('Storage event detected for completed timestamps');
-				this._completed = JSON.parse(e.newValue);
-				this.requestUpdate();
-			} catch {}
-		}
-		if (e.key === 'c4k_bonus_visual') {
-			try {
-				this._bonusVisual = e.newValue ? JSON.parse(e.newValue) : {};
-				this.requestUpdate();
-			} catch {}
+		if (this._unsubscribeSync) {
+			this._unsubscribeSync();
+			this._unsubscribeSync = null;
 		}
 	}
 
@@ -1240,9 +1237,15 @@ class Chores4KidsDevCard extends LitElement {
 	_getBackendUiColors(){
 		try{
 			const states = this.hass?.states || {};
-			let s = states['sensor.chores4kids_ui'];
-			if (!s){
-				s = Object.values(states).find(st=>{
+			const s = this._uiSensor(states);
+			return this._memo('uiColors', [s], ()=> this._uiColorsFrom(s));
+		}catch{ return {}; }
+	}
+	_uiSensor(states){
+		let s = states['sensor.chores4kids_ui'] || (this._idUi && states[this._idUi]);
+		if (!s){
+			s = this._memo('uiSensorScan', [states], ()=>
+				Object.values(states).find(st=>{
 					try{
 						if (!st?.entity_id?.startsWith('sensor.')) return false;
 						const a = st.attributes || {};
@@ -1253,8 +1256,13 @@ class Chores4KidsDevCard extends LitElement {
 							|| ('kid_task_title_size' in a) || ('kid_task_points_size' in a) || ('kid_task_button_size' in a)
 							|| ('confetti_enabled' in a);
 					}catch{ return false; }
-				});
-			}
+				}));
+			if (s?.entity_id) this._idUi = s.entity_id;
+		}
+		return s;
+	}
+	_uiColorsFrom(s){
+		try{
 			const a = s?.attributes || {};
 			const out = {
 				start_task_bg: a.start_task_bg,
@@ -1301,59 +1309,15 @@ class Chores4KidsDevCard extends LitElement {
 		}catch{ /* ignore */ }
 	}
 
-	_toggleRepeat(e){
-		const enabled = !!(e?.target?.checked);
-		this._repeatEnabled = enabled;
-		if (enabled){
-			this._weeklyEnabled = false;
-			this._monthlyEnabled = false;
-		}
-		if (!enabled){
-			this._repeatDays = new Set();
-			this._repeatAssign = new Set();
-			this._openRepeatMenu = false;
-		}
-		this._normalizeScheduleFlags();
-		this.requestUpdate();
-	}
-	_toggleWeekly(e){
-		const enabled = !!(e?.target?.checked);
-		this._weeklyEnabled = enabled;
-		if (enabled){
-			this._monthlyEnabled = false;
-			this._repeatEnabled = false;
-			this._repeatDays = new Set();
-			this._openRepeatMenu = false;
-			// Weekly/monthly must not be used with carry unfinished
-			this._persistUntilDone = false;
-			this._markOverdue = true;
-		}
-		this._normalizeScheduleFlags();
-		this.requestUpdate();
-	}
-	_toggleMonthly(e){
-		const enabled = !!(e?.target?.checked);
-		this._monthlyEnabled = enabled;
-		if (enabled){
-			this._weeklyEnabled = false;
-			this._repeatEnabled = false;
-			this._repeatDays = new Set();
-			this._openRepeatMenu = false;
-			// Weekly/monthly must not be used with carry unfinished
-			this._persistUntilDone = false;
-			this._markOverdue = true;
-		}
-		this._normalizeScheduleFlags();
-		this.requestUpdate();
-	}
-
-	static getConfigElement(){ return document.createElement('chores4kids-card-editor'); }
+	static async getConfigElement(){ await c4kLoadChunk('editor'); return document.createElement('chores4kids-card-editor'); }
 	static getStubConfig(){ return { mode: 'admin' }; }
 
 	getCardSize(){ return this._mode==='admin'? 8 : 3; }
 
 	// Helpers
 	_t(key, vars){ return c4kLocalize(key, this.hass || navigator.language || 'en', vars); }
+	// Prefer a server-generated size variant (thumb | card | notify) when one exists.
+	_imageUrl(obj, variant){ return this._resolveUrl(obj?.image_variants?.[variant] || obj?.image || ''); }
 	_resolveUrl(url){
 		if (!url) return '';
 		if (String(url).startsWith('http') || String(url).startsWith('data:')) return url;
@@ -1556,20 +1520,23 @@ class Chores4KidsDevCard extends LitElement {
 			return this._effectiveStatus(task)==='taken' ? (this._takenTsFor(task) || undefined) : this._completedTsFor(task);
 		}catch{ return this._completedTsFor(task); }
 	}
-	_recordCompleted(taskId, ts){ try{ const map={...(this._completed||{})}; map[String(taskId)]=ts; this._completed=map; localStorage.setItem('c4k_completed_ts', JSON.stringify(map)); }catch{} }
-	_clearCompleted(taskId){ try{ const map={...(this._completed||{})}; delete map[String(taskId)]; this._completed=map; localStorage.setItem('c4k_completed_ts', JSON.stringify(map)); }catch{} }
+	_recordCompleted(taskId, ts){ try{ const map={...(this._completed||{})}; map[String(taskId)]=ts; this._completed=map; c4kSync.set('c4k_completed_ts', map, this._onSyncChange); }catch{} }
+	_clearCompleted(taskId){ try{ const map={...(this._completed||{})}; delete map[String(taskId)]; this._completed=map; c4kSync.set('c4k_completed_ts', map, this._onSyncChange); }catch{} }
 
 	// ===== CATEGORY SORTING HELPERS =====
-	_catOrderResolved(){
+	_catOrderResolved(){ return [...this._catOrderMemo().order]; }
+	_catOrderMemo(){
 		const cats = this._store.categories||[];
-		const NONE='__none__';
-		let order = Array.isArray(this._catOrder)? [...this._catOrder]:[];
-		order = order.filter(id=> id===NONE || cats.some(c=> c.id===id));
-		for (const c of cats){ if (!order.includes(c.id)) order.push(c.id); }
-		if (!order.includes(NONE)) order.push(NONE);
-		return order;
+		return this._memo('catOrder', [cats, this._catOrder], ()=>{
+			const NONE='__none__';
+			let order = Array.isArray(this._catOrder)? [...this._catOrder]:[];
+			order = order.filter(id=> id===NONE || cats.some(c=> c.id===id));
+			for (const c of cats){ if (!order.includes(c.id)) order.push(c.id); }
+			if (!order.includes(NONE)) order.push(NONE);
+			return { order, rank: new Map(order.map((id, idx)=> [id, idx])), byId: new Map(cats.map(c=> [c.id, c])), orderedFor: new WeakMap() };
+		});
 	}
-	_catRankForId(id){ const order=this._catOrderResolved(); const idx=order.indexOf(id); return idx>=0? idx : 9999; }
+	_catRankForId(id){ const idx=this._catOrderMemo().rank.get(id); return idx!==undefined? idx : 9999; }
 	_taskCatRank(t){ const ids=Array.isArray(t?.categories)? t.categories:[]; if(ids.length){ let best=9999; for(const cid of ids){ const r=this._catRankForId(cid); if(r<best) best=r; } return best; } return this._catRankForId('__none__'); }
 	_sortTasks(list, withStatus=false){
 		const parse=(x)=>{ try{ return x? new Date(x).getTime():0; }catch{return 0;} };
@@ -1581,7 +1548,7 @@ class Chores4KidsDevCard extends LitElement {
 			return String(a.title||'').localeCompare(String(b.title||''));
 		});
 	}
-	_categoryById(id){ try{ return (this._store.categories||[]).find(c=> c.id===id); }catch{ return null; } }
+	_categoryById(id){ try{ return this._catOrderMemo().byId.get(id); }catch{ return null; } }
 	_normalizeHexColor(value){
 		try{
 			let v = String(value||'').trim().toLowerCase();
@@ -1617,39 +1584,157 @@ class Chores4KidsDevCard extends LitElement {
 	}
 	_orderedCategories(ids){
 		try{
-			const cats=this._store.categories||[];
-			const catMap=new Map(cats.map(c=>[c.id,c]));
+			// Task rows pass the same ids array until the tasks sensor changes
+			const memo=this._catOrderMemo(); const catMap=memo.byId;
+			const cacheable=Array.isArray(ids);
+			if (cacheable && memo.orderedFor.has(ids)) return memo.orderedFor.get(ids);
 			const clean=(ids||[]).filter(id=> catMap.has(id));
 			const sorted=[...clean].sort((a,b)=> this._catRankForId(a)-this._catRankForId(b));
-			return sorted.map(id=> catMap.get(id)).filter(Boolean);
+			const out=sorted.map(id=> catMap.get(id)).filter(Boolean);
+			if (cacheable) memo.orderedFor.set(ids, out);
+			return out;
 		}catch{ return []; }
 	}
 	_orderedCategoryNames(ids){ const cats=this._store.categories||[]; const catMap=new Map(cats.map(c=>[c.id,c.name])); const clean=(ids||[]).filter(id=> catMap.has(id)); const sorted=[...clean].sort((a,b)=> this._catRankForId(a)-this._catRankForId(b)); return sorted.map(id=> catMap.get(id)); }
 
 	// ===== STORE =====
-	get _store(){
-		const states = this.hass?.states || {};
-		const children = Object.values(states)
-			.filter((s)=> s && s.entity_id?.startsWith('sensor.') && s.attributes?.child_id && (s.attributes?.slug !== undefined))
-			.map((s)=> ({ id: s.attributes.child_id, name: s.attributes.name, slug: s.attributes.slug, points: Number(s.state||0), tasks: s.attributes.tasks||[] }));
+	// Derived data is memoized on the last_updated of the integration's sensors, so
+	// state changes of unrelated entities neither rebuild it nor re-render the card.
+	_memo(name, deps, fn){
+		const memos = this._memos || (this._memos = {});
+		const m = memos[name];
+		if (m && m.deps.length === deps.length && m.deps.every((d, i)=> d === deps[i])) return m.value;
+		const value = fn();
+		memos[name] = { deps, value };
+		return value;
+	}
+	_childSensors(states){
+		const ids = this._childIds;
+		const count = Object.keys(states).length;
+		if (ids && this._childIdsCount === count && ids.every((id)=> states[id])) return ids.map((id)=> states[id]);
+		const found = Object.values(states)
+			.filter((s)=> s && s.entity_id?.startsWith('sensor.') && s.attributes?.child_id && (s.attributes?.slug !== undefined));
+		this._childIds = found.map((s)=> s.entity_id);
+		this._childIdsCount = count;
+		return found;
+	}
+	_storeSources(states){
 		// tasks
 		let allTasksSensor = this._idTasks && states[this._idTasks];
 		if (!allTasksSensor){ allTasksSensor = Object.values(states).find((s)=> s?.entity_id?.includes('chores4kids_tasks') && s.attributes?.tasks); if (allTasksSensor?.entity_id) this._idTasks = allTasksSensor.entity_id; }
-		const allTasks = allTasksSensor?.attributes?.tasks || [];
-		const categories = allTasksSensor?.attributes?.categories || [];
 		// shop
 		let shopSensor = this._idShop && states[this._idShop];
 		if (!shopSensor){ shopSensor = Object.values(states).find((s)=> s?.entity_id?.includes('chores4kids_shop')); if (shopSensor?.entity_id) this._idShop = shopSensor.entity_id; }
-		const items = shopSensor?.attributes?.items || [];
-		const purchases = shopSensor?.attributes?.purchases || [];
-		return { children, allTasks, items, purchases, categories };
+		const childSensors = this._childSensors(states);
+		const uiSensor = this._uiSensor(states);
+		const key = [allTasksSensor, shopSensor, uiSensor, ...childSensors].map((s)=> s ? `${s.entity_id}@${s.last_updated}` : '-').join('|');
+		return { key, allTasksSensor, shopSensor, childSensors };
+	}
+	get _store(){
+		const states = this.hass?.states || {};
+		const memo = this._storeMemo;
+		const pendingRev = this._pendingRev || 0;
+		if (memo && memo.states === states && memo.pendingRev === pendingRev) return memo.value;
+		const src = this._storeSources(states);
+		if (memo && memo.key === src.key && memo.pendingRev === pendingRev){ memo.states = states; return memo.value; }
+		const children = src.childSensors
+			.map((s)=> ({ id: s.attributes.child_id, name: s.attributes.name, slug: s.attributes.slug, points: Number(s.state||0), tasks: this._overlayTasks(s.attributes.tasks||[]) }));
+		const allTasks = this._overlayTasks(src.allTasksSensor?.attributes?.tasks || []);
+		const categories = src.allTasksSensor?.attributes?.categories || [];
+		const items = src.shopSensor?.attributes?.items || [];
+		const purchases = src.shopSensor?.attributes?.purchases || [];
+		const purchasesTotal = Number(src.shopSensor?.attributes?.purchases_total ?? purchases.length);
+		const value = { children, allTasks, items, purchases, purchasesTotal, categories };
+		this._storeMemo = { states, key: src.key, pendingRev, value };
+		return value;
+	}
+
+	// ===== OPTIMISTIC UPDATES =====
+	// Task actions patch the task locally right away. Each patch is tagged with a pending
+	// id, dropped once the sensors carry the authoritative result (or a newer revision, or
+	// after C4K_PENDING_TTL_MS), and rolled back if the service call fails.
+	async _optimistic(taskId, patch, call){
+		const pending = this._pending || (this._pending = new Map());
+		const id = `${String(taskId)}:${(this._pendingSeq = (this._pendingSeq || 0) + 1)}`;
+		const entry = { taskId: String(taskId), patch, settled: false, rev: null, expires: 0 };
+		pending.set(id, entry);
+		this._pendingChanged();
+		try{
+			const result = await call();
+			entry.settled = true;
+			entry.rev = this._storeSources(this.hass?.states || {}).key;
+			entry.expires = Date.now() + C4K_PENDING_TTL_MS;
+			setTimeout(()=> this._reconcilePending(), C4K_PENDING_TTL_MS + 50);
+			this._reconcilePending();
+			return result;
+		}catch(err){
+			if (pending.delete(id)) this._pendingChanged();
+			throw err;
+		}
+	}
+	_pendingChanged(){ this._pendingRev = (this._pendingRev || 0) + 1; this.requestUpdate(); }
+	_overlayTasks(list){
+		if (!this._pending?.size || !Array.isArray(list)) return list;
+		const cache = this._overlayCache?.rev === this._pendingRev ? this._overlayCache : (this._overlayCache = { rev: this._pendingRev, lists: new WeakMap() });
+		if (cache.lists.has(list)) return cache.lists.get(list);
+		const patches = new Map();
+		for (const p of this._pending.values()) patches.set(p.taskId, { ...(patches.get(p.taskId) || {}), ...p.patch });
+		const out = list.map((t)=> patches.has(String(t?.id)) ? { ...t, ...patches.get(String(t.id)) } : t);
+		cache.lists.set(list, out);
+		return out;
+	}
+	_reconcilePending(){
+		if (!this._pending?.size) return;
+		const src = this._storeSources(this.hass?.states || {});
+		const serverTasks = this._memo('serverTasksById', [src.allTasksSensor], ()=> new Map((src.allTasksSensor?.attributes?.tasks || []).map((t)=> [String(t.id), t])));
+		const now = Date.now();
+		let changed = false;
+		for (const [id, p] of this._pending){
+			if (!p.settled) continue;
+			const server = serverTasks.get(p.taskId);
+			const applied = !server || Object.entries(p.patch).every(([k, v])=> server[k] === v);
+			if (applied || src.key !== p.rev || now >= p.expires){ this._pending.delete(id); changed = true; }
+		}
+		if (changed) this._pendingChanged();
+	}
+	willUpdate(changedProps){
+		if (this._pending?.size && changedProps.has('hass')) this._reconcilePending();
+	}
+
+	shouldUpdate(changedProps){
+		// A hass update that touched none of our sensors (and not language/theme) is skipped.
+		// The advanced shop modal lists arbitrary entities, so it always re-renders.
+		if (changedProps.size === 1 && changedProps.has('hass') && changedProps.get('hass') && !this._advItem){
+			const h = this.hass;
+			const key = `${this._storeSources(h?.states || {}).key}|${h?.language}|${h?.locale?.language}|${h?.themes?.darkMode}`;
+			const same = key === this._renderKey;
+			this._renderKey = key;
+			return !same;
+		}
+		this._renderKey = undefined;
+		return true;
 	}
 
 	// ===== RENDER =====
 	render(){
+		if (this._mode==='admin' && !this._ensureChunk('admin')) return this._renderChunkPending();
 		return this._mode==='admin' ? this._renderAdmin() : (this._mode==='kid' ? this._renderChild() : this._renderOverviewOnly());
 	}
 
+	_chunkReady(name){ return c4kChunkInstalled(name); }
+	_ensureChunk(name){
+		if (c4kChunkInstalled(name)) return true;
+		if (!this._chunkError){
+			c4kLoadChunk(name).then(()=> this.requestUpdate()).catch((err)=>{ console.error(`Chores4Kids: loading ${name} failed`, err); this._chunkError = String(err?.message || err); this.requestUpdate(); });
+		}
+		return false;
+	}
+	_renderChunkPending(){
+		return html`<ha-card><div class="card-content" style="display:grid;place-items:center;min-height:96px;">
+			${this._chunkError ? html`<i>${this._chunkError}</i>` : html`<ha-icon icon="mdi:loading" style="--mdc-icon-size:32px; animation: spin 1s linear infinite;"></ha-icon>`}
+		</div></ha-card>`;
+	}
+
 	_isCollapsed(key){ try{ return !!(this._collapsed && this._collapsed[key]); }catch{ return false; } }
 	_toggleSection(key){ const next={ ...(this._collapsed||{}) }; next[key]=!this._isCollapsed(key); this._collapsed=next; try{ localStorage.setItem('c4k_admin_collapsed', JSON.stringify(next)); }catch{} this.requestUpdate(); }
 
@@ -1678,7 +1763,7 @@ class Chores4KidsDevCard extends LitElement {
 		if (!id) return;
 		const next = { ...(this._bonusVisual||{}), [id]: String(state||'assigned') };
 		this._bonusVisual = next;
-		try{ localStorage.setItem('c4k_bonus_visual', JSON.stringify(next)); }catch{}
+		c4kSync.set('c4k_bonus_visual', next, this._onSyncChange);
 		this.requestUpdate();
 	}
 
@@ -1692,8 +1777,8 @@ class Chores4KidsDevCard extends LitElement {
 		this._setTaskBusy(t.id, true);
 		try{
 			if (!t?.bonus_completed_ts){
-				await this.hass.callService('chores4kids','complete_bonus_task',{ task_id: t.id, completed_ts: Date.now() });
-				t.bonus_completed_ts = Date.now();
+				const ts = Date.now();
+				await this._optimistic(t.id, { bonus_completed_ts: ts }, ()=> this.hass.callService('chores4kids','complete_bonus_task',{ task_id: t.id, completed_ts: ts }));
 			}
 			this._setBonusVisualState(t.id, 'done');
 			this._playCompletionSound();
@@ -1713,10 +1798,12 @@ class Chores4KidsDevCard extends LitElement {
 		if (this._isTaskBusy(t.id)) return;
 		this._setTaskBusy(t.id, true);
 		try{
-			if (!t?.bonus_completed_ts){
-				await this.hass.callService('chores4kids','complete_bonus_task',{ task_id: t.id, completed_ts: Date.now() });
-			}
-			await this.hass.callService('chores4kids','approve_bonus_task',{ task_id: t.id });
+			await this._optimistic(t.id, { bonus_approved: true }, async ()=>{
+				if (!t?.bonus_completed_ts){
+					await this.hass.callService('chores4kids','complete_bonus_task',{ task_id: t.id, completed_ts: Date.now() });
+				}
+				await this.hass.callService('chores4kids','approve_bonus_task',{ task_id: t.id });
+			});
 			this._setBonusVisualState(t.id, 'done');
 		} finally {
 			this._setTaskBusy(t.id, false);
@@ -1726,16 +1813,15 @@ class Chores4KidsDevCard extends LitElement {
 	async _approveMainAndBonus(t){
 		if(!t?.id) return;
 		if (this._isTaskBusy(t.id)) return;
+		// Overdue auto-assigned tasks go through the re-assign prompt first
+		if (!this._hasBonusTask(t) || (this._isTaskOverdue(t) && this._autoAssignActive(t) && this._isScheduledToday(t))) return this._approve(t);
 		this._setTaskBusy(t.id, true);
 		try{
-			await this._approve(t);
-			if (this._reassignTask?.id === t.id) return;
-			if (!this._hasBonusTask(t)) return;
-			if (!t?.bonus_completed_ts){
-				await this.hass.callService('chores4kids','complete_bonus_task',{ task_id: t.id, completed_ts: Date.now() });
-			}
-			await this.hass.callService('chores4kids','approve_bonus_task',{ task_id: t.id });
+			// One round-trip: main task, bonus completion and bonus approval in a single backend save
+			await this._optimistic(t.id, { status: 'approved', bonus_approved: true }, ()=> this.hass.callService('chores4kids','approve_tasks',{ task_ids: [t.id], include_bonus: true }));
 			this._setBonusVisualState(t.id, 'done');
+		}catch(err){
+			console.error('Failed to approve task:', err);
 		} finally {
 			this._setTaskBusy(t.id, false);
 		}
@@ -1777,425 +1863,7 @@ class Chores4KidsDevCard extends LitElement {
 		if (t?.status !== 'approved') return '';
 		return html`<button class="btn-primary" ?disabled=${this._isTaskBusy(t.id)} @click=${()=>this._approveBonusOnly(t)}>${this._t('btn.approve_bonus')}</button>`;
 	}
-	_renderAdmin(){
-		const { children } = this._store; const totalKids = children.length;
-		const pointsEnabled = this._pointsEnabled();
-		const showScoreboard = pointsEnabled && (this.config?.show_scoreboard !== false);
-		return html`
-			<ha-card header="${this._t('card.admin_title')}">
-				<div class="card-content">
-					<div class="row">
-						<input placeholder="${this._t('input.new_child_name')}" .value=${this._name||''} @input=${(e)=>this._name=e.target.value} />
-						<button class="btn-primary" @click=${this._addChild}>${this._t('btn.add_child')}</button>
-						${pointsEnabled ? html`<button class="btn-ghost" style="margin-left:auto; min-height:40px;" @click=${()=>this._shopModalOpen=true}>${this._t('shop.open')}</button>` : ''}
-					</div>
-
-					<div class="list section">
-						<h3 class="h3-row">
-							<span class="collapsible" @click=${()=>this._toggleSection('children')}><ha-icon class="chev ${this._isCollapsed('children')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('section.children')} (${totalKids})</span>
-						</h3>
-						${this._isCollapsed('children')? '' : html`<div class="table-wrap"><table class="table-center">
-							<thead><tr><th>${this._t('th.name')}</th>${pointsEnabled ? html`<th>${this._t('th.points')}</th>`:''}<th>${this._t('th.pending')}</th><th>${this._t('th.actions')}</th></tr></thead>
-							<tbody>
-								${children.map((c)=> html`
-									<tr>
-										<td data-label="${this._t('th.name')}">${c.name}</td>
-										${pointsEnabled ? html`<td data-label="${this._t('th.points')}"><b>${c.points}</b></td>`:''}
-										<td data-label="${this._t('th.pending')}"><span class="badge status-awaiting_approval">${(c.tasks||[]).filter(t=>t.status==="awaiting_approval").length}</span></td>
-										<td data-label="${this._t('th.actions')}">
-											<button class="btn-ghost" @click=${()=>this._promptRename(c)}>${this._t('btn.rename')}</button>
-											${pointsEnabled ? html`<button class="btn-ghost" @click=${()=>this._openPoints(c)}>${this._t('btn.add_points')}</button>`:''}
-											${pointsEnabled ? html`<button class="btn-ghost" @click=${()=>this._resetPoints(c)}>${this._t('btn.reset_points')}</button>`:''}
-											<button class="btn-danger" @click=${()=>this._removeChild(c)}>${this._t('btn.delete')}</button>
-										</td>
-									</tr>
-								`)}
-							</tbody>
-						</table></div>`}
-					</div>
-
-					<hr />
-
-					<!-- Categories management -->
-					<div class="list section">
-						<h3 class="h3-row">
-							<span class="collapsible" @click=${()=>this._toggleSection('categories')}><ha-icon class="chev ${this._isCollapsed('categories')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('section.categories')} (${(this._store.categories||[]).length})</span>
-						</h3>
-						${this._isCollapsed('categories')? '' : html`<div class="row">
-							<input placeholder="${this._t('input.new_category_name')}" .value=${this._newCategoryName||''} @input=${(e)=> this._newCategoryName = e.target.value} />
-							<div class="color-cell" style="flex:0 0 auto; align-items:center;">
-								<input type="color" .value=${this._colorInputValue(this._newCategoryColor)} @change=${(e)=>{ this._newCategoryColor = e?.target?.value || ''; }} />
-							</div>
-							<button class="btn-ghost" @click=${this._addCategory}>${this._t('btn.add_category')}</button>
-						</div>
-						<div class="table-wrap"><table class="table-center">
-							<thead><tr><th>${this._t('th.name')}</th><th>${this._t('th.color')}</th><th>${this._t('th.actions')}</th></tr></thead>
-							<tbody>
-								${(this._store.categories||[]).map(cat=> html`
-									<tr>
-										<td data-label="${this._t('th.name')}">${cat.name}</td>
-										<td data-label="${this._t('th.color')}">
-											<div class="color-cell">
-												<input type="color" .value=${this._colorInputValue(cat?.color)} @change=${(e)=>this._setCategoryColor(cat, e)} />
-											</div>
-										</td>
-										<td data-label="${this._t('th.actions')}">
-											<button class="btn-ghost" @click=${()=> this._promptRenameCategory(cat)}>${this._t('btn.rename')}</button>
-											<button class="btn-danger" @click=${()=> this._deleteCategory(cat)}>${this._t('btn.delete')}</button>
-										</td>
-									</tr>
-								`)}
-							</tbody>
-						</table></div>`}
-					</div>
-
-					<hr />
-					<h3 class="h3-row"><span class="collapsible" @click=${()=>this._toggleSection('newtask')}><ha-icon class="chev ${this._isCollapsed('newtask')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('section.new_task')}</span></h3>
-					${this._isCollapsed('newtask')? '' : html`<div class="row fields">
-						<div class="form-field title">
-							<input class="${this._showTitleError? 'invalid':''}" placeholder="${this._t('ph.title')}" .value=${this._taskTitle||''} @input=${e=>{this._taskTitle=e.target.value; this.requestUpdate();}} />
-							<div class="error-space">${this._showTitleError? html`<span class="error-text">${this._t('err.title_required')}</span>`:''}</div>
-						</div>
-						${pointsEnabled ? html`
-							<div class="form-field points">
-								<input class="${this._showPointsError? 'invalid':''}" type="number" placeholder="${this._t('ph.points')}" .value=${this._taskPoints||''} @input=${e=>{this._taskPoints=e.target.value; this.requestUpdate();}} />
-								<div class="error-space">${this._pointsErrorKey? html`<span class="error-text">${this._t(this._pointsErrorKey)}</span>`:''}</div>
-							</div>
-						` : ''}
-					</div>
-					<div class="row"><textarea rows="2" placeholder="${this._t('ph.description')}" .value=${this._taskDesc||''} @input=${e=>this._taskDesc=e.target.value}></textarea></div>
-					<div class="row">
-						<div style="flex:1 1 260px;">
-							<div style="font-size:.9rem; color: var(--secondary-text-color); margin-bottom:4px;">${this._t('ph.categories')}</div>
-							<div class="multi-dd" @click=${(e)=>{ e.stopPropagation(); this._openCategoriesMenu = !this._openCategoriesMenu; }}>
-								<div class="box">
-									<span class="multi-dd-value ${this._taskCategories && this._taskCategories.size ? '' : 'placeholder'}">
-										${(()=>{ const ids=this._taskCategories||new Set(); const names=(this._store.categories||[]).filter(c=> ids.has(c.id)).map(c=>c.name); return names.length? (names.slice(0,2).join(', ')+(names.length>2?` +${names.length-2}`:'')) : this._t('select.categories'); })()}
-									</span>
-									<ha-icon icon="mdi:chevron-down"></ha-icon>
-								</div>
-								${this._openCategoriesMenu ? html`
-									<div class="multi-dd-menu" @click=${e=> e.stopPropagation()}>
-										${(this._store.categories||[]).map(c=> html`<label><input type="checkbox" .checked=${this._taskCategories?.has?.(c.id)} @change=${(e)=>{ const s=this._taskCategories instanceof Set? this._taskCategories : new Set(this._taskCategories||[]); if(e.target.checked){ s.add(c.id);}else{ s.delete(c.id);} this._taskCategories=s; this.requestUpdate(); }} /><span>${c.name}</span></label>`) }
-									</div>
-								` : ''}
-							</div>
-						</div>
-					</div>
-					<div class="row" style="justify-content:flex-start; align-items:flex-start;">
-						<div style="flex:1 1 520px; min-width:260px;">
-							<div style="display:flex; flex-direction:column; gap:6px; align-items:flex-start;">
-								${pointsEnabled ? html`
-									<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
-										<input style="margin:0;" type="checkbox" .checked=${!!this._taskEarlyBonusEnabled} @change=${e=>{ this._taskEarlyBonusEnabled = !!e.target.checked; this.requestUpdate(); }} />
-										<span style="white-space:nowrap;">${this._t('ui.early_bonus_enabled')}</span>
-									</label>
-									<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
-										<input style="margin:0;" type="checkbox" .checked=${!!this._taskBonusEnabled} @change=${e=>{ this._taskBonusEnabled = !!e.target.checked; this.requestUpdate(); }} />
-										<span style="white-space:nowrap;">${this._t('ui.bonus_task')}</span>
-									</label>
-									${this._taskBonusEnabled ? html`
-										<div style="width:100%;">
-											<div class="row fields" style="margin-top:4px;">
-												<div class="form-field">
-													<input placeholder="${this._t('ph.bonus_title')}" .value=${this._taskBonusTitle||''} @input=${e=>{ this._taskBonusTitle=e.target.value; this.requestUpdate(); }} />
-												</div>
-												<div class="form-field">
-													<input type="number" min="0" step="1" placeholder="${this._t('ph.bonus_points')}" .value=${this._taskBonusPoints||''} @input=${e=>{ this._taskBonusPoints=e.target.value; this.requestUpdate(); }} />
-												</div>
-											</div>
-										</div>
-									` : ''}
-									${(!!this._taskEarlyBonusEnabled || String(this._taskDue||'').trim()) ? html`
-										<div style="width:100%;">
-											<div class="row fields" style="margin-top:4px;">
-												<div class="form-field">
-													<input type="date" placeholder="${this._t('ph.due')}" ?disabled=${(!!this._taskEarlyBonusEnabled) && (!!this._repeatEnabled || !!this._weeklyEnabled || !!this._monthlyEnabled)} .value=${this._taskDue||''} @input=${e=>{ this._taskDue=e.target.value; this.requestUpdate(); }} />
-													<div class="error-space">${((!!this._taskEarlyBonusEnabled) && (!!this._repeatEnabled || !!this._weeklyEnabled || !!this._monthlyEnabled)) ? html`<span class="error-text">${this._t('warn.schedule_overrides_due')}</span>` : ''}</div>
-												</div>
-												${this._taskEarlyBonusEnabled ? html`
-													<div class="form-field">
-														<input type="number" min="0" step="1" placeholder="${this._t('ph.early_bonus_days')}" .value=${this._taskEarlyBonusDays||''} @input=${e=>{ this._taskEarlyBonusDays=e.target.value; this.requestUpdate(); }} />
-													</div>
-												` : html`<div class="form-field"></div>`}
-											</div>
-											${this._taskEarlyBonusEnabled ? html`
-												<div class="row fields">
-													<div class="form-field">
-														<input type="number" min="0" step="1" placeholder="${this._t('ph.early_bonus_points')}" .value=${this._taskEarlyBonusPoints||''} @input=${e=>{ this._taskEarlyBonusPoints=e.target.value; this.requestUpdate(); }} />
-													</div>
-													<div class="form-field"></div>
-												</div>
-											` : ''}
-										</div>
-									` : ''}
-								` : ''}
-									<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
-																	<input style="margin:0;" type="checkbox" .checked=${!!this._persistUntilDone} ?disabled=${!!this._weeklyEnabled || !!this._monthlyEnabled} @change=${e=>{ this._persistUntilDone = !!e.target.checked; this._normalizeScheduleFlags(); this.requestUpdate(); }} />
-																	<span style="white-space:nowrap;">${this._t('ui.persist_until_done')}</span>
-																</label>
-																${this._persistUntilDone ? html`
-																	<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin-left:24px; font-size:.9rem; width:fit-content; text-align:left;">
-																		<input style="margin:0;" type="checkbox" .checked=${this._markOverdue!==false} @change=${e=>{ this._markOverdue = !!e.target.checked; this.requestUpdate(); }} />
-																		<span style="white-space:nowrap;">${this._t('ui.mark_overdue')}</span>
-																	</label>
-																` : ''}
-								<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
-									<input style="margin:0;" type="checkbox" .checked=${!!this._quickComplete} @change=${e=>{ this._quickComplete = !!e.target.checked; }} />
-									<span style="white-space:nowrap;">${this._t('ui.quick_complete')}</span>
-								</label>
-								<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
-									<input style="margin:0;" type="checkbox" .checked=${!!this._skipApproval} @change=${e=>{ this._skipApproval = !!e.target.checked; }} />
-									<span style="white-space:nowrap;">${this._t('ui.skip_approval')}</span>
-								</label>
-								<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
-									<input style="margin:0;" type="checkbox" .checked=${!!this._fastestWins} @change=${e=>{ this._fastestWins = !!e.target.checked; }} />
-									<span style="white-space:nowrap;">${this._t('ui.fastest_wins')}</span>
-								</label>
-								<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
-																	<input style="margin:0;" type="checkbox" .checked=${!!this._repeatEnabled} ?disabled=${(!!this._weeklyEnabled || !!this._monthlyEnabled) && !this._repeatEnabled} @change=${this._toggleRepeat} />
-									<span style="white-space:nowrap;">${this._t('repeat.enable')}</span>
-								</label>
-																<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
-																	<input style="margin:0;" type="checkbox" .checked=${!!this._weeklyEnabled} ?disabled=${!!this._persistUntilDone || ((!!this._repeatEnabled || !!this._monthlyEnabled) && !this._weeklyEnabled)} @change=${this._toggleWeekly} />
-																	<span style="white-space:nowrap;">${this._t('schedule.weekly')}</span>
-																</label>
-																<label style="display:flex; align-items:center; justify-content:flex-start; gap:8px; margin:0; font-size:.95rem; width:fit-content; text-align:left;">
-																	<input style="margin:0;" type="checkbox" .checked=${!!this._monthlyEnabled} ?disabled=${!!this._persistUntilDone || ((!!this._repeatEnabled || !!this._weeklyEnabled) && !this._monthlyEnabled)} @change=${this._toggleMonthly} />
-																	<span style="white-space:nowrap;">${this._t('schedule.monthly')}</span>
-																</label>
-							</div>
-															${this._repeatEnabled ? html`
-								<div class="repeat-line">
-									<div class="repeat-days">
-										<div style="font-size:.9rem; color: var(--secondary-text-color); margin-bottom:4px;">${this._t('repeat.label')}</div>
-										<div class="days">
-											${['mon','tue','wed','thu','fri','sat','sun'].map(k=> html`
-												<span class="day ${this._repeatDays.has(k)?'on':''}" @click=${()=>{ const s=this._repeatDays; s.has(k)?s.delete(k):s.add(k); this.requestUpdate(); }}>${this._t('repeat.days.'+k)}</span>
-											`)}
-										</div>
-									</div>
-									<div class="repeat-assign">
-										<div style="font-size:.9rem; color: var(--secondary-text-color); margin-bottom:4px;">${this._t('repeat.auto_assign')}</div>
-										<div class="multi-dd" @click=${(e)=>{ e.stopPropagation(); this._openRepeatMenu = !this._openRepeatMenu; }}>
-											<div class="box">
-												<span class="multi-dd-value ${this._repeatAssign && this._repeatAssign.size ? '' : 'placeholder'}">
-													${(()=>{ const ids=this._repeatAssign||new Set(); const names=children.filter(c=>ids.has(c.id)).map(c=>c.name); return names.length? (names.slice(0,2).join(', ')+(names.length>2?` +${names.length-2}`:'')) : '—'; })()}
-												</span>
-												<ha-icon icon="mdi:chevron-down"></ha-icon>
-											</div>
-											${this._openRepeatMenu ? html`
-												<div class="multi-dd-menu" @click=${e=> e.stopPropagation()}>
-													${children.map(c=> html`<label><input type="checkbox" .checked=${this._repeatAssign?.has?.(c.id)} @change=${(e)=>{ const s=this._repeatAssign instanceof Set? this._repeatAssign : new Set(this._repeatAssign||[]); if(e.target.checked){ s.add(c.id);}else{ s.delete(c.id);} this._repeatAssign=s; this.requestUpdate(); }} /><span>${c.name}</span></label>`)}
-												</div>
-											` : ''}
-										</div>
-									</div>
-								</div>
-							` : ''}
-						</div>
-					</div>
-					<div class="row">
-						<button type="button" class="btn-ghost" @click=${()=> this._iconModalOpen = true}>${this._t('icon.choose')}</button>
-						${this._editingTask ? html`
-							<button class="btn-primary" ?disabled=${this._hasFormErrors} @click=${this._saveEditedTask}>${this._t('btn.update_task')}</button>
-							<span style="font-size:.9rem; color: var(--secondary-text-color);">${this._t('editor.loaded_task')}</span>
-						` : html`
-							<button class="btn-primary" ?disabled=${this._hasFormErrors} @click=${this._createTask}>${this._t('btn.create_task')}</button>
-						`}
-					</div>
-				`}
-
-
-					<hr />
-					<h3 class="h3-row">
-						<span class="collapsible" @click=${()=>this._toggleSection('tasks')}><ha-icon class="chev ${this._isCollapsed('tasks')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('section.tasks')}</span>
-						<button class="btn-ghost icon-btn" title="${this._t('sort.configure')}" @click=${()=> this._sortModalOpen = true}><ha-icon icon="mdi:sort-variant"></ha-icon></button>
-					</h3>
-					${this._isCollapsed('tasks')? '' : html`<div class="table-wrap"><table class="table-center">
-						<thead><tr><th>${this._t('ph.title')}</th>${pointsEnabled ? html`<th>${this._t('ph.points')}</th>`:''}<th>${this._t('th.categories')}</th><th class="assign-col">${this._t('th.assign')}</th><th>${this._t('th.actions')}</th></tr></thead>
-						<tbody @click=${()=>{ this._openAssignMenuFor = null; this._assignMenuStyle=''; }}>
-										${this._sortTasks(this._store.allTasks.filter(t=>!t.assigned_to), false).map(t=> html`
-								<tr data-task="${t.id}">
-									<td data-label="${this._t('ph.title')}">${t.title}${String(t?.bonus_title||'').trim() ? ` • ${this._t('lbl.bonus')}: ${String(t?.bonus_title||'').trim()}` : ''}${t.icon? html` <ha-icon class="inline-ico" icon="${t.icon}"></ha-icon>`:''}</td>
-								${pointsEnabled ? html`<td data-label="${this._t('ph.points')}"><b>${t.points}</b></td>`:''}
-									<td data-label="${this._t('th.categories')}">
-										${(()=>{ const ids=Array.isArray(t.categories)? t.categories:[]; const cats=this._orderedCategories(ids); return cats.length? cats.map(c=> this._renderCategoryChip(c)) : html`—`; })()}
-									</td>
-												<td class="assign-cell" data-label="${this._t('th.assign')}">
-													${this._autoAssignActive(t) ? (()=>{
-														const ids = (Array.isArray(t.repeat_child_ids)&&t.repeat_child_ids.length)? t.repeat_child_ids : (t.repeat_child_id? [t.repeat_child_id]:[]);
-														const names = this._store.children.filter(c=> ids.includes(c.id)).map(c=> c.name);
-														return html`<span>${this._t('assign.auto_to',{names: (names.length? names.join(', ') : '—')})}</span>`;
-													})() : html`
-													<div class="multi-dd task-assign-dd" @click=${(e)=>{ e.stopPropagation(); const open = this._openAssignMenuFor===t.id? null : t.id; this._openAssignMenuFor = open; if (open){ try{ const box=e.currentTarget.querySelector('.box'); const r=box.getBoundingClientRect(); this._assignMenuStyle=`position:fixed;left:${Math.round(r.left)}px;top:${Math.round(r.bottom+4)}px;width:${Math.round(r.width)}px;z-index:200000`; }catch{ this._assignMenuStyle=''; } } else { this._assignMenuStyle=''; } }}>
-														<div class="box"><span class="multi-dd-value placeholder">${this._t('select.assign_child')}</span><ha-icon icon="mdi:chevron-down"></ha-icon></div>
-														${this._openAssignMenuFor===t.id ? html`
-															<div class="multi-dd-menu" style="${this._assignMenuStyle||''}" @click=${e=> e.stopPropagation()}>
-																${this._store.children.map(c=> html`<label><input class="c4k-assign" type="checkbox" value=${c.id} @change=${(e)=> this._updateAssignSummary(t.id, t)} /><span>${c.name}</span></label>`)}
-															</div>
-														`: ''}
-													</div>`}
-												</td>
-									<td data-label="${this._t('th.actions')}">
-														${(this._weeklyEnabled || this._monthlyEnabled) ? html`
-															<div class="repeat-line">
-																<div class="repeat-assign">
-																	<div style="font-size:.9rem; color: var(--secondary-text-color); margin-bottom:4px;">${this._t('repeat.auto_assign')}</div>
-																	<div class="multi-dd" @click=${(e)=>{ e.stopPropagation(); this._openRepeatMenu = !this._openRepeatMenu; }}>
-																		<div class="box">
-																			<span class="multi-dd-value ${this._repeatAssign && this._repeatAssign.size ? '' : 'placeholder'}">
-																				${(()=>{ const ids=this._repeatAssign||new Set(); const names=children.filter(c=>ids.has(c.id)).map(c=>c.name); return names.length? (names.slice(0,2).join(', ')+(names.length>2?` +${names.length-2}`:'')) : '—'; })()}
-																			</span>
-																			<ha-icon icon="mdi:chevron-down"></ha-icon>
-																		</div>
-																		${this._openRepeatMenu ? html`
-																			<div class="multi-dd-menu" @click=${e=> e.stopPropagation()}>
-																				${children.map(c=> html`<label><input type="checkbox" .checked=${this._repeatAssign?.has?.(c.id)} @change=${(e)=>{ const s=this._repeatAssign instanceof Set? this._repeatAssign : new Set(this._repeatAssign||[]); if(e.target.checked){ s.add(c.id);}else{ s.delete(c.id);} this._repeatAssign=s; this.requestUpdate(); }} /><span>${c.name}</span></label>`)}
-																			</div>
-																		` : ''}
-																	</div>
-																</div>
-															</div>
-														` : ''}
-										<button class="btn-ghost" @click=${()=> this._editTask(t)}>${this._t('btn.edit')}</button>
-										<button class="btn-primary" ?disabled=${this._autoAssignActive(t)} title="${this._autoAssignActive(t)? this._t('assign.disabled_auto') : ''}" @click=${()=> {
-											const row = this.shadowRoot.querySelector(`tr[data-task="${t.id}"]`);
-											const checkedNow = Array.from(row?.querySelectorAll('.c4k-assign:checked')||[]).map(i=> i.value);
-											const ids = (Array.isArray(t._assignToMulti) && t._assignToMulti.length) ? t._assignToMulti : checkedNow;
-											this._assignTaskMulti(t, ids);
-										}}>${this._t('btn.assign')}</button>
-										<button class="btn-danger" @click=${()=> this._deleteTask(t.id)}>${this._t('btn.delete')}</button>
-									</td>
-								</tr>
-							`)}
-						</tbody>
-						</table></div>`}
-
-					<hr />
-					<h3 class="h3-row">
-						<span class="collapsible" @click=${()=>this._toggleSection('overview')}><ha-icon class="chev ${this._isCollapsed('overview')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('overview.title')}</span>
-						<button class="btn-ghost icon-btn" title="${this._t('sort.configure')}" @click=${()=> this._sortModalOpen = true}><ha-icon icon="mdi:sort-variant"></ha-icon></button>
-					</h3>
-					${this._isCollapsed('overview')? '' : (()=>{
-						const allAssigned=(this._store.allTasks||[]).filter(t=>!!t.assigned_to);
-						const active=allAssigned.filter(t=>!['approved','awaiting_approval','taken'].includes(this._effectiveStatus(t)));
-						if(!active.length) return html`<i>${this._t('overview.none_active')}</i>`;
-						const sorted=this._sortTasks(active, true);
-						const top=sorted.slice(0,3); const pending=allAssigned.filter(t=>t.status==='awaiting_approval').length;
-						const row=(t)=> html`<tr>
-							<td data-label="${this._t('ph.title')}">${t.title}${String(t?.bonus_title||'').trim() ? ` • ${this._t('lbl.bonus')}: ${String(t?.bonus_title||'').trim()}` : ''}${t.icon? html` <ha-icon class="inline-ico" icon="${t.icon}"></ha-icon>`:''}</td>
-							${pointsEnabled ? html`<td data-label="${this._t('ph.points')}"><b>${t.points}</b></td>`:''}
-							<td data-label="${this._t('th.categories')}">${(()=>{ const ids=Array.isArray(t.categories)? t.categories:[]; const names=this._orderedCategoryNames(ids); return names.length? names.map(n=> html`<span class='chip'>${n}</span>`): html`—`; })()}</td>
-							<td data-label="${this._t('th.status')}">${this._renderStatusBadge(t)}</td>
-							<td data-label="${this._t('th.completed')}">${(()=>{ const ts=this._displayedTsFor(t); if(!ts) return html`—`; const dt=this._fmtDateTime(ts); return html`${dt.formatted}`; })()}</td>
-							<td data-label="${this._t('th.assign')}">${t.assigned_to_name || this._t('status.unassigned')}</td>
-							<td data-label="${this._t('th.actions')}">
-								${t.status==="assigned" ? html`
-									${this._canManualReassign(t) ? html`<button class="btn-ghost" @click=${()=>this._manualReassign(t)}>${this._t('btn.back')}</button>`:''}
-									<button class="btn-danger" @click=${()=>this._deleteTask(t.id)}>${this._t('btn.delete')}</button>
-								`: t.status==="in_progress" ? html`
-									<button class="btn-ghost" @click=${()=>this._setStatus(t.id,'awaiting_approval')}>${this._t('btn.awaiting')}</button>
-									<button class="btn-ghost" @click=${()=>this._setStatus(t.id,'assigned')}>${this._t('btn.back')}</button>
-									<button class="btn-danger" @click=${()=>this._deleteTask(t.id)}>${this._t('btn.delete')}</button>
-								`: t.status==="awaiting_approval" ? html`
-									${this._renderAwaitingActions(t)}
-								`: html`${this._renderBonusApproveBtn(t)}${this._canManualReassign(t) ? html`<button class="btn-ghost" @click=${()=>this._manualReassign(t)}>${this._t('btn.back')}</button>`:''}<button class="btn-danger" @click=${()=>this._deleteTask(t.id)}>${this._t('btn.delete')}</button>`}
-							</td>
-						</tr>`;
-						return html`
-							<div class="table-wrap"><table class="table-center table-fixed">${this._renderAssignedFinishedColgroup()}
-								<thead><tr><th>${this._t('ph.title')}</th>${pointsEnabled ? html`<th>${this._t('ph.points')}</th>`:''}<th>${this._t('th.categories')}</th><th>${this._t('th.status')}</th><th>${this._t('th.completed')}</th><th>${this._t('th.assign')}</th><th>${this._t('th.actions')}</th></tr></thead>
-								<tbody>${top.map(row)}</tbody>
-							</table></div>
-							<div class="row" style="justify-content:flex-end;">${active.length>3? html`<button class="btn-primary" @click=${()=>this._tasksModalOpen=true}>${this._t('overview.show_all',{pending})}</button>`:''}</div>
-						`;
-					})()}
-
-					<h3 class="h3-row">
-						<span class="collapsible" @click=${()=>this._toggleSection('awaiting')}><ha-icon class="chev ${this._isCollapsed('awaiting')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('lbl.awaiting')}</span>
-					</h3>
-					${this._isCollapsed('awaiting')? '' : (()=>{
-						const allAssigned=(this._store.allTasks||[]).filter(t=>!!t.assigned_to);
-						const awaiting=allAssigned.filter(t=>this._effectiveStatus(t)==='awaiting_approval');
-						if(!awaiting.length) return html`<i>${this._t('overview.none_active')}</i>`;
-						const sorted=this._sortTasks(awaiting, true);
-						const row=(t)=> html`<tr>
-							<td data-label="${this._t('ph.title')}">${t.title}${String(t?.bonus_title||'').trim() ? ` • ${this._t('lbl.bonus')}: ${String(t?.bonus_title||'').trim()}` : ''}${t.icon? html` <ha-icon class="inline-ico" icon="${t.icon}"></ha-icon>`:''}</td>
-							${pointsEnabled ? html`<td data-label="${this._t('ph.points')}"><b>${t.points}</b></td>`:''}
-							<td data-label="${this._t('th.categories')}">${(()=>{ const ids=Array.isArray(t.categories)? t.categories:[]; const names=this._orderedCategoryNames(ids); return names.length? names.map(n=> html`<span class='chip'>${n}</span>`): html`—`; })()}</td>
-							<td data-label="${this._t('th.status')}">${this._renderStatusBadge(t)}</td>
-							<td data-label="${this._t('th.completed')}">${(()=>{ const ts=this._displayedTsFor(t); if(!ts) return html`—`; const dt=this._fmtDateTime(ts); return html`${dt.formatted}`; })()}</td>
-							<td data-label="${this._t('th.assign')}">${t.assigned_to_name || this._t('status.unassigned')}</td>
-							<td data-label="${this._t('th.actions')}">
-								${this._renderAwaitingActions(t)}
-							</td>
-						</tr>`;
-						return html`
-							<div class="table-wrap"><table class="table-center table-fixed">${this._renderAssignedFinishedColgroup()}
-								<thead><tr><th>${this._t('ph.title')}</th>${pointsEnabled ? html`<th>${this._t('ph.points')}</th>`:''}<th>${this._t('th.categories')}</th><th>${this._t('th.status')}</th><th>${this._t('th.completed')}</th><th>${this._t('th.assign')}</th><th>${this._t('th.actions')}</th></tr></thead>
-								<tbody>${sorted.map(row)}</tbody>
-							</table></div>
-						`;
-					})()}
-
-					<h3 class="h3-row">
-						<span class="collapsible" @click=${()=>this._toggleSection('finished')}><ha-icon class="chev ${this._isCollapsed('finished')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('overview.finished_title')}</span>
-					</h3>
-					${this._isCollapsed('finished')? '' : (()=>{
-						const allAssigned=(this._store.allTasks||[]).filter(t=>!!t.assigned_to);
-						const finished=allAssigned.filter(t=>['approved','taken'].includes(this._effectiveStatus(t)));
-						if(!finished.length) return html`<i>${this._t('overview.finished_none')}</i>`;
-						const sorted=this._sortTasks(finished, true);
-						const row=(t)=> html`<tr>
-							<td data-label="${this._t('ph.title')}">${t.title}${String(t?.bonus_title||'').trim() ? ` • ${this._t('lbl.bonus')}: ${String(t?.bonus_title||'').trim()}` : ''}${t.icon? html` <ha-icon class="inline-ico" icon="${t.icon}"></ha-icon>`:''}</td>
-							${pointsEnabled ? html`<td data-label="${this._t('ph.points')}"><b>${t.points}</b></td>`:''}
-							<td data-label="${this._t('th.categories')}">${(()=>{ const ids=Array.isArray(t.categories)? t.categories:[]; const names=this._orderedCategoryNames(ids); return names.length? names.map(n=> html`<span class='chip'>${n}</span>`): html`—`; })()}</td>
-								<td data-label="${this._t('th.status')}">${this._renderStatusBadge(t)}</td>
-							<td data-label="${this._t('th.completed')}">${(()=>{ const ts=this._displayedTsFor(t); if(!ts) return html`—`; const dt=this._fmtDateTime(ts); return html`${dt.formatted}`; })()}</td>
-							<td data-label="${this._t('th.assign')}">${t.assigned_to_name || this._t('status.unassigned')}</td>
-							<td data-label="${this._t('th.actions')}">
-								${t.status==="awaiting_approval" ? html`
-									${this._renderAwaitingActions(t)}
-								` : html`
-									${this._renderBonusApproveBtn(t)}
-									${this._canManualReassign(t) ? html`<button class="btn-ghost" @click=${()=>this._manualReassign(t)}>${this._t('btn.back')}</button>`:''}
-									<button class="btn-danger" @click=${()=>this._deleteTask(t.id)}>${this._t('btn.delete')}</button>
-								`}
-							</td>
-						</tr>`;
-						return html`
-							<div class="table-wrap"><table class="table-center table-fixed">${this._renderAssignedFinishedColgroup()}
-								<thead><tr><th>${this._t('ph.title')}</th>${pointsEnabled ? html`<th>${this._t('ph.points')}</th>`:''}<th>${this._t('th.categories')}</th><th>${this._t('th.status')}</th><th>${this._t('th.completed')}</th><th>${this._t('th.assign')}</th><th>${this._t('th.actions')}</th></tr></thead>
-								<tbody>${sorted.map(row)}</tbody>
-							</table></div>
-						`;
-					})()}
-
-				${showScoreboard ? html`
-					<hr />
-					<h3 class="h3-row"><span class="collapsible" @click=${()=>this._toggleSection('scoreboard')}><ha-icon class="chev ${this._isCollapsed('scoreboard')?'rot':''}" icon="mdi:chevron-down"></ha-icon>${this._t('section.scoreboard')}</span></h3>
-					${this._isCollapsed('scoreboard')? '' : html`
-						<ol style="display:grid; gap:8px; padding-left:18px;">
-							${[...children].sort((a,b)=>b.points-a.points).map((c,i)=> html`
-								<li style="display:flex; align-items:center; gap:10px;"><span class="badge status-in_progress">#${i+1}</span><span style="flex:1;">${c.name}</span><b>${c.points}</b></li>
-							`)}
-						</ol>
-					`}
-				` : ''}
-				</div>
-
-				${pointsEnabled ? this._renderPointsModal() : ''}
-				${this._renderAllTasksModal()}
-				${pointsEnabled ? this._renderShopModal() : ''}
-			${this._renderAdvancedModal()}
-			${this._renderSortModal()}
-				${this._renderReassignModal()}
-		</ha-card>
-		${this._renderIconModal()}
-		${this._renderCustomIconModal()}
-	`;
-}	// ------- OVERVIEW-ONLY VIEW -------
+	// ------- OVERVIEW-ONLY VIEW -------
 	_renderOverviewOnly(){
 		const pointsEnabled = this._pointsEnabled();
 		const all=(this._store.allTasks||[]).filter(t=>!!t.assigned_to && !['approved','awaiting_approval','taken'].includes(this._effectiveStatus(t)));
@@ -2240,23 +1908,6 @@ class Chores4KidsDevCard extends LitElement {
 			</ha-card>`;
 	}
 
-	_renderPointsModal(){
-		return html`<div class="overlay ${this._pointsChild?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._closePoints(); }}>
-			<div class="modal" @click=${e=>e.stopPropagation()}>
-				<h3>${this._pointsChild ? this._t('points.title', { name: this._pointsChild.name }) : ''}</h3>
-				<div style="font-size:.85rem; color: var(--secondary-text-color);">${this._t('points.quick')}</div>
-				<div class="row" style="gap:8px;">${[5,10,15,20].map(n=> html`<button class="btn-primary" @click=${()=>this._addPointsQuick(n)}>+${n}</button>`)}</div>
-				<div style="font-size:.85rem; color: var(--secondary-text-color);">${this._t('points.remove')}</div>
-				<div class="row" style="gap:8px;">${[5,10,15,20].map(n=> html`<button class="btn-danger" @click=${()=>this._addPointsQuick(-n)}>−${n}</button>`)}</div>
-				<div style="font-size:.85rem; color: var(--secondary-text-color);">${this._t('points.custom')}</div>
-				<div class="row" style="gap:6px; align-items:center;">
-					<input type="number" .value=${String(this._pointsValue||0)} @input=${e=> this._pointsValue = Number(e.target.value||0)} style="max-width:120px;" />
-					<button class="btn-primary" @click=${()=>this._addPointsQuick(this._pointsValue||0)}>${this._t('form.add')}</button>
-					<button class="btn-ghost" @click=${this._closePoints}>${this._t('form.cancel')}</button>
-				</div>
-			</div>
-		</div>`;
-	}
 	_renderAllTasksModal(){
 		const pointsEnabled = this._pointsEnabled();
 		return html`<div class="overlay ${this._tasksModalOpen?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._tasksModalOpen=false; }}>
@@ -2316,391 +1967,6 @@ class Chores4KidsDevCard extends LitElement {
 				<col style="width:10%;" />
 			</colgroup>`;
 		}
-	_renderShopModal(){
-		if (!this._pointsEnabled()) return '';
-		return html`<div class="overlay shop-admin-overlay ${this._shopModalOpen?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._shopModalOpen=false; }}>
-			<div class="modal shop-modal shop-admin-modal" @click=${e=>e.stopPropagation()}>
-                <h3>${this._t('shop.title')}</h3>
-				<div class="row fields">
-					<div class="form-field title"><input placeholder="${this._t('shop.item')}" .value=${this._shopTitle||''} @input=${e=>this._shopTitle=e.target.value} /></div>
-					<div class="form-field points"><input type="number" placeholder="${this._t('shop.price')}" .value=${this._shopPrice||''} @input=${e=>this._shopPrice=e.target.value} /></div>
-				</div>
-				<div class="shop-add-row">
-					<div class="shop-add-left">
-						${this._shopImage ? html`<img class="img-preview" src="${this._resolveUrl(this._shopImage)}" alt="preview" loading="lazy" decoding="async"/>` : html`<div class="img-preview" style="display:grid;place-items:center;color:var(--secondary-text-color);">${this._t('shop.image')}</div>`}
-						<input id="c4k-shop-file" class="file-hidden" type="file" accept="image/*" @change=${this._onPickImage} />
-						<button class="btn-ghost" @click=${()=> this.shadowRoot.getElementById('c4k-shop-file')?.click()}>${this._t('shop.upload')}</button>
-					</div>
-					<button class="btn-primary" style="flex:0 0 auto;" @click=${this._addShopItem}>${this._t('shop.add_item')}</button>
-				</div>
-								<div class="table-wrap desktop-only"><table class="table-center">
-					<thead><tr><th>${this._t('shop.item')}</th><th>${this._t('shop.price')}</th><th>${this._t('shop.active')}</th><th>${this._t('th.actions')}</th></tr></thead>
-					<tbody>
-						${this._store.items.map(i=> html`
-							${this._editItem && this._editItem.id===i.id ? html`
-								<tr>
-									<td data-label="${this._t('shop.item')}"><div style="display:flex; align-items:center; gap:8px;">${this._editItem.image? html`<img class="img-preview" style="width:36px;height:36px;" src="${this._resolveUrl(this._editItem.image)}" loading="lazy" decoding="async">`:''}<input style="max-width:220px;" .value=${this._editItem.title||''} @input=${e=> this._editItem={...this._editItem, title:e.target.value}} /><input type="file" accept="image/*" @change=${this._onPickEditImage} /></div></td>
-									<td data-label="${this._t('shop.price')}"><input type="number" style="max-width:120px;" .value=${this._editItem.price||0} @input=${e=> this._editItem={...this._editItem, price:Number(e.target.value||0)}} /></td>
-									<td data-label="${this._t('shop.active')}"><input type="checkbox" .checked=${this._editItem.active!==false} @change=${e=> this._editItem={...this._editItem, active: e.target.checked}} /></td>
-									<td data-label="${this._t('th.actions')}"><button class="btn-primary" @click=${this._saveEditItem}>${this._t('form.save')}</button><button class="btn-ghost" @click=${()=>{this._editItem=null; this.requestUpdate();}}>${this._t('form.cancel')}</button></td>
-								</tr>
-							`: html`
-								<tr>
-									<td data-label="${this._t('shop.item')}">${i.image? html`<img class="img-preview" style="width:36px;height:36px;margin-right:6px;vertical-align:middle;" src="${this._resolveUrl(i.image)}" loading="lazy" decoding="async">`:''}${i.title}</td>
-									<td data-label="${this._t('shop.price')}"><b>${i.price}</b></td>
-									<td data-label="${this._t('shop.active')}"><input type="checkbox" .checked=${i.active!==false} @change=${e=> this._toggleItemActive(i,e)} /></td>
-									<td data-label="${this._t('th.actions')}"><button class="btn-ghost" @click=${()=> this._startEditItem(i)}>${this._t('btn.edit')}</button><button class="btn-ghost" @click=${()=> this._openAdvanced(i)}>${this._t('shop.advanced')}</button><button class="btn-danger" @click=${()=>this._deleteShopItem(i.id)}>${this._t('btn.delete')}</button></td>
-								</tr>
-							`}
-						`)}
-					</tbody>
-				</table></div>
-								<!-- Mobile cards for items -->
-								<div class="mobile-only mobile-only-grid">
-									${this._store.items.map(i=> html`
-										<div class="shop-admin-card">
-											<div class="shop-admin-head">
-												${i.image? html`<img src="${this._resolveUrl(i.image)}" alt="${i.title}" loading="lazy" decoding="async">` : html`<div class="img-preview" style="width:44px;height:44px;display:grid;place-items:center;">?</div>`}
-												<div class="shop-admin-meta">
-													<div class="shop-admin-title">${i.title}</div>
-													<div class="shop-admin-price">${i.price}</div>
-												</div>
-																								<label class="shop-admin-toggle">
-																									<span>${this._t('shop.active')}</span>
-																									<ha-switch .checked=${i.active!==false} @change=${e=> this._toggleItemActive(i,e)}></ha-switch>
-																								</label>
-											</div>
-											<div class="shop-admin-actions">
-												<button class="btn-ghost" @click=${()=> this._startEditItem(i)}>${this._t('btn.edit')}</button>
-												<button class="btn-ghost" @click=${()=> this._openAdvanced(i)}>${this._t('shop.advanced')}</button>
-												<button class="btn-danger" @click=${()=> this._deleteShopItem(i.id)}>${this._t('btn.delete')}</button>
-											</div>
-										</div>
-									`)}
-								</div>
-				<div class="row" style="align-items:center; justify-content:space-between; margin-top:12px;">
-					<h3 style="margin:0;">${this._t('shop.history')}</h3>
-					${(this._store.purchases||[]).length ? html`<button class="btn-danger" @click=${this._clearShopHistory}>${this._t('shop.clear_history')}</button>`:''}
-				</div>
-								<div class="table-wrap desktop-only"><table class="table-center">
-					<thead><tr><th>${this._t('shop.date')}</th><th>${this._t('shop.time')}</th><th>${this._t('shop.child')}</th><th>${this._t('shop.item')}</th><th>${this._t('shop.price')}</th></tr></thead>
-					<tbody>
-						${[...(this._store.purchases||[])].slice().reverse().map(p=> { const dt=this._fmtDateTime(p.ts); return html`<tr>
-							<td data-label="${this._t('shop.date')}">${dt.date}</td>
-							<td data-label="${this._t('shop.time')}">${dt.time}</td>
-							<td data-label="${this._t('shop.child')}">${p.child_name||p.child_id}</td>
-							<td data-label="${this._t('shop.item')}">${p.title}</td>
-							<td data-label="${this._t('shop.price')}"><b>${p.price}</b></td>
-						</tr>`; })}
-					</tbody>
-				</table></div>
-								<!-- Mobile cards for purchases -->
-								<div class="mobile-only mobile-only-grid">
-									${[...(this._store.purchases||[])].slice().reverse().map(p=> { const dt=this._fmtDateTime(p.ts); return html`
-										<div class="purchase-card">
-											<div class="kv"><b>${this._t('shop.date')}</b><span>${dt.date}</span></div>
-											<div class="kv"><b>${this._t('shop.time')}</b><span>${dt.time}</span></div>
-											<div class="kv"><b>${this._t('shop.child')}</b><span>${p.child_name||p.child_id}</span></div>
-											<div class="kv"><b>${this._t('shop.item')}</b><span>${p.title}</span></div>
-											<div class="kv"><b>${this._t('shop.price')}</b><b>${p.price}</b></div>
-										</div>`; })}
-								</div>
-				<div class="row" style="justify-content:flex-end; margin-top:8px;"><button class="btn-ghost" @click=${()=>this._shopModalOpen=false}>${this._t('form.close')}</button></div>
-			</div>
-		</div>`;
-	}
-	_renderAdvancedModal(){
-		return html`<div class="overlay ${this._advItem?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._advItem=null; }}>
-			${this._advItem ? html`<div class="modal" style="max-width: 900px; width: min(95vw, 900px);" @click=${e=>e.stopPropagation()}>
-				<h3>${this._t('shop.advanced')} — ${this._advItem.title}</h3>
-				<div style="font-size:.9rem; color: var(--secondary-text-color); margin-bottom:6px;">${this._t('shop.steps')}</div>
-				<div style="display:grid; gap:8px;">${(this._advSteps||[]).map((st,idx)=> html`
-					<div style="display:grid; grid-template-columns: 1fr auto; gap:8px; align-items:center; border:1px solid var(--divider-color); padding:8px; border-radius:8px;">
-						${st.type==='delay' ? html`<div style="display:flex; gap:8px; align-items:center;"><b>${this._t('shop.delay')}</b><input type="number" style="width:110px;" .value=${st.seconds||0} @input=${e=>{ st.seconds=Number(e.target.value||0); this.requestUpdate(); }} /><span>${this._t('shop.seconds')}</span></div>` : html`
-							<div style="display:flex; gap:8px; align-items:center; flex-wrap:wrap;">
-								<b>${this._t('shop.entity')}</b>
-								<select style="min-width:260px;" .value=${st.entity_id||''} @change=${e=>{ st.entity_id=e.target.value; if(!st.op) st.op = this._defaultOpFor(st.entity_id); this.requestUpdate(); }}>
-									<option value="">—</option>
-									${(()=>{ const ents=Object.values(this.hass.states); const cur=st.entity_id||''; const exists=cur && ents.some(x=>x.entity_id===cur); return html`${!exists&&cur? html`<option value=${cur} selected>${cur}</option>`:''}${ents.map(s=> html`<option value=${s.entity_id} ?selected=${s.entity_id===cur}>${s.attributes.friendly_name||s.entity_id}</option>`)}`; })()}
-								</select>
-								<b>${this._t('shop.operation')}</b>
-								<select .value=${st.op||(st.entity_id?this._defaultOpFor(st.entity_id):'')} @change=${e=>{ st.op=e.target.value; this.requestUpdate(); }}>
-									${this._opsForDomain((st.entity_id||'').split('.')[0]).map(op=> html`<option value=${op} ?selected=${op===st.op}>${op}</option>`)}</select>
-							</div>`}
-						<button class="btn-danger" @click=${()=>{ this._advSteps.splice(idx,1); this.requestUpdate(); }}>${this._t('btn.delete')}</button>
-					</div>`)}
-				</div>
-				<div class="row" style="gap:8px; margin-top:10px;">
-					<button class="btn-ghost" @click=${()=>{ this._advSteps.push({ type:'entity_service', entity_id:'', op:'turn_on' }); this.requestUpdate(); }}>${this._t('shop.add_action')}</button>
-					<button class="btn-ghost" @click=${()=>{ this._advSteps.push({ type:'delay', seconds:60 }); this.requestUpdate(); }}>${this._t('shop.add_delay')}</button>
-				</div>
-				<div class="row" style="justify-content:flex-end; gap:8px; margin-top:10px;">
-					<button class="btn-ghost" @click=${()=>{ this._advItem=null; }}>${this._t('form.cancel')}</button>
-					<button class="btn-primary" @click=${this._saveAdvanced}>${this._t('form.save')}</button>
-				</div>
-			</div>`: ''}
-		</div>`;
-	}
-	_renderIconModal(){
-		return html`<div class="overlay ${this._iconModalOpen?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._iconModalOpen=false; }}>
-			<div class="modal" style="max-width: 560px; width: min(95vw, 560px);" @click=${e=>e.stopPropagation()}>
-				<h3>${this._t('icon.choose')}</h3>
-				<div class="row" style="gap:8px; align-items:center;">
-					<input style="flex:1" placeholder="${this._t('icon.search')}" .value=${this._iconSearch||''} @input=${e=>{ this._iconSearch=e.target.value; this.requestUpdate(); }} />
-					${this._taskIcon ? html`<button class="btn-ghost" @click=${()=>{ this._taskIcon=''; this.requestUpdate(); }}>${this._t('icon.clear')}</button>`: ''}
-				</div>
-				${(()=>{ 
-					const q=String(this._iconSearch||'').toLowerCase(); 
-					const filter=(arr)=> arr.filter(i=> i.id.toLowerCase().includes(q) || (i.label||'').toLowerCase().includes(q)); 
-					const customIcons = (this._customIcons||[]).map(c=> ({id:c.id, label:c.label}));
-					const allIcons = [...customIcons, ...C4K_ICON_SET];
-					const recent=filter((this._iconRecents||[]).map(id=> {const found = allIcons.find(x=>x.id===id); return {id, label: found?.label || id};})).slice(0,12); 
-					const base=filter(C4K_ICON_SET);
-					const custom=filter(customIcons);
-					const tile=(i)=> html`<button class="btn-ghost" style="display:flex;align-items:center;gap:8px;border:1px solid var(--divider-color);border-radius:8px;padding:8px;" @click=${()=> this._pickIcon(i.id)}><ha-icon icon="${i.id}"></ha-icon><small>${i.label||i.id}</small></button>`; 
-					const customTile = html`<button class="btn-primary" style="display:flex;align-items:center;gap:8px;border:1px solid var(--divider-color);border-radius:8px;padding:8px;" @click=${()=> this._openCustomIconModal()}><ha-icon icon="mdi:plus-circle"></ha-icon><small>Custom</small></button>`;
-					return html`
-						${recent.length? html`<div style="font-size:.9rem;color:var(--secondary-text-color);margin:6px 0;">Recent</div>`:''}${recent.length? html`<div style="display:grid;grid-template-columns:repeat(auto-fill,minmax(120px,1fr));gap:8px;">${recent.map(tile)}</div>`:''}
-						${custom.length? html`<div style="font-size:.9rem;color:var(--secondary-text-color);margin:6px 0;">Custom</div>`:''}
-						${custom.length? html`<div style="display:grid;grid-template-columns:repeat(auto-fill,minmax(120px,1fr));gap:8px;">${custom.map(tile)}</div>`:''}
-						<div style="font-size:.9rem;color:var(--secondary-text-color);margin:6px 0;">All</div>
-						<div style="display:grid;grid-template-columns:repeat(auto-fill,minmax(120px,1fr));gap:8px;">${customTile}${base.map(tile)}</div>
-					`; 
-				})()}
-				<div class="row" style="justify-content:flex-end; margin-top:10px;"><button class="btn-ghost" @click=${()=> this._iconModalOpen=false}>${this._t('form.cancel')}</button></div>
-			</div>
-		</div>`;
-	}
-
-	_renderCustomIconModal(){
-		return html`<div class="overlay ${this._customIconModalOpen?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._closeCustomIconModal(); }}>
-			<div class="modal" style="max-width: 800px; width: min(95vw, 800px); max-height: 85vh; display:flex; flex-direction:column;" @click=${e=>e.stopPropagation()}>
-				<h3>Vælg Custom Icon</h3>
-				<div class="row" style="gap:8px; align-items:center; margin-bottom:8px;">
-					<input style="flex:1" placeholder="Søg efter ikon (f.eks. home, car, star, heart...)" .value=${this._customIconSearch||''} @input=${e=>{ this._customIconSearch=e.target.value; this._iconDisplayLimit = 200; this.requestUpdate(); }} />
-					${this._customIconSearch ? html`<button class="btn-ghost" @click=${()=>{ this._customIconSearch=''; this._iconDisplayLimit = 200; this.requestUpdate(); }}>Ryd</button>` : ''}
-				</div>
-				<div 
-					style="flex:1; overflow-y:auto; border:1px solid var(--divider-color); border-radius:8px; padding:12px; margin:8px 0; background:var(--card-background-color);"
-					@scroll=${(e) => {
-						const el = e.target;
-						const scrolledToBottom = el.scrollHeight - el.scrollTop <= el.clientHeight + 100;
-						if (scrolledToBottom && this._iconDisplayLimit < (this._availableIcons?.length || 0)) {
-							this._iconDisplayLimit += 200;
-							this.requestUpdate();
-						}
-					}}
-				>
-					${(()=>{
-						const q = String(this._customIconSearch||'').toLowerCase().trim();
-						// Hvis der ikke er ikoner endnu, vis loading
-						if(!this._availableIcons || !this._availableIcons.length) {
-							return html`<div style="text-align:center; padding:40px; color:var(--secondary-text-color);">
-								<ha-icon icon="mdi:loading" style="--mdc-icon-size:48px; animation: spin 1s linear infinite;"></ha-icon>
-								<div style="margin-top:12px;">Henter ikoner...</div>
-							</div>`;
-						}
-						// Filter baseret på søgning - både med og uden "mdi:" prefix
-						const filtered = q 
-							? this._availableIcons.filter(i=> {
-								const iconName = i.toLowerCase();
-								const searchTerm = q.startsWith('mdi:') ? q : q;
-								return iconName.includes(searchTerm) || iconName.replace('mdi:','').includes(searchTerm);
-							  })
-							: this._availableIcons;
-						
-						if(!filtered.length) {
-							return html`<div style="text-align:center; padding:40px; color:var(--secondary-text-color);">
-								<ha-icon icon="mdi:magnify-close" style="--mdc-icon-size:48px;"></ha-icon>
-								<div style="margin-top:12px;">Ingen ikoner fundet for "${this._customIconSearch}"</div>
-								<div style="margin-top:8px; font-size:0.85rem;">Prøv f.eks: home, car, star, heart, light, door</div>
-							</div>`;
-						}
-						
-						// Begræns til displayLimit for performance
-						const displayLimit = this._iconDisplayLimit || 200;
-						const toShow = filtered.slice(0, displayLimit);
-						const hasMore = filtered.length > displayLimit;
-						
-						return html`
-							<div style="display:grid; grid-template-columns:repeat(auto-fill,minmax(85px,1fr)); gap:8px;">
-								${toShow.map(icon=> html`
-									<button 
-										class="btn-ghost ${this._customIconPreview===icon?'btn-primary':''}" 
-										style="display:flex;flex-direction:column;align-items:center;justify-content:center;gap:6px;border:1px solid var(--divider-color);border-radius:10px;padding:12px 6px;min-height:90px;transition:all 0.2s ease;${this._customIconPreview===icon?'transform:scale(1.05);box-shadow:0 4px 12px rgba(var(--rgb-primary-color),0.3);border-color:var(--primary-color);':''}" 
-										@click=${()=>{ this._customIconPreview=icon; this._customIconLabel = icon.replace('mdi:','').split('-').map(w=> w.charAt(0).toUpperCase()+w.slice(1)).join(' '); this.requestUpdate(); }}
-										title="${icon}"
-									>
-										<ha-icon icon="${icon}" style="--mdc-icon-size:36px;"></ha-icon>
-										<small style="font-size:9px;text-align:center;word-break:break-word;line-height:1.3;max-width:100%;opacity:0.8;">${icon.replace('mdi:','').replace(/-/g,' ')}</small>
-									</button>
-								`)}
-							</div>
-							${hasMore ? html`
-								<div style="text-align:center; margin-top:16px; padding:12px; color:var(--secondary-text-color); font-size:0.9rem; background:color-mix(in srgb, var(--primary-color) 6%, transparent); border-radius:8px;">
-									<ha-icon icon="mdi:arrow-down" style="--mdc-icon-size:24px;"></ha-icon>
-									<div style="margin-top:6px;">Scroll ned for at se flere...</div>
-								</div>
-							` : ''}
-							<div style="text-align:center; margin-top:12px; padding:8px; color:var(--secondary-text-color); font-size:0.85rem;">
-								${q ? html`Viser <b>${toShow.length}</b> af <b>${filtered.length}</b> matchende ikoner` : html`Viser <b>${toShow.length}</b> af <b>${filtered.length}</b> ikoner`}
-							</div>
-						`;
-					})()}
-				</div>
-				${this._customIconPreview ? html`
-					<div style="border:1px solid var(--primary-color); border-radius:12px; padding:16px; margin-bottom:8px; background:color-mix(in srgb, var(--primary-color) 4%, transparent);">
-						<div style="font-size:.9rem; font-weight:600; color:var(--primary-text-color); margin-bottom:10px;">Valgt ikon:</div>
-						<div style="display:flex; align-items:center; gap:16px;">
-							<div style="width:80px; height:80px; display:grid; place-items:center; border:2px solid var(--primary-color); border-radius:12px; background:var(--card-background-color); box-shadow:0 2px 8px rgba(0,0,0,0.1);">
-								<ha-icon icon="${this._customIconPreview}" style="--mdc-icon-size:56px; color:var(--primary-color);"></ha-icon>
-							</div>
-							<div style="flex:1;">
-								<div style="font-size:.85rem; color:var(--secondary-text-color); margin-bottom:8px;">
-									<b>Ikon ID:</b> ${this._customIconPreview}
-								</div>
-								<div style="font-size:.85rem; color:var(--secondary-text-color); margin-bottom:6px;">Navngiv dit custom ikon:</div>
-								<input 
-									placeholder="F.eks. Mit Hjem, Min Favorit Stjerne, etc." 
-									.value=${this._customIconLabel||''} 
-									@input=${e=>{ this._customIconLabel=e.target.value; this.requestUpdate(); }}
-									style="width:100%; padding:10px; border-radius:8px; border:1px solid var(--divider-color);" 
-								/>
-							</div>
-						</div>
-					</div>
-				` : ''}
-				${(this._customIcons||[]).length ? html`
-					<div style="border:1px solid var(--divider-color); border-radius:12px; padding:12px; margin-bottom:8px; background:color-mix(in srgb, var(--success-color,#43a047) 4%, transparent);">
-						<div style="font-size:.9rem; font-weight:600; color:var(--primary-text-color); margin-bottom:8px; display:flex; align-items:center; gap:6px;">
-							<ha-icon icon="mdi:star-circle" style="--mdc-icon-size:20px; color:var(--success-color,#43a047);"></ha-icon>
-							Gemte Custom Ikoner (${(this._customIcons||[]).length})
-						</div>
-						<div style="display:grid; gap:6px;">
-							${(this._customIcons||[]).map(c=> html`
-								<div style="display:flex; align-items:center; gap:10px; padding:8px 10px; border-radius:8px; background:var(--card-background-color); border:1px solid var(--divider-color);">
-									<ha-icon icon="${c.id}" style="--mdc-icon-size:28px;"></ha-icon>
-									<span style="flex:1; font-weight:500;">${c.label}</span>
-									<small style="color:var(--secondary-text-color); font-size:10px;">${c.id}</small>
-									<button class="btn-danger icon-btn" @click=${()=> this._deleteCustomIcon(c.id)} title="Slet">
-										<ha-icon icon="mdi:delete"></ha-icon>
-									</button>
-								</div>
-							`)}
-						</div>
-					</div>
-				` : ''}
-				<div class="row" style="justify-content:flex-end; gap:8px; margin-top:8px;">
-					<button class="btn-ghost" @click=${()=> this._closeCustomIconModal()}>${this._t('form.cancel')}</button>
-					<button class="btn-primary" ?disabled=${!this._customIconPreview || !this._customIconLabel} @click=${()=> this._saveCustomIcon()}>${this._t('form.save')}</button>
-				</div>
-			</div>
-		</div>`;
-	}
-	_renderSortModal(){
-		const cats = (this._store.categories||[]);
-		// Working order = saved order filtered to existing + new appended; include optional NONE marker at end if present in saved
-		const NONE = '__none__';
-		let order = Array.isArray(this._catOrder)? [...this._catOrder]:[];
-		// ensure only existing ids + NONE
-		order = order.filter(id => id===NONE || cats.some(c=> c.id===id));
-		// append any missing categories
-		for (const c of cats){ if (!order.includes(c.id)) order.push(c.id); }
-		// also ensure NONE is present at end if previously chosen
-		if (!order.includes(NONE)) order.push(NONE);
-		const labelFor = (id)=> id===NONE ? this._t('sort.none') : (cats.find(c=>c.id===id)?.name || id);
-		const onDragStart = (e, idx)=>{ e.dataTransfer.effectAllowed='move'; e.dataTransfer.setData('text/plain', String(idx)); };
-		const onDragOver = (e)=>{ e.preventDefault(); e.currentTarget.classList.add('dragover'); };
-		const onDragLeave = (e)=>{ e.currentTarget.classList.remove('dragover'); };
-		const onDrop = (e, toIdx)=>{
-			e.preventDefault(); e.currentTarget.classList.remove('dragover');
-			const fromIdx = Number(e.dataTransfer.getData('text/plain'));
-			if (!Number.isFinite(fromIdx)) return;
-			const arr = [...order];
-			const [it] = arr.splice(fromIdx,1);
-			arr.splice(toIdx,0,it);
-			this._catOrder = arr; this.requestUpdate();
-		};
-		const save = ()=>{ try{ localStorage.setItem('c4k_cat_order', JSON.stringify(order)); }catch{} this._catOrder = order; this._sortModalOpen=false; this.requestUpdate(); };
-		const reset = ()=>{ order = cats.map(c=> c.id); order.push(NONE); this._catOrder = order; this.requestUpdate(); };
-		return html`<div class="overlay ${this._sortModalOpen?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) this._sortModalOpen=false; }}>
-			${this._sortModalOpen ? html`<div class="modal" style="max-width: 560px; width: min(95vw, 560px);" @click=${e=>e.stopPropagation()}>
-				<h3>${this._t('sort.title')}</h3>
-				<div style="font-size:.9rem; color: var(--secondary-text-color);">${this._t('sort.categories_order')}</div>
-				<ul class="sort-list">
-					${order.map((id, idx)=> html`
-						<li class="sort-item" draggable="true" @dragstart=${e=> onDragStart(e, idx)} @dragover=${onDragOver} @dragleave=${onDragLeave} @drop=${e=> onDrop(e, idx)}>
-							<span class="sort-handle">⋮⋮</span>
-							<span style="flex:1;">${labelFor(id)}</span>
-						</li>
-					`)}
-				</ul>
-				<div class="row" style="justify-content:flex-end; gap:8px;">
-					<button class="btn-ghost" @click=${reset}>${this._t('sort.reset')}</button>
-					<button class="btn-primary" @click=${save}>${this._t('sort.save')}</button>
-				</div>
-			</div>`: ''}
-		</div>`;
-	}
-	
-	_renderReassignModal(){
-		const task = this._reassignTask;
-		if (!task) return '';
-		
-		const approveOnly = async () => {
-			await this.hass.callService('chores4kids','approve_task',{ task_id: task.id });
-			this._reassignTask = null;
-			this.requestUpdate();
-		};
-		
-		const approveAndReassign = async () => {
-			// First approve
-			await this.hass.callService('chores4kids','approve_task',{ task_id: task.id });
-			
-			// Then assign today's version to same child(ren)
-			const targetIds = Array.isArray(task.repeat_child_ids) && task.repeat_child_ids.length 
-				? task.repeat_child_ids 
-				: (task.repeat_child_id ? [task.repeat_child_id] : [task.assigned_to]);
-			
-			for (const childId of targetIds) {
-				try {
-					// Find the unassigned template task
-					const templates = this._store.allTasks.filter(t => 
-						!t.assigned_to && 
-						t.title === task.title && 
-						Number(t.points) === Number(task.points)
-					);
-					
-					if (templates.length > 0) {
-						await this.hass.callService('chores4kids','assign_task',{ 
-							task_id: templates[0].id, 
-							child_id: childId 
-						});
-						this._setBonusVisualState(templates[0].id, 'assigned');
-					}
-				} catch(e) {
-					console.error('Failed to reassign task:', e);
-				}
-			}
-			
-			this._reassignTask = null;
-			this.requestUpdate();
-		};
-		
-		return html`<div class="overlay ${task?'open':''}" @click=${e=>{ if (e.target.classList.contains('overlay')) { this._reassignTask=null; this.requestUpdate(); } }}>
-			<div class="modal" style="max-width: 560px; width: min(95vw, 560px);" @click=${e=>e.stopPropagation()}>
-				<h3>${this._t('overdue.reassign_prompt')}</h3>
-				<div style="padding: 16px 0; color: var(--secondary-text-color);">
-					<div><strong>${task.title}</strong></div>
-					<div style="margin-top:8px; font-size:0.9rem;">${task.assigned_to_name || task.assigned_to}</div>
-				</div>
-				<div class="row" style="justify-content:flex-end; gap:8px;">
-					<button class="btn-ghost" @click=${approveOnly}>${this._t('overdue.no')}</button>
-					<button class="btn-primary" @click=${approveAndReassign}>${this._t('overdue.yes')}</button>
-				</div>
-			</div>
-		</div>`;
-	}
 
 	_openTaskDescription(task, e) {
 		try{
@@ -2771,19 +2037,22 @@ class Chores4KidsDevCard extends LitElement {
 
 		// Fetch store once
 		const store = this._store;
-		const allTasksMap = new Map((store.allTasks||[]).map(t=>[t.id, t]));
-		const templateCandidatesBySignature = new Map();
-		for (const t of (store.allTasks||[]).filter(task=> !task?.assigned_to)){
-			const sig = `${String(t?.title||'').trim().toLowerCase()}|${Number(t?.points||0)}`;
-			const arr = templateCandidatesBySignature.get(sig) || [];
-			arr.push(t);
-			templateCandidatesBySignature.set(sig, arr);
-		}
+		const { allTasksMap, templateCandidatesBySignature } = this._memo('childTaskIndex', [store.allTasks], ()=>{
+			const allTasksMap = new Map((store.allTasks||[]).map(t=>[t.id, t]));
+			const templateCandidatesBySignature = new Map();
+			for (const t of (store.allTasks||[]).filter(task=> !task?.assigned_to)){
+				const sig = `${String(t?.title||'').trim().toLowerCase()}|${Number(t?.points||0)}`;
+				const arr = templateCandidatesBySignature.get(sig) || [];
+				arr.push(t);
+				templateCandidatesBySignature.set(sig, arr);
+			}
+			return { allTasksMap, templateCandidatesBySignature };
+		});
 
 		const myChildId = s?.attributes?.child_id;
 
 		// Enrich tasks with description from master list if missing
-		const rawTasks = (s.attributes.tasks||[]).filter(t=> ['assigned','in_progress','awaiting_approval','approved'].includes(t.status));
+		const rawTasks = this._overlayTasks(s.attributes.tasks||[]).filter(t=> ['assigned','in_progress','awaiting_approval','approved'].includes(t.status));
 		const tasks = rawTasks.map(t => {
 			const full = allTasksMap.get(t.id) || null;
 			const sig = `${String(t?.title||'').trim().toLowerCase()}|${Number(t?.points||0)}`;
@@ -2928,7 +2197,7 @@ class Chores4KidsDevCard extends LitElement {
 							<div class="shop-grid">
 								${items.map(i=> html`
 									<div class="shop-item ${this._buyingItemId===i.id ? 'is-buying' : ''} ${this._buySuccessItemId===i.id ? 'is-bought' : ''}">
-										${i.image ? html`<div class="img-wrap"><img src="${this._resolveUrl(i.image)}" alt="${i.title}" loading="lazy" decoding="async"></div>` : html`<div class="img-wrap" style="display:grid;place-items:center;opacity:.7;">${i.icon? html`<ha-icon icon="${i.icon}" style="--mdc-icon-size:48px"></ha-icon>`:'?'}</div>`}
+										${i.image ? html`<div class="img-wrap"><img src="${this._imageUrl(i, 'card')}" alt="${i.title}" loading="lazy" decoding="async"></div>` : html`<div class="img-wrap" style="display:grid;place-items:center;opacity:.7;">${i.icon? html`<ha-icon icon="${i.icon}" style="--mdc-icon-size:48px"></ha-icon>`:'?'}</div>`}
 										<div class="body">
 											<div class="title">${i.title}</div>
 											<div class="meta"><span class="chip chip-points">${i.price} ${this._t('lbl.points')}</span></div>
@@ -2949,185 +2218,9 @@ class Chores4KidsDevCard extends LitElement {
 	}
 
 	// ===== Actions (admin + child) =====
-	async _addChild(){ if(!this._name) return; await this.hass.callService('chores4kids','add_child',{ name: this._name }); this._name=''; }
-	async _removeChild(c){ if(!confirm(this._t('confirm.delete_child',{name:c.name}))) return; await this.hass.callService('chores4kids','remove_child',{ child_id: c.id }); }
-	_openPoints(c){ if(!this._pointsEnabled()) return; this._pointsChild=c; this._pointsValue=5; this.requestUpdate(); }
-	_closePoints=()=>{ this._pointsChild=null; this.requestUpdate(); }
-	async _addPointsQuick(n){ if(!this._pointsEnabled()) return; if(!this._pointsChild) return; const pts=Number(n||0); if(!Number.isFinite(pts)||pts===0) return; await this.hass.callService('chores4kids','add_points',{ child_id: this._pointsChild.id, points: pts }); this._closePoints(); }
-	async _resetPoints(c){ if(!this._pointsEnabled()) return; if(!confirm(this._t('btn.reset_points')+'?')) return; await this.hass.callService('chores4kids','reset_points',{ child_id: c.id }); }
-	async _promptRename(c){ const nn=prompt(this._t('btn.rename'), c.name); if(!nn || nn===c.name) return; await this.hass.callService('chores4kids','rename_child',{ child_id:c.id, new_name: nn }); }
-	get _showTitleError(){ return (this._touchedTitle && !(String(this._taskTitle||'').trim().length>0)); }
-	get _pointsErrorKey(){ if(!this._pointsEnabled()) return null; if(!this._touchedPoints) return null; const raw=String(this._taskPoints??'').trim(); if(raw==='') return 'err.points_required'; const n=Number(raw); if(!Number.isFinite(n)) return 'err.points_number'; if(n<0) return 'err.points_positive'; return null; }
-	get _showPointsError(){ return !!this._pointsErrorKey; }
-	get _hasFormErrors(){ return this._showTitleError || (this._pointsEnabled() && this._showPointsError); }
-	_pickIcon(id){ this._taskIcon=id; try{ const arr=Array.isArray(this._iconRecents)? [...this._iconRecents]:[]; const next=[id,...arr.filter(x=>x!==id)].slice(0,12); this._iconRecents=next; localStorage.setItem('c4k_icn_recent', JSON.stringify(next)); }catch{} this._iconModalOpen=false; this.requestUpdate(); }
-	_openCustomIconModal(){ this._customIconModalOpen = true; this._customIconSearch = ''; this._customIconPreview = ''; this._customIconLabel = ''; this._iconDisplayLimit = 200; this._iconModalOpen = false; if(!this._availableIcons || !this._availableIcons.length) this._fetchAvailableIcons(); this.requestUpdate(); }
-	_closeCustomIconModal(){ this._customIconModalOpen = false; this._customIconSearch = ''; this._customIconPreview = ''; this._customIconLabel = ''; this._iconDisplayLimit = 200; this.requestUpdate(); }
-	async _fetchAvailableIcons(){ 
-		try{ 
-			// Hent ALLE MDI ikoner direkte fra CDN metadata
-			console.log('Fetching all MDI icons from CDN...');
-			const response = await fetch('https://cdn.jsdelivr.net/npm/@mdi/svg@latest/meta.json');
-			const data = await response.json();
-			
-			if (data && Array.isArray(data)) {
-				this._availableIcons = data.map(icon => `mdi:${icon.name}`).sort();
-				console.log('Successfully loaded ALL MDI icons:', this._availableIcons.length);
-				this.requestUpdate();
-				return;
-			}
-		} catch(e) {
-			console.warn('Could not fetch from MDI CDN:', e);
-		}
-		
-		// Fallback: Prøv Home Assistant's API
-		try{ 
-			const result = await this.hass.callWS({ type: 'frontend/get_icons', category: 'mdi' }); 
-			const icons = result?.resources?.mdi || {}; 
-			this._availableIcons = Object.keys(icons).map(k=> `mdi:${k}`).sort(); 
-			console.log('Loaded icons via HA WebSocket:', this._availableIcons.length);
-			this.requestUpdate(); 
-		}catch(e){ 
-			console.error('Could not fetch icons, using fallback list:', e); 
-			// Sidste fallback: Generate common icons
-			this._availableIcons = this._generateFallbackIcons();
-			console.log('Using fallback icons:', this._availableIcons.length);
-			this.requestUpdate();
-		} 
-	}
-	_generateFallbackIcons(){
-		// Fallback list med de mest almindelige ikoner
-		const common = ['home','car','star','heart','phone','email','calendar','clock','bell','light','fan','door','window','lock','key','trash','recycle','book','pen','pencil','brush','palette','music','headphones','speaker','microphone','camera','video','television','monitor','laptop','keyboard','mouse','gamepad','gift','shopping','cart','bag','wallet','credit-card','money','piggy-bank','food','pizza','coffee','beer','wine','leaf','flower','tree','sun','moon','cloud','umbrella','snowflake','fire','water','lightning','weather','thermometer','gauge','speedometer','wrench','hammer','screwdriver','tools','cog','settings','account','face','people','run','walk','bike','bus','train','airplane','rocket','boat','castle','office','store','hospital','school','bank','factory','warehouse','package','truck','van','ambulance','police','shield','alert','information','help','check','close','plus','minus','arrow','chevron','menu','dots','grid','list','chart','graph','table','download','upload','share','link','tag','label','bookmark','flag','pin','map','navigation','compass','target','crosshairs','eye','hide','lock-open','volume','brightness','wifi','bluetooth','battery','power','plug','usb','sd-card','memory','cpu','chip','server','cloud-outline','cloud-download','cloud-upload','folder','file','document','image','picture','note','text','format','undo','redo','save','print','scan','fax','timer','stopwatch','alarm','weather-cloudy','weather-rainy','weather-snowy','weather-windy','dog','cat','paw','fish','bug','bee','butterfly','baseball','basketball','football','soccer','tennis','golf','cards','dice','puzzle','robot','alien','ghost','skull','pizza-outline','hamburger','ice-cream','cake','cupcake','candy','apple','orange','banana','grapes','carrot','corn','bread','cheese','egg','cookie','donut','hot-dog','popcorn','soda','cup','glass','bottle','plate','silverware','pot','kettle','microwave','oven','fridge','dishwasher','washing-machine','tumble-dryer','iron','vacuum','broom','bucket','spray-bottle','mop','brush-variant','sponge','soap','towel','toilet','shower','bathtub','sink','mirror','toothbrush','razor','hair-dryer','perfume','ring','diamond','crown','medal','trophy','ticket','balloon','confetti','firework','party-popper','candle','lamp','lightbulb','desk-lamp','ceiling-light','chandelier','spotlight','led-strip','necklace','bracelet','watch','glasses','sunglasses','hat','shirt','tie','shoe','boot','sock','glove','jacket','umbrella-outline','backpack','briefcase','purse','luggage'];
-		return common.map(name=> `mdi:${name}`).sort();
-	}
-	_saveCustomIcon(){ const icon = String(this._customIconPreview||'').trim(); const label = String(this._customIconLabel||'').trim(); if(!icon || !label) return; const customs = Array.isArray(this._customIcons)? [...this._customIcons]:[]; const exists = customs.find(c=> c.id === icon); if(!exists){ customs.push({ id: icon, label }); try{ localStorage.setItem('c4k_custom_icons', JSON.stringify(customs)); }catch{} this._customIcons = customs; } this._pickIcon(icon); this._closeCustomIconModal(); }
-	_deleteCustomIcon(iconId){ const customs = Array.isArray(this._customIcons)? [...this._customIcons]:[]; const filtered = customs.filter(c=> c.id !== iconId); try{ localStorage.setItem('c4k_custom_icons', JSON.stringify(filtered)); }catch{} this._customIcons = filtered; this.requestUpdate(); }
-	async _waitForNewTemplateTask(beforeUnassignedIds, sig, timeoutMs=6000){
-		const start = Date.now();
-		const sleep = (ms)=> new Promise(r=> setTimeout(r, ms));
-		const wantTitle = String(sig?.title||'').trim();
-		const wantPoints = Number(sig?.points||0);
-		while ((Date.now() - start) < (Number(timeoutMs)||6000)){
-			try{
-				const candidates = (this._store.allTasks||[])
-					.filter(t=> !t.assigned_to && !(beforeUnassignedIds?.has?.(t.id)))
-					.filter(t=> String(t.title||'').trim()===wantTitle && Number(t.points||0)===wantPoints);
-				if (candidates.length){
-					// Prefer the most recently created
-					candidates.sort((a,b)=>{ try{ return new Date(b.created).getTime() - new Date(a.created).getTime(); }catch{ return 0; } });
-					return candidates[0];
-				}
-			}catch{ /* ignore */ }
-			await sleep(150);
-		}
-		return null;
-	}
-	async _createTask(){
-		const pointsEnabled = this._pointsEnabled();
-		this._touchedTitle=true;
-		this._touchedPoints = pointsEnabled;
-		if(this._hasFormErrors) return;
-		const beforeUnassignedIds = new Set((this._store.allTasks||[]).filter(t=>!t.assigned_to).map(t=>t.id));
-		const scheduleMode = this._weeklyEnabled ? 'weekly' : (this._monthlyEnabled ? 'monthly' : (this._repeatEnabled ? 'repeat' : ''));
-		const repeatOn = (scheduleMode === 'repeat');
-		const bonusOn = pointsEnabled ? !!this._taskEarlyBonusEnabled : false;
-		const dueVal = (bonusOn && (scheduleMode==='repeat' || scheduleMode==='weekly' || scheduleMode==='monthly')) ? undefined : (String(this._taskDue||'').trim() || undefined);
-		const _days = repeatOn ? Array.from(this._repeatDays||[]) : [];
-		const _ids = repeatOn ? Array.from(this._repeatAssign||[]) : [];
-		const _cats = Array.from(this._taskCategories||[]);
-		const _persist = (scheduleMode==='weekly' || scheduleMode==='monthly') ? false : !!this._persistUntilDone;
-		const _quick = !!this._quickComplete;
-		const _skip = !!this._skipApproval;
-		const _fastest = !!this._fastestWins;
-		const _bonusEnabled = pointsEnabled ? !!this._taskBonusEnabled : false;
-		const _bonusTitle = _bonusEnabled ? String(this._taskBonusTitle||'').trim() : '';
-		const _bonusPoints = _bonusEnabled ? Number(this._taskBonusPoints||0) : 0;
-		const _autoAssignIds = (scheduleMode ? Array.from(this._repeatAssign||[]) : []);
-		
-		// Check if today matches schedule - if so, auto-assign immediately
-		const now = new Date();
-		const jsDay = now.getDay(); // 0=Sun
-		const weekdayMap = [6, 0, 1, 2, 3, 4, 5]; // Convert JS day (0=Sun) to backend format (0=Mon)
-		const todayBackend = weekdayMap[jsDay];
-		const assignToday = (
-			scheduleMode==='weekly' ? (todayBackend===0) :
-			scheduleMode==='monthly' ? (now.getDate()===1) :
-			repeatOn ? (_days.includes(todayBackend) || _days.includes(['mon','tue','wed','thu','fri','sat','sun'][todayBackend])) :
-			false
-		);
-		
-		// Always create a reusable unassigned template task.
-		// If today is included in repeat_days, we then assign today's copies from the template
-		// so the task stays editable under "Tasks" and assigned tasks remain linked.
-		const taskData = {
-			title:this._taskTitle,
-			points: pointsEnabled ? Number(this._taskPoints) : 0,
-			description:this._taskDesc||'',
-			due: dueVal,
-			schedule_mode: scheduleMode || undefined,
-			early_bonus_enabled: bonusOn,
-			early_bonus_days: (bonusOn && this._taskEarlyBonusDays!=='' && this._taskEarlyBonusDays!=null) ? Number(this._taskEarlyBonusDays) : undefined,
-			early_bonus_points: (bonusOn && this._taskEarlyBonusPoints!=='' && this._taskEarlyBonusPoints!=null) ? Number(this._taskEarlyBonusPoints) : undefined,
-			bonus_enabled: _bonusEnabled,
-			icon:this._taskIcon||undefined,
-			quick_complete: _quick,
-			skip_approval: _skip,
-			fastest_wins: _fastest,
-			bonus_title: _bonusTitle,
-			bonus_points: Number.isFinite(_bonusPoints) ? _bonusPoints : 0,
-			repeat_days:_days,
-			repeat_child_id: scheduleMode ? (((_autoAssignIds[0]||'') || undefined)) : undefined,
-			repeat_child_ids: scheduleMode ? (_autoAssignIds.length ? _autoAssignIds : undefined) : undefined,
-			persist_until_completed: _persist,
-			mark_overdue: _persist ? !!this._markOverdue : true,
-			categories: _cats
-		};
-		await this.hass.callService('chores4kids','add_task', taskData);
-
-		if (assignToday && _autoAssignIds.length){
-			const tpl = await this._waitForNewTemplateTask(beforeUnassignedIds, { title: this._taskTitle, points: pointsEnabled ? Number(this._taskPoints) : 0 });
-			if (tpl?.id){
-				for (const cid of _autoAssignIds){
-					if(!cid) continue;
-					await this.hass.callService('chores4kids','assign_task', { task_id: tpl.id, child_id: cid });
-				}
-			}
-		}
-
-		// Ensure Tasks section is visible after creating a task
-		try{
-			if (this._collapsed?.tasks){
-				const next = { ...(this._collapsed||{}) };
-				next.tasks = false;
-				this._collapsed = next;
-				localStorage.setItem('c4k_admin_collapsed', JSON.stringify(next));
-			}
-		}catch{}
-		// Clear form and reset validation state so inputs don't show errors
-		this._taskTitle=this._taskPoints=this._taskDesc=this._taskIcon='';
-		this._taskDue='';
-		this._taskEarlyBonusDays='';
-		this._taskEarlyBonusPoints='';
-		this._taskEarlyBonusEnabled=false;
-		this._taskBonusEnabled=false;
-		this._taskBonusTitle='';
-		this._taskBonusPoints='';
-		this._repeatDays=new Set();
-		this._repeatAssign=new Set();
-		this._repeatEnabled=false;
-		this._weeklyEnabled=false;
-		this._monthlyEnabled=false;
-		this._taskCategories=new Set();
-		this._markOverdue=true;
-		this._persistUntilDone=false;
-		this._quickComplete=false;
-		this._skipApproval=false;
-		this._fastestWins=false;
-		this._touchedTitle=false; this._touchedPoints=false;
-	}
 	async _setStatus(taskId,status){
 		try{
-			await this.hass.callService('chores4kids','set_task_status',{ task_id: taskId, status });
+			await this._optimistic(taskId, { status }, ()=> this.hass.callService('chores4kids','set_task_status',{ task_id: taskId, status }));
 		} finally {
 			if (status!=='awaiting_approval'){
 				this._clearCompleted(taskId);
@@ -3251,7 +2344,7 @@ class Chores4KidsDevCard extends LitElement {
 		}
 		
 		// Normal approve (timestamp remains in backend for historical view)
-		await this.hass.callService('chores4kids','approve_task',{ task_id: task.id });
+		await this._optimistic(task.id, { status: 'approved' }, ()=> this.hass.callService('chores4kids','approve_task',{ task_id: task.id }));
 		}catch(err){
 			console.error('Failed to approve task:', err);
 			const msg = String(err?.message || err || 'Unknown error');
@@ -3260,25 +2353,6 @@ class Chores4KidsDevCard extends LitElement {
 			this._setTaskBusy(task.id, false);
 		}
 	}
-	async _assignTask(task, childId){ if(!childId){ alert(this._t('alert.choose_child_first')); return; } await this.hass.callService('chores4kids','assign_task',{ task_id: task.id, child_id: childId }); this._setBonusVisualState(task.id, 'assigned'); task._assignTo=''; this.requestUpdate(); }
-	async _assignTaskMulti(task, childIds){
-		const ids = Array.isArray(childIds) ? childIds.filter(Boolean) : [];
-		if (!ids.length){ alert(this._t('alert.choose_child_first')); return; }
-		for (const id of ids){
-			try{ await this.hass.callService('chores4kids','assign_task',{ task_id: task.id, child_id: id }); this._setBonusVisualState(task.id, 'assigned'); }
-			catch(e){ /* continue to next */ }
-		}
-		// Best-effort: ensure new assigned copies inherit categories from template
-		try{ this._ensureAssignedHasCategories(task, ids); }catch{}
-		// clear selections
-		try{
-			const row = this.shadowRoot.querySelector(`tr[data-task="${task.id}"]`);
-			row?.querySelectorAll('.c4k-assign')?.forEach(i=> i.checked = false);
-			const val = row?.querySelector('.multi-dd-value'); if (val) val.textContent = this._t('select.assign_child'); val?.classList.add('placeholder');
-		}catch{}
-		this._openAssignMenuFor = null;
-		this.requestUpdate();
-	}
 
 	_ensureAssignedHasCategories(templateTask, childIds){
 		const cats = Array.isArray(templateTask?.categories)? templateTask.categories : [];
@@ -3304,176 +2378,12 @@ class Chores4KidsDevCard extends LitElement {
 		}, 500);
 	}
 
-	// Category management
-	async _addCategory(){
-		const n=String(this._newCategoryName||'').trim();
-		if(!n) return;
-		const color=this._normalizeHexColor(this._newCategoryColor);
-		const payload = color ? { name:n, color } : { name:n };
-		await this.hass.callService('chores4kids','add_category', payload);
-		this._newCategoryName='';
-		this._newCategoryColor='';
-	}
-	async _setCategoryColor(cat, e){
-		try{
-			if (!cat?.id) return;
-			const color = String(e?.target?.value || '').trim();
-			await this.hass.callService('chores4kids','set_category_color',{ category_id: cat.id, color });
-		}catch(err){
-			console.error('Failed to set category color:', err);
-		}
-	}
-	async _promptRenameCategory(cat){ const nn=prompt(this._t('btn.rename'), cat.name); if(!nn || nn===cat.name) return; await this.hass.callService('chores4kids','rename_category',{ category_id: cat.id, new_name: nn }); }
-	async _deleteCategory(cat){ if(!confirm(this._t('btn.delete')+'?')) return; await this.hass.callService('chores4kids','delete_category',{ category_id: cat.id }); }
-
-	_updateAssignSummary(taskId, taskRef){
-		try{
-			const row = this.shadowRoot.querySelector(`tr[data-task="${taskId}"]`);
-			const boxes = Array.from(row?.querySelectorAll('.c4k-assign:checked')||[]);
-			const ids = boxes.map(i=> i.value);
-			const names = boxes.map(i=> i.parentElement?.querySelector('span')?.textContent?.trim()).filter(Boolean);
-			if (taskRef) taskRef._assignToMulti = ids;
-			const val = row?.querySelector('.multi-dd-value');
-			if (val){
-				if (names.length===0){ val.textContent = this._t('select.assign_child'); val.classList.add('placeholder'); }
-				else {
-					val.textContent = names.slice(0,2).join(', ') + (names.length>2? ` +${names.length-2}` : '');
-					val.classList.remove('placeholder');
-				}
-			}
-		}catch{}
-	}
-	_editTask(t){ this._editingTask=t; this._taskTitle=t.title; this._taskPoints=t.points; this._taskDesc=t.description||''; this._taskIcon=t.icon||''; this._taskDue = (()=>{ const d=this._parseDueToDate(t?.due); return d? this._formatDateISO(d) : ''; })(); this._taskEarlyBonusDays = (t?.early_bonus_days!=null && Number(t.early_bonus_days)>0)? String(t.early_bonus_days) : ''; this._taskEarlyBonusPoints = (t?.early_bonus_points!=null && Number(t.early_bonus_points)>0)? String(t.early_bonus_points) : ''; this._taskEarlyBonusEnabled = (()=>{ const v=t?.early_bonus_enabled; if (v===true) return true; if (v===false) return false; return (Number(t?.early_bonus_days||0)>0 && Number(t?.early_bonus_points||0)>0); })(); this._taskBonusTitle = String(t?.bonus_title||''); this._taskBonusPoints = (t?.bonus_points!=null && Number(t.bonus_points)>0)? String(t.bonus_points) : ''; this._taskBonusEnabled = !!(String(t?.bonus_title||'').trim() || Number(t?.bonus_points||0)>0); const mode = String(t?.schedule_mode||'').toLowerCase(); this._weeklyEnabled = (mode==='weekly'); this._monthlyEnabled = (mode==='monthly'); const map=["mon","tue","wed","thu","fri","sat","sun"]; const fromAttr=Array.isArray(t.repeat_days)? t.repeat_days.map(d=> typeof d==='number'? map[d] : String(d).slice(0,3)) : []; this._repeatDays=new Set(fromAttr); const kids = Array.isArray(t.repeat_child_ids)? t.repeat_child_ids : (t.repeat_child_id? [t.repeat_child_id]:[]); this._repeatAssign=new Set(kids); this._repeatEnabled = (!this._weeklyEnabled && !this._monthlyEnabled) && !!(fromAttr.length || kids.length || mode==='repeat'); this._persistUntilDone = !!t.persist_until_completed; this._markOverdue = t.mark_overdue !== false; this._quickComplete = !!t.quick_complete; this._skipApproval = !!t.skip_approval; this._fastestWins = !!t.fastest_wins; const cats = Array.isArray(t.categories)? t.categories : []; this._taskCategories = new Set(cats); if (this._weeklyEnabled || this._monthlyEnabled){ this._persistUntilDone = false; this._markOverdue = true; } }
-	async _saveEditedTask(){
-		if(!this._editingTask) return;
-		// validate like create
-		const pointsEnabled = this._pointsEnabled();
-		this._touchedTitle = true; this._touchedPoints = pointsEnabled; this.requestUpdate();
-		if (this._hasFormErrors) return;
-		try{
-			const bonusOn = pointsEnabled ? !!this._taskEarlyBonusEnabled : false;
-			const scheduleMode = this._weeklyEnabled ? 'weekly' : (this._monthlyEnabled ? 'monthly' : (this._repeatEnabled ? 'repeat' : ''));
-			const repeatOn = (scheduleMode === 'repeat');
-			const dueVal = (bonusOn && (scheduleMode==='repeat' || scheduleMode==='weekly' || scheduleMode==='monthly')) ? undefined : (String(this._taskDue||'').trim() || undefined);
-			await this.hass.callService('chores4kids','update_task',{
-				task_id: this._editingTask.id,
-				title: this._taskTitle,
-				points: pointsEnabled ? Number(this._taskPoints) : 0,
-				description: this._taskDesc||'',
-				due: dueVal,
-				early_bonus_enabled: bonusOn,
-				early_bonus_days: (bonusOn && this._taskEarlyBonusDays!=='' && this._taskEarlyBonusDays!=null) ? Number(this._taskEarlyBonusDays) : undefined,
-				early_bonus_points: (bonusOn && this._taskEarlyBonusPoints!=='' && this._taskEarlyBonusPoints!=null) ? Number(this._taskEarlyBonusPoints) : undefined,
-				bonus_enabled: (pointsEnabled && this._taskBonusEnabled),
-				bonus_title: (pointsEnabled && this._taskBonusEnabled) ? String(this._taskBonusTitle||'').trim() : '',
-				bonus_points: (pointsEnabled && this._taskBonusEnabled) ? Number(this._taskBonusPoints||0) : 0,
-				icon: this._taskIcon||'',
-				persist_until_completed: (scheduleMode==='weekly' || scheduleMode==='monthly') ? false : !!this._persistUntilDone,
-				mark_overdue: ((scheduleMode==='weekly' || scheduleMode==='monthly') ? false : !!this._persistUntilDone) ? !!this._markOverdue : true,
-				quick_complete: !!this._quickComplete,
-				skip_approval: !!this._skipApproval,
-				fastest_wins: !!this._fastestWins,
-				categories: Array.from(this._taskCategories||[])
-			});
-			// Try to set multi-children (backend may ignore list if unsupported). Fallback: set first only.
-			const _ids = scheduleMode ? Array.from(this._repeatAssign||[]) : [];
-			const _days = repeatOn ? Array.from(this._repeatDays||[]) : [];
-			await this.hass.callService('chores4kids','set_task_repeat',{
-				task_id: this._editingTask.id,
-				repeat_days: _days,
-				repeat_child_id: _ids[0]||undefined,
-				repeat_child_ids: _ids,
-				schedule_mode: scheduleMode || undefined,
-			});
-			
-			// Check if today is in repeat days and task is unassigned template - if so, auto-assign now
-			if (!this._editingTask.assigned_to && scheduleMode && _ids.length > 0) {
-				const now = new Date();
-				const jsDay = now.getDay();
-				const weekdayMap = [6, 0, 1, 2, 3, 4, 5];
-				const todayBackend = weekdayMap[jsDay];
-				const assignToday = (
-					scheduleMode==='weekly' ? (todayBackend===0) :
-					scheduleMode==='monthly' ? (now.getDate()===1) :
-					repeatOn ? (_days.includes(todayBackend) || _days.includes(['mon','tue','wed','thu','fri','sat','sun'][todayBackend])) :
-					false
-				);
-				
-				if (assignToday) {
-					// Assign only for children missing a today's active instance (avoid duplicates)
-					for (const cid of _ids) {
-						try {
-							if(!cid) continue;
-							const alreadyHasTodays = (this._store.allTasks||[]).some(t =>
-								!!t.assigned_to &&
-								t.assigned_to === cid &&
-								String(t.repeat_template_id||'') === String(this._editingTask.id||'') &&
-								['assigned','in_progress','awaiting_approval'].includes(String(t.status||'')) &&
-								!this._isFromBeforeToday(t)
-							);
-							if (alreadyHasTodays) continue;
-							await this.hass.callService('chores4kids','assign_task',{ 
-								task_id: this._editingTask.id, 
-								child_id: cid 
-							});
-							this._setBonusVisualState(this._editingTask.id, 'assigned');
-						} catch(e) {
-							// Best-effort: ignore assign errors (e.g. backend rejects invalid child)
-						}
-					}
-				}
-			}
-		} finally {
-			this._editingTask=null;
-			this._taskTitle=this._taskPoints=this._taskDesc=this._taskIcon='';
-			this._taskDue='';
-			this._taskEarlyBonusDays='';
-			this._taskEarlyBonusPoints='';
-			this._taskEarlyBonusEnabled=false;
-			this._taskBonusEnabled=false;
-			this._taskBonusTitle='';
-			this._taskBonusPoints='';
-			this._repeatDays=new Set(); this._repeatAssign=new Set();
-			this._repeatEnabled=false;
-			this._weeklyEnabled=false;
-			this._monthlyEnabled=false;
-			this._taskCategories=new Set();
-			this._markOverdue=true;
-			this._quickComplete=false;
-			this._skipApproval=false;
-			this._touchedTitle=false; this._touchedPoints=false;
-		}
-	}
 	async _deleteTask(taskId){
 		if(!confirm(this._t('confirm.delete_task'))) return;
 		await this.hass.callService('chores4kids','delete_task',{ task_id: taskId });
 		this._clearCompleted(taskId);
 		this._setBonusVisualState(taskId, 'assigned');
 	}
-	async _addShopItem(){ if(!this._pointsEnabled()) return; const title=String(this._shopTitle||'').trim(); const price=Number(this._shopPrice||0); if(!title || !Number.isFinite(price)) return; await this.hass.callService('chores4kids','add_shop_item',{ title, price, image: this._shopImage||undefined }); this._shopTitle=this._shopPrice=this._shopImage=''; try{ const el=this.shadowRoot.getElementById('c4k-shop-file'); if(el) el.value=''; }catch{} }
-	async _deleteShopItem(id){ if(!this._pointsEnabled()) return; if(!id) return; await this.hass.callService('chores4kids','delete_shop_item',{ item_id: id }); }
-	async _clearShopHistory(){
-		if(!this._pointsEnabled()) return;
-		if(!confirm(this._t('confirm.clear_history'))) return;
-		try{
-			await this.hass.callService('chores4kids','clear_shop_history',{});
-		}catch(err){
-			try{
-				await this.hass.callService('chores4kids','reset_shop_history',{});
-			}catch(err2){
-				alert('Service chores4kids.clear_shop_history not available');
-			}
-		}
-	}
-	async _onPickImage(e){ if(!this._pointsEnabled()) return; const f=e.target?.files?.[0]; if(!f) return; const reader=new FileReader(); reader.onload= async ()=>{ try{ const dataUrl=reader.result; const ext=(f.name.split('.').pop()||'jpg').toLowerCase(); const name=`c4k_${Date.now()}_${Math.random().toString(36).slice(2)}.${ext}`; await this.hass.callService('chores4kids','upload_shop_image',{ filename:name, data:String(dataUrl) }); this._shopImage=`/local/chores4kids/${name}`; } finally { this.requestUpdate(); } }; reader.readAsDataURL(f); }
-	_startEditItem(i){ this._editItem={ id:i.id, title:i.title, price:i.price, image:i.image||'', active:i.active!==false }; this.requestUpdate(); }
-	async _onPickEditImage(e){ if(!this._pointsEnabled()) return; const f=e.target?.files?.[0]; if(!f) return; const reader=new FileReader(); reader.onload= async ()=>{ const dataUrl=reader.result; const ext=(f.name.split('.').pop()||'jpg').toLowerCase(); const name=`c4k_${Date.now()}_${Math.random().toString(36).slice(2)}.${ext}`; await this.hass.callService('chores4kids','upload_shop_image',{ filename:name, data:String(dataUrl) }); this._editItem={ ...this._editItem, image:`/local/chores4kids/${name}` }; this.requestUpdate(); }; reader.readAsDataURL(f); }
-	async _saveEditItem(){ if(!this._pointsEnabled()) return; const it=this._editItem; if(!it) return; await this.hass.callService('chores4kids','update_shop_item',{ item_id: it.id, title:String(it.title||'').trim(), price:Number(it.price||0), image: it.image||'', active: !!it.active }); this._editItem=null; this.requestUpdate(); }
-	async _toggleItemActive(i,e){ if(!this._pointsEnabled()) return; const active=!!e.target.checked; await this.hass.callService('chores4kids','update_shop_item',{ item_id: i.id, active }); }
-	_openAdvanced(i){ if(!this._pointsEnabled()) return; try{ const shop=Object.values(this.hass.states).find(s=> s?.entity_id?.includes('chores4kids_shop')); const latest=shop?.attributes?.items?.find?.((x)=> x.id===i.id); this._advItem=latest||i; }catch{ this._advItem=i; } const steps=Array.isArray(this._advItem.actions)? JSON.parse(JSON.stringify(this._advItem.actions)) : []; this._advSteps=steps.map(st=>{ const t=String(st?.type||'').toLowerCase(); if(t==='service'){ const ent=st.entity_id || st.data?.entity_id || ''; const op=st.service || st.op; return { type:'entity_service', entity_id: ent, op }; } if(t==='entity_service'){ return { type:'entity_service', entity_id: st.entity_id||'', op: st.op||st.service }; } if(t==='delay'){ return { type:'delay', seconds: Number(st.seconds||st.secs||0) }; } return st; }); this.requestUpdate(); }
-	_defaultOpFor(entity_id){ const dom=(entity_id||'').split('.')[0]; const ops=this._opsForDomain(dom); return ops[0]||'turn_on'; }
-	_opsForDomain(dom){ switch(dom){ case 'switch': case 'light': case 'fan': case 'input_boolean': return ['turn_on','turn_off','toggle']; case 'media_player': return ['turn_on','turn_off','media_play','media_pause','toggle']; case 'lock': return ['lock','unlock']; default: return ['turn_on','turn_off']; } }
-	async _saveAdvanced(){ if(!this._pointsEnabled()) return; if(!this._advItem) return; const actions=(this._advSteps||[]).map(st=> st.type==='delay'? { type:'delay', seconds: Number(st.seconds||0) } : { type:'entity_service', entity_id: st.entity_id, op: st.op||'turn_on' }); await this.hass.callService('chores4kids','update_shop_item',{ item_id: this._advItem.id, actions }); this._advItem=null; this._advSteps=[]; this.requestUpdate(); }
 	async _completeNow(task){
 		if(!task||!task.id) return;
 		if (this._isTaskBusy(task.id)) return;
@@ -3487,8 +2397,7 @@ class Chores4KidsDevCard extends LitElement {
 			const ts = Date.now();
 			console.log('Recording completion timestamp:', task.id, ts);
 			this._recordCompleted(task.id, ts);
-			this.requestUpdate();
-			await this.hass.callService('chores4kids','set_task_status',{ task_id: task.id, status: next, completed_ts: ts });
+			await this._optimistic(task.id, { status: next }, ()=> this.hass.callService('chores4kids','set_task_status',{ task_id: task.id, status: next, completed_ts: ts }));
 		} finally {
 			this._setTaskBusy(task.id, false);
 		}
@@ -3508,11 +2417,10 @@ class Chores4KidsDevCard extends LitElement {
 				const ts = Date.now();
 				console.log('Recording completion timestamp:', task.id, ts);
 				this._recordCompleted(task.id, ts);
-				this.requestUpdate();
 				// Send timestamp to backend
-				await this.hass.callService('chores4kids','set_task_status',{ task_id: task.id, status: next, completed_ts: ts }); 
+				await this._optimistic(task.id, { status: next }, ()=> this.hass.callService('chores4kids','set_task_status',{ task_id: task.id, status: next, completed_ts: ts }));
 			} else {
-				await this.hass.callService('chores4kids','set_task_status',{ task_id: task.id, status: next }); 
+				await this._optimistic(task.id, { status: next }, ()=> this.hass.callService('chores4kids','set_task_status',{ task_id: task.id, status: next }));
 			}
 		} finally {
 			this._setTaskBusy(task.id, false);
@@ -3629,608 +2537,6 @@ class Chores4KidsDevCard extends LitElement {
 }
 
 try{ customElements.define('chores4kids-card', Chores4KidsDevCard); }catch(e){ /* ignore */ }
-// Simple GUI editor
-class Chores4KidsDevCardEditor extends LitElement{
-	static get properties(){ return { hass: {}, _config: {} }; }
-	setConfig(config){
-		this._config = { mode:'admin', ...config };
-		this.requestUpdate();
-	}
-	updated(changedProps){
-		try{
-			if (changedProps.has('hass') || changedProps.has('_config')){
-				this._ensureDetectedCompletionSound();
-			}
-		}catch{ /* ignore */ }
-	}
-	_getGlobalConfettiEnabled(){
-		try{
-			const a = this._getUiSensorAttrs?.() || {};
-			if (typeof a.confetti_enabled === 'boolean') return a.confetti_enabled;
-		}catch{ /* ignore */ }
-		// Default ON
-		return true;
-	}
-	async _saveGlobalConfettiEnabled(enabled){
-		try{
-			await this._saveGlobalUiSettings({ confetti_enabled: !!enabled });
-		}catch(e){
-			console.warn('Failed to save confetti_enabled', e);
-		}
-	}
-	_getGlobalEnablePoints(){
-		try{
-			const states = this.hass?.states || {};
-			let s = states['sensor.chores4kids_ui'];
-			if (!s){
-				s = Object.values(states).find(st=>{
-					try{
-						if (!st?.entity_id?.startsWith('sensor.')) return false;
-						const a = st.attributes || {};
-						return ('enable_points' in a) || ('start_task_bg' in a) || ('complete_task_bg' in a) || ('kid_points_bg' in a)
-							|| ('task_done_bg' in a) || ('task_done_text' in a)
-							|| ('start_task_text' in a) || ('complete_task_text' in a) || ('kid_points_text' in a)
-							|| ('task_points_bg' in a) || ('task_points_text' in a);
-					}catch{ return false; }
-				});
-			}
-			const a = s?.attributes || {};
-			if (typeof a.enable_points === 'boolean') return a.enable_points;
-		}catch{ /* ignore */ }
-		return true;
-	}
-	async _saveGlobalEnablePoints(enabled){
-		try{
-			if (!this.hass) return;
-			await this.hass.callService('chores4kids','set_ui_colors',{ enable_points: !!enabled });
-		}catch(e){
-			console.warn('Failed to save enable_points', e);
-		}
-	}
-	_saveGlobalColors(cfg){
-		// Persist globally in HA backend so it syncs across users/devices.
-		try{
-			if (!this.hass) return;
-			const payload = {
-				start_task_bg: cfg?.start_task_bg || '',
-				complete_task_bg: cfg?.complete_task_bg || '',
-				kid_points_bg: cfg?.kid_points_bg || '',
-				task_done_bg: cfg?.task_done_bg || '',
-				start_task_text: cfg?.start_task_text || '',
-				complete_task_text: cfg?.complete_task_text || '',
-				kid_points_text: cfg?.kid_points_text || '',
-				task_done_text: cfg?.task_done_text || '',
-				task_points_bg: cfg?.task_points_bg || '',
-				task_points_text: cfg?.task_points_text || '',
-			};
-			// debounce service calls while typing
-			this._pendingUiColors = payload;
-			if (this._uiColorSaveTimer) clearTimeout(this._uiColorSaveTimer);
-			this._uiColorSaveTimer = setTimeout(async ()=>{
-				try{
-					await this.hass.callService('chores4kids','set_ui_colors', this._pendingUiColors || payload);
-				}catch(e){
-					console.warn('Failed to save UI colors', e);
-				}
-			}, 250);
-		}catch{ /* ignore */ }
-	}
-	_t(key, vars){ return c4kLocalize(key, this.hass || navigator.language || 'en', vars); }
-	_emit(){ this.dispatchEvent(new CustomEvent('config-changed',{ detail:{ config: this._config }, bubbles:true, composed:true })); }
-	async _onSoundUpload(e) {
-		const file = e.target?.files?.[0];
-		if(!file) return;
-		const reader = new FileReader();
-		reader.onload = async () => {
-			try {
-				const dataUrl = reader.result;
-				const ext = (file.name.split('.').pop() || 'mp3').toLowerCase();
-				// Use a stable filename so all dashboards share the same sound
-				const name = `completion.${ext}`;
-				// Upload to Home Assistant using existing shop image service
-				await this.hass.callService('chores4kids','upload_shop_image',{ filename: name, data: String(dataUrl) });
-				// Update config with the path
-				this._config = {...this._config, completion_sound: `/local/chores4kids/${name}`};
-				// allow selecting the same file again later
-				try{ if (e?.target) e.target.value = ''; }catch{}
-				this._emit();
-			} catch(err) {
-				console.error('Sound upload failed:', err);
-				alert('Failed to upload sound file');
-			}
-		};
-		reader.readAsDataURL(file);
-	}
-	_getCompletionSoundFilename(){
-		try{
-			const raw = String(this._config?.completion_sound || '').trim();
-			if (!raw) return '';
-			const m = raw.match(/\/local\/chores4kids\/([^/?#]+)$/);
-			if (m && m[1]) return m[1];
-			const last = raw.split('/').pop();
-			return String(last || '').trim();
-		}catch{ return ''; }
-	}
-	async _urlExists(url){
-		try{
-			const bust = (url.includes('?') ? '&' : '?') + `_=${Date.now()}`;
-			let r = await fetch(url + bust, { method:'HEAD', cache:'no-store' });
-			if (r.ok) return true;
-			// Some servers block HEAD; try a tiny GET.
-			if (r.status === 405 || r.status === 403){
-				r = await fetch(url + bust, { method:'GET', cache:'no-store', headers: { 'Range': 'bytes=0-0' } });
-				if (r.ok) return true;
-			}
-		}catch{ /* ignore */ }
-		return false;
-	}
-	async _ensureDetectedCompletionSound(force=false){
-		try{
-			const cfg = this._config || {};
-			if (cfg.mode === 'kid') return;
-			// If explicitly configured, no need to detect.
-			if (cfg.completion_sound){
-				this._detectedCompletionSound = null;
-				return;
-			}
-			if (!force && this._detectedCompletionSound) return;
-			if (this._soundDetectInFlight) return;
-			this._soundDetectInFlight = true;
-			const exts = ['mp3','wav','ogg','m4a','aac'];
-			let found = null;
-			for (const ext of exts){
-				const url = `/local/chores4kids/completion.${ext}`;
-				// eslint-disable-next-line no-await-in-loop
-				if (await this._urlExists(url)) { found = { url, filename: `completion.${ext}` }; break; }
-			}
-			this._detectedCompletionSound = found;
-			this.requestUpdate();
-		}catch{ /* ignore */ }
-		finally{ this._soundDetectInFlight = false; }
-	}
-	async _deleteCompletionSound(){
-		try{
-			if (!this.hass) return;
-			const fromCfg = this._getCompletionSoundFilename();
-			const filename = fromCfg || this._detectedCompletionSound?.filename || '';
-			if (!confirm(this._t('editor.delete_sound_confirm'))) return;
-			// Try deleting the explicitly referenced filename (if any)
-			if (filename){
-				try{ await this.hass.callService('chores4kids','delete_uploaded_file',{ filename }); }catch(e){ /* fall through */ }
-			}
-			// Always also delete legacy completion files
-			await this.hass.callService('chores4kids','delete_completion_sound',{});
-			this._config = {...(this._config||{}), completion_sound: ''};
-			this._detectedCompletionSound = null;
-			this._emit();
-			this._ensureDetectedCompletionSound(true);
-		}catch(e){
-			console.error('Sound delete failed:', e);
-			alert(this._t('editor.delete_sound_failed'));
-		}
-	}
-	_getChildren(){
-		try{
-			const states = this.hass?.states || {};
-			const names = Object.values(states)
-				.filter((s)=> s && s.entity_id?.startsWith('sensor.') && s.attributes?.child_id && s.attributes?.name)
-				.map((s)=> s.attributes.name)
-				.filter(Boolean);
-			return Array.from(new Set(names)).sort((a,b)=> String(a).localeCompare(String(b)));
-		}catch{ return []; }
-	}
-	_getNotifyServiceOptions(){
-		try{
-			const services = this.hass?.services?.notify || {};
-			return Object.keys(services).sort((a,b)=> String(a).localeCompare(String(b)));
-		}catch{ return []; }
-	}
-	_getGlobalNotifyServices(){
-		try{
-			const a = this._getUiSensorAttrs?.() || {};
-			const fromCfg = Array.isArray(this._config?.notify_services) ? this._config.notify_services : [];
-			const list = Array.isArray(a.notify_services) ? a.notify_services : [];
-			const cleaned = [...list, ...fromCfg].map(s=> String(s||'').trim()).filter(Boolean)
-				.filter((v,i,a)=> a.indexOf(v)===i);
-			const single = String(a.notify_service || '').trim();
-			if (single && !cleaned.includes(single)) cleaned.push(single);
-			return cleaned;
-		}catch{ return []; }
-	}
-	_getNotifyServiceSettings(){
-		try{
-			const a = this._getUiSensorAttrs?.() || {};
-			const fromCfg = (this._config?.notify_service_settings && typeof this._config.notify_service_settings === 'object') ? this._config.notify_service_settings : {};
-			const fromStore = (a.notify_service_settings && typeof a.notify_service_settings === 'object') ? a.notify_service_settings : {};
-			const merged = { ...fromStore };
-			for (const [svc, opts] of Object.entries(fromCfg || {})){
-				if (!opts || typeof opts !== 'object') continue;
-				merged[svc] = { ...(merged[svc] || {}), ...opts };
-			}
-			return merged;
-		}catch{ return {}; }
-	}
-	_setNotifyServiceSetting(service, key, value){
-		try{
-			const map = this._getNotifyServiceSettings();
-			const next = { ...map, [service]: { ...(map?.[service] || {}), [key]: !!value } };
-			this._config = { ...(this._config||{}), notify_service_settings: next };
-			this._saveGlobalUiSettings({ notify_service_settings: next });
-			this._emit();
-		}catch{ /* ignore */ }
-	}
-	_getUiSensorAttrs(){
-		try{
-			const states = this.hass?.states;
-			if (!states) return {};
-			let s = states['sensor.chores4kids_ui'];
-			if (!s){
-				s = Object.values(states).find(st=>{
-					try{
-						if (!st?.entity_id?.startsWith('sensor.')) return false;
-						const a = st.attributes || {};
-						return (
-							('enable_points' in a) || ('start_task_bg' in a) || ('complete_task_bg' in a) || ('kid_points_bg' in a)
-							|| ('task_done_bg' in a) || ('task_done_text' in a)
-							|| ('start_task_text' in a) || ('complete_task_text' in a) || ('kid_points_text' in a)
-							|| ('task_points_bg' in a) || ('task_points_text' in a)
-							|| ('kid_task_title_size' in a) || ('kid_task_points_size' in a) || ('kid_task_button_size' in a)
-							|| ('confetti_enabled' in a)
-							|| ('notify_service' in a) || ('notify_services' in a) || ('notify_service_settings' in a)
-						);
-					}catch{ return false; }
-				});
-			}
-			return (s?.attributes && typeof s.attributes === 'object') ? s.attributes : {};
-		}catch{ return {}; }
-	}
-	_getGlobalKidFontSizes(){
-		const a = this._getUiSensorAttrs();
-		return {
-			title: a?.kid_task_title_size || '',
-			points: a?.kid_task_points_size || '',
-			button: a?.kid_task_button_size || '',
-		};
-	}
-	_saveGlobalUiSettings(payload){
-		// Persist globally in HA backend so it syncs across users/devices.
-		try{
-			if (!this.hass) return;
-			const next = { ...(this._pendingUiColors || {}), ...(payload || {}) };
-			this._pendingUiColors = next;
-			const hasNotifySettings = payload && Object.prototype.hasOwnProperty.call(payload, 'notify_service_settings');
-			if (hasNotifySettings){
-				try{ this.hass.callService('chores4kids','set_ui_colors', this._pendingUiColors || next); }catch(e){
-					console.warn('Failed to save UI settings (notify)', e);
-				}
-				return;
-			}
-			if (this._uiColorSaveTimer) clearTimeout(this._uiColorSaveTimer);
-			this._uiColorSaveTimer = setTimeout(async ()=>{
-				try{
-					await this.hass.callService('chores4kids','set_ui_colors', this._pendingUiColors || next);
-				}catch(e){
-					console.warn('Failed to save UI settings', e);
-				}
-			}, 250);
-		}catch{ /* ignore */ }
-	}
-		render(){
-		const cfg=this._config||{};
-		const kids=this._getChildren();
-		const notifyOptions = this._getNotifyServiceOptions();
-		const globalNotify = this._getGlobalNotifyServices();
-		const notifyAvailable = (notifyOptions||[]).filter(s=> !globalNotify.includes(s));
-		const notifySettings = this._getNotifyServiceSettings();
-		const globalFs = this._getGlobalKidFontSizes();
-		const fsTitle = (this._fsTaskTitle != null) ? this._fsTaskTitle : globalFs.title;
-		const fsPoints = (this._fsTaskPoints != null) ? this._fsTaskPoints : globalFs.points;
-		const fsButton = (this._fsTaskButton != null) ? this._fsTaskButton : globalFs.button;
-		return html`
-		<div class="card-config">
-			<div class="section-box">
-				<div class="form-field">
-					<label>${this._t('editor.developer_mode')}</label>
-					<label style="display:flex;align-items:center;gap:8px;">
-						<span>${this._t('ui.toggle_off_on')}</span>
-						<ha-switch .checked=${cfg.debug_mode === true} @change=${e=>{ this._config={...cfg, debug_mode: !!e.target.checked}; this._emit(); }}></ha-switch>
-					</label>
-					<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.developer_mode_help')}</small>
-				</div>
-				<div class="form-field"><label>${this._t('editor.mode')}</label>
-					<select .value=${cfg.mode||'admin'} @change=${e=>{ this._config={...cfg, mode:e.target.value}; this._emit(); }}>
-						<option value="admin">${this._t('editor.mode_admin')}</option>
-						<option value="kid">${this._t('editor.mode_kid')}</option>
-						<option value="overview">${this._t('editor.mode_overview')}</option>
-					</select>
-				</div>
-				${(cfg.mode||'admin')==='admin' ? html`
-					<div class="form-field">
-						<label>${this._t('editor.confetti')}</label>
-						<label style="display:flex;align-items:center;gap:8px;">
-							<span>${this._t('ui.toggle_off_on')}</span>
-							<ha-switch .checked=${this._getGlobalConfettiEnabled()} @change=${async e=>{ const enabled=!!e.target.checked; await this._saveGlobalConfettiEnabled(enabled); this._config={...cfg, confetti: enabled}; this._emit(); }}></ha-switch>
-						</label>
-						<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.confetti_help')}</small>
-					</div>
-				` : ''}
-				${cfg.mode !== 'kid' ? html`
-					<div class="form-field">
-						<label>${this._t('editor.completion_sound')}</label>
-						<input type="file" accept="audio/*" @change=${e=> this._onSoundUpload(e)} style="width:100%; max-width:100%; box-sizing:border-box; margin-bottom:4px;" />
-						${(cfg.completion_sound || this._detectedCompletionSound) ? html`
-							<div style="display:flex;align-items:center;gap:8px;margin-top:4px; flex-wrap:wrap;">
-								<small style="opacity:.8;flex:1;word-break:break-all;">${cfg.completion_sound || this._detectedCompletionSound?.url}</small>
-								${cfg.completion_sound ? html`
-									<button @click=${()=>{ this._config={...cfg, completion_sound: ''}; this._emit(); }} style="padding:4px 8px;font-size:0.8rem;">${this._t('form.clear')}</button>
-								` : ''}
-								<button @click=${()=> this._deleteCompletionSound()} ?disabled=${!(cfg.completion_sound || this._detectedCompletionSound?.filename)} style="padding:4px 8px;font-size:0.8rem;">${this._t('editor.delete_sound')}</button>
-							</div>
-						` : ''}
-
-						${(!(cfg.completion_sound || this._detectedCompletionSound)) ? html`
-							<div style="display:flex;align-items:center;gap:8px;margin-top:4px;">
-								<button @click=${()=> this._deleteCompletionSound()} style="padding:4px 8px;font-size:0.8rem;">${this._t('editor.delete_sound')}</button>
-							</div>
-						` : ''}
-						<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.completion_sound_help')}</small>
-					</div>
-				` : ''}
-			</div>
-
-			${(cfg.mode||'admin')==='admin' ? html`
-				<div class="section-box">
-					<div class="form-field">
-						<label>${this._t('section.notifications')}</label>
-						<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.notify_target_help')}</small>
-						<div class="notify-chips">
-							${(globalNotify||[]).length ? (globalNotify||[]).map(s=> html`
-								<span class="notify-chip">
-									${s}
-									<button class="chip-x" title="${this._t('form.clear')}" @click=${()=>{
-										const next = (globalNotify||[]).filter(x=> x!==s);
-										this._saveGlobalUiSettings({ notify_services: next, notify_service: next[0] || '' });
-										this._config={...cfg, notify_service: next[0] || '', notify_services: next};
-										this._emit();
-									}}>&times;</button>
-								</span>
-							`) : html`<span class="notify-empty">${this._t('editor.notify_target_none')}</span>`}
-						</div>
-						<select .value=${''} @change=${e=>{ const v=String(e.target.value||''); if(!v){ this._saveGlobalUiSettings({ notify_services: [], notify_service: '' }); this._config={...cfg, notify_service: '', notify_services: []}; this._emit(); return; } const next=[...(globalNotify||[]), v].filter((x,i,a)=>a.indexOf(x)===i); this._saveGlobalUiSettings({ notify_services: next, notify_service: next[0] || '' }); this._config={...cfg, notify_service: next[0] || '', notify_services: next}; this._emit(); try{ e.target.value=''; }catch{} }}>
-							<option value="">${this._t('editor.notify_target_none')}</option>
-							${(notifyAvailable||[]).map(s=> html`<option value="${s}">${s}</option>`)}
-						</select>
-						${(globalNotify||[]).length ? html`
-							<div style="margin-top:10px; display:grid; gap:10px;">
-								${(globalNotify||[]).map(service=>{
-									const s = notifySettings?.[service] || {};
-									const taskCompleteEnabled = (s.task_complete !== undefined) ? !!s.task_complete : true;
-									const shopPurchaseEnabled = (s.shop_purchase !== undefined) ? !!s.shop_purchase : true;
-									const shopImageEnabled = (s.shop_image !== undefined) ? !!s.shop_image : true;
-									return html`
-										<ha-expansion-panel .header=${service} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
-											<div style="padding:10px; display:grid; gap:10px;">
-												<label style="display:flex;align-items:center;gap:8px;">
-													<ha-switch .checked=${taskCompleteEnabled} @change=${e=> this._setNotifyServiceSetting(service, 'task_complete', e.target.checked)}></ha-switch>
-													<span>${this._t('editor.notify_toggle_complete')}</span>
-												</label>
-												<label style="display:flex;align-items:center;gap:8px;">
-													<ha-switch .checked=${shopPurchaseEnabled} @change=${e=> this._setNotifyServiceSetting(service, 'shop_purchase', e.target.checked)}></ha-switch>
-													<span>${this._t('editor.notify_toggle_shop')}</span>
-												</label>
-												<label style="display:flex;align-items:center;gap:8px; margin-left:26px; opacity:${shopPurchaseEnabled ? '1' : '.5'};">
-													<ha-switch .checked=${shopImageEnabled} ?disabled=${!shopPurchaseEnabled} @change=${e=> this._setNotifyServiceSetting(service, 'shop_image', e.target.checked)}></ha-switch>
-													<span>${this._t('editor.notify_toggle_shop_image')}</span>
-												</label>
-											</div>
-										</ha-expansion-panel>
-									`;
-								})}
-							</div>
-						` : ''}
-					</div>
-				</div>
-			` : ''}
-
-			${cfg.mode==='admin' ? html`
-				<div class="section-box">
-					<div class="form-field">
-						<label>${this._t('editor.enable_points')}</label>
-						<label style="display:flex;align-items:center;gap:8px;">
-							<span>${this._t('ui.toggle_off_on')}</span>
-							<ha-switch .checked=${this._getGlobalEnablePoints()} @change=${async e=>{ const enabled=!!e.target.checked; await this._saveGlobalEnablePoints(enabled); this._config={...cfg, enable_points: enabled}; this._emit(); }}></ha-switch>
-						</label>
-						<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.enable_points_help')}</small>
-					</div>
-					<div class="form-field">
-						<label>${this._t('section.scoreboard')}</label>
-						<label style="display:flex;align-items:center;gap:8px;">
-							<span>${this._t('ui.toggle_off_on')}</span>
-							<ha-switch .checked=${(cfg.enable_points !== false) && (cfg.show_scoreboard !== false)} ?disabled=${cfg.enable_points === false} @change=${e=>{ this._config={...cfg, show_scoreboard: !!e.target.checked}; this._emit(); }}></ha-switch>
-						</label>
-					</div>
-				</div>
-
-				<div class="section-box">
-					<div class="form-field">
-						<label>${this._t('editor.colors')}</label>
-						<div style="display:grid; gap:12px; margin-top:8px;">
-						<ha-expansion-panel .header=${this._t('editor.color_group_start')} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
-							<div style="padding:10px;">
-								<div class="form-field" style="margin-top:6px;">
-									<label style="font-weight:600;">${this._t('editor.color_field_bg')}</label>
-									<div style="display:flex; gap:8px; align-items:center;">
-										<input .value=${cfg.start_task_bg||''} @input=${e=>{ this._config={...cfg, start_task_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
-										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.start_task_bg||'') ? cfg.start_task_bg : '#000000')} @change=${e=>{ this._config={...cfg, start_task_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
-											<button @click=${()=>{ this._config={...cfg, start_task_bg: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-									</div>
-								</div>
-								<div class="form-field" style="margin-top:6px;">
-									<label style="font-weight:600;">${this._t('editor.color_field_text')}</label>
-									<div style="display:flex; gap:8px; align-items:center;">
-										<input .value=${cfg.start_task_text||''} @input=${e=>{ this._config={...cfg, start_task_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
-										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.start_task_text||'') ? cfg.start_task_text : '#000000')} @change=${e=>{ this._config={...cfg, start_task_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
-											<button @click=${()=>{ this._config={...cfg, start_task_text: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-									</div>
-								</div>
-								<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.color_empty_default')}</small>
-							</div>
-						</ha-expansion-panel>
-
-						<ha-expansion-panel .header=${this._t('editor.color_group_complete')} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
-							<div style="padding:10px;">
-								<div class="form-field" style="margin-top:6px;">
-									<label style="font-weight:600;">${this._t('editor.color_field_bg')}</label>
-									<div style="display:flex; gap:8px; align-items:center;">
-										<input .value=${cfg.complete_task_bg||''} @input=${e=>{ this._config={...cfg, complete_task_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
-										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.complete_task_bg||'') ? cfg.complete_task_bg : '#000000')} @change=${e=>{ this._config={...cfg, complete_task_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
-											<button @click=${()=>{ this._config={...cfg, complete_task_bg: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-									</div>
-								</div>
-								<div class="form-field" style="margin-top:6px;">
-									<label style="font-weight:600;">${this._t('editor.color_field_text')}</label>
-									<div style="display:flex; gap:8px; align-items:center;">
-										<input .value=${cfg.complete_task_text||''} @input=${e=>{ this._config={...cfg, complete_task_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
-										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.complete_task_text||'') ? cfg.complete_task_text : '#000000')} @change=${e=>{ this._config={...cfg, complete_task_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
-											<button @click=${()=>{ this._config={...cfg, complete_task_text: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-									</div>
-								</div>
-								<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.color_empty_default')}</small>
-							</div>
-						</ha-expansion-panel>
-
-						<ha-expansion-panel .header=${this._t('btn.task_done')} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
-							<div style="padding:10px;">
-								<div class="form-field" style="margin-top:6px;">
-									<label style="font-weight:600;">${this._t('editor.color_field_bg')}</label>
-									<div style="display:flex; gap:8px; align-items:center;">
-										<input .value=${cfg.task_done_bg||''} @input=${e=>{ this._config={...cfg, task_done_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
-										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.task_done_bg||'') ? cfg.task_done_bg : '#000000')} @change=${e=>{ this._config={...cfg, task_done_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
-											<button @click=${()=>{ this._config={...cfg, task_done_bg: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-									</div>
-								</div>
-								<div class="form-field" style="margin-top:6px;">
-									<label style="font-weight:600;">${this._t('editor.color_field_text')}</label>
-									<div style="display:flex; gap:8px; align-items:center;">
-										<input .value=${cfg.task_done_text||''} @input=${e=>{ this._config={...cfg, task_done_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
-										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.task_done_text||'') ? cfg.task_done_text : '#000000')} @change=${e=>{ this._config={...cfg, task_done_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
-											<button @click=${()=>{ this._config={...cfg, task_done_text: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-									</div>
-								</div>
-								<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.color_empty_default')}</small>
-							</div>
-						</ha-expansion-panel>
-
-						${cfg.enable_points === false ? '' : html`<ha-expansion-panel .header=${this._t('editor.color_group_kid_points')} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
-							<div style="padding:10px;">
-								<div class="form-field" style="margin-top:6px;">
-									<label style="font-weight:600;">${this._t('editor.color_field_bg')}</label>
-									<div style="display:flex; gap:8px; align-items:center;">
-										<input .value=${cfg.kid_points_bg||''} @input=${e=>{ this._config={...cfg, kid_points_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
-										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.kid_points_bg||'') ? cfg.kid_points_bg : '#000000')} @change=${e=>{ this._config={...cfg, kid_points_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
-											<button @click=${()=>{ this._config={...cfg, kid_points_bg: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-									</div>
-								</div>
-								<div class="form-field" style="margin-top:6px;">
-									<label style="font-weight:600;">${this._t('editor.color_field_text')}</label>
-									<div style="display:flex; gap:8px; align-items:center;">
-										<input .value=${cfg.kid_points_text||''} @input=${e=>{ this._config={...cfg, kid_points_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
-										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.kid_points_text||'') ? cfg.kid_points_text : '#000000')} @change=${e=>{ this._config={...cfg, kid_points_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
-											<button @click=${()=>{ this._config={...cfg, kid_points_text: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-									</div>
-								</div>
-								<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.color_empty_default')}</small>
-							</div>
-						</ha-expansion-panel>`}
-
-						${cfg.enable_points === false ? '' : html`<ha-expansion-panel .header=${this._t('editor.color_group_task_points')} style="border:1px solid var(--divider-color); border-radius:8px; overflow:hidden;">
-							<div style="padding:10px;">
-								<div class="form-field" style="margin-top:6px;">
-									<label style="font-weight:600;">${this._t('editor.color_field_bg')}</label>
-									<div style="display:flex; gap:8px; align-items:center;">
-										<input .value=${cfg.task_points_bg||''} @input=${e=>{ this._config={...cfg, task_points_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
-										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.task_points_bg||'') ? cfg.task_points_bg : '#000000')} @change=${e=>{ this._config={...cfg, task_points_bg: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
-											<button @click=${()=>{ this._config={...cfg, task_points_bg: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-									</div>
-								</div>
-								<div class="form-field" style="margin-top:6px;">
-									<label style="font-weight:600;">${this._t('editor.color_field_text')}</label>
-									<div style="display:flex; gap:8px; align-items:center;">
-										<input .value=${cfg.task_points_text||''} @input=${e=>{ this._config={...cfg, task_points_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} placeholder="#RRGGBB" style="flex:1;" />
-										<input type="color" .value=${(/^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$/.test(cfg.task_points_text||'') ? cfg.task_points_text : '#000000')} @change=${e=>{ this._config={...cfg, task_points_text: e.target.value}; this._saveGlobalColors(this._config); this._emit(); }} style="width:44px; height:36px; padding:0; border:0; background:transparent;" />
-											<button @click=${()=>{ this._config={...cfg, task_points_text: ''}; this._saveGlobalColors(this._config); this._emit(); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-									</div>
-								</div>
-								<small style="opacity:.8; margin-top:4px; display:block;">${this._t('editor.color_empty_default')}</small>
-							</div>
-						</ha-expansion-panel>`}
-					</div>
-					</div>
-				</div>
-
-				<div class="section-box">
-					<div class="form-field">
-						<label>Font Sizes</label>
-						<div style="display:grid; gap:12px; margin-top:8px;">
-							<div class="form-field">
-								<label style="font-weight:600;">Task title</label>
-								<div style="display:flex; gap:8px; align-items:center;">
-									<input type="number" min="10" max="40" step="1" .value=${(fsTitle||'').replace('px','')} @input=${e=>{ const raw=String(e.target.value||'').trim(); this._fsTaskTitle = raw; const v = raw==='' ? '' : `${Number(raw)}px`; this._saveGlobalUiSettings({ kid_task_title_size: v }); }} placeholder="16" style="flex:1;" />
-									<span style="opacity:.8; white-space:nowrap;">px</span>
-									<button @click=${()=>{ this._fsTaskTitle=''; this._saveGlobalUiSettings({ kid_task_title_size: '' }); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-								</div>
-							</div>
-							<div class="form-field">
-								<label style="font-weight:600;">Task points</label>
-								<div style="display:flex; gap:8px; align-items:center;">
-									<input type="number" min="10" max="30" step="1" .value=${(fsPoints||'').replace('px','')} @input=${e=>{ const raw=String(e.target.value||'').trim(); this._fsTaskPoints = raw; const v = raw==='' ? '' : `${Number(raw)}px`; this._saveGlobalUiSettings({ kid_task_points_size: v }); }} placeholder="12" style="flex:1;" />
-									<span style="opacity:.8; white-space:nowrap;">px</span>
-									<button @click=${()=>{ this._fsTaskPoints=''; this._saveGlobalUiSettings({ kid_task_points_size: '' }); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-								</div>
-							</div>
-							<div class="form-field">
-								<label style="font-weight:600;">Task button text</label>
-								<div style="display:flex; gap:8px; align-items:center;">
-									<input type="number" min="10" max="30" step="1" .value=${(fsButton||'').replace('px','')} @input=${e=>{ const raw=String(e.target.value||'').trim(); this._fsTaskButton = raw; const v = raw==='' ? '' : `${Number(raw)}px`; this._saveGlobalUiSettings({ kid_task_button_size: v }); }} placeholder="14" style="flex:1;" />
-									<span style="opacity:.8; white-space:nowrap;">px</span>
-									<button @click=${()=>{ this._fsTaskButton=''; this._saveGlobalUiSettings({ kid_task_button_size: '' }); }} style="padding:6px 10px;">${this._t('form.clear')}</button>
-								</div>
-							</div>
-						</div>
-					</div>
-				</div>
-			` : ''}
-
-			${cfg.mode==='kid' ? html`
-				<div class="section-box">
-					<div class="form-field">
-						<label>${this._t('editor.child_label')}</label>
-						${kids.length ? html`
-							<select @change=${e=>{ this._config={...cfg, child: e.target.value}; this._emit(); }}>
-								<option value="" ?selected=${!cfg.child}>${this._t('editor.child_select_prompt')}</option>
-								${cfg.child && !kids.includes(cfg.child) ? html`<option value=${cfg.child} ?selected=${true}>(custom) ${cfg.child}</option>`: ''}
-								${kids.map(n=> html`<option value=${n} ?selected=${n===cfg.child}>${n}</option>`) }
-							</select>
-						`: html`
-							<input .value=${cfg.child||''} @input=${e=>{ this._config={...cfg, child: e.target.value}; this._emit(); }} placeholder="${this._t('editor.child_placeholder')}" />
-							<small style="opacity:.8;">${this._t('editor.child_hint')}</small>
-						`}
-					</div>
-				</div>
-			`:''}
-		</div>`;
-	}
-	static get styles(){
-		return css`
-			.card-config{ display:grid; gap:12px; }
-			.section-box{ border:1px solid var(--divider-color); border-radius: var(--ha-card-border-radius, 12px); padding: 12px; display:grid; gap:10px; }
-			label{ display:block; font-weight:600; margin-bottom:4px; }
-			input,select{ width:100%; padding:8px 10px; border-radius:8px; border:1px solid var(--divider-color); background: var(--card-background-color); color: var(--primary-text-color); }
-			ha-expansion-panel{ background: var(--ha-card-background, var(--card-background-color)); }
-		`;
-	}
-}
-try{ customElements.define('chores4kids-card-editor', Chores4KidsDevCardEditor); }catch(e){ /* ignore */ }
 
 // Lovelace card registry
 window.customCards = window.customCards || [];
@@ -1,32 +1,81 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
 from homeassistant.const import Platform
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.event import async_call_later, async_track_time_change, async_track_time_interval
 from homeassistant.util import dt as dt_util
 
 import logging
 
-from .const import DOMAIN, SIGNAL_CHILDREN_UPDATED, SIGNAL_DATA_UPDATED
+from .const import (
+    CONF_ATTRIBUTES_BUDGET,
+    CONF_INSTRUMENTATION,
+    CONF_ROLLOVER_JITTER,
+    CONF_ROLLOVER_TIME,
+    CONF_STORAGE_BUDGET,
+    DEFAULT_ATTRIBUTES_BUDGET,
+    DEFAULT_INSTRUMENTATION,
+    DEFAULT_ROLLOVER_JITTER,
+    DEFAULT_ROLLOVER_TIME,
+    DEFAULT_STORAGE_BUDGET,
+    DOMAIN,
+    LEDGER_PAGE_MAX,
+    MAX_ROLLOVER_JITTER,
+    MEDIA_GC_INTERVAL,
+    PURCHASES_ATTR_LIMIT,
+    PURCHASES_PAGE_MAX,
+    SIGNAL_CHILDREN_UPDATED,
+    SIGNAL_DATA_UPDATED,
+    STATS_DAILY_DAYS,
+    STATS_PUSH_MINUTE,
+    STORAGE_VERSION,
+    UPLOAD_MAX_BYTES,
+)
+from .instrumentation import INSTRUMENTATION, timed
+from .media import async_process_upload, is_allowed_upload
+from .notify import NotificationRenderer
+from .scheduler import RolloverScheduler, parse_rollover_time
+from .stats import METRICS, async_push_statistics
 from .storage import KidsChoresStore
+from .transfer import read_jsonl, resolve_path, write_jsonl
+from .upload import async_register_upload_view, media_dir, sanitize_filename, write_bytes_atomic
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.CALENDAR]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the Chores4Kids integration."""
+    INSTRUMENTATION.set_enabled(entry.options.get(CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION))
     store = KidsChoresStore(hass)
     await store.async_load()
 
+    def _configure_budgets() -> None:
+        store.sizes.configure(
+            entry.options.get(CONF_STORAGE_BUDGET, DEFAULT_STORAGE_BUDGET),
+            entry.options.get(CONF_ATTRIBUTES_BUDGET, DEFAULT_ATTRIBUTES_BUDGET),
+        )
+
+    _configure_budgets()
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN]["store"] = store
+    # Resume persisted shop action runs once other integrations' services are available.
+    # Must be a callback: a plain function would be run in the executor, off the event loop.
+    @callback
+    def _resume_actions(_hass: HomeAssistant) -> None:
+        store.async_resume_actions()
+
+    entry.async_on_unload(async_at_started(hass, _resume_actions))
 
     # Ensure Lovelace card JS is available and resource is registered (best-effort)
     try:
@@ -37,168 +86,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    def _get_lang_key() -> str:
-        raw = str(getattr(hass.config, "language", "en") or "en").lower()
-        return raw.split("-", 1)[0]
-
-    _NOTIFY_I18N = {
-        "en": {
-            "child": "A child",
-            "message": "{who} completed: {title} ({dt})",
-            "approve": "Approve",
-            "approve_all": "Approve all",
-            "approve_partial": "Partial approve",
-            "reassign": "Reassign",
-            "purchase": "{who} bought {item} for {price} points ({dt})",
-            "bonus_label": "Bonus task",
-            "bonus_done": "Bonus task completed",
-            "bonus_not_done": "Bonus task not completed",
-            "bonus_line": "{status}",
-        },
-        "da": {
-            "child": "Et barn",
-            "message": "{who} har meldt opgaven færdig: {title} ({dt})",
-            "approve": "Godkend",
-            "approve_all": "Godkend alle",
-            "approve_partial": "Delvis godkend",
-            "reassign": "Gentildel",
-            "purchase": "{who} købte {item} for {price} point ({dt})",
-            "bonus_label": "Bonusopgave",
-            "bonus_done": "Bonusopgave er klaret",
-            "bonus_not_done": "Bonusopgave er ikke klaret",
-            "bonus_line": "{status}",
-        },
-        "sv": {
-            "child": "Ett barn",
-            "message": "{who} har markerat uppgiften som klar: {title} ({dt})",
-            "approve": "Godkänn",
-            "approve_all": "Godkänn alla",
-            "approve_partial": "Delvis godkänn",
-            "reassign": "Tilldela igen",
-            "purchase": "{who} köpte {item} för {price} poäng ({dt})",
-            "bonus_label": "Bonusuppgift",
-            "bonus_done": "Bonusuppgift klar",
-            "bonus_not_done": "Bonusuppgift inte klar",
-            "bonus_line": "{status}",
-        },
-        "nb": {
-            "child": "Et barn",
-            "message": "{who} har meldt oppgaven ferdig: {title} ({dt})",
-            "approve": "Godkjenn",
-            "approve_all": "Godkjenn alle",
-            "approve_partial": "Delvis godkjenn",
-            "reassign": "Tildel på nytt",
-            "purchase": "{who} kjøpte {item} for {price} poeng ({dt})",
-            "bonus_label": "Bonusoppgave",
-            "bonus_done": "Bonusoppgave fullført",
-            "bonus_not_done": "Bonusoppgave ikke fullført",
-            "bonus_line": "{status}",
-        },
-        "de": {
-            "child": "Ein Kind",
-            "message": "{who} hat die Aufgabe erledigt: {title} ({dt})",
-            "approve": "Genehmigen",
-            "approve_all": "Alle genehmigen",
-            "approve_partial": "Teilweise genehmigen",
-            "reassign": "Neu zuweisen",
-            "purchase": "{who} kaufte {item} für {price} Punkte ({dt})",
-            "bonus_label": "Bonusaufgabe",
-            "bonus_done": "Bonusaufgabe erledigt",
-            "bonus_not_done": "Bonusaufgabe nicht erledigt",
-            "bonus_line": "{status}",
-        },
-        "es": {
-            "child": "Un niño",
-            "message": "{who} completó: {title} ({dt})",
-            "approve": "Aprobar",
-            "approve_all": "Aprobar todo",
-            "approve_partial": "Aprobar parcial",
-            "reassign": "Reasignar",
-            "purchase": "{who} compró {item} por {price} puntos ({dt})",
-            "bonus_label": "Tarea de bono",
-            "bonus_done": "Tarea de bono completada",
-            "bonus_not_done": "Tarea de bono no completada",
-            "bonus_line": "{status}",
-        },
-        "fr": {
-            "child": "Un enfant",
-            "message": "{who} a terminé : {title} ({dt})",
-            "approve": "Approuver",
-            "approve_all": "Tout approuver",
-            "approve_partial": "Approuver partiellement",
-            "reassign": "Réattribuer",
-            "purchase": "{who} a acheté {item} pour {price} points ({dt})",
-            "bonus_label": "Tâche bonus",
-            "bonus_done": "Tâche bonus terminée",
-            "bonus_not_done": "Tâche bonus non terminée",
-            "bonus_line": "{status}",
-        },
-        "fi": {
-            "child": "Lapsi",
-            "message": "{who} suoritti: {title} ({dt})",
-            "approve": "Hyväksy",
-            "approve_all": "Hyväksy kaikki",
-            "approve_partial": "Osittainen hyväksyntä",
-            "reassign": "Määritä uudelleen",
-            "purchase": "{who} osti {item} {price} pisteellä ({dt})",
-            "bonus_label": "Bonustehtävä",
-            "bonus_done": "Bonustehtävä valmis",
-            "bonus_not_done": "Bonustehtävä ei valmis",
-            "bonus_line": "{status}",
-        },
-        "it": {
-            "child": "Un bambino",
-            "message": "{who} ha completato: {title} ({dt})",
-            "approve": "Approva",
-            "approve_all": "Approva tutto",
-            "approve_partial": "Approva parzialmente",
-            "reassign": "Riassegna",
-            "purchase": "{who} ha comprato {item} per {price} punti ({dt})",
-            "bonus_label": "Attività bonus",
-            "bonus_done": "Attività bonus completata",
-            "bonus_not_done": "Attività bonus non completata",
-            "bonus_line": "{status}",
-        },
-    }
-
-    _NOTIFY_LANG_ALIAS = {
-        "no": "nb",
-    }
-
-    def _get_notify_texts() -> dict:
-        lang = _get_lang_key()
-        lang = _NOTIFY_LANG_ALIAS.get(lang, lang)
-        return _NOTIFY_I18N.get(lang, _NOTIFY_I18N["en"])
-
-    def _format_dt(dt):
-        try:
-            return dt_util.as_local(dt).strftime("%Y-%m-%d %H:%M")
-        except Exception:
-            try:
-                return dt_util.as_local(dt_util.utcnow()).strftime("%Y-%m-%d %H:%M")
-            except Exception:
-                return ""
-
-    def _resolve_notify_image_url(raw: str) -> str:
-        try:
-            url = str(raw or "").strip()
-            if not url:
-                return ""
-            if url.startswith("http://") or url.startswith("https://"):
-                return url
-            base = str(getattr(hass.config, "external_url", "") or "").strip() or str(getattr(hass.config, "internal_url", "") or "").strip()
-            if not base:
-                api = getattr(hass.config, "api", None)
-                base = str(getattr(api, "base_url", "") or "").strip()
-            if not base:
-                return url
-            if url.startswith("/"):
-                return base.rstrip("/") + url
-            return base.rstrip("/") + "/" + url
-        except Exception:
-            return ""
-
+    async_register_upload_view(hass)
 
+    renderer = NotificationRenderer(hass, store)
+    renderer.async_start()
+    hass.data[DOMAIN]["notify_renderer"] = renderer
 
     def _get_notify_settings() -> dict:
         try:
@@ -241,72 +133,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             return [single] if single and _is_notify_enabled(single, kind) else []
 
     # Services
+    @timed("notify.task_completed")
     async def _notify_task_completed(task_id: str):
         try:
             targets = _get_notify_targets("task_complete")
             if not targets:
                 return
 
-            task = next((t for t in store.tasks if t.id == task_id), None)
-            if not task:
+            try:
+                task = store._get_task(task_id)
+            except ValueError:
                 return
 
-            child_name = None
-            try:
-                if task.assigned_to:
-                    child_name = next((c.name for c in store.children if c.id == task.assigned_to), None)
-            except Exception:
-                child_name = None
-
-            texts = _get_notify_texts()
-            title = "Chores4Kids"
-            who = child_name or texts["child"]
-            dt = _format_dt(dt_util.utcnow())
-            message = str(texts["message"]).format(who=who, title=task.title, dt=dt)
-            if bool(getattr(task, "bonus_enabled", False)):
-                bonus_title = str(getattr(task, "bonus_title", "") or "").strip()
-                bonus_label = bonus_title or str(texts.get("bonus_label", "Bonus task"))
-                bonus_status_key = "bonus_done" if bool(getattr(task, "bonus_completed_ts", None)) else "bonus_not_done"
-                bonus_status = str(texts.get(bonus_status_key, "Bonus task completed" if bonus_status_key == "bonus_done" else "Bonus task not completed"))
-                bonus_line_tpl = str(texts.get("bonus_line", "{status}"))
-                message = f"{message}\n{bonus_line_tpl.format(label=bonus_label, status=bonus_status)}"
-            tag = f"chores4kids_task_done_{task_id}"
-            data = {"tag": tag, "task_id": task_id}
-
-            if not getattr(task, "skip_approval", False):
-                approve_label = texts["approve"]
-                reassign_label = texts["reassign"]
-                if bool(getattr(task, "bonus_enabled", False)):
-                    data["actions"] = [
-                        {
-                            "action": f"C4K_APPROVE_ALL_{task_id}",
-                            "title": texts.get("approve_all", approve_label),
-                            "action_data": {"task_id": task_id},
-                        },
-                        {
-                            "action": f"C4K_APPROVE_PARTIAL_{task_id}",
-                            "title": texts.get("approve_partial", approve_label),
-                            "action_data": {"task_id": task_id},
-                        },
-                        {
-                            "action": f"C4K_REASSIGN_{task_id}",
-                            "title": reassign_label,
-                            "action_data": {"task_id": task_id},
-                        },
-                    ]
-                else:
-                    data["actions"] = [
-                        {
-                            "action": f"C4K_APPROVE_{task_id}",
-                            "title": approve_label,
-                            "action_data": {"task_id": task_id},
-                        },
-                        {
-                            "action": f"C4K_REASSIGN_{task_id}",
-                            "title": reassign_label,
-                            "action_data": {"task_id": task_id},
-                        },
-                    ]
+            payload = renderer.task_completed(task)
 
             for svc in targets:
                 domain = "notify"
@@ -321,28 +160,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 await hass.services.async_call(
                     domain,
                     service,
-                    {"title": title, "message": message, "data": data},
+                    payload,
                     blocking=False,
                 )
         except Exception:
             _LOGGER.debug("%s: notification failed", DOMAIN, exc_info=True)
 
+    @timed("notify.shop_purchase")
     async def _notify_shop_purchase(purchase):
         try:
             targets = _get_notify_targets("shop_purchase")
             if not targets:
                 return
 
-            texts = _get_notify_texts()
-            title = "Chores4Kids"
-            who = str(getattr(purchase, "child_name", "") or texts["child"])
-            item = str(getattr(purchase, "title", "") or "")
-            price = int(getattr(purchase, "price", 0) or 0)
-            ts_raw = getattr(purchase, "ts", None)
-            ts = dt_util.parse_datetime(str(ts_raw)) if ts_raw else None
-            dt = _format_dt(ts or dt_util.utcnow())
-            message = str(texts["purchase"]).format(who=who, item=item, price=price, dt=dt)
-            data = {"tag": "chores4kids_shop_purchase"}
+            base_payload = renderer.shop_purchase(purchase)
+            img = None
 
             for svc in targets:
                 domain = "notify"
@@ -354,11 +186,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     _LOGGER.warning("%s: notify service %s.%s not found", DOMAIN, domain, service)
                     continue
 
-                payload = {"title": title, "message": message, "data": data}
+                payload = base_payload
                 if _is_notify_enabled(svc, "shop_image"):
-                    img = _resolve_notify_image_url(getattr(purchase, "image", "") or "")
+                    if img is None:
+                        raw_img = getattr(purchase, "image", "") or ""
+                        raw_img = store.image_variant(raw_img, "notify") or raw_img
+                        img = renderer.resolve_image_url(raw_img)
                     if img:
-                        payload["data"] = {**data, "image": img}
+                        payload = {**base_payload, "data": {**base_payload["data"], "image": img}}
                 await hass.services.async_call(
                     domain,
                     service,
@@ -414,39 +249,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             elif not task_id and action.startswith("C4K_REASSIGN_"):
                 task_id = action.split("C4K_REASSIGN_", 1)[1].strip()
 
-            if action in ("C4K_APPROVE_ALL",) or action.startswith("C4K_APPROVE_ALL_"):
-                if not task_id:
-                    _LOGGER.warning("%s: missing task_id for action %s (data=%s)", DOMAIN, action, dict(event.data))
-                    return
-                await store.approve_task(task_id)
-                try:
-                    task = next((t for t in store.tasks if t.id == task_id), None)
+            async with store.transaction():
+                if action in ("C4K_APPROVE_ALL",) or action.startswith("C4K_APPROVE_ALL_"):
+                    if not task_id:
+                        _LOGGER.warning("%s: missing task_id for action %s (data=%s)", DOMAIN, action, dict(event.data))
+                        return
+                    # Main task + bonus as one unit: a failing bonus step rolls back the approval too
+                    await store.approve_task(task_id)
+                    task = store._tasks_by_id_or_none(task_id)
                     if task and bool(getattr(task, "bonus_enabled", False)):
                         if not getattr(task, "bonus_completed_ts", None):
                             completed_ts = int(dt_util.utcnow().timestamp() * 1000)
                             await store.set_task_bonus_completed(task_id, completed_ts)
                         if not bool(getattr(task, "bonus_approved", False)):
                             await store.approve_bonus_task(task_id)
-                except Exception:
-                    _LOGGER.debug("%s: approve-all bonus flow failed", DOMAIN, exc_info=True)
-            elif action in ("C4K_APPROVE_PARTIAL",) or action.startswith("C4K_APPROVE_PARTIAL_"):
-                if not task_id:
-                    _LOGGER.warning("%s: missing task_id for action %s (data=%s)", DOMAIN, action, dict(event.data))
-                    return
-                await store.approve_task(task_id)
-            elif action in ("C4K_APPROVE",) or action.startswith("C4K_APPROVE_"):
-                if not task_id:
-                    _LOGGER.warning("%s: missing task_id for action %s (data=%s)", DOMAIN, action, dict(event.data))
-                    return
-                await store.approve_task(task_id)
-            elif action in ("C4K_REASSIGN",) or action.startswith("C4K_REASSIGN_"):
-                if not task_id:
-                    _LOGGER.warning("%s: missing task_id for action %s (data=%s)", DOMAIN, action, dict(event.data))
+                elif action in ("C4K_APPROVE_PARTIAL",) or action.startswith("C4K_APPROVE_PARTIAL_"):
+                    if not task_id:
+                        _LOGGER.warning("%s: missing task_id for action %s (data=%s)", DOMAIN, action, dict(event.data))
+                        return
+                    await store.approve_task(task_id)
+                elif action in ("C4K_APPROVE",) or action.startswith("C4K_APPROVE_"):
+                    if not task_id:
+                        _LOGGER.warning("%s: missing task_id for action %s (data=%s)", DOMAIN, action, dict(event.data))
+                        return
+                    await store.approve_task(task_id)
+                elif action in ("C4K_REASSIGN",) or action.startswith("C4K_REASSIGN_"):
+                    if not task_id:
+                        _LOGGER.warning("%s: missing task_id for action %s (data=%s)", DOMAIN, action, dict(event.data))
+                        return
+                    await store.set_task_status(task_id, "assigned")
+                else:
                     return
-                await store.set_task_status(task_id, "assigned")
-            else:
-                return
-            async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
+                store.async_dispatch(SIGNAL_DATA_UPDATED)
         except Exception:
             _LOGGER.debug("%s: notification action failed", DOMAIN, exc_info=True)
 
@@ -534,6 +368,50 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await store.delete_task(call.data["task_id"])
         async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
 
+    # Bulk variants: select by task_ids and/or child/status/category filters,
+    # apply in one pass, persist once and refresh once.
+    def _task_filters(call: ServiceCall, child_key: str = "child_id") -> dict:
+        ids = call.data.get("task_ids")
+        if isinstance(ids, str):
+            ids = [x.strip() for x in ids.split(",")]
+        return {
+            "task_ids": ids,
+            "child_id": call.data.get(child_key),
+            "status": call.data.get("current_status"),
+            "category_id": call.data.get("category_id"),
+        }
+
+    async def svc_approve_tasks(call: ServiceCall) -> ServiceResponse:
+        done = await store.approve_tasks(
+            include_bonus=bool(call.data.get("include_bonus", False)),
+            **_task_filters(call),
+        )
+        if done:
+            async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
+        return {"task_ids": done, "count": len(done)}
+
+    async def svc_delete_tasks(call: ServiceCall) -> ServiceResponse:
+        done = await store.delete_tasks(**_task_filters(call))
+        if done:
+            async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
+        return {"task_ids": done, "count": len(done)}
+
+    async def svc_set_tasks_status(call: ServiceCall) -> ServiceResponse:
+        status = call.data["status"]
+        done, skipped = await store.set_tasks_status(status, call.data.get("completed_ts"), **_task_filters(call))
+        if status == "awaiting_approval":
+            for task_id in done:
+                await _notify_task_completed(task_id)
+        if done or skipped:
+            async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
+        return {"task_ids": done, "skipped": skipped, "count": len(done)}
+
+    async def svc_assign_tasks(call: ServiceCall) -> ServiceResponse:
+        done = await store.assign_tasks(call.data["child_id"], **_task_filters(call, "from_child_id"))
+        if done:
+            async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
+        return {"task_ids": done, "count": len(done)}
+
     async def svc_update_task(call: ServiceCall):
         await store.update_task(
             task_id=call.data["task_id"],
@@ -612,6 +490,91 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await _notify_shop_purchase(pur)
         async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
 
+    async def svc_list_shop_actions(call: ServiceCall) -> ServiceResponse:
+        return {"runs": store.list_action_runs()}
+
+    async def svc_list_purchases(call: ServiceCall) -> ServiceResponse:
+        offset = int(call.data.get("offset", 0) or 0)
+        limit = min(int(call.data.get("limit", PURCHASES_ATTR_LIMIT) or PURCHASES_ATTR_LIMIT), PURCHASES_PAGE_MAX)
+        page, total = store.page_purchases(offset, limit, call.data.get("child_id"))
+        return {
+            "purchases": [store.purchase_dict(p) for p in page],
+            "offset": offset,
+            "total": total,
+        }
+
+    async def svc_list_ledger(call: ServiceCall) -> ServiceResponse:
+        limit = min(int(call.data.get("limit", 100) or 100), LEDGER_PAGE_MAX)
+        entries = store.ledger.entries_for(call.data.get("child_id"), limit)
+        return {
+            "entries": [
+                {
+                    "ts": dt_util.utc_from_timestamp(e.ts).isoformat(),
+                    "child_id": e.child_id,
+                    "kind": e.kind,
+                    "points": e.points,
+                    "ref": e.ref,
+                    "count": e.count,
+                }
+                for e in entries
+            ],
+        }
+
+    async def svc_get_statistics(call: ServiceCall) -> ServiceResponse:
+        days = min(max(int(call.data.get("days", 7) or 7), 1), STATS_DAILY_DAYS)
+        today = dt_util.now().date()
+        start, end = today - timedelta(days=days - 1), today + timedelta(days=1)
+        child_id = call.data.get("child_id")
+        children = [c for c in store.children if not child_id or c.id == child_id]
+        if child_id and not children:
+            raise ValueError("child_not_found")
+        return {
+            "start": start.isoformat(),
+            "children": [
+                {
+                    "child_id": c.id,
+                    "name": c.name,
+                    "totals": dict(zip(METRICS, store.stats.totals(c.id, start, end))),
+                    "days": store.stats.days(c.id, start, end),
+                }
+                for c in children
+            ],
+        }
+
+    async def svc_export_data(call: ServiceCall) -> ServiceResponse:
+        include_history = bool(call.data.get("include_history", False))
+        now = dt_util.now()
+        path = resolve_path(
+            hass, call.data.get("filename"), f"chores4kids-{now.strftime('%Y%m%d-%H%M%S')}.jsonl"
+        )
+        header = {
+            "format": DOMAIN,
+            "version": STORAGE_VERSION,
+            "exported_at": now.isoformat(),
+            "history": include_history,
+        }
+        # Snapshot in the loop, stream to disk in the executor
+        records = store.export_records(include_history)
+        counts = await hass.async_add_executor_job(write_jsonl, path, header, records)
+        return {"path": path, "counts": counts}
+
+    async def svc_import_data(call: ServiceCall) -> ServiceResponse:
+        path = resolve_path(hass, call.data["filename"])
+        header, records = await hass.async_add_executor_job(read_jsonl, path)
+        counts = await store.import_records(
+            records,
+            mode=str(call.data.get("mode", "merge") or "merge"),
+            remap_ids=bool(call.data.get("remap_ids", False)),
+            history=bool(header.get("history", False)),
+        )
+        async_dispatcher_send(hass, SIGNAL_CHILDREN_UPDATED)
+        async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
+        return {"path": path, "counts": counts}
+
+    async def svc_cancel_shop_action(call: ServiceCall):
+        await store.cancel_action_runs(call.data.get("run_id"), call.data.get("purchase_id"))
+        async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
+
     async def svc_clear_shop_history(call: ServiceCall):
         # Optional: clear for specific child_id
         await store.clear_shop_history(call.data.get("child_id"))
@@ -627,6 +590,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.services.async_register(DOMAIN, "complete_bonus_task", svc_complete_bonus_task)
     hass.services.async_register(DOMAIN, "approve_bonus_task", svc_approve_bonus_task)
     hass.services.async_register(DOMAIN, "delete_task", svc_delete_task)
+    for name, handler in (
+        ("approve_tasks", svc_approve_tasks),
+        ("delete_tasks", svc_delete_tasks),
+        ("set_tasks_status", svc_set_tasks_status),
+        ("assign_tasks", svc_assign_tasks),
+    ):
+        hass.services.async_register(DOMAIN, name, handler, supports_response=SupportsResponse.OPTIONAL)
     hass.services.async_register(DOMAIN, "update_task", svc_update_task)
     hass.services.async_register(DOMAIN, "reset_points", svc_reset_points)
     hass.services.async_register(DOMAIN, "add_points", svc_add_points)
@@ -659,29 +629,56 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.services.async_register(DOMAIN, "delete_shop_item", svc_delete_shop_item)
     hass.services.async_register(DOMAIN, "buy_shop_item", svc_buy_shop_item)
     hass.services.async_register(DOMAIN, "clear_shop_history", svc_clear_shop_history)
+    hass.services.async_register(
+        DOMAIN, "list_shop_actions", svc_list_shop_actions, supports_response=SupportsResponse.ONLY
+    )
+    hass.services.async_register(DOMAIN, "cancel_shop_action", svc_cancel_shop_action)
+    hass.services.async_register(
+        DOMAIN, "list_purchases", svc_list_purchases, supports_response=SupportsResponse.ONLY
+    )
+    hass.services.async_register(
+        DOMAIN, "list_ledger", svc_list_ledger, supports_response=SupportsResponse.ONLY
+    )
+    hass.services.async_register(
+        DOMAIN, "get_statistics", svc_get_statistics, supports_response=SupportsResponse.ONLY
+    )
+    hass.services.async_register(
+        DOMAIN, "export_data", svc_export_data, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, "import_data", svc_import_data, supports_response=SupportsResponse.OPTIONAL
+    )
     # Backwards/alias
     hass.services.async_register(DOMAIN, "reset_shop_history", svc_clear_shop_history)
 
-    # Upload images for shop items into /config/www/chores4kids
+    # Upload images for shop items into /config/www/chores4kids.
+    # Large files should use the streaming HTTP view (UPLOAD_URL); this service
+    # stays for small payloads and older cards.
     async def svc_upload_shop_image(call: ServiceCall):
-        import os, base64, re
-        rel_dir = hass.config.path('www', 'chores4kids')
-        os.makedirs(rel_dir, exist_ok=True)
-        filename = call.data.get('filename') or 'upload.bin'
-        # sanitize filename
-        filename = re.sub(r'[^a-zA-Z0-9._-]+', '_', filename)
+        import base64, binascii
+        filename = sanitize_filename(call.data.get('filename'))
+        if not is_allowed_upload(filename):
+            raise ValueError('unsupported_file_type')
         data = call.data.get('data') or ''
         if ',' in data:
             data = data.split(',',1)[1]
+        if len(data) * 3 // 4 > UPLOAD_MAX_BYTES:
+            raise ValueError('file_too_large')
+
+        def _decode_and_write():
+            try:
+                raw = base64.b64decode(data)
+            except (binascii.Error, ValueError):
+                raise ValueError('invalid_base64')
+            write_bytes_atomic(media_dir(hass), filename, raw)
+            return len(raw)
+
+        size = await hass.async_add_executor_job(_decode_and_write)
         try:
-            raw = base64.b64decode(data)
+            # Legacy callers build the URL from the filename, so keep it.
+            await async_process_upload(hass, media_dir(hass), filename, size, rename=False)
         except Exception:
-            raise ValueError('invalid_base64')
-        path = os.path.join(rel_dir, filename)
-        def _write():
-            with open(path, 'wb') as f:
-                f.write(raw)
-        await hass.async_add_executor_job(_write)
+            _LOGGER.debug("%s: image pipeline failed for %s", DOMAIN, filename, exc_info=True)
         async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
 
     hass.services.async_register(DOMAIN, 'upload_shop_image', svc_upload_shop_image)
@@ -692,8 +689,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         Safety: only allows deleting a single filename (no paths) after sanitization.
         """
         import os, re
-        rel_dir = hass.config.path('www', 'chores4kids')
-        os.makedirs(rel_dir, exist_ok=True)
+        rel_dir = media_dir(hass)
         filename = call.data.get('filename') or ''
         filename = re.sub(r'[^a-zA-Z0-9._-]+', '_', filename)
         if not filename or '/' in filename or '\\' in filename or filename.startswith('.'):
@@ -712,6 +708,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         try:
             removed = await hass.async_add_executor_job(_remove)
+            store.media.files.pop(filename, None)
             _LOGGER.info("delete_uploaded_file: filename=%s removed=%s", filename, removed)
         except Exception as ex:
             _LOGGER.exception("delete_uploaded_file failed for %s", filename)
@@ -728,27 +725,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         - completion_<timestamp>.<ext>
         """
         import os, re
-        rel_dir = hass.config.path('www', 'chores4kids')
-        os.makedirs(rel_dir, exist_ok=True)
+        rel_dir = media_dir(hass)
         pattern = re.compile(r'^completion(_\d+)?\.(mp3|wav|ogg|m4a|aac)$', re.IGNORECASE)
 
         def _remove_all():
             matched = 0
-            removed = 0
+            removed: list[str] = []
             errors: list[str] = []
+            # List the directory itself: the media registry may lag behind recent uploads.
             for name in os.listdir(rel_dir):
                 if not pattern.match(name):
                     continue
                 matched += 1
                 try:
                     os.remove(os.path.join(rel_dir, name))
-                    removed += 1
+                    removed.append(name)
+                except FileNotFoundError:
+                    removed.append(name)
                 except Exception as ex:
                     errors.append(f"{name}: {type(ex).__name__}")
             return matched, removed, errors
 
         try:
-            matched, removed, errors = await hass.async_add_executor_job(_remove_all)
+            matched, removed_names, errors = await hass.async_add_executor_job(_remove_all)
+            for name in removed_names:
+                store.media.files.pop(name, None)
+            removed = len(removed_names)
             _LOGGER.info(
                 "delete_completion_sound: matched=%s removed=%s errors=%s", matched, removed, errors
             )
@@ -763,14 +765,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.services.async_register(DOMAIN, 'delete_completion_sound', svc_delete_completion_sound)
 
+    # Periodic garbage collection of unreferenced media in /config/www/chores4kids
+    async def _collect_media(_now=None):
+        try:
+            result = await store.collect_media_garbage()
+        except Exception:
+            _LOGGER.debug("%s: media garbage collection failed", DOMAIN, exc_info=True)
+            return
+        if result["files"]:
+            _LOGGER.info(
+                "%s: media GC removed %s file(s), reclaimed %s bytes", DOMAIN, result["files"], result["bytes"]
+            )
+        hass.bus.async_fire(f"{DOMAIN}_media_gc", result)
+
+    async def svc_collect_media(call: ServiceCall):
+        await _collect_media()
+
+    hass.services.async_register(DOMAIN, 'collect_media', svc_collect_media)
+    entry.async_on_unload(async_track_time_interval(hass, _collect_media, MEDIA_GC_INTERVAL))
+    entry.async_on_unload(async_call_later(hass, 120, _collect_media))
+
+    # Push each completed hour of per-child statistics to the recorder's long-term statistics
+    async def _push_statistics(_now=None):
+        try:
+            pushed = async_push_statistics(hass, store.stats, store.get_child_name)
+        except Exception:
+            _LOGGER.debug("%s: statistics export failed", DOMAIN, exc_info=True)
+            return
+        if pushed:
+            await store.async_save()
+
+    entry.async_on_unload(async_track_time_change(hass, _push_statistics, minute=STATS_PUSH_MINUTE, second=0))
+    entry.async_on_unload(async_at_started(hass, _push_statistics))
+
     async def svc_debug_mark_overdue(call: ServiceCall):
         """DEBUG: Manually mark a task as overdue for testing."""
-        task_id = call.data["task_id"]
-        task = None
-        for t in store.tasks:
-            if t.id == task_id:
-                task = t
-                break
+        task = store._tasks_by_id_or_none(call.data["task_id"])
         if task:
             task.carried_over = True
             await store.async_save()
@@ -858,13 +888,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.services.async_register(DOMAIN, "purge_orphans", svc_purge_orphans)
 
-    # Schedule midnight rollover and run once on startup
-    async def _midnight_cb(now):
+    # Schedule the daily rollover (configurable time + per-household offset) and run once on startup
+    async def _rollover_cb():
         await store.daily_rollover()
         async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
 
-    async_track_time_change(hass, _midnight_cb, hour=0, minute=0, second=0)
-    hass.async_create_task(store.daily_rollover())
+    scheduler = RolloverScheduler(hass, _rollover_cb, entry.entry_id)
+    hass.data[DOMAIN]["rollover_scheduler"] = scheduler
+
+    @callback
+    def _configure_rollover() -> None:
+        try:
+            at = parse_rollover_time(entry.options.get(CONF_ROLLOVER_TIME, DEFAULT_ROLLOVER_TIME))
+        except ValueError:
+            _LOGGER.warning("%s: invalid rollover time %r, using midnight", DOMAIN, entry.options.get(CONF_ROLLOVER_TIME))
+            at = parse_rollover_time(DEFAULT_ROLLOVER_TIME)
+        jitter = int(entry.options.get(CONF_ROLLOVER_JITTER, DEFAULT_ROLLOVER_JITTER) or 0)
+        scheduler.async_configure(at, min(max(jitter, 0), MAX_ROLLOVER_JITTER))
+
+    async def _options_updated(_hass: HomeAssistant, _entry: ConfigEntry) -> None:
+        INSTRUMENTATION.set_enabled(entry.options.get(CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION))
+        _configure_budgets()
+        _configure_rollover()
+
+    _configure_rollover()
+    entry.async_on_unload(scheduler.async_stop)
+    entry.async_on_unload(entry.add_update_listener(_options_updated))
+
+    async def _startup_rollover():
+        # Replays the rollovers missed while Home Assistant was down, up to the last
+        # one whose time has passed; today's is left to the scheduler if still ahead.
+        days = await store.daily_rollover(until=scheduler.last_due_day())
+        if days:
+            _LOGGER.info("%s: caught up %d missed daily rollovers", DOMAIN, days)
+            async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
+
+    hass.async_create_task(_startup_rollover())
 
     return True
 
@@ -884,5 +943,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 unsub_ios()
             except Exception:
                 _LOGGER.debug("%s: iOS notify action unsubscribe failed", DOMAIN, exc_info=True)
+        store = hass.data.get(DOMAIN, {}).get("store")
+        if store:
+            store.async_stop_actions()
+        renderer = hass.data.get(DOMAIN, {}).pop("notify_renderer", None)
+        if renderer:
+            renderer.async_stop()
         hass.data.pop(DOMAIN, None)
     return unload_ok
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SIGNAL_DATA_UPDATED
+from .lazy import entries, field as record_field
+from .schedule import TaskTimeline, TimelineEntry
+from .storage import STATUS_APPROVED, KidsChoresStore, Task
+
+# Materialized schedule windows kept per calendar (the frontend re-asks the same month often)
+WINDOW_CACHE_SIZE = 8
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
+    store: KidsChoresStore = hass.data[DOMAIN]["store"]
+    async_add_entities([Chores4KidsScheduleCalendar(store), Chores4KidsTasksCalendar(store)])
+
+
+def _device_info() -> DeviceInfo:
+    return DeviceInfo(
+        identifiers={(DOMAIN, "tasks")},
+        name="Chores4Kids – Tasks",
+        manufacturer="Chores4Kids",
+        model="Task Index",
+    )
+
+
+def _local_date(raw) -> date | None:
+    if not raw:
+        return None
+    try:
+        parsed = dt_util.parse_datetime(str(raw))
+        if parsed is not None:
+            return dt_util.as_local(parsed).date()
+        return dt_util.parse_date(str(raw))
+    except (TypeError, ValueError):
+        return None
+
+
+def _query_range(start_date: datetime, end_date: datetime) -> tuple[date, date]:
+    start = dt_util.as_local(start_date).date()
+    end_local = dt_util.as_local(end_date)
+    end = end_local.date()
+    if end_local.time() != datetime.min.time():
+        end += timedelta(days=1)
+    return start, end
+
+
+class Chores4KidsScheduleCalendar(CalendarEntity):
+    """Upcoming spawns of repeat, weekly and monthly tasks, straight from the schedule index."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Chores4Kids Schedule"
+    _attr_unique_id = "chores4kids_schedule"
+    _attr_should_poll = False
+
+    def __init__(self, store: KidsChoresStore):
+        self._store = store
+        self._attr_device_info = _device_info()
+        # (start, end) -> (schedule revision, events)
+        self._windows: dict[tuple[date, date], tuple[int, list[CalendarEvent]]] = {}
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(async_dispatcher_connect(self.hass, SIGNAL_DATA_UPDATED, self._handle_data_updated))
+
+    @callback
+    def _handle_data_updated(self) -> None:
+        self._windows.clear()
+        self.async_write_ha_state()
+
+    def _event(self, day: date, task_id: str) -> CalendarEvent | None:
+        try:
+            t = self._store._get_task(task_id)
+        except ValueError:
+            return None
+        targets = self._store._repeat_targets_for_template(t) or ([t.assigned_to] if t.assigned_to else [])
+        names = [n for n in (self._store.get_child_name(cid) for cid in targets) if n]
+        summary = f"{t.title} ({', '.join(names)})" if names else t.title
+        return CalendarEvent(
+            start=day,
+            end=day + timedelta(days=1),
+            summary=summary,
+            description=f"{t.points} points",
+            uid=f"{t.id}_{day.isoformat()}",
+        )
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        today = dt_util.now().date()
+        best: tuple[date, str] | None = None
+        for task_id in self._store.schedule.task_ids():
+            day = self._store.schedule.next_due(task_id, today)
+            if day is not None and (best is None or day < best[0]):
+                best = (day, task_id)
+        return self._event(*best) if best else None
+
+    async def async_get_events(self, hass: HomeAssistant, start_date: datetime, end_date: datetime) -> list[CalendarEvent]:
+        start, end = _query_range(start_date, end_date)
+        revision = self._store.schedule.revision
+        cached = self._windows.get((start, end))
+        if cached is not None and cached[0] == revision:
+            return list(cached[1])
+        events = []
+        for day, task_id in self._store.schedule.occurrences_between(start, end):
+            ev = self._event(day, task_id)
+            if ev is not None:
+                events.append(ev)
+        # Titles and children can change without a schedule change, so data updates clear the cache too.
+        if len(self._windows) >= WINDOW_CACHE_SIZE:
+            self._windows.pop(next(iter(self._windows)))
+        self._windows[(start, end)] = (revision, events)
+        return list(events)
+
+
+class Chores4KidsTasksCalendar(CalendarEntity):
+    """Assigned chores on their due (or creation) day, overdue ones flagged, plus approved history."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Chores4Kids Tasks"
+    _attr_unique_id = "chores4kids_tasks_calendar"
+    _attr_should_poll = False
+
+    def __init__(self, store: KidsChoresStore):
+        self._store = store
+        self._attr_device_info = _device_info()
+        # Approved history, rebuilt only when the store's history_revision moves
+        self._timeline = TaskTimeline()
+        self._history_revision: int | None = None
+        # (local date, entries of the store's open tasks); cleared on data updates
+        self._open: tuple[date, list[TimelineEntry]] | None = None
+        # (local date, current event) for the entity state; cleared on data updates
+        self._current: tuple[date, CalendarEvent | None] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(async_dispatcher_connect(self.hass, SIGNAL_DATA_UPDATED, self._handle_data_updated))
+
+    @callback
+    def _handle_data_updated(self) -> None:
+        # Open chores are re-read from store.open_tasks on demand; history waits for a revision change
+        self._open = None
+        self._current = None
+        self.async_write_ha_state()
+
+    @staticmethod
+    def _open_entry(t: Task, today: date) -> TimelineEntry:
+        """Entry of an assigned, not approved chore; overdue ones stretch from their start up to today."""
+        due = _local_date(t.due)
+        created = _local_date(t.created) or due or today
+        start = min(created, due) if due else created
+        kind = "overdue" if due is not None and due < today else "open"
+        last = today if kind == "overdue" else (due or created)
+        return TimelineEntry(start, last + timedelta(days=1), t.id, kind)
+
+    def _open_entries(self, today: date) -> list[TimelineEntry]:
+        """Open chores sorted by (start, end), from the store's small open-task index."""
+        if self._open is None or self._open[0] != today:
+            found = [self._open_entry(t, today) for t in self._store.open_tasks.values()]
+            found.sort(key=lambda e: (e.start, e.end))
+            self._open = (today, found)
+        return self._open[1]
+
+    def _index(self) -> TaskTimeline:
+        revision = self._store.history_revision
+        if self._history_revision != revision:
+            # Fields are read straight from stored rows, so approved history is not hydrated
+            history: list[TimelineEntry] = []
+            for t in entries(self._store.tasks):
+                if not record_field(t, "assigned_to") or record_field(t, "status") != STATUS_APPROVED:
+                    continue
+                day = _local_date(record_field(t, "approved_at")) or _local_date(record_field(t, "due"))
+                if day is not None:
+                    history.append(TimelineEntry(day, day + timedelta(days=1), record_field(t, "id"), "approved"))
+            self._timeline.rebuild(history)
+            self._history_revision = revision
+        self._timeline.set_ongoing(self._open_entries(dt_util.now().date()))
+        return self._timeline
+
+    def _event(self, entry: TimelineEntry) -> CalendarEvent | None:
+        try:
+            t: Task = self._store._get_task(entry.task_id)
+        except ValueError:
+            return None
+        name = self._store.get_child_name(t.assigned_to)
+        summary = f"{t.title} ({name})" if name else t.title
+        if entry.kind == "overdue":
+            summary = f"Overdue: {summary}"
+        elif entry.kind == "approved":
+            summary = f"✓ {summary}"
+        return CalendarEvent(
+            start=entry.start,
+            end=entry.end,
+            summary=summary,
+            description=f"{t.points} points · {t.status}",
+            uid=f"{t.id}_{entry.kind}",
+        )
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        today = dt_util.now().date()
+        if self._current is None or self._current[0] != today:
+            # First open or overdue chore on today, same order as the timeline (start, end)
+            best = next((e for e in self._open_entries(today) if e.start <= today < e.end), None)
+            self._current = (today, self._event(best) if best is not None else None)
+        return self._current[1]
+
+    async def async_get_events(self, hass: HomeAssistant, start_date: datetime, end_date: datetime) -> list[CalendarEvent]:
+        start, end = _query_range(start_date, end_date)
+        events = []
+        for entry in self._index().between(start, end):
+            ev = self._event(entry)
+            if ev is not None:
+                events.append(ev)
+        return events
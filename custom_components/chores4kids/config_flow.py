@@ -1,7 +1,25 @@
 from __future__ import annotations
 import voluptuous as vol
 from homeassistant import config_entries
-from .const import DOMAIN
+from homeassistant.core import callback
+from homeassistant.helpers import selector
+from .const import (
+    CONF_ATTRIBUTES_BUDGET,
+    CONF_INSTRUMENTATION,
+    CONF_ROLLOVER_JITTER,
+    CONF_ROLLOVER_TIME,
+    CONF_STORAGE_BUDGET,
+    DEFAULT_ATTRIBUTES_BUDGET,
+    DEFAULT_INSTRUMENTATION,
+    DEFAULT_ROLLOVER_JITTER,
+    DEFAULT_ROLLOVER_TIME,
+    DEFAULT_STORAGE_BUDGET,
+    DOMAIN,
+    MAX_ATTRIBUTES_BUDGET,
+    MAX_ROLLOVER_JITTER,
+    MAX_STORAGE_BUDGET,
+)
+from .scheduler import parse_rollover_time
 
 class Chores4KidsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
@@ -11,3 +29,56 @@ class Chores4KidsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Ingen konfiguration nødvendig – bare opret entry
             return self.async_create_entry(title="Chores4Kids", data={})
         return self.async_show_form(step_id="user", data_schema=vol.Schema({}))
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return Chores4KidsOptionsFlow(config_entry)
+
+
+class Chores4KidsOptionsFlow(config_entries.OptionsFlow):
+    """Rollover time and jitter, size budgets, performance instrumentation."""
+
+    def __init__(self, config_entry):
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        errors = {}
+        if user_input is not None:
+            try:
+                parse_rollover_time(user_input.get(CONF_ROLLOVER_TIME, DEFAULT_ROLLOVER_TIME))
+            except ValueError:
+                errors[CONF_ROLLOVER_TIME] = "invalid_rollover_time"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+        opts = self._entry.options
+        schema = vol.Schema({
+            vol.Required(
+                CONF_ROLLOVER_TIME, default=opts.get(CONF_ROLLOVER_TIME, DEFAULT_ROLLOVER_TIME)
+            ): selector.TimeSelector(),
+            vol.Required(
+                CONF_ROLLOVER_JITTER, default=opts.get(CONF_ROLLOVER_JITTER, DEFAULT_ROLLOVER_JITTER)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0, max=MAX_ROLLOVER_JITTER, step=1, unit_of_measurement="min", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Required(
+                CONF_STORAGE_BUDGET, default=opts.get(CONF_STORAGE_BUDGET, DEFAULT_STORAGE_BUDGET)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=256, max=MAX_STORAGE_BUDGET, step=256, unit_of_measurement="KiB", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Required(
+                CONF_ATTRIBUTES_BUDGET, default=opts.get(CONF_ATTRIBUTES_BUDGET, DEFAULT_ATTRIBUTES_BUDGET)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=4, max=MAX_ATTRIBUTES_BUDGET, step=1, unit_of_measurement="KiB", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Required(
+                CONF_INSTRUMENTATION, default=opts.get(CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION)
+            ): selector.BooleanSelector(),
+        })
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
@@ -1,6 +1,52 @@
+from datetime import timedelta
+
 DOMAIN = "chores4kids"
-PLATFORMS = ["sensor"]
+PLATFORMS = ["sensor", "calendar"]
 STORAGE_KEY = DOMAIN
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 SIGNAL_CHILDREN_UPDATED = f"{DOMAIN}_children_updated"
 SIGNAL_DATA_UPDATED = f"{DOMAIN}_data_updated"
+
+# Uploaded media lives under /config/www/<MEDIA_DIR> and is served as /local/<MEDIA_DIR>/
+MEDIA_DIR = DOMAIN
+MEDIA_URL_PREFIX = f"/local/{MEDIA_DIR}/"
+UPLOAD_URL = f"/api/{DOMAIN}/upload"
+UPLOAD_MAX_BYTES = 20 * 1024 * 1024
+MEDIA_GC_INTERVAL = timedelta(hours=6)
+
+# The shop sensor only carries the newest purchases; older pages come from list_purchases
+PURCHASES_ATTR_LIMIT = 50
+PURCHASES_PAGE_MAX = 200
+
+# On startup, missed daily rollovers are replayed for at most this many days (today included)
+ROLLOVER_MAX_CATCHUP_DAYS = 7
+
+# Options: local time of the daily rollover (before 06:00) and a per-household spread in minutes
+CONF_ROLLOVER_TIME = "rollover_time"
+CONF_ROLLOVER_JITTER = "rollover_jitter"
+DEFAULT_ROLLOVER_TIME = "00:00:00"
+DEFAULT_ROLLOVER_JITTER = 0
+MAX_ROLLOVER_JITTER = 120
+# Latency/payload instrumentation (see instrumentation.py), off by default
+CONF_INSTRUMENTATION = "instrumentation"
+DEFAULT_INSTRUMENTATION = False
+# Size budgets (KiB) for the stored document and any one sensor's attributes; over budget raises a repairs issue.
+# The attribute default matches the recorder's 16 KiB limit for state attributes.
+CONF_STORAGE_BUDGET = "storage_budget_kb"
+CONF_ATTRIBUTES_BUDGET = "attributes_budget_kb"
+DEFAULT_STORAGE_BUDGET = 2048
+DEFAULT_ATTRIBUTES_BUDGET = 16
+MAX_STORAGE_BUDGET = 65536
+MAX_ATTRIBUTES_BUDGET = 256
+
+# Points ledger entries older than this are compacted to one entry per child, day and kind
+LEDGER_RAW_DAYS = 90
+LEDGER_PAGE_MAX = 500
+
+# Statistics buckets: daily ones back the leaderboard, hourly ones feed long-term statistics
+STATS_DAILY_DAYS = 90
+STATS_HOURLY_KEEP = timedelta(hours=48)
+# Rows per async_add_external_statistics call
+STATS_IMPORT_BATCH = 500
+# Minute past each hour at which the previous hour is pushed to the recorder
+STATS_PUSH_MINUTE = 2
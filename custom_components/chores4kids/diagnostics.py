@@ -0,0 +1,48 @@
+"""Diagnostics download: store counts and sizes, scheduler state and instrumentation numbers."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, STORAGE_VERSION
+from .instrumentation import INSTRUMENTATION
+from .lazy import LazyList, entries, field
+from .storage import STATUS_APPROVED, KidsChoresStore
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    data: dict[str, Any] = {
+        "options": dict(entry.options),
+        "instrumentation": INSTRUMENTATION.snapshot(),
+    }
+    domain_data = hass.data.get(DOMAIN, {})
+    store: KidsChoresStore | None = domain_data.get("store")
+    if store is not None:
+        # Counts only; names, titles and notify targets stay out of the download
+        data["store"] = {
+            "storage_version": STORAGE_VERSION,
+            "children": len(store.children),
+            "tasks": len(store.tasks),
+            "templates": sum(1 for t in entries(store.tasks) if not field(t, "assigned_to")),
+            "approved_tasks": sum(1 for t in entries(store.tasks) if field(t, "status") == STATUS_APPROVED),
+            "categories": len(store.categories),
+            "shop_items": len(store.items),
+            "purchases": len(store.purchases),
+            "pending_actions": len(store.pending_actions),
+            # Records still held as stored rows (not read since load)
+            "unhydrated": {
+                name: seq.raw_count if isinstance(seq, LazyList) else 0
+                for name, seq in (("tasks", store.tasks), ("purchases", store.purchases))
+            },
+            "scheduled_tasks": len(store.schedule),
+            "ledger_entries": len(store.ledger),
+            "stats_buckets": {"hourly": len(store.stats.hourly), "daily": len(store.stats.daily)},
+            "last_rollover_date": store.last_rollover_date,
+        }
+        data["sizes"] = store.sizes.snapshot()
+    scheduler = domain_data.get("rollover_scheduler")
+    if scheduler is not None and scheduler.next_run is not None:
+        data["next_rollover"] = scheduler.next_run.isoformat()
+    return data
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import gzip
 import hashlib
+import json
 import logging
 import shutil
 from pathlib import Path
 from uuid import uuid4
 
+from aiohttp import web  # type: ignore[reportMissingImports]
+
+from homeassistant.components.http import HomeAssistantView  # type: ignore[reportMissingImports]
 from homeassistant.core import HomeAssistant  # type: ignore[reportMissingImports]
 from homeassistant.helpers.storage import Store  # type: ignore[reportMissingImports]
 from homeassistant.helpers.event import async_call_later  # type: ignore[reportMissingImports]
@@ -15,10 +20,33 @@ _LOGGER = logging.getLogger(__name__)
 # The JS file shipped with this integration under ./www/
 JS_FILENAME = "chores4kids-card.js"
 
-# Where Home Assistant serves files from config/www/ as /local/
-RESOURCE_URL = f"/local/{JS_FILENAME}"
+# Chunks the card imports on demand (admin view, icon picker, config editor). They are
+# loaded relative to the card with the same ?v= token, so the token covers all files.
+JS_CHUNKS = (
+    "chores4kids-card-admin.js",
+    "chores4kids-card-icons.js",
+    "chores4kids-card-editor.js",
+)
+BUNDLE_FILES = (JS_FILENAME, *JS_CHUNKS)
+
+# The bundle files in the package's www/ directory are served under this path.
+# Requests carrying the ?v=<hash> token (the resource URL and the chunks it imports)
+# are cached as immutable for a year; the token changes with the bundle.
+STATIC_URL = "/chores4kids_static"
+RESOURCE_URL = f"{STATIC_URL}/{JS_FILENAME}"
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDATE = "no-cache"
+
+# Legacy location: a copy in config/www/, served by Home Assistant as /local/
+LEGACY_RESOURCE_URL = f"/local/{JS_FILENAME}"
 RESOURCE_TYPE = "module"  # modern custom cards should be loaded as ES modules
 
+# Sidecar next to the bundled files caching their digests keyed on (size, mtime_ns),
+# so startup doesn't re-read the bundle when nothing changed.
+META_FILENAME = f".{JS_FILENAME}.meta.json"
+
+DATA_STATIC_REGISTERED = "chores4kids_static_registered"
+
 
 def _strip_query(url: str) -> str:
     try:
@@ -77,24 +105,66 @@ def _sha256(path: Path) -> str:
 async def ensure_frontend(hass: HomeAssistant) -> None:
     """Best-effort:
 
-    1) Copy bundled JS from the integration package to /config/www/
+    1) Serve the bundled JS from the integration package (precompressed, cached)
     2) Register the JS as a Lovelace resource (storage mode)
 
+    Older Home Assistant versions without static path registration fall back to
+    copying the JS into /config/www/ and loading it from /local/.
+
     This is intentionally best-effort: failures must not block the integration
     (and must not break config flow loading).
     """
+    static_ok = False
     try:
-        await _ensure_js_in_www(hass)
+        static_ok = await _register_static_path(hass)
     except Exception:
-        _LOGGER.debug("ensure_frontend: failed copying JS to /config/www", exc_info=True)
+        _LOGGER.debug("ensure_frontend: failed registering static path", exc_info=True)
 
+    digest = None
     try:
-        await _ensure_lovelace_resource_retry(hass, attempts_left=6)
+        digest = await _ensure_bundle(hass, legacy_copy=not static_ok)
+    except Exception:
+        _LOGGER.debug("ensure_frontend: failed preparing JS bundle", exc_info=True)
+
+    base_url = RESOURCE_URL if static_ok else LEGACY_RESOURCE_URL
+    try:
+        await _ensure_lovelace_resource_retry(hass, attempts_left=6, digest=digest, base_url=base_url)
     except Exception:
         _LOGGER.debug("ensure_frontend: failed registering Lovelace resource", exc_info=True)
 
 
-async def _ensure_lovelace_resource_retry(hass: HomeAssistant, attempts_left: int) -> None:
+class BundleView(HomeAssistantView):
+    """Serve the card bundle; aiohttp picks the .br/.gz sibling by Accept-Encoding."""
+
+    url = STATIC_URL + "/{filename}"
+    name = "chores4kids:bundle"
+    requires_auth = False
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
+        if filename not in BUNDLE_FILES:
+            raise web.HTTPNotFound()
+        path = self._directory / filename
+        cache = CACHE_IMMUTABLE if request.query.get("v") else CACHE_REVALIDATE
+        return web.FileResponse(path, headers={"Cache-Control": cache})
+
+
+async def _register_static_path(hass: HomeAssistant) -> bool:
+    """Serve the bundle at STATIC_URL (once per HA run; views cannot be unregistered)."""
+    if hass.data.get(DATA_STATIC_REGISTERED):
+        return True
+    if not hasattr(hass.http, "register_view"):
+        return False
+    hass.http.register_view(BundleView(Path(__file__).parent / "www"))
+    hass.data[DATA_STATIC_REGISTERED] = True
+    return True
+
+
+async def _ensure_lovelace_resource_retry(
+    hass: HomeAssistant, attempts_left: int, digest: str | None, base_url: str = RESOURCE_URL
+) -> None:
     """Retry resource registration if Lovelace isn't fully ready yet."""
     if attempts_left <= 0:
         return
@@ -105,39 +175,131 @@ async def _ensure_lovelace_resource_retry(hass: HomeAssistant, attempts_left: in
             hass,
             5,
             lambda _now: hass.async_create_task(
-                _ensure_lovelace_resource_retry(hass, attempts_left - 1)
+                _ensure_lovelace_resource_retry(hass, attempts_left - 1, digest, base_url)
             ),
         )
         return
 
-    await _ensure_lovelace_resource(hass)
+    await _ensure_lovelace_resource(hass, digest, base_url)
 
 
-async def _ensure_js_in_www(hass: HomeAssistant) -> None:
-    src = Path(__file__).parent / "www" / JS_FILENAME
-    dst = Path(hass.config.path("www", JS_FILENAME))
+def _stat_key(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [int(st.st_size), int(st.st_mtime_ns)]
 
-    if not src.exists():
-        # If the file isn't shipped, do nothing.
-        _LOGGER.debug("ensure_frontend: bundled JS not found at %s", src)
+
+def _read_meta(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def _write_precompressed(src: Path) -> None:
+    """Write .gz (and .br when brotli is available) siblings served by aiohttp."""
+    raw = src.read_bytes()
+    _write_atomic(src.with_name(src.name + ".gz"), gzip.compress(raw, compresslevel=9, mtime=0))
+    br_path = src.with_name(src.name + ".br")
+    try:
+        import brotli  # type: ignore[reportMissingImports]
+    except ImportError:
+        # Never leave a stale .br behind; it would be served instead of the new bundle.
+        br_path.unlink(missing_ok=True)
         return
+    _write_atomic(br_path, brotli.compress(raw, quality=11))
+
+
+def _deploy_file(src: Path, dst: Path | None, old: dict) -> dict | None:
+    """Hash, precompress and (optionally) copy one bundle file; return its meta entry."""
+    src_key = _stat_key(src)
+    if src_key is None:
+        return None
+    digest = old.get("digest") if old.get("src") == src_key else None
+    if not digest:
+        digest = _sha256(src)
+    entry = {"src": src_key, "digest": digest}
 
-    dst.parent.mkdir(parents=True, exist_ok=True)
+    if old.get("compressed") != digest or not src.with_name(src.name + ".gz").exists():
+        try:
+            _write_precompressed(src)
+            entry["compressed"] = digest
+        except Exception:
+            _LOGGER.debug("ensure_frontend: could not precompress %s", src, exc_info=True)
+    else:
+        entry["compressed"] = digest
+
+    if dst is not None:
+        dst_key = _stat_key(dst)
+        if dst_key is None or old.get("dst") != dst_key or old.get("digest") != digest:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(src, dst)
+            dst_key = _stat_key(dst)
+        entry["dst"] = dst_key
+    return entry
+
+
+def _deploy_js(src_dir: Path, dst_dir: Path, meta_path: Path, legacy_copy: bool) -> str | None:
+    """Prepare the bundled JS files and return one sha256 over all of them (executor).
+
+    Each file's digest is only recomputed when its (size, mtime) changes, and
+    compressed siblings are rebuilt only for a new digest. Copies in
+    /config/www/ are made when legacy_copy is set, or refreshed if an older
+    install already has one there.
+    """
+    if _stat_key(src_dir / JS_FILENAME) is None:
+        # If the file isn't shipped, do nothing.
+        _LOGGER.debug("ensure_frontend: bundled JS not found in %s", src_dir)
+        return None
 
-    # Copy only if missing or changed
-    if dst.exists():
+    meta = _read_meta(meta_path)
+    old_files = meta.get("files") if isinstance(meta.get("files"), dict) else {}
+    copy = legacy_copy or _stat_key(dst_dir / JS_FILENAME) is not None
+
+    files: dict[str, dict] = {}
+    combined = hashlib.sha256()
+    for name in BUNDLE_FILES:
+        entry = _deploy_file(src_dir / name, dst_dir / name if copy else None, old_files.get(name) or {})
+        if entry is None:
+            continue
+        files[name] = entry
+        combined.update(f"{name}:{entry['digest']}\n".encode())
+    digest = combined.hexdigest()
+
+    new_meta = {"digest": digest, "files": files}
+    if new_meta != meta:
         try:
-            if _sha256(src) == _sha256(dst):
-                return
+            meta_path.write_text(json.dumps(new_meta), encoding="utf-8")
         except Exception:
-            # If hashing fails for any reason, overwrite.
-            pass
+            _LOGGER.debug("ensure_frontend: could not write %s", meta_path, exc_info=True)
+    return digest
 
-    await hass.async_add_executor_job(shutil.copyfile, src, dst)
 
+async def _ensure_bundle(hass: HomeAssistant, legacy_copy: bool) -> str | None:
+    src_dir = Path(__file__).parent / "www"
+    dst_dir = Path(hass.config.path("www"))
+    meta_path = src_dir / META_FILENAME
+    return await hass.async_add_executor_job(_deploy_js, src_dir, dst_dir, meta_path, legacy_copy)
 
-async def _ensure_lovelace_resource(hass: HomeAssistant) -> None:
-    """Add/update /local/... as a Lovelace resource (storage mode) with cache-busting."""
+
+async def _ensure_lovelace_resource(hass: HomeAssistant, digest: str | None, base_url: str = RESOURCE_URL) -> None:
+    """Add/update the card as a Lovelace resource (storage mode) with cache-busting.
+
+    Entries still pointing at the legacy /local/ copy are moved to base_url.
+    """
+
+    token = _token_from_hash(digest) if digest else "0"
+    url = f"{base_url}?v={token}"
+    known_urls = {RESOURCE_URL, LEGACY_RESOURCE_URL}
 
     # Prefer HA's resource collection API (what the UI uses).
     resources = _get_lovelace_resources(hass)
@@ -145,19 +307,10 @@ async def _ensure_lovelace_resource(hass: HomeAssistant) -> None:
         if not getattr(resources, "loaded", True):
             await resources.async_load()
 
-        deployed = Path(hass.config.path("www", JS_FILENAME))
-        token = "0"
-        if deployed.exists():
-            try:
-                token = _token_from_hash(_sha256(deployed))
-            except Exception:
-                token = "0"
-        url = f"{RESOURCE_URL}?v={token}"
-
         matches = []
         for entry in resources.async_items():
             try:
-                if _strip_query(entry.get("url", "")) == RESOURCE_URL:
+                if _strip_query(entry.get("url", "")) in known_urls:
                     matches.append(entry)
             except Exception:
                 continue
@@ -212,17 +365,8 @@ async def _ensure_lovelace_resource(hass: HomeAssistant) -> None:
     if isinstance(resources, dict):
         resources = resources.get("resources", [])
 
-    deployed = Path(hass.config.path("www", JS_FILENAME))
-    token = "0"
-    if deployed.exists():
-        try:
-            token = _token_from_hash(_sha256(deployed))
-        except Exception:
-            token = "0"
-    url = f"{RESOURCE_URL}?v={token}"
-
     for r in resources:
-        if isinstance(r, dict) and _strip_query(r.get("url", "")) == RESOURCE_URL:
+        if isinstance(r, dict) and _strip_query(r.get("url", "")) in known_urls:
             if r.get("url") != url or r.get("type") != RESOURCE_TYPE:
                 r["url"] = url
                 r["type"] = RESOURCE_TYPE
@@ -0,0 +1,173 @@
+"""In-memory latency histograms for store operations, sensor attribute builds and notifications.
+
+Off by default (enable it in the integration options). While disabled an
+instrumented call costs one attribute check. While enabled each call is timed
+with perf_counter into a fixed log-scale histogram, and sensor attribute
+payloads and store saves also record their serialized size. Nothing is
+persisted: the numbers describe the current Home Assistant run and are read
+through the diagnostics download and the debug sensor.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from functools import wraps
+import inspect
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+
+# Upper bucket bounds in seconds: 10 µs .. ~170 s, four buckets per doubling (< 19 % error)
+_BOUNDS: List[float] = [1e-5 * 2 ** (i / 4) for i in range(96)]
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile, capped at the observed max."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if c and seen >= rank:
+                return min(_BOUNDS[i], self.max) if i < len(_BOUNDS) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        def _ms(seconds: float) -> float:
+            return round(seconds * 1000, 3)
+
+        return {
+            "count": self.count,
+            "mean_ms": _ms(self.total / self.count) if self.count else 0.0,
+            "p50_ms": _ms(self.percentile(0.50)),
+            "p95_ms": _ms(self.percentile(0.95)),
+            "p99_ms": _ms(self.percentile(0.99)),
+            "max_ms": _ms(self.max),
+        }
+
+
+class SizeStats:
+    __slots__ = ("count", "total", "max", "last")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.last = 0
+
+    def observe(self, nbytes: int) -> None:
+        self.count += 1
+        self.total += nbytes
+        self.last = nbytes
+        if nbytes > self.max:
+            self.max = nbytes
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "last_bytes": self.last,
+            "mean_bytes": self.total // self.count if self.count else 0,
+            "max_bytes": self.max,
+        }
+
+
+class Instrumentation:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.since: Optional[str] = None
+        self.latency: Dict[str, Histogram] = {}
+        self.sizes: Dict[str, SizeStats] = {}
+
+    def set_enabled(self, enabled: bool) -> None:
+        enabled = bool(enabled)
+        if enabled and not self.enabled:
+            self.reset()
+        elif not enabled:
+            # Drop the numbers so a disabled instance holds no memory
+            self.latency, self.sizes, self.since = {}, {}, None
+        self.enabled = enabled
+
+    def reset(self) -> None:
+        self.latency, self.sizes = {}, {}
+        self.since = dt_util.utcnow().isoformat()
+
+    def observe(self, name: str, seconds: float) -> None:
+        hist = self.latency.get(name)
+        if hist is None:
+            hist = self.latency[name] = Histogram()
+        hist.observe(seconds)
+
+    def observe_size(self, name: str, nbytes: int) -> None:
+        stats = self.sizes.get(name)
+        if stats is None:
+            stats = self.sizes[name] = SizeStats()
+        stats.observe(nbytes)
+
+    @property
+    def operations(self) -> int:
+        return sum(h.count for h in self.latency.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "since": self.since,
+            "latency": {name: h.summary() for name, h in sorted(self.latency.items())},
+            "payload_sizes": {name: s.summary() for name, s in sorted(self.sizes.items())},
+        }
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+def payload_size(obj: Any) -> int:
+    """Serialized JSON size in bytes, as Home Assistant would write it."""
+    return len(json_bytes(obj))
+
+
+def timed(name: str) -> Callable:
+    """Time an async function under `name`."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not INSTRUMENTATION.enabled:
+                return await func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                INSTRUMENTATION.observe(name, perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_methods(prefix: str) -> Callable:
+    """Class decorator: time every public coroutine method as `<prefix>.<method>`."""
+
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if not attr.startswith("_") and inspect.iscoroutinefunction(value):
+                setattr(cls, attr, timed(f"{prefix}.{attr}")(value))
+        return cls
+
+    return decorator
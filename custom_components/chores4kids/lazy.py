@@ -0,0 +1,159 @@
+"""Record lists that hydrate stored history on first access.
+
+`async_load` keeps approved task instances and the purchase history as the
+raw dicts read from storage. A `LazyList` turns an entry into its dataclass
+the first time it is read through the normal list interface (index, slice or
+iteration), so loading costs the same whether the history holds ten records
+or ten thousand. Saving writes untouched entries back as they are, and bulk
+paths that only need one field (media refs, the rollover sweep, per-child
+filters) read it with `field()` without hydrating anything.
+"""
+from __future__ import annotations
+
+from collections.abc import MutableSequence
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+
+def record_factory(cls) -> Callable[[Dict[str, Any]], Any]:
+    """Build `cls` from a stored row, ignoring keys it does not know.
+
+    The object's fields are filled in directly rather than through __init__,
+    so hydration skips the per-field __setattr__ the store's records have.
+    """
+    known = frozenset(f.name for f in fields(cls))
+    defaults = {f.name: f.default for f in fields(cls) if f.default is not MISSING}
+    factories = [(f.name, f.default_factory) for f in fields(cls) if f.default_factory is not MISSING]
+    required = frozenset(f.name for f in fields(cls) if f.default is MISSING and f.default_factory is MISSING)
+
+    def build(row: Dict[str, Any]) -> Any:
+        if not required <= row.keys():
+            raise TypeError(f"{cls.__name__}: missing {sorted(required - row.keys())}")
+        state = dict(defaults)
+        for name, make in factories:
+            if name not in row:
+                state[name] = make()
+        for k, v in row.items():
+            if k in known:
+                # Containers are copied so the object never shares them with a row that may still be saved
+                state[k] = list(v) if type(v) is list else dict(v) if type(v) is dict else v
+        obj = object.__new__(cls)
+        obj.__dict__.update(state)
+        return obj
+
+    return build
+
+
+def field(entry: Any, name: str, default: Any = None) -> Any:
+    """Field of a record, whether it is still a raw row or already an object."""
+    if type(entry) is dict:
+        return entry.get(name, default)
+    return getattr(entry, name, default)
+
+
+def entries(seq: Iterable[Any]) -> List[Any]:
+    """Raw rows and objects as they are held, hydrating nothing."""
+    return seq.entries() if isinstance(seq, LazyList) else list(seq)
+
+
+def rows(seq: Iterable[Any], to_row: Callable[[Any], Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Storage rows: raw entries are passed through, objects converted with to_row."""
+    if isinstance(seq, LazyList):
+        return seq.rows(to_row)
+    return [to_row(x) for x in seq]
+
+
+def loaded(seq: Iterable[Any]) -> Iterator[Any]:
+    """Objects that are already hydrated, skipping raw rows."""
+    return seq.loaded() if isinstance(seq, LazyList) else iter(seq)
+
+
+class LazyList(MutableSequence):
+    """List of records where some entries are still raw rows (plain dicts)."""
+
+    __slots__ = ("_items", "_factory", "_raw")
+
+    def __init__(self, factory: Callable[[Dict[str, Any]], Any], items: Iterable[Any] = ()) -> None:
+        self._factory = factory
+        self._items: List[Any] = list(items)
+        self._raw = sum(1 for x in self._items if type(x) is dict)
+
+    @property
+    def factory(self) -> Callable[[Dict[str, Any]], Any]:
+        return self._factory
+
+    @property
+    def raw_count(self) -> int:
+        return self._raw
+
+    def _at(self, i: int) -> Any:
+        item = self._items[i]
+        if type(item) is dict:
+            item = self._items[i] = self._factory(item)
+            self._raw -= 1
+        return item
+
+    def _recount(self) -> None:
+        self._raw = sum(1 for x in self._items if type(x) is dict)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._at(j) for j in range(*i.indices(len(self._items)))]
+        return self._at(i)
+
+    def __setitem__(self, i, value) -> None:
+        if isinstance(i, slice):
+            self._items[i] = list(value)
+            self._recount()
+            return
+        old, self._items[i] = self._items[i], value
+        self._raw += (type(value) is dict) - (type(old) is dict)
+
+    def __delitem__(self, i) -> None:
+        del self._items[i]
+        if self._raw:
+            self._recount()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        if not self._raw:
+            return iter(self._items)
+        return self._hydrating()
+
+    def _hydrating(self) -> Iterator[Any]:
+        i = 0
+        while i < len(self._items):
+            yield self._at(i)
+            i += 1
+
+    def __reversed__(self) -> Iterator[Any]:
+        for i in range(len(self._items) - 1, -1, -1):
+            yield self._at(i)
+
+    def __repr__(self) -> str:
+        return f"LazyList({len(self._items)} entries, {self._raw} raw)"
+
+    def insert(self, i: int, value: Any) -> None:
+        self._items.insert(i, value)
+        if type(value) is dict:
+            self._raw += 1
+
+    def append(self, value: Any) -> None:
+        self.insert(len(self._items), value)
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        self._items = sorted(self, key=key, reverse=reverse)
+        self._raw = 0
+
+    def loaded(self) -> Iterator[Any]:
+        if not self._raw:
+            return iter(self._items)
+        return (x for x in self._items if type(x) is not dict)
+
+    def entries(self) -> List[Any]:
+        return list(self._items)
+
+    def rows(self, to_row: Callable[[Any], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [x if type(x) is dict else to_row(x) for x in self._items]
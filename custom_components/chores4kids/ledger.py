@@ -0,0 +1,267 @@
+"""Append-only points ledger.
+
+Every change to a child's points is appended as one entry: points earned for
+an approved task or bonus, shop purchases and manual adjustments (add_points,
+reset_points, opening balances). Per child the ledger keeps running prefix
+sums over local days, so the total for any window of days is two bisects and a
+subtraction, and the current week/month counters on `Child` are maintained
+incrementally instead of being recomputed from the task list.
+
+Entries older than LEDGER_RAW_DAYS are compacted into one entry per child,
+local day and kind. The per-day aggregates are unchanged by compaction; only
+the individual timestamps and references inside those days are dropped.
+"""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left, bisect_right
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.util import dt as dt_util
+
+KIND_EARNED = "earned"
+KIND_PURCHASE = "purchase"
+KIND_ADJUST = "adjust"
+KINDS = (KIND_EARNED, KIND_PURCHASE, KIND_ADJUST)
+
+# Marks an entry that summarises a compacted day
+COMPACTED_REF = "*"
+
+
+@dataclass
+class LedgerEntry:
+    ts: int  # seconds since epoch (UTC)
+    child_id: str
+    kind: str
+    points: int  # signed delta on the child's balance
+    ref: str = ""  # task / purchase id, COMPACTED_REF for day summaries
+    count: int = 1  # source entries represented (> 1 after compaction)
+
+    def as_row(self) -> List[Any]:
+        return [self.ts, self.child_id, self.kind, self.points, self.ref, self.count]
+
+    @classmethod
+    def from_row(cls, row: List[Any]) -> "LedgerEntry":
+        ts, child_id, kind, points = row[:4]
+        ref = row[4] if len(row) > 4 else ""
+        count = row[5] if len(row) > 5 else 1
+        return cls(int(ts), str(child_id), str(kind), int(points), str(ref or ""), int(count or 1))
+
+    @property
+    def day(self) -> date:
+        return dt_util.as_local(dt_util.utc_from_timestamp(self.ts)).date()
+
+
+class _ChildSums:
+    """Running per-day sums for one child: days[i] is a local date ordinal and
+    cum[kind][i] the total of that kind up to and including that day."""
+
+    __slots__ = ("days", "cum", "counts")
+
+    def __init__(self) -> None:
+        self.days: List[int] = []
+        self.cum: Dict[str, List[int]] = {k: [] for k in KINDS}
+        self.counts: Dict[str, List[int]] = {k: [] for k in KINDS}
+
+    def add(self, ordinal: int, kind: str, points: int, count: int) -> None:
+        days = self.days
+        if not days or ordinal > days[-1]:
+            days.append(ordinal)
+            for k in KINDS:
+                self.cum[k].append(self.cum[k][-1] if self.cum[k] else 0)
+                self.counts[k].append(self.counts[k][-1] if self.counts[k] else 0)
+            i = len(days) - 1
+        else:
+            i = bisect_left(days, ordinal)
+            if i == len(days) or days[i] != ordinal:
+                # Back-dated entry (opening balances, restored data): rare, O(days)
+                days.insert(i, ordinal)
+                for k in KINDS:
+                    self.cum[k].insert(i, self.cum[k][i - 1] if i else 0)
+                    self.counts[k].insert(i, self.counts[k][i - 1] if i else 0)
+        cum, counts = self.cum[kind], self.counts[kind]
+        for j in range(i, len(days)):
+            cum[j] += points
+            counts[j] += count
+
+    def _upto(self, series: List[int], ordinal: int) -> int:
+        # total of all days < ordinal
+        i = bisect_left(self.days, ordinal)
+        return series[i - 1] if i else 0
+
+    def window(self, kind: str, start: int, end: int) -> Tuple[int, int]:
+        """(points, entries) for local day ordinals start <= day < end."""
+        cum, counts = self.cum[kind], self.counts[kind]
+        return (
+            self._upto(cum, end) - self._upto(cum, start),
+            self._upto(counts, end) - self._upto(counts, start),
+        )
+
+    def total(self, kind: str) -> int:
+        series = self.cum[kind]
+        return series[-1] if series else 0
+
+
+class PointsLedger:
+    def __init__(self) -> None:
+        self.entries: List[LedgerEntry] = []
+        self._sums: Dict[str, _ChildSums] = {}
+        # (task, undo log) of the transaction open in this context: recorded
+        # entries, or the list compact()/forget() replaced
+        self._undo: ContextVar[Optional[Tuple[Any, List[Any]]]] = ContextVar("chores4kids_ledger_undo", default=None)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def load(self, rows: Iterable[List[Any]]) -> None:
+        self.entries = []
+        for row in rows:
+            try:
+                self.entries.append(LedgerEntry.from_row(row))
+            except (TypeError, ValueError, IndexError):
+                continue
+        self.entries.sort(key=lambda e: e.ts)
+        self._reaggregate()
+
+    def as_rows(self) -> List[List[Any]]:
+        return [e.as_row() for e in self.entries]
+
+    def _reaggregate(self) -> None:
+        self._sums = {}
+        for e in self.entries:
+            self._aggregate(e)
+
+    def _aggregate(self, e: LedgerEntry) -> None:
+        sums = self._sums.get(e.child_id)
+        if sums is None:
+            sums = self._sums[e.child_id] = _ChildSums()
+        sums.add(e.day.toordinal(), e.kind, e.points, e.count)
+
+    def record(self, child_id: str, kind: str, points: int, ref: str = "", ts: Optional[int] = None) -> Optional[LedgerEntry]:
+        if kind not in KINDS:
+            raise ValueError("invalid_ledger_kind")
+        points = int(points)
+        if not points:
+            return None
+        e = LedgerEntry(int(ts if ts is not None else dt_util.utcnow().timestamp()), child_id, kind, points, ref or "")
+        if self.entries and e.ts < self.entries[-1].ts:
+            self.entries.insert(bisect_right([x.ts for x in self.entries], e.ts), e)
+        else:
+            self.entries.append(e)
+        self._aggregate(e)
+        self._log(e)
+        return e
+
+    def forget(self, child_ids: Iterable[str]) -> int:
+        """Drop every entry of the given (removed) children. Returns how many were dropped."""
+        gone = set(child_ids)
+        kept = [e for e in self.entries if e.child_id not in gone]
+        removed = len(self.entries) - len(kept)
+        if removed:
+            self._log(self.entries)
+            self.entries = kept
+            for cid in gone:
+                self._sums.pop(cid, None)
+        return removed
+
+    # --- Transactions ---
+    def begin(self) -> None:
+        """Start logging the calling task's changes so rollback() can undo them."""
+        self._undo.set((asyncio.current_task(), []))
+
+    def commit(self) -> None:
+        self._undo.set(None)
+
+    def _log(self, step: Any) -> None:
+        undo = self._undo.get()
+        if undo is not None and undo[0] is asyncio.current_task():
+            undo[1].append(step)
+
+    def rollback(self) -> None:
+        """Undo every record(), compact() and forget() the task made since begin()."""
+        undo = self._undo.get()
+        self._undo.set(None)
+        if not undo or not undo[1]:
+            return
+        for step in reversed(undo[1]):
+            if isinstance(step, list):
+                self.entries = step
+                continue
+            # Entries recorded in the transaction sit near the end
+            for i in range(len(self.entries) - 1, -1, -1):
+                if self.entries[i] is step:
+                    del self.entries[i]
+                    break
+        self._reaggregate()
+
+    # --- Queries ---
+    def window(self, child_id: str, kind: str, start: date, end: date) -> int:
+        """Points of `kind` on local days start <= day < end."""
+        sums = self._sums.get(child_id)
+        return sums.window(kind, start.toordinal(), end.toordinal())[0] if sums else 0
+
+    def window_count(self, child_id: str, kind: str, start: date, end: date) -> int:
+        sums = self._sums.get(child_id)
+        return sums.window(kind, start.toordinal(), end.toordinal())[1] if sums else 0
+
+    def total(self, child_id: str, kind: str) -> int:
+        sums = self._sums.get(child_id)
+        return sums.total(kind) if sums else 0
+
+    def balance(self, child_id: str) -> int:
+        return sum(self.total(child_id, kind) for kind in KINDS)
+
+    def earned_windows(self, child_id: str, today: date) -> Tuple[int, int, int]:
+        """(lifetime, current month, current ISO week) earned points."""
+        end = today + timedelta(days=1)
+        month_start = today.replace(day=1)
+        week_start = today - timedelta(days=today.weekday())
+        return (
+            self.total(child_id, KIND_EARNED),
+            self.window(child_id, KIND_EARNED, month_start, end),
+            self.window(child_id, KIND_EARNED, week_start, end),
+        )
+
+    def entries_for(self, child_id: Optional[str] = None, limit: int = 100) -> List[LedgerEntry]:
+        """Newest first."""
+        out: List[LedgerEntry] = []
+        for e in reversed(self.entries):
+            if child_id and e.child_id != child_id:
+                continue
+            out.append(e)
+            if len(out) >= limit:
+                break
+        return out
+
+    # --- Compaction ---
+    def compact(self, before: date) -> int:
+        """Fold entries on local days before `before` into one per (child, day, kind).
+
+        Returns how many entries were removed. Aggregates are unaffected.
+        """
+        cutoff = int(dt_util.as_utc(dt_util.start_of_local_day(before)).timestamp())
+        split = bisect_left([e.ts for e in self.entries], cutoff)
+        if not split:
+            return 0
+        old = self.entries[:split]
+        merged: Dict[Tuple[str, date, str], LedgerEntry] = {}
+        for e in old:
+            key = (e.child_id, e.day, e.kind)
+            m = merged.get(key)
+            if m is None:
+                merged[key] = LedgerEntry(
+                    int(dt_util.as_utc(dt_util.start_of_local_day(e.day)).timestamp()),
+                    e.child_id, e.kind, e.points, COMPACTED_REF, e.count,
+                )
+            else:
+                m.points += e.points
+                m.count += e.count
+        folded = sorted((m for m in merged.values() if m.points or m.count), key=lambda m: m.ts)
+        removed = len(old) - len(folded)
+        if removed > 0:
+            self._log(self.entries)
+            self.entries = folded + self.entries[split:]
+        return max(removed, 0)
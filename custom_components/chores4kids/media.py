@@ -0,0 +1,290 @@
+"""Image pipeline for uploaded shop media.
+
+After an upload lands in /config/www/chores4kids the file is renamed to a
+content-hash filename (so identical uploads share one file) and resized
+variants are generated for the card and notifications. Everything here except
+`async_process_upload` runs in the executor.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, MEDIA_URL_PREFIX
+
+_LOGGER = logging.getLogger(__name__)
+
+IMAGE_EXTS = {"jpg", "jpeg", "png", "webp", "gif", "bmp"}
+AUDIO_EXTS = {"mp3", "wav", "ogg", "m4a", "aac"}
+
+# variant name -> longest edge in px
+IMAGE_VARIANTS: Dict[str, int] = {
+    "thumb": 128,
+    "card": 512,
+    "notify": 1024,
+}
+
+HASH_LEN = 20
+
+
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 256), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _ext(filename: str) -> str:
+    return filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+
+
+def is_image(filename: str) -> bool:
+    return _ext(filename) in IMAGE_EXTS
+
+
+def is_allowed_upload(filename: str) -> bool:
+    """Only images and sounds may be uploaded: the folder is served unauthenticated under /local/."""
+    return _ext(filename) in IMAGE_EXTS or _ext(filename) in AUDIO_EXTS
+
+
+def _save_variant(im, path: str, fmt: str) -> None:
+    tmp = f"{path}.tmp"
+    if fmt == "JPEG":
+        im.convert("RGB").save(tmp, fmt, quality=85, optimize=True, progressive=True)
+    else:
+        im.save(tmp, fmt, optimize=True)
+    os.replace(tmp, path)
+
+
+def _make_variants(directory: str, base: str, filename: str) -> Dict[str, str]:
+    try:
+        from PIL import Image, ImageOps  # Pillow ships with Home Assistant core
+    except ImportError:
+        _LOGGER.debug("%s: Pillow not available, skipping image variants", DOMAIN)
+        return {}
+
+    variants: Dict[str, str] = {}
+    with Image.open(os.path.join(directory, filename)) as src:
+        if getattr(src, "is_animated", False):
+            # Keep animations intact; every variant points at the original.
+            return {name: filename for name in IMAGE_VARIANTS}
+        im = ImageOps.exif_transpose(src)
+        has_alpha = im.mode in ("RGBA", "LA", "PA") or (im.mode == "P" and "transparency" in im.info)
+        fmt, vext = ("PNG", "png") if has_alpha else ("JPEG", "jpg")
+        for name, edge in IMAGE_VARIANTS.items():
+            if max(im.size) <= edge:
+                variants[name] = filename
+                continue
+            vname = f"{base}_{name}.{vext}"
+            vpath = os.path.join(directory, vname)
+            if os.path.exists(vpath):
+                os.utime(vpath)
+            else:
+                resized = im.copy()
+                resized.thumbnail((edge, edge), Image.LANCZOS)
+                _save_variant(resized, vpath, fmt)
+            variants[name] = vname
+    return variants
+
+
+def process_image(directory: str, filename: str, rename: bool = True) -> Optional[Tuple[str, Dict[str, str]]]:
+    """Rename an uploaded image to its content hash and build size variants.
+
+    With rename=False the original filename is kept (legacy callers that
+    already know the URL); variants are still content-addressed.
+    Returns (final_filename, {variant: filename}) or None for non-images.
+    """
+    if not is_image(filename):
+        return None
+    path = os.path.join(directory, filename)
+    base = _file_digest(path)[:HASH_LEN]
+    ext = _ext(filename)
+    final_name = f"{base}.{ext}" if rename else filename
+    if final_name != filename:
+        final_path = os.path.join(directory, final_name)
+        if os.path.exists(final_path):
+            # Identical content already stored; drop the duplicate upload and
+            # touch the kept file so the collector's grace period starts again.
+            os.remove(path)
+            os.utime(final_path)
+        else:
+            os.replace(path, final_path)
+    try:
+        variants = _make_variants(directory, base, final_name)
+    except Exception:
+        _LOGGER.warning("%s: could not create variants for %s", DOMAIN, final_name, exc_info=True)
+        variants = {}
+    return final_name, variants
+
+
+async def async_process_upload(
+    hass: HomeAssistant, directory: str, filename: str, size: int = 0, rename: bool = True
+) -> Tuple[str, Dict[str, str]]:
+    """Run the pipeline in the executor; return (url, {variant: url})."""
+    store = hass.data.get(DOMAIN, {}).get("store")
+    result = await hass.async_add_executor_job(process_image, directory, filename, rename)
+    if result is None:
+        if store is not None:
+            store.media.add_file(filename, size)
+        return f"{MEDIA_URL_PREFIX}{filename}", {}
+    final_name, variants = result
+    url = f"{MEDIA_URL_PREFIX}{final_name}"
+    variant_urls = {name: f"{MEDIA_URL_PREFIX}{vname}" for name, vname in variants.items()}
+    if store is not None:
+        store.media.add_file(final_name, size)
+        for vname in variants.values():
+            if vname not in store.media.files:
+                store.media.add_file(vname, 0)
+        if variant_urls:
+            await store.set_image_variants(url, variant_urls)
+    return url, variant_urls
+
+
+# Files the integration itself created and may therefore garbage-collect:
+# content-hash images/variants and legacy card uploads (c4k_<ts>_<rand>.<ext>).
+# Anything else (completion sounds, files the user placed there) is never collected.
+_MANAGED_RE = re.compile(r"^(?:[0-9a-f]{%d}(?:_[a-z]+)?|c4k_[a-z0-9_]+)\.[a-z0-9]+$" % HASH_LEN)
+_TEMP_PREFIX = ".upload_"
+
+
+def media_filename(url: str) -> Optional[str]:
+    """Return the bare filename for a /local/chores4kids/<name> URL, else None."""
+    url = str(url or "").strip()
+    if not url.startswith(MEDIA_URL_PREFIX):
+        return None
+    name = url[len(MEDIA_URL_PREFIX):]
+    if not name or "/" in name:
+        return None
+    return name
+
+
+class MediaRegistry:
+    """Reference counts for files under /config/www/chores4kids.
+
+    Shop items and purchases reference an image; generated variants are
+    referenced through their parent image. `files` is the inventory from the
+    last directory scan (name -> (size, mtime)), kept current by uploads.
+    """
+
+    def __init__(self) -> None:
+        self._refs: Dict[str, int] = {}
+        self._parent: Dict[str, str] = {}
+        self._children: Dict[str, Set[str]] = {}
+        self.files: Dict[str, Tuple[int, float]] = {}
+        self.scanned = False
+
+    def clear_refs(self) -> None:
+        self._refs.clear()
+        self._parent.clear()
+        self._children.clear()
+
+    def ref(self, url: str) -> None:
+        name = media_filename(url)
+        if name:
+            self._refs[name] = self._refs.get(name, 0) + 1
+
+    def unref(self, url: str) -> int:
+        """Drop one reference; return the remaining count."""
+        name = media_filename(url)
+        if not name:
+            return 0
+        left = self._refs.get(name, 0) - 1
+        if left > 0:
+            self._refs[name] = left
+        else:
+            self._refs.pop(name, None)
+            left = 0
+        return left
+
+    def set_variants(self, image_url: str, variants: Dict[str, str]) -> None:
+        parent = media_filename(image_url)
+        if not parent:
+            return
+        for old in self._children.pop(parent, set()):
+            self._parent.pop(old, None)
+        children: Set[str] = set()
+        for url in variants.values():
+            name = media_filename(url)
+            if name and name != parent:
+                self._parent[name] = parent
+                children.add(name)
+        if children:
+            self._children[parent] = children
+
+    def forget(self, name: str) -> None:
+        self._refs.pop(name, None)
+        for child in self._children.pop(name, set()):
+            self._parent.pop(child, None)
+        self._parent.pop(name, None)
+        self.files.pop(name, None)
+
+    def refcount(self, name: str) -> int:
+        return self._refs.get(self._parent.get(name, name), 0)
+
+    def variants_of(self, name: str) -> Set[str]:
+        return set(self._children.get(name, ()))
+
+    def add_file(self, name: str, size: int) -> None:
+        self.files[name] = (int(size), time.time())
+
+    def rescan(self, files: Dict[str, Tuple[int, float]]) -> None:
+        """Replace the inventory with a scan, keeping newer times recorded by add_file."""
+        for name, (size, mtime) in files.items():
+            known = self.files.get(name)
+            if known is not None and known[1] > mtime:
+                files[name] = (size, known[1])
+        self.files = files
+        self.scanned = True
+
+    def collectable(self, grace_seconds: float, now: Optional[float] = None) -> List[str]:
+        now = time.time() if now is None else now
+        out: List[str] = []
+        for name, (_size, mtime) in self.files.items():
+            if now - mtime < grace_seconds:
+                continue
+            if name.startswith(_TEMP_PREFIX) or name.endswith(".tmp"):
+                out.append(name)
+            elif _MANAGED_RE.match(name) and self.refcount(name) == 0:
+                out.append(name)
+        return out
+
+
+def scan_media_dir(directory: str) -> Dict[str, Tuple[int, float]]:
+    """List regular files in the media directory (executor)."""
+    out: Dict[str, Tuple[int, float]] = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    out[entry.name] = (int(st.st_size), float(st.st_mtime))
+    except FileNotFoundError:
+        pass
+    return out
+
+
+def remove_media_files(directory: str, names: Iterable[str]) -> Tuple[List[str], int]:
+    """Delete files by name (executor); return (removed names, bytes reclaimed)."""
+    removed: List[str] = []
+    reclaimed = 0
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            removed.append(name)
+            continue
+        except OSError:
+            _LOGGER.debug("%s: could not remove %s", DOMAIN, path, exc_info=True)
+            continue
+        removed.append(name)
+        reclaimed += size
+    return removed, reclaimed
@@ -0,0 +1,335 @@
+"""Notification rendering for Chores4Kids.
+
+Templates are compiled once per language and the base URL used for image
+attachments is cached until Home Assistant's core config changes.
+"""
+from __future__ import annotations
+
+import logging
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+
+_LOGGER = logging.getLogger(__name__)
+
+NOTIFY_TITLE = "Chores4Kids"
+
+NOTIFY_I18N: dict[str, dict[str, str]] = {
+    "en": {
+        "child": "A child",
+        "message": "{who} completed: {title} ({dt})",
+        "approve": "Approve",
+        "approve_all": "Approve all",
+        "approve_partial": "Partial approve",
+        "reassign": "Reassign",
+        "purchase": "{who} bought {item} for {price} points ({dt})",
+        "bonus_label": "Bonus task",
+        "bonus_done": "Bonus task completed",
+        "bonus_not_done": "Bonus task not completed",
+        "bonus_line": "{status}",
+    },
+    "da": {
+        "child": "Et barn",
+        "message": "{who} har meldt opgaven færdig: {title} ({dt})",
+        "approve": "Godkend",
+        "approve_all": "Godkend alle",
+        "approve_partial": "Delvis godkend",
+        "reassign": "Gentildel",
+        "purchase": "{who} købte {item} for {price} point ({dt})",
+        "bonus_label": "Bonusopgave",
+        "bonus_done": "Bonusopgave er klaret",
+        "bonus_not_done": "Bonusopgave er ikke klaret",
+        "bonus_line": "{status}",
+    },
+    "sv": {
+        "child": "Ett barn",
+        "message": "{who} har markerat uppgiften som klar: {title} ({dt})",
+        "approve": "Godkänn",
+        "approve_all": "Godkänn alla",
+        "approve_partial": "Delvis godkänn",
+        "reassign": "Tilldela igen",
+        "purchase": "{who} köpte {item} för {price} poäng ({dt})",
+        "bonus_label": "Bonusuppgift",
+        "bonus_done": "Bonusuppgift klar",
+        "bonus_not_done": "Bonusuppgift inte klar",
+        "bonus_line": "{status}",
+    },
+    "nb": {
+        "child": "Et barn",
+        "message": "{who} har meldt oppgaven ferdig: {title} ({dt})",
+        "approve": "Godkjenn",
+        "approve_all": "Godkjenn alle",
+        "approve_partial": "Delvis godkjenn",
+        "reassign": "Tildel på nytt",
+        "purchase": "{who} kjøpte {item} for {price} poeng ({dt})",
+        "bonus_label": "Bonusoppgave",
+        "bonus_done": "Bonusoppgave fullført",
+        "bonus_not_done": "Bonusoppgave ikke fullført",
+        "bonus_line": "{status}",
+    },
+    "de": {
+        "child": "Ein Kind",
+        "message": "{who} hat die Aufgabe erledigt: {title} ({dt})",
+        "approve": "Genehmigen",
+        "approve_all": "Alle genehmigen",
+        "approve_partial": "Teilweise genehmigen",
+        "reassign": "Neu zuweisen",
+        "purchase": "{who} kaufte {item} für {price} Punkte ({dt})",
+        "bonus_label": "Bonusaufgabe",
+        "bonus_done": "Bonusaufgabe erledigt",
+        "bonus_not_done": "Bonusaufgabe nicht erledigt",
+        "bonus_line": "{status}",
+    },
+    "es": {
+        "child": "Un niño",
+        "message": "{who} completó: {title} ({dt})",
+        "approve": "Aprobar",
+        "approve_all": "Aprobar todo",
+        "approve_partial": "Aprobar parcial",
+        "reassign": "Reasignar",
+        "purchase": "{who} compró {item} por {price} puntos ({dt})",
+        "bonus_label": "Tarea de bono",
+        "bonus_done": "Tarea de bono completada",
+        "bonus_not_done": "Tarea de bono no completada",
+        "bonus_line": "{status}",
+    },
+    "fr": {
+        "child": "Un enfant",
+        "message": "{who} a terminé : {title} ({dt})",
+        "approve": "Approuver",
+        "approve_all": "Tout approuver",
+        "approve_partial": "Approuver partiellement",
+        "reassign": "Réattribuer",
+        "purchase": "{who} a acheté {item} pour {price} points ({dt})",
+        "bonus_label": "Tâche bonus",
+        "bonus_done": "Tâche bonus terminée",
+        "bonus_not_done": "Tâche bonus non terminée",
+        "bonus_line": "{status}",
+    },
+    "fi": {
+        "child": "Lapsi",
+        "message": "{who} suoritti: {title} ({dt})",
+        "approve": "Hyväksy",
+        "approve_all": "Hyväksy kaikki",
+        "approve_partial": "Osittainen hyväksyntä",
+        "reassign": "Määritä uudelleen",
+        "purchase": "{who} osti {item} {price} pisteellä ({dt})",
+        "bonus_label": "Bonustehtävä",
+        "bonus_done": "Bonustehtävä valmis",
+        "bonus_not_done": "Bonustehtävä ei valmis",
+        "bonus_line": "{status}",
+    },
+    "it": {
+        "child": "Un bambino",
+        "message": "{who} ha completato: {title} ({dt})",
+        "approve": "Approva",
+        "approve_all": "Approva tutto",
+        "approve_partial": "Approva parzialmente",
+        "reassign": "Riassegna",
+        "purchase": "{who} ha comprato {item} per {price} punti ({dt})",
+        "bonus_label": "Attività bonus",
+        "bonus_done": "Attività bonus completata",
+        "bonus_not_done": "Attività bonus non completata",
+        "bonus_line": "{status}",
+    },
+}
+
+NOTIFY_LANG_ALIAS = {
+    "no": "nb",
+}
+
+# A compiled template is a list of (literal, field_name) pairs; field_name is None
+# for the trailing literal.
+_Compiled = List[Tuple[str, Optional[str]]]
+
+
+def _compile(template: str) -> _Compiled | None:
+    """Split a str.format template into literal/field parts.
+
+    Returns None for templates using conversions or format specs; those are
+    rendered with str.format instead.
+    """
+    parts: _Compiled = []
+    try:
+        for literal, field_name, spec, conversion in Formatter().parse(template):
+            if spec or conversion:
+                return None
+            parts.append((literal, field_name or None))
+    except ValueError:
+        return None
+    return parts
+
+
+class _LangTemplates:
+    """Text table plus compiled templates for a single language."""
+
+    def __init__(self, texts: Dict[str, str]):
+        self.texts = texts
+        self._compiled: Dict[str, _Compiled | None] = {
+            key: _compile(str(value)) for key, value in texts.items()
+        }
+
+    def get(self, key: str, default: str = "") -> str:
+        return str(self.texts.get(key, default))
+
+    def render(self, key: str, default: str = "", **values: Any) -> str:
+        parts = self._compiled.get(key)
+        if parts is None:
+            return str(self.texts.get(key, default)).format(**values)
+        return "".join(
+            literal + (str(values[name]) if name is not None else "")
+            for literal, name in parts
+        )
+
+
+class NotificationRenderer:
+    """Build notify payloads for task completions and shop purchases."""
+
+    def __init__(self, hass: HomeAssistant, store):
+        self.hass = hass
+        self._store = store
+        self._templates: Dict[str, _LangTemplates] = {
+            lang: _LangTemplates(texts) for lang, texts in NOTIFY_I18N.items()
+        }
+        self._current: _LangTemplates | None = None
+        self._base_url: str | None = None
+        self._unsub: Callable[[], None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Invalidate cached language/base URL whenever core config changes."""
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._handle_config_update)
+
+    @callback
+    def async_stop(self) -> None:
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _handle_config_update(self, _event: Event) -> None:
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self._current = None
+        self._base_url = None
+
+    # --- cached lookups ---
+    def _lang_key(self) -> str:
+        raw = str(getattr(self.hass.config, "language", "en") or "en").lower()
+        lang = raw.split("-", 1)[0]
+        return NOTIFY_LANG_ALIAS.get(lang, lang)
+
+    @property
+    def templates(self) -> _LangTemplates:
+        if self._current is None:
+            self._current = self._templates.get(self._lang_key(), self._templates["en"])
+        return self._current
+
+    def _resolve_base_url(self) -> str:
+        if self._base_url:
+            return self._base_url
+        cfg = self.hass.config
+        base = str(getattr(cfg, "external_url", "") or "").strip() or str(getattr(cfg, "internal_url", "") or "").strip()
+        if not base:
+            api = getattr(cfg, "api", None)
+            base = str(getattr(api, "base_url", "") or "").strip()
+        base = base.rstrip("/")
+        # Only cache a real URL: the http API may not be up yet on an early call
+        if base:
+            self._base_url = base
+        return base
+
+    def resolve_image_url(self, raw: str) -> str:
+        try:
+            url = str(raw or "").strip()
+            if not url:
+                return ""
+            if url.startswith("http://") or url.startswith("https://"):
+                return url
+            base = self._resolve_base_url()
+            if not base:
+                return url
+            if url.startswith("/"):
+                return base + url
+            return base + "/" + url
+        except Exception:
+            return ""
+
+    @staticmethod
+    def format_dt(dt) -> str:
+        try:
+            return dt_util.as_local(dt).strftime("%Y-%m-%d %H:%M")
+        except Exception:
+            try:
+                return dt_util.as_local(dt_util.utcnow()).strftime("%Y-%m-%d %H:%M")
+            except Exception:
+                return ""
+
+    # --- payloads ---
+    def task_completed(self, task) -> Dict[str, Any]:
+        """Return the notify payload (title/message/data) for a completed task."""
+        tpl = self.templates
+        task_id = task.id
+        who = self._store.get_child_name(task.assigned_to) or tpl.get("child")
+        dt = self.format_dt(dt_util.utcnow())
+        message = tpl.render("message", who=who, title=task.title, dt=dt)
+        bonus_enabled = bool(getattr(task, "bonus_enabled", False))
+        if bonus_enabled:
+            bonus_title = str(getattr(task, "bonus_title", "") or "").strip()
+            bonus_label = bonus_title or tpl.get("bonus_label", "Bonus task")
+            if getattr(task, "bonus_completed_ts", None):
+                bonus_status = tpl.get("bonus_done", "Bonus task completed")
+            else:
+                bonus_status = tpl.get("bonus_not_done", "Bonus task not completed")
+            message = f"{message}\n{tpl.render('bonus_line', '{status}', label=bonus_label, status=bonus_status)}"
+
+        data: Dict[str, Any] = {"tag": f"chores4kids_task_done_{task_id}", "task_id": task_id}
+        if not getattr(task, "skip_approval", False):
+            approve_label = tpl.get("approve")
+            reassign = {
+                "action": f"C4K_REASSIGN_{task_id}",
+                "title": tpl.get("reassign"),
+                "action_data": {"task_id": task_id},
+            }
+            if bonus_enabled:
+                data["actions"] = [
+                    {
+                        "action": f"C4K_APPROVE_ALL_{task_id}",
+                        "title": tpl.get("approve_all", approve_label),
+                        "action_data": {"task_id": task_id},
+                    },
+                    {
+                        "action": f"C4K_APPROVE_PARTIAL_{task_id}",
+                        "title": tpl.get("approve_partial", approve_label),
+                        "action_data": {"task_id": task_id},
+                    },
+                    reassign,
+                ]
+            else:
+                data["actions"] = [
+                    {
+                        "action": f"C4K_APPROVE_{task_id}",
+                        "title": approve_label,
+                        "action_data": {"task_id": task_id},
+                    },
+                    reassign,
+                ]
+        return {"title": NOTIFY_TITLE, "message": message, "data": data}
+
+    def shop_purchase(self, purchase) -> Dict[str, Any]:
+        """Return the notify payload for a purchase (without image attachment)."""
+        tpl = self.templates
+        who = str(getattr(purchase, "child_name", "") or "") or self._store.get_child_name(getattr(purchase, "child_id", None)) or tpl.get("child")
+        item = str(getattr(purchase, "title", "") or "")
+        price = int(getattr(purchase, "price", 0) or 0)
+        ts_raw = getattr(purchase, "ts", None)
+        ts = dt_util.parse_datetime(str(ts_raw)) if ts_raw else None
+        dt = self.format_dt(ts or dt_util.utcnow())
+        message = tpl.render("purchase", who=who, item=item, price=price, dt=dt)
+        return {"title": NOTIFY_TITLE, "message": message, "data": {"tag": "chores4kids_shop_purchase"}}
@@ -0,0 +1,228 @@
+"""Schedule index for scheduled (repeat / weekly / monthly) tasks.
+
+The store keeps one `ScheduleIndex`. Each scheduled task gets its rule and the
+next SCHEDULE_OCCURRENCES dates, computed when the task is added, changed via
+set_task_repeat/update_task or removed. "What spawns on day X" is a lookup in a
+weekday / first-of-month bucket and "next due" a bisect in the precomputed
+dates, so the nightly rollover and the calendar never re-derive a schedule.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+SCHEDULE_OCCURRENCES = 12
+
+MODE_REPEAT = "repeat"
+MODE_WEEKLY = "weekly"
+MODE_MONTHLY = "monthly"
+
+
+def schedule_rule(task: Any) -> Optional[Tuple[str, Tuple[int, ...]]]:
+    """(mode, weekdays) for a scheduled task, None when it has no usable schedule.
+
+    Mirrors the rollover rules: an empty mode with repeat_days means "repeat",
+    weekly is every Monday and monthly every 1st.
+    """
+    try:
+        mode = str(getattr(task, "schedule_mode", "") or "").strip().lower()
+    except Exception:
+        mode = ""
+    if mode == MODE_WEEKLY:
+        return MODE_WEEKLY, (0,)
+    if mode == MODE_MONTHLY:
+        return MODE_MONTHLY, ()
+    if mode in ("", MODE_REPEAT):
+        try:
+            days = tuple(sorted({int(d) for d in (getattr(task, "repeat_days", None) or []) if 0 <= int(d) <= 6}))
+        except Exception:
+            days = ()
+        if days:
+            return MODE_REPEAT, days
+    return None
+
+
+def occurs_on(mode: str, weekdays: Tuple[int, ...], day: date) -> bool:
+    if mode == MODE_MONTHLY:
+        return day.day == 1
+    return day.weekday() in weekdays
+
+
+def first_on_or_after(mode: str, weekdays: Tuple[int, ...], day: date) -> date:
+    if mode == MODE_MONTHLY:
+        if day.day == 1:
+            return day
+        return date(day.year + (day.month == 12), day.month % 12 + 1, 1)
+    wd = day.weekday()
+    return day + timedelta(days=min((d - wd) % 7 for d in weekdays))
+
+
+def iter_occurrences(mode: str, weekdays: Tuple[int, ...], start: date) -> Iterator[date]:
+    day = first_on_or_after(mode, weekdays, start)
+    while True:
+        yield day
+        day = first_on_or_after(mode, weekdays, day + timedelta(days=1))
+
+
+@dataclass
+class ScheduleEntry:
+    task_id: str
+    mode: str
+    weekdays: Tuple[int, ...]
+    occurrences: List[date] = field(default_factory=list)
+
+    def fill(self, start: date, count: int) -> None:
+        it = iter_occurrences(self.mode, self.weekdays, start)
+        self.occurrences = [next(it) for _ in range(count)]
+
+
+class ScheduleIndex:
+    """Precomputed occurrences for every scheduled task, keyed by task id."""
+
+    def __init__(self, count: int = SCHEDULE_OCCURRENCES) -> None:
+        self._count = count
+        self._entries: Dict[str, ScheduleEntry] = {}
+        # weekday -> ids of repeat/weekly tasks due that weekday; monthly ids apart
+        self._by_weekday: Dict[int, Set[str]] = {d: set() for d in range(7)}
+        self._monthly: Set[str] = set()
+        self.revision = 0
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def task_ids(self) -> List[str]:
+        return list(self._entries)
+
+    def rebuild(self, tasks: Iterable[Any], today: date) -> None:
+        self._entries.clear()
+        self._monthly.clear()
+        for ids in self._by_weekday.values():
+            ids.clear()
+        for t in tasks:
+            self._add(t, today)
+        self.revision += 1
+
+    def update(self, task: Any, today: date) -> None:
+        """(Re)index one task after its schedule may have changed."""
+        self._drop(task.id)
+        self._add(task, today)
+        self.revision += 1
+
+    def discard(self, task_id: str) -> None:
+        if self._drop(task_id):
+            self.revision += 1
+
+    def _add(self, task: Any, today: date) -> None:
+        rule = schedule_rule(task)
+        if rule is None:
+            return
+        entry = ScheduleEntry(task.id, *rule)
+        entry.fill(today, self._count)
+        self._entries[task.id] = entry
+        if entry.mode == MODE_MONTHLY:
+            self._monthly.add(task.id)
+        else:
+            for d in entry.weekdays:
+                self._by_weekday[d].add(task.id)
+
+    def _drop(self, task_id: str) -> bool:
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            return False
+        self._monthly.discard(task_id)
+        for d in entry.weekdays:
+            self._by_weekday[d].discard(task_id)
+        return True
+
+    def spawns_on(self, day: date) -> Set[str]:
+        """Ids of scheduled tasks with an occurrence on day."""
+        ids = set(self._by_weekday[day.weekday()])
+        if day.day == 1:
+            ids |= self._monthly
+        return ids
+
+    def next_due(self, task_id: str, day: date, include_today: bool = True) -> Optional[date]:
+        entry = self._entries.get(task_id)
+        if entry is None:
+            return None
+        start = day if include_today else day + timedelta(days=1)
+        occ = entry.occurrences
+        if not occ or start < occ[0]:
+            # Before the precomputed window (a replayed rollover day, a past due date):
+            # the window only covers dates from the day it was filled, so compute directly.
+            return first_on_or_after(entry.mode, entry.weekdays, start)
+        i = bisect_left(occ, start)
+        if i >= len(occ):
+            # Past the precomputed window (the index was built days ago): slide it forward.
+            entry.fill(start, self._count)
+            return entry.occurrences[0]
+        return occ[i]
+
+    def occurrences_between(self, start: date, end: date) -> List[Tuple[date, str]]:
+        """(day, task id) for every occurrence with start <= day < end, sorted by day."""
+        out: List[Tuple[date, str]] = []
+        for entry in self._entries.values():
+            occ = entry.occurrences
+            if occ and occ[0] <= start and end <= occ[-1]:
+                out.extend((d, entry.task_id) for d in occ[bisect_left(occ, start):bisect_left(occ, end)])
+                continue
+            for d in iter_occurrences(entry.mode, entry.weekdays, start):
+                if d >= end:
+                    break
+                out.append((d, entry.task_id))
+        out.sort(key=lambda x: x[0])
+        return out
+
+
+@dataclass(frozen=True)
+class TimelineEntry:
+    start: date
+    end: date  # exclusive
+    task_id: str
+    kind: str
+
+
+class TaskTimeline:
+    """Interval index over dated task instances and approved history.
+
+    Entries are kept sorted by start; since no entry spans more than
+    `_max_span` days, a range query only has to look at starts within
+    [start - max_span, end), which is two bisects plus the k hits.
+    Ongoing entries (open chores; overdue ones stretch up to today) are few,
+    kept apart and checked one by one. They can be swapped with set_ongoing()
+    without re-sorting the rest, and a chore left open for months does not
+    widen the span every query has to scan.
+    """
+
+    def __init__(self) -> None:
+        self._starts: List[date] = []
+        self._entries: List[TimelineEntry] = []
+        self._ongoing: List[TimelineEntry] = []
+        self._max_span = timedelta(days=1)
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._ongoing)
+
+    def rebuild(self, entries: Iterable[TimelineEntry], ongoing: Iterable[TimelineEntry] = ()) -> None:
+        self._entries = sorted(entries, key=lambda e: (e.start, e.end))
+        self._ongoing = sorted(ongoing, key=lambda e: (e.start, e.end))
+        self._starts = [e.start for e in self._entries]
+        self._max_span = max((e.end - e.start for e in self._entries), default=timedelta(days=1))
+
+    def set_ongoing(self, ongoing: Iterable[TimelineEntry]) -> None:
+        self._ongoing = sorted(ongoing, key=lambda e: (e.start, e.end))
+
+    def between(self, start: date, end: date) -> List[TimelineEntry]:
+        """Entries overlapping [start, end), sorted by start."""
+        lo = bisect_left(self._starts, start - self._max_span)
+        hi = bisect_left(self._starts, end)
+        hits = [e for e in self._entries[lo:hi] if e.end > start]
+        ongoing = [e for e in self._ongoing if e.start < end and e.end > start]
+        if not ongoing:
+            return hits
+        return sorted(hits + ongoing, key=lambda e: (e.start, e.end))
@@ -0,0 +1,130 @@
+"""Daily rollover scheduling.
+
+The rollover runs at a configurable local wall-clock time plus a stable
+per-household offset (0..jitter minutes, derived from the config entry id) so
+installs don't all hit their heaviest work at midnight. The next run is
+computed from the local calendar date each time, which keeps it on the right
+wall-clock time across DST changes: a time that doesn't exist on a
+spring-forward day runs at the first valid moment after the gap, and a time
+that occurs twice on a fall-back day runs once.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+import hashlib
+import logging
+from typing import Awaitable, Callable, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_rollover_time(value: str) -> time:
+    """'HH:MM[:SS]' -> time; the rollover must stay in the early hours of its day."""
+    try:
+        parsed = time.fromisoformat(str(value).strip())
+    except ValueError as err:
+        raise ValueError("invalid_rollover_time") from err
+    if parsed.hour >= 6:
+        raise ValueError("invalid_rollover_time")
+    return parsed
+
+
+def household_offset(seed: str, jitter_minutes: int) -> timedelta:
+    """Stable offset in [0, jitter_minutes] minutes for this household."""
+    span = max(0, int(jitter_minutes)) * 60
+    if not span:
+        return timedelta(0)
+    digest = hashlib.sha256(str(seed).encode("utf-8")).digest()
+    return timedelta(seconds=int.from_bytes(digest[:4], "big") % (span + 1))
+
+
+def local_wall_time(day, at: time, offset: timedelta = timedelta(0)) -> datetime:
+    """Aware datetime for `at` (+ offset) on local `day`, normalised through UTC.
+
+    The offset is added to the naive wall time, so the result is resolved once:
+    zoneinfo resolves an ambiguous time to its first occurrence (fold=0) and
+    the UTC round-trip moves a non-existent time past the DST gap.
+    """
+    naive = datetime.combine(day, at) + offset
+    aware = naive.replace(tzinfo=dt_util.get_default_time_zone())
+    return dt_util.as_local(dt_util.as_utc(aware))
+
+
+def next_rollover(after: datetime, at: time, offset: timedelta) -> datetime:
+    """First rollover moment strictly after `after`."""
+    day = dt_util.as_local(after).date() - timedelta(days=1)
+    while True:
+        candidate = local_wall_time(day, at, offset)
+        if candidate > after:
+            return candidate
+        day += timedelta(days=1)
+
+
+def last_rollover_day(now: datetime, at: time, offset: timedelta) -> date:
+    """Latest local day whose rollover moment is at or before `now`."""
+    day = dt_util.as_local(now).date()
+    if local_wall_time(day, at, offset) > now:
+        day -= timedelta(days=1)
+    return day
+
+
+class RolloverScheduler:
+    """Runs `action` once per local day at the configured time, rescheduling itself."""
+
+    def __init__(self, hass: HomeAssistant, action: Callable[[], Awaitable[None]], seed: str) -> None:
+        self.hass = hass
+        self._action = action
+        self._seed = seed
+        self._at = time(0, 0)
+        self._offset = timedelta(0)
+        self._unsub: Optional[CALLBACK_TYPE] = None
+        self._next: Optional[datetime] = None
+
+    @property
+    def next_run(self) -> Optional[datetime]:
+        return self._next
+
+    def last_due_day(self) -> date:
+        """Latest local day whose rollover time has passed (what a startup may replay)."""
+        return last_rollover_day(dt_util.now(), self._at, self._offset)
+
+    @callback
+    def async_configure(self, at: time, jitter_minutes: int) -> None:
+        """(Re)start with a new time and jitter."""
+        self._at = at
+        self._offset = household_offset(self._seed, jitter_minutes)
+        self.async_stop()
+        self._schedule(dt_util.now())
+
+    @callback
+    def async_stop(self) -> None:
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._next = None
+
+    @callback
+    def _schedule(self, after: datetime) -> None:
+        self._next = next_rollover(after, self._at, self._offset)
+        self._unsub = async_track_point_in_time(self.hass, self._fire, self._next)
+        _LOGGER.debug("%s: next daily rollover at %s", DOMAIN, self._next.isoformat())
+
+    async def _fire(self, _now: datetime) -> None:
+        fired_for = self._next or dt_util.now()
+        self._unsub = None
+        try:
+            await self._action()
+        except Exception:
+            _LOGGER.exception("%s: daily rollover failed", DOMAIN)
+        finally:
+            # Never base the next run on a clock reading earlier than the target,
+            # or an early wake-up would run the same day twice.
+            # Skip if stopped or reconfigured while the action ran.
+            if self._next is not None and self._unsub is None:
+                self._schedule(max(dt_util.now(), fired_for))
@@ -1,14 +1,22 @@
 from __future__ import annotations
-from homeassistant.components.sensor import SensorEntity
+from datetime import timedelta
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.const import UnitOfInformation
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, SIGNAL_CHILDREN_UPDATED, SIGNAL_DATA_UPDATED
+from .const import DOMAIN, PURCHASES_ATTR_LIMIT, SIGNAL_CHILDREN_UPDATED, SIGNAL_DATA_UPDATED
+from .instrumentation import INSTRUMENTATION
+from .lazy import entries, field as record_field
+from .ledger import KIND_PURCHASE
+from .sizes import accounted_attributes
 from .storage import KidsChoresStore
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
@@ -18,6 +26,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     all_tasks_sensor: Chores4KidsAllTasksSensor | None = None
     shop_sensor: Chores4KidsShopSensor | None = None
     ui_sensor: Chores4KidsUiSensor | None = None
+    leaderboards = [Chores4KidsLeaderboardSensor(store, period) for period in LEADERBOARD_PERIODS]
+    async_add_entities(leaderboards)
+    async_add_entities([
+        Chores4KidsDebugSensor(),
+        Chores4KidsStorageSizeSensor(store),
+        Chores4KidsAttributeSizeSensor(store),
+    ])
 
     async def _cleanup_removed_entities(removed_ids: set[str]):
         registry = er.async_get(hass)
@@ -28,6 +43,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 continue
             # Remove entity from state machine
             await ent.async_remove()
+            store.sizes.forget_sensor(ent.entity_id)
             # Remove from entity registry to avoid leftover 'unavailable' restored entities
             reg_entry = registry.async_get(ent.entity_id)
             device_id = reg_entry.device_id if reg_entry else None
@@ -105,12 +121,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             shop_sensor.async_schedule_update_ha_state(True)
         if ui_sensor is not None:
             ui_sensor.async_schedule_update_ha_state(True)
+        for board in leaderboards:
+            board.async_schedule_update_ha_state(True)
 
     _sync_entities()
 
     entry.async_on_unload(async_dispatcher_connect(hass, SIGNAL_CHILDREN_UPDATED, _handle_children_updated))
     entry.async_on_unload(async_dispatcher_connect(hass, SIGNAL_DATA_UPDATED, _handle_data_updated))
 
+LEADERBOARD_PERIODS = ("week", "month")
+
+
 class KidsChoresPointsSensor(SensorEntity):
     _attr_has_entity_name = True
 
@@ -142,42 +163,44 @@ class KidsChoresPointsSensor(SensorEntity):
         return self._child.points
 
     @property
+    @accounted_attributes("sensor.child")
     def extra_state_attributes(self):
         ch = self._child
-        tasks = [t for t in self._store.tasks if t.assigned_to == ch.id]
+        # Read through record_field so history still held as stored rows is not hydrated
+        tasks = [t for t in entries(self._store.tasks) if record_field(t, "assigned_to") == ch.id]
         counts = {
-            "assigned_count": sum(1 for t in tasks if t.status == "assigned"),
-            "in_progress_count": sum(1 for t in tasks if t.status == "in_progress"),
-            "awaiting_approval_count": sum(1 for t in tasks if t.status == "awaiting_approval"),
-            "approved_count": sum(1 for t in tasks if t.status == "approved"),
-            "rejected_count": sum(1 for t in tasks if t.status == "rejected"),
+            "assigned_count": sum(1 for t in tasks if record_field(t, "status") == "assigned"),
+            "in_progress_count": sum(1 for t in tasks if record_field(t, "status") == "in_progress"),
+            "awaiting_approval_count": sum(1 for t in tasks if record_field(t, "status") == "awaiting_approval"),
+            "approved_count": sum(1 for t in tasks if record_field(t, "status") == "approved"),
+            "rejected_count": sum(1 for t in tasks if record_field(t, "status") == "rejected"),
         }
         # keep tasks lightweight
         tasks_min = [{
-            "id": t.id,
-            "title": t.title,
-            "points": t.points,
-            "status": t.status,
-            "due": t.due,
-            "early_bonus_enabled": getattr(t, "early_bonus_enabled", False),
-            "early_bonus_days": getattr(t, "early_bonus_days", 0),
-            "early_bonus_points": getattr(t, "early_bonus_points", 0),
-            "bonus_enabled": getattr(t, "bonus_enabled", False),
-            "bonus_title": getattr(t, "bonus_title", ""),
-            "bonus_points": getattr(t, "bonus_points", 0),
-            "bonus_completed_ts": getattr(t, "bonus_completed_ts", None),
-            "bonus_approved": getattr(t, "bonus_approved", False),
-            "completed_ts": getattr(t, "completed_ts", None),
-            "icon": getattr(t, "icon", None),
-            "categories": getattr(t, "categories", []),
-            "carried_over": getattr(t, "carried_over", False),
-            "quick_complete": getattr(t, "quick_complete", False),
-            "skip_approval": getattr(t, "skip_approval", False),
-            "fastest_wins": getattr(t, "fastest_wins", False),
-            "fastest_wins_claimed_by_child_id": getattr(t, "fastest_wins_claimed_by_child_id", None),
-            "fastest_wins_claimed_by_child_name": getattr(t, "fastest_wins_claimed_by_child_name", None),
-            "fastest_wins_claimed_ts": getattr(t, "fastest_wins_claimed_ts", None),
-            "mark_overdue": getattr(t, "mark_overdue", True),
+            "id": record_field(t, "id"),
+            "title": record_field(t, "title"),
+            "points": record_field(t, "points"),
+            "status": record_field(t, "status"),
+            "due": record_field(t, "due"),
+            "early_bonus_enabled": record_field(t, "early_bonus_enabled", False),
+            "early_bonus_days": record_field(t, "early_bonus_days", 0),
+            "early_bonus_points": record_field(t, "early_bonus_points", 0),
+            "bonus_enabled": record_field(t, "bonus_enabled", False),
+            "bonus_title": record_field(t, "bonus_title", ""),
+            "bonus_points": record_field(t, "bonus_points", 0),
+            "bonus_completed_ts": record_field(t, "bonus_completed_ts", None),
+            "bonus_approved": record_field(t, "bonus_approved", False),
+            "completed_ts": record_field(t, "completed_ts", None),
+            "icon": record_field(t, "icon", None),
+            "categories": record_field(t, "categories", []),
+            "carried_over": record_field(t, "carried_over", False),
+            "quick_complete": record_field(t, "quick_complete", False),
+            "skip_approval": record_field(t, "skip_approval", False),
+            "fastest_wins": record_field(t, "fastest_wins", False),
+            "fastest_wins_claimed_by_child_id": record_field(t, "fastest_wins_claimed_by_child_id", None),
+            "fastest_wins_claimed_by_child_name": record_field(t, "fastest_wins_claimed_by_child_name", None),
+            "fastest_wins_claimed_ts": record_field(t, "fastest_wins_claimed_ts", None),
+            "mark_overdue": record_field(t, "mark_overdue", True),
         } for t in tasks]
         return {
             "child_id": ch.id,
@@ -186,6 +209,7 @@ class KidsChoresPointsSensor(SensorEntity):
             "lifetime_earned": int(getattr(ch, "lifetime_earned", 0) or 0),
             "monthly_earned": int(getattr(ch, "monthly_earned", 0) or 0),
             "weekly_earned": int(getattr(ch, "weekly_earned", 0) or 0),
+            "spent_total": -self._store.ledger.total(ch.id, KIND_PURCHASE),
             "pending_count": counts["awaiting_approval_count"],
             "tasks": tasks_min,
             **counts,
@@ -211,51 +235,46 @@ class Chores4KidsAllTasksSensor(SensorEntity):
         return len(self._store.tasks)
 
     @property
+    @accounted_attributes("sensor.tasks")
     def extra_state_attributes(self):
-        def child_name(cid: str | None):
-            if not cid:
-                return None
-            for c in self._store.children:
-                if c.id == cid:
-                    return c.name
-            return None
+        child_name = self._store.get_child_name
         tasks = [{
-            "id": t.id,
-            "title": t.title,
-            "points": t.points,
-            "status": t.status,
-            "description": getattr(t, "description", "") or "",
-            "due": t.due,
-            "repeat_template_id": getattr(t, "repeat_template_id", None),
-            "early_bonus_enabled": getattr(t, "early_bonus_enabled", False),
-            "early_bonus_days": getattr(t, "early_bonus_days", 0),
-            "early_bonus_points": getattr(t, "early_bonus_points", 0),
-            "bonus_enabled": getattr(t, "bonus_enabled", False),
-            "bonus_title": getattr(t, "bonus_title", ""),
-            "bonus_points": getattr(t, "bonus_points", 0),
-            "bonus_completed_ts": getattr(t, "bonus_completed_ts", None),
-            "bonus_approved": getattr(t, "bonus_approved", False),
-            "completed_ts": getattr(t, "completed_ts", None),
-            "assigned_to": t.assigned_to,
-            "assigned_to_name": child_name(t.assigned_to),
-            "created": getattr(t, "created", None),
-            "icon": getattr(t, "icon", None),
-            "repeat_days": t.repeat_days,
-            "schedule_mode": getattr(t, "schedule_mode", ""),
-            "repeat_child_id": getattr(t, "repeat_child_id", None),
-            "repeat_child_ids": getattr(t, "repeat_child_ids", []),
-            "persist_until_completed": getattr(t, "persist_until_completed", False),
-            "quick_complete": getattr(t, "quick_complete", False),
-            "skip_approval": getattr(t, "skip_approval", False),
-            "categories": getattr(t, "categories", []),
-            "carried_over": getattr(t, "carried_over", False),
-            "fastest_wins": getattr(t, "fastest_wins", False),
-            "fastest_wins_template_id": getattr(t, "fastest_wins_template_id", None),
-            "fastest_wins_claimed_by_child_id": getattr(t, "fastest_wins_claimed_by_child_id", None),
-            "fastest_wins_claimed_by_child_name": getattr(t, "fastest_wins_claimed_by_child_name", None),
-            "fastest_wins_claimed_ts": getattr(t, "fastest_wins_claimed_ts", None),
-            "mark_overdue": getattr(t, "mark_overdue", True),
-        } for t in self._store.tasks]
+            "id": record_field(t, "id"),
+            "title": record_field(t, "title"),
+            "points": record_field(t, "points"),
+            "status": record_field(t, "status"),
+            "description": record_field(t, "description", "") or "",
+            "due": record_field(t, "due"),
+            "repeat_template_id": record_field(t, "repeat_template_id", None),
+            "early_bonus_enabled": record_field(t, "early_bonus_enabled", False),
+            "early_bonus_days": record_field(t, "early_bonus_days", 0),
+            "early_bonus_points": record_field(t, "early_bonus_points", 0),
+            "bonus_enabled": record_field(t, "bonus_enabled", False),
+            "bonus_title": record_field(t, "bonus_title", ""),
+            "bonus_points": record_field(t, "bonus_points", 0),
+            "bonus_completed_ts": record_field(t, "bonus_completed_ts", None),
+            "bonus_approved": record_field(t, "bonus_approved", False),
+            "completed_ts": record_field(t, "completed_ts", None),
+            "assigned_to": record_field(t, "assigned_to"),
+            "assigned_to_name": child_name(record_field(t, "assigned_to")),
+            "created": record_field(t, "created", None),
+            "icon": record_field(t, "icon", None),
+            "repeat_days": record_field(t, "repeat_days"),
+            "schedule_mode": record_field(t, "schedule_mode", ""),
+            "repeat_child_id": record_field(t, "repeat_child_id", None),
+            "repeat_child_ids": record_field(t, "repeat_child_ids", []),
+            "persist_until_completed": record_field(t, "persist_until_completed", False),
+            "quick_complete": record_field(t, "quick_complete", False),
+            "skip_approval": record_field(t, "skip_approval", False),
+            "categories": record_field(t, "categories", []),
+            "carried_over": record_field(t, "carried_over", False),
+            "fastest_wins": record_field(t, "fastest_wins", False),
+            "fastest_wins_template_id": record_field(t, "fastest_wins_template_id", None),
+            "fastest_wins_claimed_by_child_id": record_field(t, "fastest_wins_claimed_by_child_id", None),
+            "fastest_wins_claimed_by_child_name": record_field(t, "fastest_wins_claimed_by_child_name", None),
+            "fastest_wins_claimed_ts": record_field(t, "fastest_wins_claimed_ts", None),
+            "mark_overdue": record_field(t, "mark_overdue", True),
+        } for t in entries(self._store.tasks)]
         categories = [
             {
                 "id": cat.id,
@@ -289,6 +308,7 @@ class Chores4KidsUiSensor(SensorEntity):
             return "default"
 
     @property
+    @accounted_attributes("sensor.ui")
     def extra_state_attributes(self):
         colors = getattr(self._store, "ui_colors", {}) or {}
         # expose explicit keys for stable frontend lookup
@@ -333,33 +353,150 @@ class Chores4KidsShopSensor(SensorEntity):
         return len([i for i in self._store.items if i.active])
 
     @property
+    @accounted_attributes("sensor.shop")
     def extra_state_attributes(self):
-        # denormalize child name on purchases
-        def child_name(cid: str | None):
-            if not cid:
-                return None
-            for c in self._store.children:
-                if c.id == cid:
-                    return c.name
-            return None
         items = [{
             "id": i.id,
             "title": i.title,
             "price": i.price,
             "icon": i.icon,
             "image": getattr(i, 'image', ''),
+            "image_variants": self._store.image_variants.get(getattr(i, 'image', '') or '', {}),
             "active": i.active,
             "actions": getattr(i, 'actions', []),
         } for i in self._store.items]
-        purchases = [{
-            "id": p.id,
-            "child_id": p.child_id,
-            "child_name": p.child_name or child_name(p.child_id),
-            "item_id": p.item_id,
-            "title": p.title,
-            "price": p.price,
-            "icon": p.icon,
-            "image": getattr(p, 'image', ''),
-            "ts": p.ts,
-        } for p in self._store.purchases]
-        return {"items": items, "purchases": purchases}
+        # Only the newest purchases; the card pages older history via list_purchases
+        purchases = [self._store.purchase_dict(p) for p in self._store.purchases[-PURCHASES_ATTR_LIMIT:]]
+        return {
+            "items": items,
+            "purchases": purchases,
+            "purchases_total": len(self._store.purchases),
+            "pending_actions": self._store.list_action_runs(),
+        }
+
+
+class Chores4KidsLeaderboardSensor(SensorEntity):
+    """Children ranked over the current ISO week or month, read from the daily statistics buckets."""
+
+    _attr_has_entity_name = True
+    # History lives in long-term statistics; don't copy the ranking into every recorder state row.
+    _unrecorded_attributes = frozenset({"ranking"})
+
+    def __init__(self, store: KidsChoresStore, period: str):
+        self._store = store
+        self._period = period
+        self._attr_unique_id = f"chores4kids_leaderboard_{period}"
+        self._attr_name = f"Chores4Kids Leaderboard {period.capitalize()}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "leaderboard")},
+            name="Chores4Kids – Leaderboard",
+            manufacturer="Chores4Kids",
+            model="Statistics",
+        )
+
+    def _ranking(self) -> tuple[str, list[dict]]:
+        today = dt_util.now().date()
+        if self._period == "month":
+            start = today.replace(day=1)
+        else:
+            start = today - timedelta(days=today.weekday())
+        rows = self._store.stats.leaderboard([c.id for c in self._store.children], start, today + timedelta(days=1))
+        for row in rows:
+            row["name"] = self._store.get_child_name(row["child_id"])
+        return start.isoformat(), rows
+
+    @property
+    def native_value(self):
+        _, rows = self._ranking()
+        if not rows or not rows[0]["earned"]:
+            return None
+        return rows[0]["name"]
+
+    @property
+    @accounted_attributes("sensor.leaderboard")
+    def extra_state_attributes(self):
+        start, rows = self._ranking()
+        return {"period": self._period, "period_start": start, "ranking": rows}
+
+
+class Chores4KidsDebugSensor(SensorEntity):
+    """Operation count and latency/payload summaries while instrumentation is enabled."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Chores4Kids Performance"
+    _attr_unique_id = "chores4kids_performance"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"latency", "payload_sizes"})
+
+    def __init__(self):
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "ui")},
+            name="Chores4Kids – UI",
+            manufacturer="Chores4Kids",
+            model="UI Settings",
+        )
+
+    @property
+    def native_value(self):
+        return INSTRUMENTATION.operations if INSTRUMENTATION.enabled else None
+
+    @property
+    def extra_state_attributes(self):
+        return INSTRUMENTATION.snapshot()
+
+
+class _SizeSensor(SensorEntity):
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+
+    def __init__(self, store: KidsChoresStore):
+        self._store = store
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "ui")},
+            name="Chores4Kids – UI",
+            manufacturer="Chores4Kids",
+            model="UI Settings",
+        )
+
+
+class Chores4KidsStorageSizeSensor(_SizeSensor):
+    """Serialized size of the stored document at the last save, per family."""
+
+    _attr_name = "Chores4Kids Storage Size"
+    _attr_unique_id = "chores4kids_storage_size"
+
+    @property
+    def native_value(self):
+        return self._store.sizes.storage_total or None
+
+    @property
+    def extra_state_attributes(self):
+        sizes = self._store.sizes
+        return {
+            "families": dict(sizes.storage),
+            "budget_bytes": sizes.storage_budget,
+            "measured_at": sizes.storage_measured_at,
+        }
+
+
+class Chores4KidsAttributeSizeSensor(_SizeSensor):
+    """Largest attribute payload among our sensors at their last state write."""
+
+    _attr_name = "Chores4Kids Largest Attributes"
+    _attr_unique_id = "chores4kids_attribute_size"
+
+    @property
+    def native_value(self):
+        return max(self._store.sizes.sensors.values(), default=None)
+
+    @property
+    def extra_state_attributes(self):
+        sizes = self._store.sizes
+        return {
+            "sensors": dict(sorted(sizes.sensors.items(), key=lambda kv: -kv[1])),
+            "budget_bytes": sizes.attributes_budget,
+            "over_budget": sizes.oversized_sensors(),
+        }
@@ -0,0 +1,163 @@
+"""Serialized size accounting for the stored document and sensor attributes.
+
+Every save measures the JSON size of each top-level family of the
+`.storage/chores4kids` document (tasks, purchases, ledger, ...) in the
+executor, and every state write of our sensors records the size of its
+attributes. When the document or any one sensor goes over its configured
+budget a repairs issue is raised, and it is removed again once back under.
+"""
+from __future__ import annotations
+
+from functools import wraps
+import logging
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_ATTRIBUTES_BUDGET, DEFAULT_STORAGE_BUDGET, DOMAIN
+from .instrumentation import INSTRUMENTATION, payload_size
+
+_LOGGER = logging.getLogger(__name__)
+
+# Top-level document keys reported on their own; everything else is "settings"
+FAMILIES = ("children", "tasks", "categories", "items", "purchases", "ledger", "stats", "pending_actions")
+
+ISSUE_STORAGE = "storage_budget_exceeded"
+ISSUE_ATTRIBUTES = "attributes_budget_exceeded"
+
+
+def measure_document(data: Dict[str, Any]) -> Dict[str, int]:
+    """Bytes per family of a storage document (runs in the executor)."""
+    sizes = {family: payload_size(data.get(family, [])) for family in FAMILIES}
+    sizes["settings"] = payload_size({k: v for k, v in data.items() if k not in FAMILIES})
+    return sizes
+
+
+class SizeAccounting:
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.storage_budget = DEFAULT_STORAGE_BUDGET * 1024
+        self.attributes_budget = DEFAULT_ATTRIBUTES_BUDGET * 1024
+        self.storage: Dict[str, int] = {}
+        self.storage_measured_at: Optional[str] = None
+        # entity id (or sensor kind before it has one) -> attribute bytes at the last state write
+        self.sensors: Dict[str, int] = {}
+        self._measuring = False
+        # Issues are only raised once configured from the config entry
+        self._issues_enabled = False
+        self._issues: Dict[str, Dict[str, str]] = {}
+
+    @property
+    def measuring(self) -> bool:
+        return self._measuring
+
+    @property
+    def storage_total(self) -> int:
+        return sum(self.storage.values())
+
+    def configure(self, storage_budget_kb: int, attributes_budget_kb: int) -> None:
+        self.storage_budget = max(1, int(storage_budget_kb)) * 1024
+        self.attributes_budget = max(1, int(attributes_budget_kb)) * 1024
+        self._issues_enabled = True
+        self._check()
+
+    async def async_measure_storage(self, data: Dict[str, Any]) -> None:
+        """Measure a document about to be saved; skipped while a measurement is running."""
+        if self._measuring:
+            return
+        self._measuring = True
+        try:
+            self.storage = await self.hass.async_add_executor_job(measure_document, data)
+            self.storage_measured_at = dt_util.utcnow().isoformat()
+            if INSTRUMENTATION.enabled:
+                # Saved size from the executor measurement; never serialize the document on the loop
+                INSTRUMENTATION.observe_size("store.save", self.storage_total)
+        except Exception:
+            _LOGGER.debug("%s: storage size measurement failed", DOMAIN, exc_info=True)
+            return
+        finally:
+            self._measuring = False
+        self._check()
+
+    def record_sensor(self, key: str, nbytes: int) -> None:
+        prev = self.sensors.get(key)
+        self.sensors[key] = nbytes
+        budget = self.attributes_budget
+        if prev is None or (prev > budget) != (nbytes > budget):
+            self._check()
+
+    def forget_sensor(self, key: str) -> None:
+        if self.sensors.pop(key, None) is not None:
+            self._check()
+
+    def oversized_sensors(self) -> List[str]:
+        return sorted(k for k, v in self.sensors.items() if v > self.attributes_budget)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "storage_bytes": self.storage_total,
+            "storage_budget_bytes": self.storage_budget,
+            "storage_families": dict(self.storage),
+            "storage_measured_at": self.storage_measured_at,
+            "attributes_budget_bytes": self.attributes_budget,
+            "sensor_attributes": dict(sorted(self.sensors.items(), key=lambda kv: -kv[1])),
+        }
+
+    def _check(self) -> None:
+        if not self._issues_enabled:
+            return
+        total = self.storage_total
+        self._set_issue(
+            ISSUE_STORAGE,
+            total > self.storage_budget,
+            {"size_kb": str(total // 1024), "budget_kb": str(self.storage_budget // 1024)},
+        )
+        oversized = self.oversized_sensors()
+        self._set_issue(
+            ISSUE_ATTRIBUTES,
+            bool(oversized),
+            {"entities": ", ".join(oversized), "budget_kb": str(self.attributes_budget // 1024)},
+        )
+
+    def _set_issue(self, issue_id: str, active: bool, placeholders: Dict[str, str]) -> None:
+        from homeassistant.helpers import issue_registry as ir
+
+        try:
+            if active:
+                if self._issues.get(issue_id) != placeholders:
+                    ir.async_create_issue(
+                        self.hass,
+                        DOMAIN,
+                        issue_id,
+                        is_fixable=False,
+                        severity=ir.IssueSeverity.WARNING,
+                        translation_key=issue_id,
+                        translation_placeholders=placeholders,
+                    )
+                    self._issues[issue_id] = placeholders
+            elif self._issues.pop(issue_id, None) is not None:
+                ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+        except Exception:
+            _LOGGER.debug("%s: repairs issue %s update failed", DOMAIN, issue_id, exc_info=True)
+
+
+def accounted_attributes(name: str) -> Callable:
+    """Wrap a sensor's attribute builder: record its serialized size and, when instrumented, its build time."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self):
+            start = perf_counter() if INSTRUMENTATION.enabled else None
+            result = func(self)
+            size = payload_size(result)
+            if start is not None:
+                INSTRUMENTATION.observe(name, perf_counter() - start)
+                INSTRUMENTATION.observe_size(name, size)
+            self._store.sizes.record_sensor(self.entity_id or name, size)
+            return result
+
+        return wrapper
+
+    return decorator
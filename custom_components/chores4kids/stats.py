@@ -0,0 +1,267 @@
+"""Per-child statistics buckets, the leaderboard and long-term statistics export.
+
+The store feeds every earned point, purchase and approved chore in here as it
+happens, adding it to an hourly (UTC hour) and a daily (local date) bucket.
+Daily buckets are kept for STATS_DAILY_DAYS and back the leaderboard sensors
+and the get_statistics service. Hourly buckets are what Home Assistant's
+long-term statistics store: completed hours are pushed in batches with
+async_add_external_statistics and dropped once exported and older than
+STATS_HOURLY_KEEP, so dashboards read precomputed sums instead of the
+recorder's attribute history.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STATS_DAILY_DAYS, STATS_HOURLY_KEEP, STATS_IMPORT_BATCH
+
+METRICS = ("earned", "spent", "completed", "on_time")
+
+# metric -> (statistic name suffix, unit)
+_STAT_META = {
+    "earned": ("points earned", "points"),
+    "spent": ("points spent", "points"),
+    "completed": ("chores completed", None),
+    "on_time": ("chores on time", None),
+}
+
+
+def _hour_start(ts: float) -> int:
+    return int(ts) // 3600 * 3600
+
+
+def statistic_id(child_id: str, metric: str) -> str:
+    """External statistic id, e.g. chores4kids:earned_<child id>."""
+    return f"{DOMAIN}:{metric}_{str(child_id).lower().replace('-', '_')}"
+
+
+class StatsEngine:
+    """Hourly and daily buckets of [earned, spent, completed, on_time] per child."""
+
+    def __init__(self) -> None:
+        self.hourly: Dict[Tuple[str, int], List[int]] = {}  # (child, UTC hour ts)
+        self.daily: Dict[Tuple[str, int], List[int]] = {}  # (child, local date ordinal)
+        # Hourly buckets starting before this were pushed to long-term statistics
+        self.exported_until = 0
+        # child -> running totals already exported, the `sum` of the next pushed hour
+        self.sums: Dict[str, List[int]] = {}
+        self.revision = 0
+        # (task, undo log) of the transaction open in this context, replayed backwards by rollback()
+        self._undo: ContextVar[Optional[Tuple[Any, List[Tuple[Any, ...]]]]] = ContextVar(
+            "chores4kids_stats_undo", default=None
+        )
+
+    # --- Persistence ---
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "hourly": [[cid, hour, *b] for (cid, hour), b in self.hourly.items()],
+            "daily": [[cid, date.fromordinal(day).isoformat(), *b] for (cid, day), b in self.daily.items()],
+            "exported_until": self.exported_until,
+            "sums": {cid: list(s) for cid, s in self.sums.items()},
+        }
+
+    def load(self, data: Dict[str, Any]) -> None:
+        self.hourly, self.daily = {}, {}
+        for row in data.get("hourly") or []:
+            try:
+                self.hourly[(str(row[0]), int(row[1]))] = [int(v) for v in row[2:6]]
+            except (TypeError, ValueError, IndexError):
+                continue
+        for row in data.get("daily") or []:
+            try:
+                self.daily[(str(row[0]), date.fromisoformat(str(row[1])).toordinal())] = [int(v) for v in row[2:6]]
+            except (TypeError, ValueError, IndexError):
+                continue
+        self.exported_until = int(data.get("exported_until") or 0)
+        self.sums = {str(cid): [int(v) for v in s][:4] for cid, s in (data.get("sums") or {}).items()}
+        self.revision += 1
+
+    # --- Recording ---
+    def record(
+        self,
+        child_id: str,
+        ts: Optional[float] = None,
+        earned: int = 0,
+        spent: int = 0,
+        completed: int = 0,
+        on_time: int = 0,
+    ) -> None:
+        values = (int(earned), int(spent), int(completed), int(on_time))
+        if not any(values):
+            return
+        if ts is None:
+            ts = dt_util.utcnow().timestamp()
+        day = dt_util.as_local(dt_util.utc_from_timestamp(ts)).date().toordinal()
+        for buckets, key in ((self.hourly, (child_id, _hour_start(ts))), (self.daily, (child_id, day))):
+            b = buckets.get(key)
+            if b is None:
+                b = buckets[key] = [0, 0, 0, 0]
+                self._log(("new", buckets, key))
+            else:
+                self._log(("set", b, list(b)))
+            for i, v in enumerate(values):
+                b[i] += v
+        self.revision += 1
+
+    def prune(self, now_ts: Optional[float] = None) -> None:
+        """Drop exported hourly buckets past STATS_HOURLY_KEEP and anything past STATS_DAILY_DAYS."""
+        if now_ts is None:
+            now_ts = dt_util.utcnow().timestamp()
+        keep_from = min(self.exported_until, now_ts - STATS_HOURLY_KEEP.total_seconds())
+        oldest = now_ts - STATS_DAILY_DAYS * 86400
+        self._log(("buckets", self.hourly, self.daily))
+        self.hourly = {k: b for k, b in self.hourly.items() if k[1] >= keep_from and k[1] >= oldest}
+        first_day = dt_util.as_local(dt_util.utc_from_timestamp(now_ts)).date().toordinal() - STATS_DAILY_DAYS
+        self.daily = {k: b for k, b in self.daily.items() if k[1] > first_day}
+        self.revision += 1
+
+    def forget(self, child_ids: Iterable[str]) -> None:
+        """Drop the buckets of removed children.
+
+        Exported running sums are kept, so a child that is imported again
+        continues its long-term statistics instead of restarting them at zero.
+        """
+        gone = set(child_ids)
+        self._log(("buckets", self.hourly, self.daily))
+        self.hourly = {k: b for k, b in self.hourly.items() if k[0] not in gone}
+        self.daily = {k: b for k, b in self.daily.items() if k[0] not in gone}
+        self.revision += 1
+
+    # --- Transactions ---
+    def begin(self) -> None:
+        """Start logging the calling task's changes so rollback() can undo them."""
+        self._undo.set((asyncio.current_task(), []))
+
+    def commit(self) -> None:
+        self._undo.set(None)
+
+    def _log(self, step: Tuple[Any, ...]) -> None:
+        undo = self._undo.get()
+        if undo is not None and undo[0] is asyncio.current_task():
+            undo[1].append(step)
+
+    def rollback(self) -> None:
+        """Undo every record(), prune() and forget() the task made since begin()."""
+        undo = self._undo.get()
+        self._undo.set(None)
+        if not undo or not undo[1]:
+            return
+        for step in reversed(undo[1]):
+            if step[0] == "new":
+                step[1].pop(step[2], None)
+            elif step[0] == "set":
+                step[1][:] = step[2]
+            else:
+                self.hourly, self.daily = step[1], step[2]
+        self.revision += 1
+
+    # --- Queries ---
+    def totals(self, child_id: str, start: date, end: date) -> List[int]:
+        """Summed bucket for local days start <= day < end."""
+        out = [0, 0, 0, 0]
+        for day in range(start.toordinal(), end.toordinal()):
+            b = self.daily.get((child_id, day))
+            if b:
+                for i, v in enumerate(b):
+                    out[i] += v
+        return out
+
+    def days(self, child_id: str, start: date, end: date) -> List[Dict[str, Any]]:
+        out = []
+        for day in range(start.toordinal(), end.toordinal()):
+            b = self.daily.get((child_id, day)) or [0, 0, 0, 0]
+            out.append({"date": date.fromordinal(day).isoformat(), **dict(zip(METRICS, b))})
+        return out
+
+    def leaderboard(self, child_ids: Iterable[str], start: date, end: date) -> List[Dict[str, Any]]:
+        """Children ranked by points earned, then chores completed, over [start, end)."""
+        rows = []
+        for cid in child_ids:
+            row: Dict[str, Any] = {"child_id": cid, **dict(zip(METRICS, self.totals(cid, start, end)))}
+            row["on_time_rate"] = round(row["on_time"] / row["completed"], 3) if row["completed"] else None
+            rows.append(row)
+        rows.sort(key=lambda r: (-r["earned"], -r["completed"]))
+        prev, rank = None, 0
+        for i, row in enumerate(rows, 1):
+            key = (row["earned"], row["completed"])
+            if key != prev:
+                rank, prev = i, key
+            row["rank"] = rank
+        return rows
+
+    # --- Long-term statistics ---
+    def pending(self, until: int) -> Dict[str, List[Tuple[int, List[int]]]]:
+        """Unexported hourly buckets before `until` per child, oldest first."""
+        out: Dict[str, List[Tuple[int, List[int]]]] = {}
+        for (cid, hour), b in self.hourly.items():
+            if self.exported_until <= hour < until:
+                out.setdefault(cid, []).append((hour, b))
+        for rows in out.values():
+            rows.sort(key=lambda r: r[0])
+        return out
+
+
+def _metadata(child_name: str, child_id: str, metric: str) -> Dict[str, Any]:
+    label, unit = _STAT_META[metric]
+    meta: Dict[str, Any] = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": f"{child_name} {label}",
+        "source": DOMAIN,
+        "statistic_id": statistic_id(child_id, metric),
+        "unit_of_measurement": unit,
+        "unit_class": None,
+    }
+    try:
+        from homeassistant.components.recorder.models import StatisticMeanType
+
+        meta["mean_type"] = StatisticMeanType.NONE
+    except ImportError:
+        pass
+    return meta
+
+
+def async_push_statistics(
+    hass: HomeAssistant, engine: StatsEngine, child_name: Callable[[str], Optional[str]]
+) -> int:
+    """Push completed, unexported hours to long-term statistics. Returns hours pushed.
+
+    Each metric is one external statistic per child; rows carry the running
+    sum, so Home Assistant derives daily/weekly/monthly changes itself.
+    """
+    if "recorder" not in hass.config.components:
+        return 0
+    try:
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+    except ImportError:
+        return 0
+    until = _hour_start(dt_util.utcnow().timestamp())
+    pushed = 0
+    new_sums: Dict[str, List[int]] = {}
+    for cid, rows in engine.pending(until).items():
+        name = child_name(cid) or cid
+        sums = list(engine.sums.get(cid) or [0, 0, 0, 0])
+        for i, metric in enumerate(METRICS):
+            running = sums[i]
+            data = []
+            for hour, b in rows:
+                running += b[i]
+                data.append({"start": dt_util.utc_from_timestamp(hour), "state": running, "sum": running})
+            if running == sums[i]:
+                continue
+            meta = _metadata(name, cid, metric)
+            for n in range(0, len(data), STATS_IMPORT_BATCH):
+                async_add_external_statistics(hass, meta, data[n:n + STATS_IMPORT_BATCH])
+            sums[i] = running
+        new_sums[cid] = sums
+        pushed += len(rows)
+    # Committed only after every batch was queued: a retry re-sends identical rows.
+    engine.sums.update(new_sums)
+    engine.exported_until = max(engine.exported_until, until)
+    return pushed
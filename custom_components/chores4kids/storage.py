@@ -1,16 +1,35 @@
 from __future__ import annotations
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, asdict, field
-from typing import Any, Dict, List, Optional
-from homeassistant.core import HomeAssistant
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 from uuid import uuid4
-import os
-import asyncio
 import unicodedata
 import re
 
-from .const import STORAGE_KEY, STORAGE_VERSION
+from .const import (
+    LEDGER_RAW_DAYS,
+    MEDIA_DIR,
+    MEDIA_URL_PREFIX,
+    ROLLOVER_MAX_CATCHUP_DAYS,
+    STATS_DAILY_DAYS,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .instrumentation import instrument_methods
+from .lazy import LazyList, entries, field as record_field, loaded, record_factory, rows
+from .ledger import KIND_ADJUST, KIND_EARNED, KIND_PURCHASE, PointsLedger
+from .media import MediaRegistry, media_filename, remove_media_files, scan_media_dir
+from .schedule import ScheduleIndex
+from .sizes import SizeAccounting
+from .stats import StatsEngine
 
 STATUS_ASSIGNED = "assigned"
 STATUS_IN_PROGRESS = "in_progress"
@@ -21,13 +40,57 @@ STATUS_REJECTED = "rejected"
 STATUSES = {STATUS_ASSIGNED, STATUS_IN_PROGRESS, STATUS_AWAITING, STATUS_APPROVED, STATUS_REJECTED}
 
 
+class _Transaction:
+    """An open KidsChoresStore.transaction(): nesting depth, deferred work and the record journal."""
+
+    __slots__ = ("store", "task", "depth", "save_pending", "signals", "records")
+
+    def __init__(self, store: "KidsChoresStore") -> None:
+        self.store = store
+        # Only the task that opened the transaction joins it; tasks it spawns do not
+        self.task = asyncio.current_task()
+        self.depth = 1
+        self.save_pending = False
+        self.signals: List[str] = []
+        # id(record) -> (record, its fields before the first write)
+        self.records: Dict[int, Tuple[Any, Dict[str, Any]]] = {}
+
+    def active(self) -> bool:
+        return self.depth > 0 and self.task is asyncio.current_task()
+
+
+# The transaction open in the running context, if any
+_TXN: ContextVar[Optional[_Transaction]] = ContextVar("chores4kids_transaction", default=None)
+
+
+class _Record:
+    """Base of the stored record dataclasses.
+
+    The first write to a record inside a transaction saves its prior fields
+    into that transaction's journal, so a rollback can put them back and
+    records the transaction does not touch cost nothing.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        txn = _TXN.get()
+        if txn is not None and txn.active():
+            state = self.__dict__
+            if name in state and id(self) not in txn.records:
+                txn.records[id(self)] = (
+                    self, {k: (v.copy() if isinstance(v, (list, dict)) else v) for k, v in state.items()}
+                )
+        object.__setattr__(self, name, value)
+
+
 def slugify(value: str) -> str:
     value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
     value = re.sub(r"[^a-zA-Z0-9]+", "_", value).strip("_")
     return value.lower() or "child"
 
 @dataclass
-class Child:
+class Child(_Record):
     id: str
     name: str
     points: int = 0
@@ -39,14 +102,14 @@ class Child:
     last_earned_week: str = ""
 
 @dataclass
-class Category:
+class Category(_Record):
     id: str
     name: str
     # Optional hex color (e.g. "#ff0000") used for UI chips. Empty means "no custom color".
     color: str = ""
 
 @dataclass
-class Task:
+class Task(_Record):
     id: str
     title: str
     points: int
@@ -114,11 +177,65 @@ class Task:
     # If true, unfinished task carried to next day is marked as overdue (red).
     mark_overdue: bool = True
 
+
+def _is_history_row(row: Any) -> bool:
+    """Stored task that async_load may leave raw: an approved instance with no schedule.
+
+    Rows are only ever hydrated, never edited, so every raw row in self.tasks is
+    approved; loops that only act on active tasks can walk loaded(self.tasks).
+    """
+    return (
+        type(row) is dict
+        and row.get("status") == STATUS_APPROVED
+        and bool(row.get("assigned_to"))
+        and not row.get("repeat_days")
+        and not row.get("schedule_mode")
+    )
+
+
+class ChoresStorage(Store):
+    """Store that upgrades older documents once, through Store's migration hook.
+
+    Store writes the migrated document back itself right after the hook returns.
+    """
+
+    async def _async_migrate_func(self, old_major_version: int, old_minor_version: int, old_data: Dict[str, Any]) -> Dict[str, Any]:
+        return _migrate_document(old_major_version, dict(old_data))
+
+
+def _migrate_document(old_version: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Bring a stored document from `old_version` up to STORAGE_VERSION."""
+    if old_version < 2:
+        # v1 -> v2: checks that used to run on every load.
+        # Early bonus configured before the explicit toggle existed stays enabled.
+        for t in data.get("tasks") or []:
+            try:
+                if isinstance(t, dict) and "early_bonus_enabled" not in t:
+                    eb_days = int(t.get("early_bonus_days", 0) or 0)
+                    eb_points = int(t.get("early_bonus_points", 0) or 0)
+                    t["early_bonus_enabled"] = bool(eb_days > 0 and eb_points > 0)
+            except Exception:
+                # Best-effort migration; fall back to dataclass defaults
+                pass
+        # Earned counters derived from the approved tasks, for data older than the counters
+        if not data.pop("earned_backfill_done", False):
+            try:
+                children = [Child(**c) for c in data.get("children", [])]
+                KidsChoresStore._backfill_earned_points(children, [_task_from_row(t) for t in data.get("tasks", [])])
+                data["children"] = [asdict(c) for c in children]
+            except Exception:
+                pass
+    data["version"] = STORAGE_VERSION
+    return data
+
+
+@instrument_methods("store")
 class KidsChoresStore:
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._store = ChoresStorage(hass, STORAGE_VERSION, STORAGE_KEY)
         self.children: List[Child] = []
+        self._children_by_id: Dict[str, Child] = {}
         self.tasks: List[Task] = []
         self.categories: List[Category] = []
         self.items: List["ShopItem"] = []
@@ -130,32 +247,50 @@ class KidsChoresStore:
         self.notify_service: str = ""
         self.notify_services: List[str] = []
         self.notify_service_settings: Dict[str, Dict[str, bool]] = {}
-        self._earned_backfill_done: bool = False
+        # Resized variants for uploaded images: image url -> {variant: url}
+        self.image_variants: Dict[str, Dict[str, str]] = {}
+        self.media = MediaRegistry()
+        # Shop action runs waiting on a delay step; persisted so they survive restarts.
+        self.pending_actions: List[Dict[str, Any]] = []
+        self._action_timers: Dict[str, Callable[[], None]] = {}
+        # Append-only record of every points change (see ledger.py)
+        self.ledger = PointsLedger()
+        # Hourly/daily per-child aggregates for the leaderboard and long-term statistics (see stats.py)
+        self.stats = StatsEngine()
+        # Serialized size per document family and per sensor, checked against budgets (see sizes.py)
+        self.sizes = SizeAccounting(hass)
+        # Local date (ISO) of the last completed rollover; drives catch-up after downtime.
+        self.last_rollover_date: str = ""
+        # id -> position in self.tasks, rebuilt lazily whenever self.tasks is replaced or resized.
+        # Holding the indexed list itself (not its id()) rules out address reuse.
+        self._tasks_by_id: Dict[str, int] = {}
+        self._tasks_indexed: Tuple[Optional[List[Task]], int] = (None, -1)
+        # Serialises transactions; the open one lives in _TXN (see transaction()).
+        self._txn_lock = asyncio.Lock()
+        # Rules and next occurrences of scheduled tasks (see schedule.py).
+        self.schedule = ScheduleIndex()
+        # Assigned, not yet approved tasks by id, and a counter bumped whenever the
+        # approved history changes; the tasks calendar indexes from these (see _track_task).
+        self.open_tasks: Dict[str, Task] = {}
+        self.history_revision = 0
 
     async def async_load(self):
         data = await self._store.async_load()
         if not data:
             return
         self.children = [Child(**c) for c in data.get("children", [])]
+        self._reindex_children()
         self.categories = [Category(**c) for c in data.get("categories", [])]
-        # Migrate tasks: if early bonus was configured before the explicit toggle existed,
-        # enable it automatically so behavior remains unchanged.
-        raw_tasks = list(data.get("tasks", []) or [])
-        migrated: list[Task] = []
-        for t in raw_tasks:
-            try:
-                if isinstance(t, dict) and "early_bonus_enabled" not in t:
-                    eb_days = int(t.get("early_bonus_days", 0) or 0)
-                    eb_points = int(t.get("early_bonus_points", 0) or 0)
-                    t["early_bonus_enabled"] = bool(eb_days > 0 and eb_points > 0)
-            except Exception:
-                # Best-effort migration; fall back to dataclass defaults
-                pass
-            migrated.append(Task(**t))
-        self.tasks = migrated
+        # Approved instances and purchases are history: kept as stored rows until read (see lazy.py).
+        # Anything with a schedule is hydrated now since the schedule index needs it.
+        self.tasks = LazyList(_task_from_row, [
+            t if _is_history_row(t) else _task_from_row(t) for t in (data.get("tasks") or [])
+        ])
+        self.schedule.rebuild(loaded(self.tasks), dt_util.now().date())
+        self._retrack_tasks()
         # Optional keys for backwards compatibility
         self.items = [ShopItem(**i) for i in data.get("items", [])]
-        self.purchases = [Purchase(**p) for p in data.get("purchases", [])]
+        self.purchases = LazyList(_purchase_from_row, data.get("purchases") or [])
         try:
             raw_colors = data.get("ui_colors") or {}
             self.ui_colors = {str(k): str(v) for k, v in raw_colors.items() if v is not None}
@@ -206,36 +341,177 @@ class KidsChoresStore:
             self.notify_service_settings = {}
 
         try:
-            self._earned_backfill_done = bool(data.get("earned_backfill_done", False))
+            raw_variants = data.get("image_variants") or {}
+            self.image_variants = {
+                str(url): {str(k): str(v) for k, v in variants.items()}
+                for url, variants in raw_variants.items()
+                if isinstance(variants, dict)
+            }
+        except Exception:
+            self.image_variants = {}
+        self._rebuild_media_refs()
+
+        try:
+            self.pending_actions = [
+                dict(r) for r in (data.get("pending_actions") or [])
+                if isinstance(r, dict) and r.get("id") and isinstance(r.get("steps"), list)
+            ]
         except Exception:
-            self._earned_backfill_done = False
+            self.pending_actions = []
 
-        if not self._earned_backfill_done:
+        self.last_rollover_date = str(data.get("last_rollover_date") or "")
+        # Saved only when seeding below adds data; a migrated document was already written by Store
+        save = False
+
+        if isinstance(data.get("ledger"), list):
+            self.ledger.load(data["ledger"])
+        else:
+            # One-time migration: opening balances from the stored counters and purchases
             try:
-                self._backfill_earned_points()
-                self._earned_backfill_done = True
-                await self.async_save()
+                self._seed_ledger()
+                save = True
             except Exception:
                 pass
+        self._sync_earned_counters()
+
+        if isinstance(data.get("stats"), dict):
+            self.stats.load(data["stats"])
+        else:
+            try:
+                self._seed_stats()
+                save = True
+            except Exception:
+                pass
+        if save:
+            await self.async_save()
+
+    def _transaction(self) -> Optional[_Transaction]:
+        """The transaction the calling task has open on this store, if any."""
+        txn = _TXN.get()
+        if txn is not None and txn.store is self and txn.active():
+            return txn
+        return None
 
     async def async_save(self):
-        await self._store.async_save({
+        txn = self._transaction()
+        if txn is not None:
+            txn.save_pending = True
+            return
+        await self._write()
+
+    @callback
+    def async_dispatch(self, signal: str) -> None:
+        """Send a dispatcher signal now, or on commit when inside a transaction."""
+        txn = self._transaction()
+        if txn is not None:
+            if signal not in txn.signals:
+                txn.signals.append(signal)
+            return
+        async_dispatcher_send(self.hass, signal)
+
+    # Attributes restored on rollback. List membership is restored from a copy
+    # of the list; record fields from the transaction's journal (see _Record).
+    _TXN_LISTS = ("children", "tasks", "categories", "items", "purchases")
+    _TXN_VALUES = (
+        "ui_colors", "enable_points", "confetti_enabled", "notify_service", "notify_services",
+        "notify_service_settings", "image_variants", "pending_actions", "last_rollover_date",
+    )
+
+    def _snapshot(self) -> Dict[str, Any]:
+        snap: Dict[str, Any] = {}
+        for name in self._TXN_LISTS:
+            seq = getattr(self, name)
+            snap[name] = (seq.factory if isinstance(seq, LazyList) else None, entries(seq))
+        for name in self._TXN_VALUES:
+            # One level is enough: nested dicts/lists in these are replaced, never edited in place
+            value = getattr(self, name)
+            snap[name] = value.copy() if isinstance(value, (list, dict)) else value
+        self.ledger.begin()
+        self.stats.begin()
+        return snap
+
+    def _restore(self, snap: Dict[str, Any], records: Dict[int, Tuple[Any, Dict[str, Any]]]) -> None:
+        for obj, state in records.values():
+            vars(obj).clear()
+            vars(obj).update(state)
+        for name in self._TXN_LISTS:
+            factory, held = snap[name]
+            setattr(self, name, LazyList(factory, held) if factory else held)
+        for name in self._TXN_VALUES:
+            setattr(self, name, snap[name])
+        self.ledger.rollback()
+        self.stats.rollback()
+        self._reindex_children()
+        self._rebuild_media_refs()
+        self.schedule.rebuild(loaded(self.tasks), dt_util.now().date())
+        self._retrack_tasks()
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Group store calls into one atomic unit: `async with store.transaction(): ...`.
+
+        Saves and signals queued with async_dispatch() are deferred until the
+        outermost block exits, so the whole unit costs one write. If the block
+        raises, the in-memory state is restored (see _snapshot) and nothing is
+        written or signalled. Effects outside the store (timers, notifications,
+        service calls) are not rolled back. Nested blocks join the outermost one.
+        Only the task that opened the block is part of it: other tasks save and
+        write records as usual, and transactions run one at a time.
+        """
+        txn = self._transaction()
+        if txn is not None:
+            txn.depth += 1
+            try:
+                yield self
+            finally:
+                txn.depth -= 1
+            return
+        async with self._txn_lock:
+            snapshot = self._snapshot()
+            txn = _Transaction(self)
+            token = _TXN.set(txn)
+            try:
+                yield self
+            except BaseException:
+                txn.depth = 0
+                self._restore(snapshot, txn.records)
+                raise
+            finally:
+                txn.depth = 0
+                _TXN.reset(token)
+                self.ledger.commit()
+                self.stats.commit()
+        if txn.save_pending:
+            await self._write()
+        for signal in txn.signals:
+            async_dispatcher_send(self.hass, signal)
+
+    async def _write(self):
+        data = {
             "version": STORAGE_VERSION,
             "children": [asdict(c) for c in self.children],
-            "tasks": [asdict(t) for t in self.tasks],
+            "tasks": rows(self.tasks, asdict),
             "categories": [asdict(c) for c in self.categories],
             "items": [asdict(i) for i in self.items],
-            "purchases": [asdict(p) for p in self.purchases],
+            "purchases": rows(self.purchases, asdict),
             "ui_colors": dict(self.ui_colors or {}),
             "enable_points": bool(getattr(self, "enable_points", True)),
             "confetti_enabled": bool(getattr(self, "confetti_enabled", True)),
             "notify_service": str(getattr(self, "notify_service", "") or ""),
             "notify_services": list(getattr(self, "notify_services", []) or []),
             "notify_service_settings": dict(getattr(self, "notify_service_settings", {}) or {}),
-            "earned_backfill_done": bool(getattr(self, "_earned_backfill_done", False)),
-        })
-
-    def _backfill_earned_points(self) -> None:
+            "image_variants": dict(self.image_variants),
+            "pending_actions": list(self.pending_actions),
+            "last_rollover_date": self.last_rollover_date,
+            "ledger": self.ledger.as_rows(),
+            "stats": self.stats.as_dict(),
+        }
+        await self._store.async_save(data)
+        if not self.sizes.measuring:
+            self.hass.async_create_task(self.sizes.async_measure_storage(data))
+
+    @staticmethod
+    def _backfill_earned_points(children: List[Child], tasks: List[Task]) -> None:
         now_local = dt_util.now()
         month_key = f"{now_local.year}-{now_local.month:02d}"
         iso_year, iso_week, _ = now_local.isocalendar()
@@ -297,11 +573,11 @@ class KidsChoresStore:
                 pass
             return None
 
-        for child in self.children:
+        for child in children:
             lifetime = 0
             monthly = 0
             weekly = 0
-            for task in self.tasks:
+            for task in tasks:
                 if task.assigned_to != child.id:
                     continue
                 if getattr(task, "status", None) != STATUS_APPROVED:
@@ -323,6 +599,100 @@ class KidsChoresStore:
             child.last_earned_month = month_key
             child.last_earned_week = week_key
 
+    def _seed_ledger(self) -> None:
+        """Opening ledger entries that reproduce the stored counters and balances.
+
+        Earned points go in as up to three opening entries (this ISO week, the
+        rest of this month, everything before) so the week/month windows match
+        the counters; purchases still in the history are added with their own
+        timestamps and a final adjustment reconciles each balance.
+        """
+        from datetime import timedelta
+
+        now_local = dt_util.now()
+        today = now_local.date()
+        month_key = f"{now_local.year}-{now_local.month:02d}"
+        iso_year, iso_week, _ = now_local.isocalendar()
+        week_key = f"{iso_year}-W{iso_week:02d}"
+        month_start = today.replace(day=1)
+        week_start = today - timedelta(days=today.weekday())
+
+        def _ts(day) -> int:
+            return int(dt_util.as_utc(dt_util.start_of_local_day(day)).timestamp())
+
+        self.ledger.load([])
+        for p in self.purchases:
+            try:
+                ts = dt_util.parse_datetime(str(p.ts))
+                self.ledger.record(p.child_id, KIND_PURCHASE, -int(p.price), p.id, int(ts.timestamp()) if ts else 0)
+            except Exception:
+                continue
+        for c in self.children:
+            lifetime = max(0, int(getattr(c, "lifetime_earned", 0) or 0))
+            monthly = max(0, int(getattr(c, "monthly_earned", 0) or 0)) if c.last_earned_month == month_key else 0
+            weekly = max(0, int(getattr(c, "weekly_earned", 0) or 0)) if c.last_earned_week == week_key else 0
+            if week_start >= month_start:
+                parts = [(week_start, weekly), (month_start, max(0, monthly - weekly))]
+            else:
+                # The week began last month: points on/after the 1st count in both windows
+                both = min(weekly, monthly)
+                parts = [(month_start, monthly), (week_start, weekly - both)]
+            for day, pts in parts:
+                self.ledger.record(c.id, KIND_EARNED, pts, "opening", _ts(day))
+            rest = lifetime - sum(pts for _, pts in parts)
+            self.ledger.record(c.id, KIND_EARNED, rest, "opening", 0)
+            self.ledger.record(c.id, KIND_ADJUST, int(c.points) - self.ledger.balance(c.id), "opening", 0)
+
+    def _seed_stats(self) -> None:
+        """Daily/hourly buckets for the last STATS_DAILY_DAYS from the ledger and approved tasks."""
+        since = dt_util.utcnow().timestamp() - STATS_DAILY_DAYS * 86400
+        self.stats.load({})
+        for e in self.ledger.entries:
+            # ts 0 marks opening balances with no real date
+            if e.ts <= 0 or e.ts < since:
+                continue
+            if e.kind == KIND_EARNED:
+                self.stats.record(e.child_id, e.ts, earned=e.points)
+            elif e.kind == KIND_PURCHASE:
+                self.stats.record(e.child_id, e.ts, spent=-e.points)
+        for t in self.tasks:
+            if t.status != STATUS_APPROVED or not t.assigned_to or not t.approved_at:
+                continue
+            approved = dt_util.parse_datetime(str(t.approved_at))
+            if approved is None or approved.timestamp() < since:
+                continue
+            self.stats.record(
+                t.assigned_to, approved.timestamp(), completed=1, on_time=int(self._completed_on_time(t))
+            )
+
+    @staticmethod
+    def _completed_on_time(t: Task) -> bool:
+        """Whether a chore was completed (or, without a timestamp, approved) by its due day."""
+        due_raw = getattr(t, "due", None)
+        if not due_raw:
+            return True
+        due_dt = dt_util.parse_datetime(str(due_raw))
+        due_date = dt_util.as_local(due_dt).date() if due_dt is not None else dt_util.parse_date(str(due_raw))
+        if due_date is None:
+            return True
+        comp_ts = getattr(t, "completed_ts", None)
+        if comp_ts:
+            done = dt_util.as_local(dt_util.utc_from_timestamp(int(comp_ts) / 1000.0))
+        else:
+            done = dt_util.parse_datetime(str(getattr(t, "approved_at", "") or "")) or dt_util.now()
+        return dt_util.as_local(done).date() <= due_date
+
+    def _sync_earned_counters(self) -> None:
+        """Refresh the lifetime/month/week counters on every child from the ledger."""
+        now_local = dt_util.now()
+        month_key = f"{now_local.year}-{now_local.month:02d}"
+        iso_year, iso_week, _ = now_local.isocalendar()
+        week_key = f"{iso_year}-W{iso_week:02d}"
+        for c in self.children:
+            c.lifetime_earned, c.monthly_earned, c.weekly_earned = self.ledger.earned_windows(c.id, now_local.date())
+            c.last_earned_month = month_key
+            c.last_earned_week = week_key
+
     async def set_ui_colors(
         self,
         start_task_bg: Optional[str] = None,
@@ -409,6 +779,7 @@ class KidsChoresStore:
         cid = str(uuid4())
         ch = Child(id=cid, name=name.strip(), points=0, slug=slugify(name))
         self.children.append(ch)
+        self._reindex_children()
         await self.async_save()
         return ch
 
@@ -423,10 +794,11 @@ class KidsChoresStore:
 
     async def remove_child(self, child_id: str):
         self.children = [c for c in self.children if c.id != child_id]
+        self._reindex_children()
         # Orphan tasks: keep but unassign
-        for t in self.tasks:
-            if t.assigned_to == child_id:
-                t.assigned_to = None
+        for t in self._tasks_where(lambda t: record_field(t, "assigned_to") == child_id):
+            t.assigned_to = None
+            self._track_task(t, history=True)
         await self.async_save()
 
     # --- Tasks ---
@@ -601,9 +973,11 @@ class KidsChoresStore:
             t.categories = []
 
         self.tasks.append(t)
+        self._track_task(t)
 
         # If this is an unassigned repeat template with early-bonus enabled, create upcoming
         # assigned instance(s) immediately, using repeat_days as the deadline.
+        self.schedule.update(t, dt_util.now().date())
         try:
             await self._maybe_spawn_repeat_bonus_instances(t)
         except Exception:
@@ -635,7 +1009,7 @@ class KidsChoresStore:
         return targets
 
     def _active_repeat_instance_exists(self, template_id: str, child_id: str) -> bool:
-        for x in self.tasks:
+        for x in loaded(self.tasks):
             if x.assigned_to != child_id:
                 continue
             if getattr(x, "repeat_template_id", None) != template_id:
@@ -644,47 +1018,12 @@ class KidsChoresStore:
                 return True
         return False
 
-    def _next_repeat_due_iso(self, base_date, repeat_days: list[int], include_today: bool = True) -> Optional[str]:
-        try:
-            from datetime import timedelta
-            if not repeat_days:
-                return None
-            wd = int(base_date.weekday())
-            best = None
-            for d in sorted(set(int(x) for x in repeat_days if 0 <= int(x) <= 6)):
-                delta = (d - wd) % 7
-                if not include_today and delta == 0:
-                    delta = 7
-                if best is None or delta < best:
-                    best = delta
-            if best is None:
-                return None
-            return (base_date + timedelta(days=int(best))).isoformat()
-        except Exception:
-            return None
-
-    def _next_monthly_due_iso(self, base_date, include_today: bool = True) -> Optional[str]:
-        try:
-            from datetime import date, timedelta
-
-            if not isinstance(base_date, date):
-                return None
-
-            # base_date is a date (local). We return ISO date string for next 1st.
-            if include_today and base_date.day == 1:
-                return base_date.isoformat()
-
-            year = int(base_date.year)
-            month = int(base_date.month)
-            # Jump to first of next month
-            if month == 12:
-                year += 1
-                month = 1
-            else:
-                month += 1
-            return date(year, month, 1).isoformat()
-        except Exception:
-            return None
+    def _next_due_iso(self, template: Task, base_date, include_today: bool = True) -> Optional[str]:
+        """Next occurrence of a scheduled task from the schedule index (repeat, weekly or monthly)."""
+        if template.id not in self.schedule:
+            self.schedule.update(template, base_date)
+        day = self.schedule.next_due(template.id, base_date, include_today=include_today)
+        return day.isoformat() if day else None
 
     async def _maybe_spawn_repeat_bonus_instances(self, template: Task):
         """For repeat templates with early-bonus enabled, ensure each target child has one upcoming instance.
@@ -713,14 +1052,7 @@ class KidsChoresStore:
         from homeassistant.util import dt as dt_util
         from datetime import datetime, timezone
         today = dt_util.now().date()  # local
-        if mode == "monthly":
-            due_iso = self._next_monthly_due_iso(today, include_today=True)
-        else:
-            # repeat + weekly both use repeat-days based next occurrence
-            rdays = list(getattr(template, "repeat_days", []) or [])
-            if mode == "weekly":
-                rdays = [0]
-            due_iso = self._next_repeat_due_iso(today, rdays, include_today=True)
+        due_iso = self._next_due_iso(template, today, include_today=True)
         if not due_iso:
             return
 
@@ -756,6 +1088,7 @@ class KidsChoresStore:
             inst.bonus_title = str(getattr(template, "bonus_title", "") or "").strip()
             inst.bonus_points = int(getattr(template, "bonus_points", 0) or 0)
             self.tasks.append(inst)
+            self._track_task(inst)
 
     async def assign_task(self, task_id: str, child_id: str):
         t = self._get_task(task_id)
@@ -777,34 +1110,36 @@ class KidsChoresStore:
                     repeat_template_id = t.id
             except Exception:
                 repeat_template_id = None
-            await self.add_task(
-                title=t.title,
-                points=t.points,
-                description=t.description,
-                due=t.due,
-                assigned_to=child_id,
-                repeat_template_id=repeat_template_id,
-                icon=t.icon,
-                persist_until_completed=getattr(t, "persist_until_completed", False),
-                quick_complete=getattr(t, "quick_complete", False),
-                skip_approval=getattr(t, "skip_approval", False),
-                categories=list(getattr(t, "categories", []) or []),
-                early_bonus_enabled=getattr(t, "early_bonus_enabled", False),
-                early_bonus_days=getattr(t, "early_bonus_days", 0),
-                early_bonus_points=getattr(t, "early_bonus_points", 0),
-                bonus_enabled=getattr(t, "bonus_enabled", False),
-                bonus_title=getattr(t, "bonus_title", ""),
-                bonus_points=getattr(t, "bonus_points", 0),
-                fastest_wins=bool(getattr(t, "fastest_wins", False)),
-                fastest_wins_template_id=(t.id if bool(getattr(t, "fastest_wins", False)) else None),
-                schedule_mode=getattr(t, "schedule_mode", None),
-                mark_overdue=getattr(t, "mark_overdue", True),
-            )
-            # add_task persists; nothing else to do
+            # add_task may spawn repeat instances too; commit it all with one write
+            async with self.transaction():
+                await self.add_task(
+                    title=t.title,
+                    points=t.points,
+                    description=t.description,
+                    due=t.due,
+                    assigned_to=child_id,
+                    repeat_template_id=repeat_template_id,
+                    icon=t.icon,
+                    persist_until_completed=getattr(t, "persist_until_completed", False),
+                    quick_complete=getattr(t, "quick_complete", False),
+                    skip_approval=getattr(t, "skip_approval", False),
+                    categories=list(getattr(t, "categories", []) or []),
+                    early_bonus_enabled=getattr(t, "early_bonus_enabled", False),
+                    early_bonus_days=getattr(t, "early_bonus_days", 0),
+                    early_bonus_points=getattr(t, "early_bonus_points", 0),
+                    bonus_enabled=getattr(t, "bonus_enabled", False),
+                    bonus_title=getattr(t, "bonus_title", ""),
+                    bonus_points=getattr(t, "bonus_points", 0),
+                    fastest_wins=bool(getattr(t, "fastest_wins", False)),
+                    fastest_wins_template_id=(t.id if bool(getattr(t, "fastest_wins", False)) else None),
+                    schedule_mode=getattr(t, "schedule_mode", None),
+                    mark_overdue=getattr(t, "mark_overdue", True),
+                )
             return
         # If the task is already assigned, reassign it to the new child
         t.assigned_to = child_id
         t.status = STATUS_ASSIGNED
+        self._track_task(t)
         await self.async_save()
 
     async def set_task_status(self, task_id: str, status: str, completed_ts: Optional[int] = None):
@@ -816,7 +1151,7 @@ class KidsChoresStore:
             from homeassistant.util import dt as dt_util
             from datetime import datetime
 
-            created_raw = getattr(task, "created", None)
+            created_raw = record_field(task, "created")
             if not created_raw:
                 return None
             try:
@@ -851,31 +1186,31 @@ class KidsChoresStore:
                 )
 
             siblings: list[Task] = []
-            for other in self.tasks:
-                if other.id == task.id:
+            for i, other in enumerate(entries(self.tasks)):
+                if record_field(other, "id") == task.id:
                     continue
                 if _local_created_date(other) != day:
                     continue
                 # Only consider assigned copies (templates are unassigned)
-                if not getattr(other, "assigned_to", None):
+                if not record_field(other, "assigned_to", None):
                     continue
-                if not bool(getattr(other, "fastest_wins", False)):
+                if not bool(record_field(other, "fastest_wins", False)):
                     continue
                 if tpl_id:
-                    if getattr(other, "fastest_wins_template_id", None) != tpl_id:
+                    if record_field(other, "fastest_wins_template_id", None) != tpl_id:
                         continue
                 else:
                     # Only group with other non-template-linked copies that match signature.
-                    if getattr(other, "fastest_wins_template_id", None):
+                    if record_field(other, "fastest_wins_template_id", None):
                         continue
                     other_sig = (
-                        str(getattr(other, "title", "") or "").strip().lower(),
-                        int(getattr(other, "points", 0) or 0),
-                        str(getattr(other, "due", "") or "").strip(),
+                        str(record_field(other, "title", "") or "").strip().lower(),
+                        int(record_field(other, "points", 0) or 0),
+                        str(record_field(other, "due", "") or "").strip(),
                     )
                     if other_sig != sig:
                         continue
-                siblings.append(other)
+                siblings.append(self.tasks[i])
 
             # Determine if the task has already been claimed by someone else.
             existing_claim_id: Optional[str] = None
@@ -929,6 +1264,7 @@ class KidsChoresStore:
                 o.fastest_wins_claimed_by_child_name = my_child_name
                 o.fastest_wins_claimed_ts = claim_ts
             return False
+        was_approved = t.status == STATUS_APPROVED
         # Store completion timestamp if provided
         if completed_ts is not None:
             t.completed_ts = completed_ts
@@ -945,8 +1281,9 @@ class KidsChoresStore:
         if status == STATUS_AWAITING and getattr(t, "skip_approval", False):
             # Set status to awaiting first (approve_task allows other states too,
             # but this keeps the flow consistent with UI expectations).
-            t.status = STATUS_AWAITING
-            await self.approve_task(task_id)
+            async with self.transaction():
+                t.status = STATUS_AWAITING
+                await self.approve_task(task_id)
             return
 
         t.status = status
@@ -962,25 +1299,22 @@ class KidsChoresStore:
             t.bonus_completed_ts = None
             t.bonus_approved = False
             t.bonus_approved_at = None
+        self._track_task(t, history=was_approved)
         await self.async_save()
 
-    def _add_earned_points(self, child: Child, earned: int) -> None:
+    def _add_earned_points(self, child: Child, earned: int, ref: str = "") -> None:
         if not earned:
             return
         try:
             now_local = dt_util.now()
-            month_key = f"{now_local.year}-{now_local.month:02d}"
+            self.ledger.record(child.id, KIND_EARNED, earned, ref)
+            self.stats.record(child.id, earned=earned)
+            child.lifetime_earned, child.monthly_earned, child.weekly_earned = self.ledger.earned_windows(
+                child.id, now_local.date()
+            )
             iso_year, iso_week, _ = now_local.isocalendar()
-            week_key = f"{iso_year}-W{iso_week:02d}"
-            if getattr(child, "last_earned_month", "") != month_key:
-                child.monthly_earned = 0
-                child.last_earned_month = month_key
-            if getattr(child, "last_earned_week", "") != week_key:
-                child.weekly_earned = 0
-                child.last_earned_week = week_key
-            child.lifetime_earned = int(getattr(child, "lifetime_earned", 0) or 0) + earned
-            child.monthly_earned = int(getattr(child, "monthly_earned", 0) or 0) + earned
-            child.weekly_earned = int(getattr(child, "weekly_earned", 0) or 0) + earned
+            child.last_earned_month = f"{now_local.year}-{now_local.month:02d}"
+            child.last_earned_week = f"{iso_year}-W{iso_week:02d}"
         except Exception:
             pass
         child.points += earned
@@ -997,10 +1331,12 @@ class KidsChoresStore:
         ts = completed_ts
         if ts is None:
             ts = int(dt_util.utcnow().timestamp() * 1000)
-        t.bonus_completed_ts = int(ts)
         if bool(getattr(t, "skip_approval", False)):
-            await self.approve_bonus_task(task_id)
+            async with self.transaction():
+                t.bonus_completed_ts = int(ts)
+                await self.approve_bonus_task(task_id)
             return
+        t.bonus_completed_ts = int(ts)
         await self.async_save()
 
     async def approve_bonus_task(self, task_id: str):
@@ -1019,7 +1355,7 @@ class KidsChoresStore:
         t.bonus_approved_at = datetime.now(timezone.utc).isoformat()
         earned = int(getattr(t, "bonus_points", 0) or 0)
         if earned:
-            self._add_earned_points(child, earned)
+            self._add_earned_points(child, earned, t.id)
         await self.async_save()
 
     async def approve_task(self, task_id: str):
@@ -1035,6 +1371,7 @@ class KidsChoresStore:
             pass
         t.status = STATUS_APPROVED
         t.approved_at = datetime.now(timezone.utc).isoformat()
+        self._track_task(t)
         # Clear carried_over flag when task is approved
         t.carried_over = False
         # Keep completed_ts for historical record (don't clear it)
@@ -1071,18 +1408,20 @@ class KidsChoresStore:
 
         earned = int(t.points) + int(bonus)
         if earned:
-            self._add_earned_points(child, earned)
+            self._add_earned_points(child, earned, t.id)
+        try:
+            self.stats.record(child.id, completed=1, on_time=int(self._completed_on_time(t)))
+        except Exception:
+            pass
 
         # If this task was spawned from a repeat template, create the next upcoming instance
         # right away (so the child card shows the next deadline without waiting for midnight).
         try:
             tpl_id = getattr(t, "repeat_template_id", None)
             if tpl_id and t.assigned_to:
-                template = None
-                for x in self.tasks:
-                    if x.id == tpl_id and (not x.assigned_to):
-                        template = x
-                        break
+                template = self._tasks_by_id_or_none(tpl_id)
+                if template is not None and template.assigned_to:
+                    template = None
                 if template and getattr(template, "repeat_days", None) and self._repeat_bonus_active(template):
                     from homeassistant.util import dt as dt_util
                     from datetime import datetime as _dt, timezone as _tz
@@ -1101,7 +1440,7 @@ class KidsChoresStore:
                                     base = due_d
                     except Exception:
                         base = dt_util.now().date()
-                    next_due = self._next_repeat_due_iso(base, list(template.repeat_days), include_today=False)
+                    next_due = self._next_due_iso(template, base, include_today=False)
                     if next_due and not self._active_repeat_instance_exists(template.id, t.assigned_to):
                         inst = Task(
                             id=str(uuid4()),
@@ -1127,14 +1466,130 @@ class KidsChoresStore:
                         inst.bonus_title = str(getattr(template, "bonus_title", "") or "").strip()
                         inst.bonus_points = int(getattr(template, "bonus_points", 0) or 0)
                         self.tasks.append(inst)
+                        self._track_task(inst)
         except Exception:
             pass
         await self.async_save()
 
     async def delete_task(self, task_id: str):
-        self.tasks = [t for t in self.tasks if t.id != task_id]
+        self.tasks = LazyList(_task_from_row, [t for t in entries(self.tasks) if record_field(t, "id") != task_id])
+        self.schedule.discard(task_id)
+        self._untrack_tasks((task_id,))
         await self.async_save()
 
+    # --- Bulk task operations ---
+    def select_tasks(
+        self,
+        task_ids: Optional[List[str]] = None,
+        child_id: Optional[str] = None,
+        status: Optional[Any] = None,
+        category_id: Optional[str] = None,
+    ) -> List[Task]:
+        """Tasks matching every given filter. At least one filter is required."""
+        ids = {str(x) for x in (task_ids or []) if x}
+        if isinstance(status, str):
+            statuses = {status} if status else set()
+        else:
+            statuses = {str(x) for x in (status or []) if x}
+        if statuses - STATUSES:
+            raise ValueError("invalid_status")
+        if not (ids or child_id or statuses or category_id):
+            raise ValueError("missing_task_filter")
+        if ids and not (child_id or statuses or category_id):
+            return [t for t in (self._tasks_by_id_or_none(x) for x in ids) if t is not None]
+
+        def _match(t) -> bool:
+            if ids and record_field(t, "id") not in ids:
+                return False
+            if child_id and record_field(t, "assigned_to") != child_id:
+                return False
+            if statuses and record_field(t, "status") not in statuses:
+                return False
+            if category_id and category_id not in (record_field(t, "categories") or []):
+                return False
+            return True
+
+        return self._tasks_where(_match)
+
+    def _tasks_where(self, match: Callable[[Any], bool]) -> List[Task]:
+        """Tasks whose entry passes `match` (given a stored row or a Task); only those are hydrated."""
+        tasks = self.tasks
+        return [tasks[i] for i, t in enumerate(entries(tasks)) if match(t)]
+
+    def _tasks_by_id_or_none(self, task_id: str) -> Optional[Task]:
+        try:
+            return self._get_task(task_id)
+        except ValueError:
+            return None
+
+    async def approve_tasks(self, include_bonus: bool = False, **filters) -> List[str]:
+        """Approve every assigned, not yet approved task in the selection as one transaction.
+
+        With include_bonus, enabled bonus parts are marked completed and approved too,
+        like the "approve all" notification action.
+        """
+        done: List[str] = []
+        async with self.transaction():
+            for t in self.select_tasks(**filters):
+                if not t.assigned_to:
+                    continue
+                changed = False
+                if t.status != STATUS_APPROVED:
+                    await self.approve_task(t.id)
+                    changed = True
+                if include_bonus and bool(getattr(t, "bonus_enabled", False)) and not getattr(t, "bonus_approved", False):
+                    if not getattr(t, "bonus_completed_ts", None):
+                        t.bonus_completed_ts = int(dt_util.utcnow().timestamp() * 1000)
+                    await self.approve_bonus_task(t.id)
+                    changed = True
+                if changed:
+                    done.append(t.id)
+        return done
+
+    async def delete_tasks(self, **filters) -> List[str]:
+        ids = {t.id for t in self.select_tasks(**filters)}
+        if ids:
+            self.tasks = LazyList(_task_from_row, [t for t in entries(self.tasks) if record_field(t, "id") not in ids])
+            for task_id in ids:
+                self.schedule.discard(task_id)
+            self._untrack_tasks(ids)
+            await self.async_save()
+        return list(ids)
+
+    async def set_tasks_status(self, new_status: str, completed_ts: Optional[int] = None, **filters) -> Tuple[List[str], List[str]]:
+        """Set the status of every selected task as one transaction.
+
+        Returns (changed ids, skipped ids); fastest-wins siblings that were already
+        claimed are skipped instead of failing the whole batch.
+        """
+        if new_status not in STATUSES:
+            raise ValueError("invalid_status")
+        changed: List[str] = []
+        skipped: List[str] = []
+        async with self.transaction():
+            for t in self.select_tasks(**filters):
+                if t.status == new_status:
+                    continue
+                try:
+                    await self.set_task_status(t.id, new_status, completed_ts)
+                except ValueError as err:
+                    if str(err) != "task_already_claimed":
+                        raise
+                    skipped.append(t.id)
+                    continue
+                changed.append(t.id)
+        return changed, skipped
+
+    async def assign_tasks(self, child_id: str, **filters) -> List[str]:
+        """Assign (or, for templates, spawn a copy of) every selected task to child_id as one transaction."""
+        self._get_child(child_id)
+        done: List[str] = []
+        async with self.transaction():
+            for t in self.select_tasks(**filters):
+                await self.assign_task(t.id, child_id)
+                done.append(t.id)
+        return done
+
     async def set_task_repeat(
         self,
         task_id: str,
@@ -1218,6 +1673,7 @@ class KidsChoresStore:
             t.persist_until_completed = False
 
         # If this is a template and early-bonus repeat is active, ensure instances exist.
+        self.schedule.update(t, dt_util.now().date())
         try:
             await self._maybe_spawn_repeat_bonus_instances(t)
         except Exception:
@@ -1335,7 +1791,7 @@ class KidsChoresStore:
         if is_template:
             try:
                 active_statuses = {STATUS_ASSIGNED, STATUS_IN_PROGRESS, STATUS_AWAITING, STATUS_REJECTED}
-                for inst in self.tasks:
+                for inst in loaded(self.tasks):
                     if not getattr(inst, "assigned_to", None):
                         continue
                     if getattr(inst, "repeat_template_id", None) != t.id:
@@ -1363,37 +1819,81 @@ class KidsChoresStore:
                 pass
 
         # If this is a template and early-bonus repeat is active, ensure instances exist.
+        self.schedule.update(t, dt_util.now().date())
         try:
             await self._maybe_spawn_repeat_bonus_instances(t)
         except Exception:
             pass
+        self._track_task(t)
         await self.async_save()
 
-    async def daily_rollover(self):
-        """Midnight housekeeping: start fresh each day.
+    async def daily_rollover(
+        self, max_catchup_days: int = ROLLOVER_MAX_CATCHUP_DAYS, until: Optional[date] = None
+    ) -> int:
+        """Run the rollover for today and any days missed since last_rollover_date.
+
+        After downtime spanning midnights, each missed day (at most
+        max_catchup_days, today included) is replayed in order so weekly and
+        monthly boundaries are not skipped. Everything is applied as one
+        transaction and persisted once. Returns the number of days rolled.
+
+        `until` caps the last day rolled (the startup catch-up passes the last
+        day whose rollover time has passed); days already rolled are skipped.
+        """
+        from datetime import timedelta
+
+        now = dt_util.now()
+        today = now.date()
+        last = dt_util.parse_date(self.last_rollover_date) if self.last_rollover_date else None
+        if until is not None:
+            if until < today:
+                today = until
+            if last is not None and last >= today:
+                return 0
+        first = today
+        if last is not None and last < today:
+            first = max(last + timedelta(days=1), today - timedelta(days=max(1, int(max_catchup_days)) - 1))
+        days = [first + timedelta(days=i) for i in range((today - first).days + 1)]
+        async with self.transaction():
+            for day in days:
+                if day == today:
+                    await self._rollover_day(day, now)
+                else:
+                    # Replayed day: stamp as if it ran at that local midnight
+                    midnight = dt_util.start_of_local_day(day)
+                    await self._rollover_day(day, midnight)
+            self.last_rollover_date = today.isoformat()
+            self._sync_earned_counters()
+            self.ledger.compact(today - timedelta(days=LEDGER_RAW_DAYS))
+            self.stats.prune()
+            await self.async_save()
+        return len(days)
+
+    async def _rollover_day(self, today, now):
+        """Midnight housekeeping for one local day: start fresh each day.
 
-                - Remove tasks from previous days unless explicitly configured to carry.
-        - Then create today's repeated tasks based on the repeat templates captured
+        - Remove tasks from previous days unless explicitly configured to carry.
+        - Then create the day's repeated tasks based on the repeat templates captured
           from the existing tasks before cleanup.
+        Saves are left to the caller (daily_rollover).
         """
-        from homeassistant.util import dt as dt_util
         from datetime import datetime
 
-        now = dt_util.now()  # aware, local
-        today = now.date()
-        weekday = now.weekday()  # 0=Mon..6=Sun
+        stamp = dt_util.as_utc(now).isoformat()
 
-        # Capture scheduled templates BEFORE cleanup so we don't lose the plan
+        # Capture scheduled templates BEFORE cleanup so we don't lose the plan.
+        # The schedule index already knows which tasks carry a usable schedule.
         templates = []
-        for t in self.tasks:
+        spawning = self.schedule.spawns_on(today)
+        for tid in self.schedule.task_ids():
+            t = self._tasks_by_id_or_none(tid)
+            if t is None:
+                self.schedule.discard(tid)
+                continue
             try:
                 mode = str(getattr(t, "schedule_mode", "") or "").strip().lower()
             except Exception:
                 mode = ""
-            # Backwards compat: if no mode but repeat_days exists, treat as repeat.
-            is_scheduled = bool(getattr(t, "repeat_days", None)) or (mode in ("weekly", "monthly", "repeat"))
-            if not is_scheduled:
-                continue
 
             # targets can be multiple children
             targets = list(getattr(t, "repeat_child_ids", []) or [])
@@ -1422,8 +1922,8 @@ class KidsChoresStore:
                 "mark_overdue": getattr(t, "mark_overdue", True),
             })
 
-        def _local_created_date(task: Task):
-            created_raw = getattr(task, "created", None)
+        def _local_created_date(task):
+            created_raw = record_field(task, "created")
             if not created_raw:
                 return None
             try:
@@ -1437,9 +1937,12 @@ class KidsChoresStore:
         # 1) Roll/clean older tasks with rules:
         #    - NEVER remove unassigned template tasks (assigned_to is empty)
         #    - Only carry tasks forward when persist_until_completed is true and task is not approved.
-        kept: list[Task] = []
-        for t in self.tasks:
-            is_template = not (getattr(t, "assigned_to", None) and str(getattr(t, "assigned_to", "")).strip())
+        # History still held as stored rows is swept without being hydrated.
+        kept: list = []
+        dropped_history = False
+        for t in entries(self.tasks):
+            assigned = record_field(t, "assigned_to")
+            is_template = not (assigned and str(assigned).strip())
             if is_template:
                 kept.append(t)
                 continue
@@ -1448,19 +1951,27 @@ class KidsChoresStore:
             # If created is missing/invalid, treat it as "old" so it doesn't stick around forever.
             is_older = (created_date is None) or (created_date < today)
             if is_older:
-                if getattr(t, "status", None) == STATUS_AWAITING:
+                status = record_field(t, "status")
+                if status == STATUS_AWAITING:
                     kept.append(t)
                     continue
-                if bool(getattr(t, "persist_until_completed", False)) and getattr(t, "status", None) != STATUS_APPROVED:
-                    from datetime import datetime as _dt, timezone as _tz
-                    t.created = _dt.now(_tz.utc).isoformat()
+                if bool(record_field(t, "persist_until_completed", False)) and status != STATUS_APPROVED:
+                    if type(t) is dict:
+                        t = _task_from_row(t)
+                    t.created = stamp
                     t.carried_over = True
                     kept.append(t)
                 else:
+                    dropped_history = dropped_history or status == STATUS_APPROVED
                     continue
             else:
                 kept.append(t)
-        self.tasks = kept
+        self.tasks = LazyList(_task_from_row, kept)
+        self._retrack_tasks(history=dropped_history)
+        kept_ids = {record_field(t, "id") for t in kept}
+        for tid in self.schedule.task_ids():
+            if tid not in kept_ids:
+                self.schedule.discard(tid)
 
         # 2) Auto-create today's repeated tasks from captured templates
         # Prefer using repeat_template_id to detect existing active instances (more robust than title/date).
@@ -1472,6 +1983,20 @@ class KidsChoresStore:
                 pass
             return False
 
+        # (child, title) of tasks created today for the fallback de-dupe below; built on first use
+        # and kept current as tasks are spawned, instead of rescanning every task per target.
+        created_today: Optional[set] = None
+
+        def _created_today(target: str, title: Any) -> bool:
+            nonlocal created_today
+            if created_today is None:
+                created_today = {
+                    (record_field(x, "assigned_to"), record_field(x, "title"))
+                    for x in entries(self.tasks)
+                    if _local_created_date(x) == today
+                }
+            return (target, title) in created_today
+
         for tpl in templates:
             rdays = tpl.get("repeat_days") or []
             try:
@@ -1496,17 +2021,15 @@ class KidsChoresStore:
             if is_bonus_repeat:
                 # Ignore any fixed date in tpl['due']; deadline is derived from schedule.
                 tpl_id = str(tpl.get("id") or "")
-                if mode == "monthly":
-                    due_iso = self._next_monthly_due_iso(today, include_today=True)
-                else:
-                    due_iso = self._next_repeat_due_iso(today, list(rdays), include_today=True)
+                due = self.schedule.next_due(tpl_id, today) if tpl_id else None
+                due_iso = due.isoformat() if due else None
                 if tpl_id and due_iso:
                     for target in targets:
                         if not target:
                             continue
                         if self._active_repeat_instance_exists(tpl_id, target):
                             continue
-                        await self.add_task(
+                        spawned = await self.add_task(
                             title=tpl["title"],
                             points=tpl["points"],
                             description=tpl["description"],
@@ -1526,18 +2049,13 @@ class KidsChoresStore:
                             categories=list(tpl.get("categories") or []),
                             mark_overdue=tpl.get("mark_overdue", True),
                         )
+                        spawned.created = stamp
+                        if created_today is not None:
+                            created_today.add((target, spawned.title))
                 continue
 
             # Scheduled behavior: create on the scheduled boundary.
-            should_spawn = False
-            if mode in ("", "repeat"):
-                should_spawn = weekday in (rdays or [])
-            elif mode == "weekly":
-                should_spawn = weekday == 0
-            elif mode == "monthly":
-                should_spawn = int(today.day) == 1
-
-            if should_spawn:
+            if tpl.get("id") in spawning:
                 tpl_id = str(tpl.get("id") or "")
                 for target in targets:
                     if not target:
@@ -1546,15 +2064,12 @@ class KidsChoresStore:
                         continue
                     # Fallback de-dupe (in case older data didn't set repeat_template_id)
                     try:
-                        if any(
-                            (x.assigned_to == target and x.title == tpl.get("title") and _local_created_date(x) == today)
-                            for x in self.tasks
-                        ):
+                        if _created_today(target, tpl.get("title")):
                             continue
                     except Exception:
                         pass
 
-                    await self.add_task(
+                    spawned = await self.add_task(
                         title=tpl["title"],
                         points=tpl["points"],
                         description=tpl["description"],
@@ -1574,21 +2089,21 @@ class KidsChoresStore:
                         categories=list(tpl.get("categories") or []),
                         mark_overdue=tpl.get("mark_overdue", True),
                     )
-
-        await self.async_save()
+                    spawned.created = stamp
+                    if created_today is not None:
+                        created_today.add((target, spawned.title))
 
     async def reset_points(self, child_id: Optional[str] = None):
-        if child_id:
-            c = self._get_child(child_id)
+        targets = [self._get_child(child_id)] if child_id else list(self.children)
+        for c in targets:
+            self.ledger.record(c.id, KIND_ADJUST, -int(c.points), "reset")
             c.points = 0
-        else:
-            for c in self.children:
-                c.points = 0
         await self.async_save()
 
     async def add_points(self, child_id: str, points: int):
         c = self._get_child(child_id)
         c.points += int(points)
+        self.ledger.record(c.id, KIND_ADJUST, int(points), "manual")
         await self.async_save()
 
     # --- Shop API ---
@@ -1600,6 +2115,7 @@ class KidsChoresStore:
         except Exception:
             it.actions = []
         self.items.append(it)
+        self.media.ref(it.image)
         await self.async_save()
         return it
 
@@ -1612,7 +2128,11 @@ class KidsChoresStore:
         if icon is not None:
             it.icon = str(icon).strip()
         if image is not None:
-            it.image = str(image).strip()
+            new_image = str(image).strip()
+            if new_image != it.image:
+                self.media.unref(it.image)
+                self.media.ref(new_image)
+            it.image = new_image
         if active is not None:
             it.active = bool(active)
         if actions is not None:
@@ -1632,27 +2152,68 @@ class KidsChoresStore:
         img = (getattr(it, "image", "") or "").strip() if it else ""
 
         self.items = [i for i in self.items if i.id != item_id]
+        name = media_filename(img)
+        orphaned = bool(name) and self.media.unref(img) == 0
+        if orphaned:
+            # No other item or purchase uses the image: drop it and its variants now.
+            self.image_variants.pop(img, None)
         await self.async_save()
 
-        # Best-effort cleanup of orphaned images stored under /local/chores4kids/
-        try:
-            if img and img.startswith("/local/"):
-                # only delete if not used by another item or in purchases history
-                used_by_item = any((getattr(x, "image", "") or "").strip() == img for x in self.items)
-                used_by_purchase = any((getattr(p, "image", "") or "").strip() == img for p in self.purchases)
-                if not used_by_item and not used_by_purchase:
-                    rel = img[len("/local/"):].lstrip("/")  # e.g. chores4kids/xyz.jpg
-                    abs_path = self.hass.config.path("www", *rel.split("/"))
-                    def _rm():
-                        if os.path.exists(abs_path):
-                            try:
-                                os.remove(abs_path)
-                            except Exception:
-                                pass
-                    await self.hass.async_add_executor_job(_rm)
-        except Exception:
-            # Never fail deletion because of cleanup
-            pass
+        if orphaned:
+            try:
+                names = [name, *self.media.variants_of(name)]
+                self.media.forget(name)
+                await self.hass.async_add_executor_job(remove_media_files, self._media_path(), names)
+            except Exception:
+                # Never fail deletion because of cleanup
+                pass
+
+    async def set_image_variants(self, image: str, variants: Dict[str, str]):
+        """Record resized variants produced by the image pipeline for an uploaded image."""
+        if self.image_variants.get(image) == variants:
+            return
+        self.image_variants[image] = dict(variants)
+        self.media.set_variants(image, variants)
+        await self.async_save()
+
+    def image_variant(self, image: str, variant: str) -> str:
+        """Return the URL of a resized variant, or "" if none was generated."""
+        return (self.image_variants.get(str(image or "").strip()) or {}).get(variant, "")
+
+    # --- Media registry ---
+    def _media_path(self) -> str:
+        return self.hass.config.path("www", MEDIA_DIR)
+
+    def _rebuild_media_refs(self) -> None:
+        self.media.clear_refs()
+        for image, variants in self.image_variants.items():
+            self.media.set_variants(image, variants)
+        for i in self.items:
+            self.media.ref(getattr(i, "image", "") or "")
+        for p in entries(self.purchases):
+            self.media.ref(record_field(p, "image", "") or "")
+
+    async def collect_media_garbage(self, grace_seconds: float = 3600) -> Dict[str, int]:
+        """Delete unreferenced integration-managed files under www/chores4kids.
+
+        Files younger than grace_seconds are kept so a fresh upload is not
+        collected before the shop item referencing it is saved.
+        """
+        directory = self._media_path()
+        self.media.rescan(await self.hass.async_add_executor_job(scan_media_dir, directory))
+        candidates = self.media.collectable(grace_seconds)
+        if not candidates:
+            return {"files": 0, "bytes": 0}
+        removed, reclaimed = await self.hass.async_add_executor_job(remove_media_files, directory, candidates)
+        dropped = False
+        for name in removed:
+            self.media.forget(name)
+            url = f"{MEDIA_URL_PREFIX}{name}"
+            if self.image_variants.pop(url, None) is not None:
+                dropped = True
+        if dropped:
+            await self.async_save()
+        return {"files": len(removed), "bytes": int(reclaimed)}
 
     async def buy_shop_item(self, child_id: str, item_id: str):
         child = self._get_child(child_id)
@@ -1668,14 +2229,26 @@ class KidsChoresStore:
             ts=datetime.now(timezone.utc).isoformat(), child_name=child.name
         )
         self.purchases.append(pur)
+        self.ledger.record(child.id, KIND_PURCHASE, -price, pur.id)
+        self.stats.record(child.id, spent=price)
+        self.media.ref(pur.image)
+        run = None
+        actions = getattr(it, "actions", []) or []
+        if actions:
+            run = {
+                "id": str(uuid4()),
+                "item_id": it.id,
+                "title": it.title,
+                "child_id": child.id,
+                "purchase_id": pur.id,
+                "steps": [dict(s) for s in actions],
+                "due": pur.ts,
+            }
+            self.pending_actions.append(run)
         await self.async_save()
-        # Execute any configured actions asynchronously (non-blocking)
-        try:
-            actions = getattr(it, "actions", []) or []
-            if actions:
-                self.hass.async_create_task(self._run_actions(list(actions)))
-        except Exception:
-            pass
+        # Execute configured actions in the background; delays are scheduled, not slept.
+        if run is not None:
+            self.hass.async_create_task(self._advance_action_run(run["id"]))
         return pur
 
     async def clear_shop_history(self, child_id: Optional[str] = None):
@@ -1683,22 +2256,246 @@ class KidsChoresStore:
         if child_id:
             # Validate child exists; raises if missing
             self._get_child(child_id)
-            self.purchases = [p for p in self.purchases if p.child_id != child_id]
+            held = entries(self.purchases)
+            removed = [p for p in held if record_field(p, "child_id") == child_id]
+            self.purchases = LazyList(_purchase_from_row, [p for p in held if record_field(p, "child_id") != child_id])
         else:
+            removed = entries(self.purchases)
             self.purchases = []
+        for p in removed:
+            self.media.unref(record_field(p, "image", "") or "")
         await self.async_save()
 
+    def purchase_dict(self, p: Purchase) -> Dict[str, Any]:
+        return {
+            "id": p.id,
+            "child_id": p.child_id,
+            "child_name": p.child_name or self.get_child_name(p.child_id),
+            "item_id": p.item_id,
+            "title": p.title,
+            "price": p.price,
+            "icon": p.icon,
+            "image": getattr(p, "image", ""),
+            "ts": p.ts,
+        }
+
+    def page_purchases(
+        self, offset: int = 0, limit: int = 50, child_id: Optional[str] = None
+    ) -> Tuple[List[Purchase], int]:
+        """Return one page of purchase history, newest first, and the total count."""
+        if child_id:
+            source = LazyList(_purchase_from_row, [p for p in entries(self.purchases) if record_field(p, "child_id") == child_id])
+        else:
+            source = self.purchases
+        total = len(source)
+        offset = max(0, int(offset))
+        limit = max(0, int(limit))
+        # purchases are stored oldest first; slice from the end without reversing everything
+        end = total - offset
+        if end <= 0 or limit == 0:
+            return [], total
+        start = max(0, end - limit)
+        return source[start:end][::-1], total
+
+    # --- Export / import (see transfer.py for the file format) ---
+    def export_records(self, include_history: bool = False) -> List[Tuple[str, Dict[str, Any]]]:
+        """Snapshot for export_data: children, categories, template tasks and shop items.
+
+        include_history adds assigned task instances and purchases.
+        """
+        out: List[Tuple[str, Dict[str, Any]]] = []
+        out.extend(("child", asdict(c)) for c in self.children)
+        out.extend(("category", asdict(c)) for c in self.categories)
+        tasks = self.tasks if include_history else [t for t in entries(self.tasks) if not record_field(t, "assigned_to")]
+        out.extend(("task", row) for row in rows(tasks, asdict))
+        out.extend(("item", asdict(i)) for i in self.items)
+        if include_history:
+            out.extend(("purchase", row) for row in rows(self.purchases, asdict))
+        return out
+
+    @staticmethod
+    def _remap_import_ids(records: Dict[str, List[Any]]) -> None:
+        """Give every imported record a fresh id and rewrite the references between them."""
+        maps: Dict[str, Dict[str, str]] = {}
+        for kind, recs in records.items():
+            maps[kind] = {}
+            for r in recs:
+                maps[kind][r.id] = r.id = str(uuid4())
+        kids, cats, tasks, items = maps["child"], maps["category"], maps["task"], maps["item"]
+        for t in records["task"]:
+            t.assigned_to = kids.get(t.assigned_to, t.assigned_to) if t.assigned_to else t.assigned_to
+            t.repeat_child_id = kids.get(t.repeat_child_id, t.repeat_child_id) if t.repeat_child_id else t.repeat_child_id
+            t.repeat_child_ids = [kids.get(c, c) for c in (t.repeat_child_ids or [])]
+            t.categories = [cats.get(c, c) for c in (t.categories or [])]
+            if t.repeat_template_id:
+                t.repeat_template_id = tasks.get(t.repeat_template_id, t.repeat_template_id)
+            if t.fastest_wins_template_id:
+                t.fastest_wins_template_id = tasks.get(t.fastest_wins_template_id, t.fastest_wins_template_id)
+        for p in records["purchase"]:
+            p.child_id = kids.get(p.child_id, p.child_id)
+            p.item_id = items.get(p.item_id, p.item_id)
+
+    async def import_records(
+        self,
+        records: Dict[str, List[Any]],
+        mode: str = "merge",
+        remap_ids: bool = False,
+        history: bool = False,
+    ) -> Dict[str, int]:
+        """Apply a parsed import in memory and persist it with one save.
+
+        merge: records are upserted by id (with remap_ids they are always added).
+        replace: children, categories, template tasks and shop items are replaced;
+        assigned tasks and purchases are replaced only when the file carries
+        history, otherwise those of children that still exist are kept. Ledger
+        entries, statistics and pending shop actions of removed children are
+        dropped, and links to templates that are gone are cleared.
+        """
+        if mode not in ("merge", "replace"):
+            raise ValueError("invalid_import_mode")
+        if remap_ids:
+            self._remap_import_ids(records)
+
+        def _merge(current: list, incoming: list) -> list:
+            # Works on entries so kept history stays as stored rows
+            out = entries(current)
+            pos = {record_field(x, "id"): i for i, x in enumerate(out)}
+            for x in incoming:
+                if x.id in pos:
+                    out[pos[x.id]] = x
+                else:
+                    pos[x.id] = len(out)
+                    out.append(x)
+            return out
+
+        gone: Set[str] = set()
+        if mode == "replace":
+            children = list(records["child"])
+            kid_ids = {c.id for c in children}
+            gone = set(self._children_by_id) - kid_ids
+            categories = list(records["category"])
+            items = list(records["item"])
+            if history:
+                tasks = list(records["task"])
+                purchases = list(records["purchase"])
+            else:
+                tasks = [t for t in records["task"] if not t.assigned_to]
+                tasks += [t for t in entries(self.tasks) if record_field(t, "assigned_to") in kid_ids]
+                purchases = [p for p in entries(self.purchases) if record_field(p, "child_id") in kid_ids]
+        else:
+            children = _merge(self.children, records["child"])
+            kid_ids = {c.id for c in children}
+            categories = _merge(self.categories, records["category"])
+            items = _merge(self.items, records["item"])
+            tasks = _merge(self.tasks, records["task"])
+            purchases = _merge(self.purchases, records["purchase"])
+
+        if any(t.assigned_to and t.assigned_to not in kid_ids for t in records["task"]):
+            raise ValueError("invalid_import: task assigned to unknown child")
+        cat_ids = {c.id for c in categories}
+        for t in records["task"]:
+            if t.categories and not set(t.categories) <= cat_ids:
+                t.categories = [c for c in t.categories if c in cat_ids]
+            if t.repeat_child_ids and not set(t.repeat_child_ids) <= kid_ids:
+                t.repeat_child_ids = [c for c in t.repeat_child_ids if c in kid_ids]
+            if t.repeat_child_id and t.repeat_child_id not in kid_ids:
+                t.repeat_child_id = None
+
+        if mode == "replace":
+            # Kept instances may point at templates the file no longer has
+            task_ids = {record_field(t, "id") for t in tasks}
+            for i, t in enumerate(tasks):
+                stale = {
+                    k: None for k in ("repeat_template_id", "fastest_wins_template_id")
+                    if record_field(t, k) and record_field(t, k) not in task_ids
+                }
+                if not stale:
+                    continue
+                if type(t) is dict:
+                    # Stored rows are replaced, never edited in place
+                    tasks[i] = {**t, **stale}
+                else:
+                    for k, v in stale.items():
+                        setattr(t, k, v)
+        if gone:
+            self.ledger.forget(gone)
+            self.stats.forget(gone)
+            self._drop_action_runs({r.get("id") for r in self.pending_actions if r.get("child_id") in gone})
+
+        self.children = children
+        self.categories = categories
+        self.items = items
+        self.tasks = LazyList(_task_from_row, tasks)
+        self.purchases = LazyList(_purchase_from_row, purchases)
+        for c in self.children:
+            if not c.slug:
+                c.slug = slugify(c.name)
+        self._reindex_children()
+        self._rebuild_media_refs()
+        self.schedule.rebuild(loaded(self.tasks), dt_util.now().date())
+        self._retrack_tasks()
+        for c in self.children:
+            self.ledger.record(c.id, KIND_ADJUST, int(c.points) - self.ledger.balance(c.id), "import")
+        await self.async_save()
+        return {kind: len(recs) for kind, recs in records.items()}
+
     # Helpers
+    def _track_task(self, t: Task, history: bool = False) -> None:
+        """File a task that was added or changed into open_tasks.
+
+        Approved tasks, and with `history` tasks leaving the approved history,
+        bump history_revision.
+        """
+        if t.assigned_to and t.status != STATUS_APPROVED:
+            self.open_tasks[t.id] = t
+        else:
+            self.open_tasks.pop(t.id, None)
+        if history or t.status == STATUS_APPROVED:
+            self.history_revision += 1
+
+    def _untrack_tasks(self, ids: Iterable[str]) -> None:
+        for task_id in ids:
+            self.open_tasks.pop(task_id, None)
+        self.history_revision += 1
+
+    def _retrack_tasks(self, history: bool = True) -> None:
+        """Rebuild open_tasks after self.tasks was replaced; raw rows are approved history."""
+        self.open_tasks = {t.id: t for t in loaded(self.tasks) if t.assigned_to and t.status != STATUS_APPROVED}
+        if history:
+            self.history_revision += 1
+
+    def _reindex_children(self) -> None:
+        self._children_by_id = {c.id: c for c in self.children}
+
     def _get_child(self, child_id: str) -> Child:
-        for c in self.children:
-            if c.id == child_id:
-                return c
+        c = self._children_by_id.get(child_id)
+        if c is not None:
+            return c
         raise ValueError("child_not_found")
 
+    def get_child_name(self, child_id: Optional[str]) -> Optional[str]:
+        if not child_id:
+            return None
+        c = self._children_by_id.get(child_id)
+        return c.name if c is not None else None
+
     def _get_task(self, task_id: str) -> Task:
-        for t in self.tasks:
-            if t.id == task_id:
-                return t
+        # Ids map to positions so a lookup hydrates only the task it returns (see lazy.py).
+        # An in-place reorder keeps the list and its length, so each hit is verified and a miss reindexes once.
+        indexed, size = self._tasks_indexed
+        fresh = indexed is not self.tasks or size != len(self.tasks)
+        while True:
+            if fresh:
+                self._tasks_by_id = {record_field(t, "id"): i for i, t in enumerate(entries(self.tasks))}
+                self._tasks_indexed = (self.tasks, len(self.tasks))
+            i = self._tasks_by_id.get(task_id)
+            if i is not None:
+                t = self.tasks[i]
+                if t.id == task_id:
+                    return t
+            if fresh:
+                break
+            fresh = True
         raise ValueError("task_not_found")
 
     def _get_category(self, category_id: str) -> Category:
@@ -1745,10 +2542,9 @@ class KidsChoresStore:
     async def delete_category(self, category_id: str):
         # remove from tasks and from list
         self.categories = [c for c in self.categories if c.id != category_id]
-        for t in self.tasks:
+        for t in self._tasks_where(lambda t: category_id in (record_field(t, "categories") or [])):
             try:
-                if getattr(t, "categories", None):
-                    t.categories = [cid for cid in t.categories if cid != category_id]
+                t.categories = [cid for cid in t.categories if cid != category_id]
             except Exception:
                 pass
         await self.async_save()
@@ -1798,13 +2594,43 @@ class KidsChoresStore:
                 continue
         return out
 
-    async def _run_actions(self, actions: List[Dict[str, Any]]):
-        for step in actions:
+    def _find_action_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        for run in self.pending_actions:
+            if run.get("id") == run_id:
+                return run
+        return None
+
+    def _schedule_action_run(self, run: Dict[str, Any]) -> None:
+        run_id = run["id"]
+        old = self._action_timers.pop(run_id, None)
+        if old:
+            old()
+        due = dt_util.parse_datetime(str(run.get("due") or "")) or dt_util.utcnow()
+
+        @callback
+        def _fire(_now):
+            self._action_timers.pop(run_id, None)
+            self.hass.async_create_task(self._advance_action_run(run_id))
+
+        self._action_timers[run_id] = async_track_point_in_time(self.hass, _fire, due)
+
+    async def _advance_action_run(self, run_id: str):
+        """Execute steps of a run until the next delay (scheduled) or the end."""
+        run = self._find_action_run(run_id)
+        if run is None:
+            return
+        steps: List[Dict[str, Any]] = run.get("steps") or []
+        while steps:
+            step = steps.pop(0)
             try:
                 if step.get("type") == "delay":
                     sec = int(step.get("seconds") or 0)
                     if sec > 0:
-                        await asyncio.sleep(sec)
+                        from datetime import timedelta
+                        run["due"] = (dt_util.utcnow() + timedelta(seconds=sec)).isoformat()
+                        self._schedule_action_run(run)
+                        await self.async_save()
+                        return
                 elif step.get("type") == "service":
                     domain = step.get("domain")
                     service = step.get("service")
@@ -1817,11 +2643,68 @@ class KidsChoresStore:
             except Exception:
                 # Keep processing remaining steps
                 continue
+        self.pending_actions = [r for r in self.pending_actions if r.get("id") != run_id]
+        await self.async_save()
+
+    @callback
+    def async_resume_actions(self) -> None:
+        """Re-arm persisted action runs after a restart; overdue runs continue right away."""
+        now = dt_util.utcnow()
+        for run in list(self.pending_actions):
+            due = dt_util.parse_datetime(str(run.get("due") or ""))
+            if due is None or due <= now:
+                self.hass.async_create_task(self._advance_action_run(run["id"]))
+            else:
+                self._schedule_action_run(run)
+
+    @callback
+    def async_stop_actions(self) -> None:
+        """Cancel timers without dropping persisted runs (used on unload)."""
+        for unsub in self._action_timers.values():
+            unsub()
+        self._action_timers.clear()
+
+    def list_action_runs(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": r.get("id"),
+                "item_id": r.get("item_id"),
+                "title": r.get("title"),
+                "child_id": r.get("child_id"),
+                "child_name": self.get_child_name(r.get("child_id")),
+                "purchase_id": r.get("purchase_id"),
+                "due": r.get("due"),
+                "steps_left": len(r.get("steps") or []),
+            }
+            for r in self.pending_actions
+        ]
+
+    async def cancel_action_runs(self, run_id: Optional[str] = None, purchase_id: Optional[str] = None) -> int:
+        """Cancel pending runs by run id and/or purchase id. Returns the number cancelled."""
+        if not run_id and not purchase_id:
+            raise ValueError("missing_run_id")
+        cancelled = [
+            r for r in self.pending_actions
+            if (run_id and r.get("id") == run_id) or (purchase_id and r.get("purchase_id") == purchase_id)
+        ]
+        if not cancelled:
+            return 0
+        self._drop_action_runs({r.get("id") for r in cancelled})
+        await self.async_save()
+        return len(cancelled)
+
+    def _drop_action_runs(self, ids: Set[str]) -> None:
+        """Forget pending runs and cancel their timers."""
+        for rid in ids:
+            unsub = self._action_timers.pop(rid, None)
+            if unsub:
+                unsub()
+        self.pending_actions = [r for r in self.pending_actions if r.get("id") not in ids]
 
 # ---- Point shop ----
 
 @dataclass
-class ShopItem:
+class ShopItem(_Record):
     id: str
     title: str
     price: int
@@ -1831,7 +2714,7 @@ class ShopItem:
     actions: List[Dict[str, Any]] = field(default_factory=list)
 
 @dataclass
-class Purchase:
+class Purchase(_Record):
     id: str
     child_id: str
     item_id: str
@@ -1844,4 +2727,8 @@ class Purchase:
     # Optional denormalized for convenience (filled when saving)
     child_name: str = ""
 
+
+_task_from_row = record_factory(Task)
+_purchase_from_row = record_factory(Purchase)
+
 # End of storage
@@ -0,0 +1,179 @@
+"""JSON-lines export/import of the Chores4Kids dataset.
+
+One JSON object per line; the first line is a header:
+
+    {"type": "header", "format": "chores4kids", "version": 1, "history": false, ...}
+    {"type": "child", "data": {...}}
+    {"type": "category" | "task" | "item" | "purchase", "data": {...}}
+
+Files live under /config/chores4kids_exports (never under www, which is served
+publicly). Writing and parsing run in the executor; the store applies a parsed
+batch with a single save (`KidsChoresStore.import_records`).
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, List, Tuple, Union, get_args, get_origin, get_type_hints
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, STORAGE_VERSION
+from .storage import STATUSES, Category, Child, Purchase, ShopItem, Task
+from .upload import sanitize_filename
+
+EXPORT_DIR = f"{DOMAIN}_exports"
+FORMAT = DOMAIN
+MAX_REPORTED_ERRORS = 10
+
+RECORD_TYPES: Dict[str, type] = {
+    "child": Child,
+    "category": Category,
+    "task": Task,
+    "item": ShopItem,
+    "purchase": Purchase,
+}
+
+_HINTS: Dict[type, Dict[str, Any]] = {}
+
+
+def export_dir(hass: HomeAssistant) -> str:
+    return hass.config.path(EXPORT_DIR)
+
+
+def resolve_path(hass: HomeAssistant, name: str | None, default: str = "export.jsonl") -> str:
+    """Absolute allow-listed paths are used as is; anything else is a file name in EXPORT_DIR."""
+    name = str(name or "").strip()
+    if name and os.path.isabs(name):
+        if not hass.config.is_allowed_path(name):
+            raise ValueError("path_not_allowed")
+        return name
+    return os.path.join(export_dir(hass), sanitize_filename(os.path.basename(name), default))
+
+
+def write_jsonl(path: str, header: Dict[str, Any], records: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, int]:
+    """Stream records to path via temp file + rename (executor). Returns counts per type."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".export_", dir=directory)
+    counts: Dict[str, int] = {}
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps({"type": "header", **header}, ensure_ascii=False) + "\n")
+            for kind, data in records:
+                fh.write(json.dumps({"type": kind, "data": data}, ensure_ascii=False, separators=(",", ":")) + "\n")
+                counts[kind] = counts.get(kind, 0) + 1
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return counts
+
+
+def _hints(cls: type) -> Dict[str, Any]:
+    hints = _HINTS.get(cls)
+    if hints is None:
+        hints = _HINTS[cls] = get_type_hints(cls)
+    return hints
+
+
+def _accepts(hint: Any, value: Any) -> bool:
+    if hint is Any:
+        return True
+    origin = get_origin(hint)
+    if origin is Union:
+        return any(_accepts(arg, value) for arg in get_args(hint))
+    if hint is type(None):
+        return value is None
+    base = origin or hint
+    if base is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    if base is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if not isinstance(value, base):
+        return False
+    args = get_args(hint)
+    if base is list and args:
+        return all(_accepts(args[0], v) for v in value)
+    return True
+
+
+def _build(cls: type, data: Any) -> Any:
+    """Validate one record against the dataclass fields and build it.
+
+    Unknown keys (from newer versions) are dropped; missing optional keys take
+    the dataclass defaults.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("record data must be an object")
+    hints = _hints(cls)
+    kwargs: Dict[str, Any] = {}
+    for f in dataclasses.fields(cls):
+        if f.name not in data:
+            if f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING:
+                raise ValueError(f"missing field {f.name}")
+            continue
+        value = data[f.name]
+        if not _accepts(hints[f.name], value):
+            raise ValueError(f"bad type for {f.name}")
+        kwargs[f.name] = value
+    obj = cls(**kwargs)
+    if not str(getattr(obj, "id", "") or "").strip():
+        raise ValueError("empty id")
+    if cls is Task and obj.status not in STATUSES:
+        raise ValueError(f"bad status {obj.status}")
+    return obj
+
+
+def read_jsonl(path: str) -> Tuple[Dict[str, Any], Dict[str, List[Any]]]:
+    """Parse and validate an export file line by line (executor).
+
+    Returns (header, records by type). Raises ValueError("invalid_import: ...")
+    listing the first few bad lines; nothing is applied unless the whole file
+    is valid.
+    """
+    header: Dict[str, Any] = {}
+    records: Dict[str, List[Any]] = {kind: [] for kind in RECORD_TYPES}
+    errors: List[str] = []
+    with open(path, "r", encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+                if not isinstance(obj, dict):
+                    raise ValueError("line must be an object")
+                kind = obj.get("type")
+                if lineno == 1 or not header:
+                    if kind != "header" or obj.get("format") != FORMAT:
+                        raise ValueError("missing chores4kids header")
+                    version = obj.get("version")
+                    if not isinstance(version, int) or version > STORAGE_VERSION:
+                        raise ValueError(f"unsupported version {version}")
+                    header = obj
+                    continue
+                cls = RECORD_TYPES.get(kind)
+                if cls is None:
+                    raise ValueError(f"unknown record type {kind}")
+                records[kind].append(_build(cls, obj.get("data")))
+            except ValueError as err:
+                errors.append(f"line {lineno}: {err}")
+                if not header or len(errors) >= MAX_REPORTED_ERRORS:
+                    break
+    if not header and not errors:
+        errors.append("empty file")
+    if errors:
+        raise ValueError("invalid_import: " + "; ".join(errors))
+    for kind in RECORD_TYPES:
+        ids = [r.id for r in records[kind]]
+        if len(ids) != len(set(ids)):
+            raise ValueError(f"invalid_import: duplicate {kind} ids")
+    return header, records
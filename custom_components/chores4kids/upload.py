@@ -0,0 +1,143 @@
+"""Streaming media upload for Chores4Kids (shop images, completion sounds)."""
+from __future__ import annotations
+
+from http import HTTPStatus
+import logging
+import os
+import re
+import tempfile
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DOMAIN, MEDIA_DIR, MEDIA_URL_PREFIX, SIGNAL_DATA_UPDATED, UPLOAD_MAX_BYTES, UPLOAD_URL
+from .media import async_process_upload, is_allowed_upload
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_UPLOAD_VIEW = f"{DOMAIN}_upload_view"
+CHUNK_SIZE = 256 * 1024
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds UPLOAD_MAX_BYTES."""
+
+
+def sanitize_filename(filename: str | None, default: str = "upload.bin") -> str:
+    name = re.sub(r"[^a-zA-Z0-9._-]+", "_", str(filename or "").strip()) or default
+    return name.lstrip(".") or default
+
+
+def media_dir(hass: HomeAssistant) -> str:
+    return hass.config.path("www", MEDIA_DIR)
+
+
+def _open_temp(directory: str):
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".upload_", dir=directory)
+    return os.fdopen(fd, "wb"), tmp_path
+
+
+def _finish(fh, tmp_path: str, final_path: str) -> None:
+    fh.flush()
+    os.fsync(fh.fileno())
+    fh.close()
+    os.replace(tmp_path, final_path)
+
+
+def _discard(fh, tmp_path: str) -> None:
+    try:
+        fh.close()
+    finally:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+def write_bytes_atomic(directory: str, filename: str, raw: bytes) -> str:
+    """Write raw bytes to directory/filename via temp file + rename (executor)."""
+    fh, tmp_path = _open_temp(directory)
+    final_path = os.path.join(directory, filename)
+    try:
+        fh.write(raw)
+        _finish(fh, tmp_path, final_path)
+    except Exception:
+        _discard(fh, tmp_path)
+        raise
+    return final_path
+
+
+class Chores4KidsUploadView(HomeAssistantView):
+    """Accept a multipart `file` field and stream it into /config/www/chores4kids."""
+
+    url = UPLOAD_URL
+    name = f"api:{DOMAIN}:upload"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+
+    async def post(self, request: web.Request) -> web.Response:
+        hass = self.hass
+        user = request.get("hass_user")
+        if user is None or not user.is_admin:
+            return self.json_message("admin_required", HTTPStatus.FORBIDDEN)
+        if request.content_length is not None and request.content_length > UPLOAD_MAX_BYTES + CHUNK_SIZE:
+            return self.json_message("file_too_large", HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        try:
+            reader = await request.multipart()
+        except Exception:
+            return self.json_message("invalid_multipart", HTTPStatus.BAD_REQUEST)
+
+        field = await reader.next()
+        while field is not None and getattr(field, "name", None) != "file":
+            field = await reader.next()
+        if field is None:
+            return self.json_message("missing_file", HTTPStatus.BAD_REQUEST)
+
+        filename = sanitize_filename(request.query.get("filename") or field.filename)
+        if not is_allowed_upload(filename):
+            return self.json_message("unsupported_file_type", HTTPStatus.UNSUPPORTED_MEDIA_TYPE)
+        directory = media_dir(hass)
+        final_path = os.path.join(directory, filename)
+
+        fh, tmp_path = await hass.async_add_executor_job(_open_temp, directory)
+        size = 0
+        try:
+            while True:
+                chunk = await field.read_chunk(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > UPLOAD_MAX_BYTES:
+                    raise UploadTooLarge
+                await hass.async_add_executor_job(fh.write, chunk)
+            await hass.async_add_executor_job(_finish, fh, tmp_path, final_path)
+        except UploadTooLarge:
+            await hass.async_add_executor_job(_discard, fh, tmp_path)
+            return self.json_message("file_too_large", HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        except Exception:
+            await hass.async_add_executor_job(_discard, fh, tmp_path)
+            _LOGGER.exception("%s: upload of %s failed", DOMAIN, filename)
+            return self.json_message("upload_failed", HTTPStatus.INTERNAL_SERVER_ERROR)
+
+        _LOGGER.debug("%s: uploaded %s (%s bytes)", DOMAIN, filename, size)
+        try:
+            url, variants = await async_process_upload(hass, directory, filename, size)
+        except Exception:
+            _LOGGER.warning("%s: image pipeline failed for %s", DOMAIN, filename, exc_info=True)
+            url, variants = f"{MEDIA_URL_PREFIX}{filename}", {}
+        async_dispatcher_send(hass, SIGNAL_DATA_UPDATED)
+        return self.json({"filename": url.rsplit("/", 1)[-1], "url": url, "variants": variants, "size": size})
+
+
+def async_register_upload_view(hass: HomeAssistant) -> None:
+    """Register the upload view once per HA run (views cannot be unregistered)."""
+    if hass.data.get(DATA_UPLOAD_VIEW):
+        return
+    hass.http.register_view(Chores4KidsUploadView(hass))
+    hass.data[DATA_UPLOAD_VIEW] = True